@@ -460,6 +460,8 @@ class ArmControllerGUI:
                         self.log_message(f"ProgramLoad kết quả: {load_result}")
                         
                         if int(load_result) == 0:
+                            # seq trạng thái trước ProgramRun: chỉ xét các khung trạng thái sau khi chạy
+                            after_seq = self.robot.snapshot()[0] if callable(getattr(self.robot, 'snapshot', None)) else None
                             run_result = self.robot.ProgramRun()
                             self.log_message(f"ProgramRun kết quả: {run_result}")
                             
@@ -468,7 +470,7 @@ class ArmControllerGUI:
                                 self.log_message("⏳ Đang đợi robot hoàn thành...")
                                 
                                 # Đợi robot hoàn thành (timeout 5 giây để chắc chắn)
-                                if self.check_robot_complete(timeout=5):
+                                if self.check_robot_complete(timeout=5, after_seq=after_seq):
                                     self.log_message("✅ ✅ COMPLETION: Robot đã hoàn thành!")
                                 else:
                                     self.log_message("⚠️ Timeout: Không nhận được confirmation sau 5s")
@@ -718,13 +720,22 @@ class ArmControllerGUI:
                 
         threading.Thread(target=debug_thread, daemon=True).start()
     
-    def check_robot_complete(self, timeout=3):
-        """Kiểm tra xem robot có hoàn thành chương trình không (timeout mặc định 3 giây)"""
+    def check_robot_complete(self, timeout=3, after_seq=None):
+        """Kiểm tra xem robot có hoàn thành chương trình không (timeout mặc định 3 giây)
+        after_seq: seq của robot.snapshot() lấy trước ProgramRun, None = seq hiện tại"""
         if not self.connected:
             return False
         
         try:
             start_time = time.time()
+            # SDK có luồng trạng thái 20004: chờ bằng condition variable thay vì polling 0.1s
+            # program_state: 1 = dừng, 2 = đang chạy, 3 = tạm dừng
+            if callable(getattr(self.robot, 'wait_program_done', None)):
+                if self.robot.wait_program_done(after_seq, timeout):
+                    return True
+                self.log_message("⚠️ Timeout kiểm tra robot hoàn thành!")
+                return False
+
             while time.time() - start_time < timeout:
                 # Thử các method để kiểm tra program state
                 if hasattr(self.robot, 'robot_state_pkg'):
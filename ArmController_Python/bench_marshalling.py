@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark đóng gói tham số XML-RPC
+So sánh, cho các lệnh trong LEGACY_CALLS, giữa
+- cách cũ: thân hàm SDK trước khi có Signatures (chép nguyên phần ép kiểu và thứ tự tham số) + xmlrpc.client.dumps
+- Signatures: request body mà RPC hiện tại gửi đi (command/query -> signature(...).marshal)
+Body được kiểm tra giống hệt nhau từng byte: gọi phương thức RPC thật trên mock_controller, chặn send_request
+để lấy body, so với body của thân hàm cũ với cùng tham số. Thời gian chỉ đo phần đóng gói.
+
+Chạy: python bench_marshalling.py [số_lần_mỗi_lệnh]
+"""
+
+import os
+import sys
+import time
+import statistics
+import xmlrpc.client
+
+# Thêm SDK path vào sys.path
+SDK_PATH = os.path.join(os.path.dirname(__file__), 'fairino_sdk')
+if os.path.exists(SDK_PATH):
+    sys.path.insert(0, SDK_PATH)
+sys.path.insert(0, os.path.dirname(__file__))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from fairino.Robot import RPC
+from fairino.Signatures import signature
+from mock_controller import MockController
+
+# Phản hồi giả cho các query (các lệnh khác trả về 0)
+REPLIES = {
+    "GetForwardKin": [0, 300.0, 0.0, 400.0, 180.0, 0.0, 90.0],
+    "GetInverseKin": [0, 1.0, -90.0, 90.0, -90.0, -90.0, 0.0],
+}
+
+
+class LegacyProxy:
+    """Thay cho ServerProxy trong thân hàm cũ: robot.X(*params) ghi lại body của xmlrpc.client.dumps"""
+
+    def __init__(self):
+        self.bodies = []
+
+    def __getattr__(self, name):
+        def call(*params):
+            self.bodies.append(xmlrpc.client.dumps(params, name).encode("utf-8", "xmlcharrefreplace"))
+            return REPLIES.get(name, 0)
+        return call
+
+
+# ---------- Thân hàm cũ (Robot.py trước Signatures), bỏ vòng lặp reconnect/socket.error ----------
+
+def legacy_MoveJ(robot, joint_pos, tool, user, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
+                 exaxis_pos=[0.0, 0.0, 0.0, 0.0], blendT=-1.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
+    joint_pos = list(map(float, joint_pos))
+    tool = int(tool)
+    user = int(user)
+    desc_pos = list(map(float, desc_pos))
+    vel = float(vel)
+    acc = float(acc)
+    ovl = float(ovl)
+    exaxis_pos = list(map(float, exaxis_pos))
+    blendT = float(blendT)
+    offset_flag = int(offset_flag)
+    offset_pos = list(map(float, offset_pos))
+    if (desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0) and (
+            desc_pos[4] == 0.0) and (desc_pos[5] == 0.0):
+        ret = robot.GetForwardKin(joint_pos)
+        if ret[0] == 0:
+            desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
+        else:
+            return ret[0]
+    return robot.MoveJ(joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag, offset_pos)
+
+
+def legacy_MoveL(robot, desc_pos, tool, user, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
+                 blendR=-1.0, blendMode=0, exaxis_pos=[0.0, 0.0, 0.0, 0.0], search=0, offset_flag=0,
+                 offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], config=-1, velAccParamMode=0, overSpeedStrategy=0,
+                 speedPercent=10):
+    desc_pos = list(map(float, desc_pos))
+    tool = int(tool)
+    user = int(user)
+    joint_pos = list(map(float, joint_pos))
+    vel = float(vel)
+    acc = float(acc)
+    ovl = float(ovl)
+    blendR = float(blendR)
+    blendMode = int(blendMode)
+    exaxis_pos = list(map(float, exaxis_pos))
+    search = int(search)
+    offset_flag = int(offset_flag)
+    offset_pos = list(map(float, offset_pos))
+    config = int(config)
+    velAccParamMode = int(velAccParamMode)
+    overSpeedStrategy = int(overSpeedStrategy)
+    speedPercent = int(speedPercent)
+    if overSpeedStrategy > 0:
+        error = robot.JointOverSpeedProtectStart(overSpeedStrategy, speedPercent)
+        if error != 0:
+            return error
+    if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
+            and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):
+        ret = robot.GetInverseKin(0, desc_pos, config)
+        if ret[0] == 0:
+            joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
+        else:
+            return ret[0]
+    error1 = robot.MoveL([joint_pos[0], joint_pos[1], joint_pos[2], joint_pos[3], joint_pos[4], joint_pos[5],
+                          desc_pos[0], desc_pos[1], desc_pos[2], desc_pos[3], desc_pos[4], desc_pos[5], tool, user,
+                          vel, acc, ovl, blendR, blendMode, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2],
+                          exaxis_pos[3], search, offset_flag, offset_pos[0], offset_pos[1], offset_pos[2],
+                          offset_pos[3], offset_pos[4], offset_pos[5], 100.0, velAccParamMode])
+    if overSpeedStrategy > 0:
+        error = robot.JointOverSpeedProtectEnd()
+        if error != 0:
+            return error
+    return error1
+
+
+def legacy_MoveCart(robot, desc_pos, tool, user, vel=20.0, acc=0.0, ovl=100.0, blendT=-1.0, config=-1):
+    desc_pos = list(map(float, desc_pos))
+    tool = int(tool)
+    user = int(user)
+    vel = float(vel)
+    acc = float(acc)
+    ovl = float(ovl)
+    blendT = float(blendT)
+    config = int(config)
+    return robot.MoveCart(desc_pos, tool, user, vel, acc, ovl, blendT, config)
+
+
+def legacy_ServoJ(robot, joint_pos, axisPos, acc=0.0, vel=0.0, cmdT=0.008, filterT=0.0, gain=0.0, id=0):
+    joint_pos = list(map(float, joint_pos))
+    axisPos = list(map(float, axisPos))
+    acc = float(acc)
+    vel = float(vel)
+    cmdT = float(cmdT)
+    filterT = float(filterT)
+    gain = float(gain)
+    id = int(id)
+    return robot.ServoJ(joint_pos, axisPos, acc, vel, cmdT, filterT, gain, id)
+
+
+def legacy_ServoCart(robot, mode, desc_pos, pos_gain=[1.0, 1.0, 1.0, 1.0, 1.0, 1.0], acc=0.0, vel=0.0, cmdT=0.008,
+                     filterT=0.0, gain=0.0):
+    mode = int(mode)
+    desc_pos = list(map(float, desc_pos))
+    pos_gain = list(map(float, pos_gain))
+    acc = float(acc)
+    vel = float(vel)
+    cmdT = float(cmdT)
+    filterT = float(filterT)
+    gain = float(gain)
+    return robot.ServoCart(mode, desc_pos, pos_gain, acc, vel, cmdT, filterT, gain)
+
+
+def legacy_StartJOG(robot, ref, nb, dir, max_dis, vel=20.0, acc=100.0):
+    ref = int(ref)
+    nb = int(nb)
+    dir = int(dir)
+    max_dis = float(max_dis)
+    vel = float(vel)
+    acc = float(acc)
+    return robot.StartJOG(ref, nb, dir, vel, acc, max_dis)
+
+
+def legacy_SetDO(robot, id, status, smooth=0, block=0):
+    return robot.SetDO(int(id), int(status), int(smooth), int(block))
+
+
+def legacy_SetToolDO(robot, id, status, smooth=0, block=0):
+    return robot.SetToolDO(int(id), int(status), int(smooth), int(block))
+
+
+def legacy_SetAO(robot, id, value, block=0):
+    id = int(id)
+    value = float(value)
+    block = int(block)
+    return robot.SetAO(id, value * 40.95, block)
+
+
+def legacy_SetSpeed(robot, vel):
+    return robot.SetSpeed(int(vel))
+
+
+def legacy_ProgramLoad(robot, program_name):
+    return robot.ProgramLoad(str(program_name))
+
+
+def legacy_SetToolCoord(robot, id, t_coord, type, install, toolID, loadNum):
+    id = int(id)
+    t_coord = list(map(float, t_coord))
+    type = int(type)
+    install = int(install)
+    toolID = int(toolID)
+    loadNum = int(loadNum)
+    return robot.SetToolCoord(id, t_coord, type, install, toolID, loadNum)
+
+
+def legacy_SetLoadWeight(robot, loadNum, weight):
+    return robot.SetLoadWeight(int(loadNum), float(weight))
+
+
+def legacy_GetForwardKin(robot, joint_pos):
+    return robot.GetForwardKin(list(map(float, joint_pos)))
+
+
+def legacy_GetInverseKin(robot, type, desc_pos, config=-1):
+    return robot.GetInverseKin(int(type), list(map(float, desc_pos)), int(config))
+
+
+JOINTS = [10, -90.5, 90, -90, -90.25, 0]
+POSE = [300.5, 12, 400, 180, 0, 90.125]
+
+# (phương thức RPC, tham số, thân hàm cũ): tham số cố ý trộn int/float để kiểm tra ép kiểu giống nhau
+LEGACY_CALLS = [
+    ("MoveJ", (JOINTS, 0, 0, POSE, 100), legacy_MoveJ),
+    ("MoveJ", (JOINTS, 1, 0), legacy_MoveJ),  # desc_pos 为 0：先 GetForwardKin
+    ("MoveL", (POSE, 0, 0, JOINTS, 50, 0, 100, -1, 0, [0, 0, 0, 1]), legacy_MoveL),
+    ("MoveL", (POSE, 0, 0), legacy_MoveL),  # joint_pos 为 0：先 GetInverseKin
+    ("MoveL", (POSE, 0, 0, JOINTS, 20, 0, 100, 5, 1, [0, 0, 0, 0], 0, 0, POSE, -1, 0, 1, 30), legacy_MoveL),
+    ("MoveCart", (POSE, 1, 2, 30, 0, 100, -1, -1), legacy_MoveCart),
+    ("ServoJ", (JOINTS, [0, 0, 0, 0]), legacy_ServoJ),
+    ("ServoCart", (1, POSE, [1, 1, 1, 1, 1, 1], 0, 0, 0.008), legacy_ServoCart),
+    ("StartJOG", (0, 1, 1, 30, 20, 100), legacy_StartJOG),
+    ("SetDO", (3, True), legacy_SetDO),
+    ("SetToolDO", (1, 1, 0, 1), legacy_SetToolDO),
+    ("SetAO", (0, 10), legacy_SetAO),
+    ("SetSpeed", (50.0,), legacy_SetSpeed),
+    ("ProgramLoad", ("/fruser/coffee.lua",), legacy_ProgramLoad),
+    ("SetToolCoord", (1, POSE, 0, 0, 0, 0), legacy_SetToolCoord),
+    ("SetLoadWeight", (0, 1), legacy_SetLoadWeight),
+    ("GetForwardKin", (JOINTS,), legacy_GetForwardKin),
+    ("GetInverseKin", (0, POSE, -1), legacy_GetInverseKin),
+]
+HOT_COMMANDS = ("MoveJ", "MoveL", "MoveCart", "ServoJ", "ServoCart", "SetDO", "SetSpeed")
+
+
+class RequestRecorder:
+    """Chặn RPC.command/query/send_request: ghi (tên lệnh, tham số) và body thay vì gửi cho controller"""
+
+    def __init__(self, rpc):
+        self.calls = []
+        self.bodies = []
+        command, query = rpc.command, rpc.query
+        rpc.command = lambda name, *args: self.calls.append((name, args)) or command(name, *args)
+        rpc.query = lambda name, *args: self.calls.append((name, args)) or query(name, *args)
+        rpc.send_request = self.send_request
+
+    def send_request(self, body):
+        self.bodies.append(body)
+        return REPLIES.get(xmlrpc.client.loads(body)[1], 0)
+
+    def run(self, func, *args):
+        self.calls, self.bodies = [], []
+        func(*args)
+        return self.calls, self.bodies
+
+
+def as_numpy(args):
+    return tuple(np.array(a, dtype=float) if isinstance(a, list) else a for a in args)
+
+
+def timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    variants = [("list", False)] + ([("numpy", True)] if np is not None else [])
+    print(f"Commands: {len(LEGACY_CALLS)}, repeat: {repeat}")
+
+    with MockController():
+        rpc = RPC('127.0.0.1')
+        recorder = RequestRecorder(rpc)
+        try:
+            for label, use_numpy in variants:
+                before, after, rows = [], [], {}
+                for method, args, legacy in LEGACY_CALLS:
+                    if use_numpy:
+                        args = as_numpy(args)
+                    calls, bodies = recorder.run(getattr(rpc, method), *args)
+                    proxy = LegacyProxy()
+                    legacy(proxy, *args)
+                    assert bodies == proxy.bodies, (method, args)
+
+                    def old():
+                        legacy(LegacyProxy(), *args)
+
+                    sigs = [(signature(name), call_args) for name, call_args in calls]
+
+                    def new():
+                        for sig, call_args in sigs:
+                            sig.marshal(*call_args)
+
+                    before.append(timeit(old, repeat))
+                    after.append(timeit(new, repeat))
+                    rows.setdefault(method, (before[-1], after[-1]))
+
+                print(f"\n[{label}] µs/call      {'before':>8} {'after':>8} {'speedup':>8}  (body giống hệt)")
+                print(f"  {'mean':<18} {statistics.mean(before):8.2f} {statistics.mean(after):8.2f} "
+                      f"{statistics.mean(before) / statistics.mean(after):7.2f}x")
+                print(f"  {'median':<18} {statistics.median(before):8.2f} {statistics.median(after):8.2f} "
+                      f"{statistics.median(before) / statistics.median(after):7.2f}x")
+                for name in HOT_COMMANDS:
+                    old_us, new_us = rows[name]
+                    print(f"  {name:<18} {old_us:8.2f} {new_us:8.2f} {old_us / new_us:7.2f}x")
+        finally:
+            rpc.CloseRPC()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark bộ parse luồng trạng thái 20004
+So sánh số gói/giây giữa legacy_state_routine (parse từng byte như thread trạng thái cũ của SDK)
+và RobotStateParser (bytes.find + kiểm tra checksum theo khối)
+
+Chạy: python bench_state_parser.py [số_gói] [kích_thước_chunk]
+"""
+
+import os
+import sys
+import time
+import ctypes
+
+# Thêm SDK path vào sys.path
+SDK_PATH = os.path.join(os.path.dirname(__file__), 'fairino_sdk')
+if os.path.exists(SDK_PATH):
+    sys.path.insert(0, SDK_PATH)
+
+from fairino.Robot import RPC, RobotStatePkg, RobotStateParser, RobotStateStore
+
+
+def build_frame(frame_cnt: int) -> bytes:
+    """Tạo một frame RobotStatePkg hợp lệ (header 0x5A5A, checksum đúng)"""
+    pkg = RobotStatePkg()
+    pkg.frame_head = 0x5A5A
+    pkg.frame_cnt = frame_cnt & 0xFF
+    pkg.data_len = ctypes.sizeof(RobotStatePkg) - 7
+    pkg.program_state = 1
+    pkg.robot_state = 1
+    for i in range(6):
+        pkg.jt_cur_pos[i] = 10.0 * i + frame_cnt * 0.001
+        pkg.jointDriverTemperature[i] = 35.0 + i
+    raw = bytearray(bytes(pkg))
+    checksum = sum(raw[:-2]) & 0xFFFF
+    raw[-2] = checksum & 0xFF
+    raw[-1] = checksum >> 8
+    return bytes(raw)
+
+
+def build_stream(num_packets: int) -> bytes:
+    return b''.join(build_frame(i) for i in range(num_packets))
+
+
+def iter_chunks(stream: bytes, chunk_size: int):
+    for i in range(0, len(stream), chunk_size):
+        yield stream[i:i + chunk_size]
+
+
+class ReplaySocket:
+    """Socket giả: trả dữ liệu theo từng chunk, hết dữ liệu thì báo ConnectionError"""
+
+    def __init__(self, stream: bytes, chunk_size: int):
+        self.chunks = iter_chunks(stream, chunk_size)
+
+    def recv_into(self, buf):
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            raise ConnectionError("replay finished")
+        buf[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        pass
+
+
+def legacy_state_routine(sock, publish, buffer_size=RPC.BUFFER_SIZE):
+    """Thread trạng thái cũ của SDK (tìm header và cộng checksum từng byte), chạy đến khi sock báo hết dữ liệu"""
+    recvbuf = bytearray(buffer_size)
+    tmp_recvbuf = bytearray(buffer_size)
+    state_pkg = bytearray(buffer_size)
+    find_head_flag = False
+    index = 0
+    length = 0
+    tmp_len = 0
+    expected_length = buffer_size
+    pkg_size = ctypes.sizeof(RobotStatePkg)
+
+    try:
+        while True:
+            recvbyte = sock.recv_into(recvbuf)
+
+            # Xử lý dữ liệu còn lại từ lần nhận trước
+            if tmp_len > 0:
+                if tmp_len + recvbyte <= buffer_size:
+                    recvbuf[:tmp_len + recvbyte] = tmp_recvbuf[:tmp_len] + recvbuf[:recvbyte]
+                    recvbyte += tmp_len
+                tmp_len = 0
+
+            i = 0
+            while i < recvbyte:
+                # Tìm header
+                if format(recvbuf[i], '02X') == "5A" and not find_head_flag:
+                    if i + 4 < recvbyte and format(recvbuf[i + 1], '02X') == "5A":
+                        find_head_flag = True
+                        state_pkg[0] = recvbuf[i]
+                        index = 1
+                        length = (recvbuf[i + 4] << 8) | recvbuf[i + 3]
+                        if length + 7 > expected_length:
+                            expected_length = length + 7
+                            tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
+                            tmp_len = recvbyte - i
+                            find_head_flag = False
+                            break
+                    i += 1
+
+                # Đã có header, gom dữ liệu
+                elif find_head_flag and index < length + 5:
+                    state_pkg[index] = recvbuf[i]
+                    index += 1
+                    i += 1
+
+                # Kiểm tra checksum
+                elif find_head_flag and index >= length + 5:
+                    if i + 1 < recvbyte:
+                        checksum = sum(state_pkg[:index])
+                        checkdata = (recvbuf[i + 1] << 8) | recvbuf[i]
+                        if checksum == checkdata:
+                            publish(RobotStatePkg.from_buffer_copy(state_pkg[:pkg_size]))
+                            expected_length = buffer_size
+                        find_head_flag = False
+                        index = 0
+                        length = 0
+                        i += 2
+                    else:
+                        # Thiếu dữ liệu, lưu lại cho lần nhận sau
+                        tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
+                        tmp_len = recvbyte - i
+                        break
+                else:
+                    i += 1
+    except ConnectionError:
+        pass
+
+
+def bench_legacy(stream: bytes, chunk_size: int):
+    count = 0
+
+    def publish(pkg):
+        nonlocal count
+        count += 1
+
+    start = time.perf_counter()
+    legacy_state_routine(ReplaySocket(stream, chunk_size), publish)
+    return count, time.perf_counter() - start
+
+
+def bench_parser(stream: bytes, chunk_size: int):
+    parser = RobotStateParser(RPC.BUFFER_SIZE)
+    store = RobotStateStore()
+    count = 0
+    start = time.perf_counter()
+    for chunk in iter_chunks(stream, chunk_size):
+        parser.feed(chunk)
+        for pkg in parser.frames():
+            store.publish(pkg)
+            count += 1
+    return count, time.perf_counter() - start
+
+
+def main():
+    num_packets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    stream = build_stream(num_packets)
+    print(f"Frame size: {ctypes.sizeof(RobotStatePkg)} bytes, packets: {num_packets}, chunk: {chunk_size} bytes")
+
+    for name, func in (("legacy (per-byte)", bench_legacy), ("RobotStateParser", bench_parser)):
+        count, elapsed = func(stream, chunk_size)
+        rate = count / elapsed if elapsed > 0 else float('inf')
+        print(f"{name:<20} {count:>7} packets  {elapsed * 1000:9.1f} ms  {rate:12.0f} packets/s")
+
+
+if __name__ == "__main__":
+    main()
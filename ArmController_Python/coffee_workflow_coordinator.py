@@ -67,10 +67,13 @@ class CoffeeWorkflowCoordinator:
         self.iot_devices[device_name] = iot_controller
         logger.info(f"✅ Đã kết nối thiết bị IoT: {device_name}")
     
-    def check_robot_complete(self, timeout: float = 3.0) -> bool:
+    def check_robot_complete(self, timeout: float = 3.0, after_seq: Optional[int] = None) -> bool:
         """
         Kiểm tra xem robot có hoàn thành chương trình/motion không (timeout mặc định 3 giây)
         
+        Args:
+            after_seq: seq trạng thái lấy trước ProgramRun (xem _robot_state_seq), None = seq hiện tại
+
         Returns:
             True nếu robot đã hoàn thành, False nếu timeout hoặc lỗi
         """
@@ -81,6 +84,15 @@ class CoffeeWorkflowCoordinator:
         logger.info(f"⏳ Đang kiểm tra robot hoàn thành (timeout: {timeout}s)...")
         start_time = time.time()
         
+        # SDK RPC có luồng trạng thái 20004: chờ bằng condition variable thay vì polling
+        # program_state: 1 = dừng, 2 = đang chạy, 3 = tạm dừng
+        if callable(getattr(self.robot, 'wait_program_done', None)) and 'ServerProxy' not in type(self.robot).__name__:
+            if self.robot.wait_program_done(after_seq, timeout):
+                logger.info("✅ Robot đã hoàn thành! (state stream)")
+                return True
+            logger.warning(f"⚠️ Timeout kiểm tra robot ({timeout}s)")
+            return False
+        
         while time.time() - start_time < timeout:
             try:
                 # Method 1: Kiểm tra robot_state_pkg.program_state
@@ -149,6 +161,12 @@ class CoffeeWorkflowCoordinator:
         logger.warning(f"⚠️ Timeout kiểm tra robot ({timeout}s)")
         return False
     
+    def _robot_state_seq(self) -> Optional[int]:
+        """seq khung trạng thái 20004 mới nhất của SDK (lấy trước ProgramRun), None nếu robot không có luồng trạng thái"""
+        if 'ServerProxy' in type(self.robot).__name__ or not callable(getattr(self.robot, 'snapshot', None)):
+            return None
+        return self.robot.snapshot()[0]
+
     def check_iot_complete(self, device_name: str, expected_response: bytes = None, 
                           timeout: float = 10.0) -> bool:
         """
@@ -202,7 +220,7 @@ class CoffeeWorkflowCoordinator:
     def _default_wait(self, step_info: Dict) -> bool:
         """Default wait function nếu không có wait_func cụ thể"""
         if step_info['type'] == 'robot':
-            return self.check_robot_complete(step_info['timeout'])
+            return self.check_robot_complete(step_info['timeout'], step_info.get('robot_seq'))
         elif step_info['type'] == 'iot':
             # Tìm device name từ step_info
             device_name = step_info.get('device', 'default')
@@ -232,6 +250,8 @@ class CoffeeWorkflowCoordinator:
         try:
             # 1. Thực hiện action
             logger.info(f"▶️ Đang thực hiện: {step['name']}...")
+            # seq trước action: _default_wait chỉ xét trạng thái robot sau khi action chạy
+            step['robot_seq'] = self._robot_state_seq() if self.robot_connected else None
             action_result = step['action']()
             
             if not action_result:
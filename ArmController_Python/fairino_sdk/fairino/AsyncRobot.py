@@ -0,0 +1,159 @@
+"""
+@brief  RPC 的 asyncio 封装
+        指令接口与 RPC 相同，以协程方式调用，可设置单次调用超时并可取消；20004 实时状态以异步迭代器提供。
+        XML-RPC 指令在有限大小的线程池中执行，状态等待直接由状态线程回调驱动，不占用线程。
+        注意：超时或取消只结束等待，已发送给控制器的指令不会撤回。
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .Robot import RPC, ProgramDoneCondition
+
+
+class AsyncRPC:
+    DEFAULT_WORKERS = 4
+
+    def __init__(self, rpc, timeout=None, max_workers=DEFAULT_WORKERS):
+        """
+        @param rpc 已连接的 RPC 实例
+        @param timeout 默认单次调用超时时间(s)，None 表示不限时
+        @param max_workers 执行 XML-RPC 指令的线程数
+        """
+        self.rpc = rpc
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fairino-async")
+
+    @classmethod
+    async def connect(cls, ip="192.168.58.2", timeout=None, max_workers=DEFAULT_WORKERS):
+        """
+        创建 RPC 连接并等待后台连接完成，不阻塞事件循环，可用 asyncio.wait_for 限时
+        @param timeout 默认单次调用超时时间(s)
+        @return 已连接的 AsyncRPC；XML-RPC 探测失败抛出 ConnectionError，失败、超时或取消时关闭 RPC
+        """
+        rpc = RPC(ip, blocking=False)
+        loop = asyncio.get_running_loop()
+        try:
+            # shield: 取消等待时不取消 rpc.ready，后台连接线程仍可正常结束
+            connected = await asyncio.shield(asyncio.wrap_future(rpc.ready))
+        except BaseException:
+            loop.run_in_executor(None, rpc.CloseRPC)
+            raise
+        if not connected:
+            await loop.run_in_executor(None, rpc.CloseRPC)
+            raise ConnectionError("XML-RPC connection to %s failed" % ip)
+        return cls(rpc, timeout, max_workers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """关闭 RPC 连接并释放线程池"""
+        try:
+            await self.call("CloseRPC")
+        finally:
+            self.executor.shutdown(wait=False)
+
+    async def call(self, name, *args, rpc_timeout=None, **kwargs):
+        """
+        调用任意 RPC 接口
+        @param name 接口名，如 "MoveJ"
+        @param rpc_timeout 本次调用超时时间(s)，None 使用默认值；超时抛出 asyncio.TimeoutError
+        @return 与同步接口相同
+        """
+        func = functools.partial(getattr(self.rpc, name), *args, **kwargs)
+        future = asyncio.get_running_loop().run_in_executor(self.executor, func)
+        timeout = self.timeout if rpc_timeout is None else rpc_timeout
+        return await asyncio.wait_for(future, timeout)
+
+    def __getattr__(self, name):
+        attr = getattr(self.rpc, name)
+        if not callable(attr):
+            return attr
+
+        async def method(*args, rpc_timeout=None, **kwargs):
+            return await self.call(name, *args, rpc_timeout=rpc_timeout, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        return method
+
+    async def states(self):
+        """
+        异步迭代 20004 实时状态，每次返回 (seq, stamp, pkg)，pkg 为 RobotStatePkg 拷贝
+        处理慢于状态周期时跳过中间帧，只返回最新状态；RPC 关闭后迭代结束
+        """
+        loop = asyncio.get_running_loop()
+        store = self.rpc.state_store
+        updated = asyncio.Event()
+
+        def on_state(seq, stamp, slot):
+            try:
+                loop.call_soon_threadsafe(updated.set)
+            except RuntimeError:  # 事件循环已关闭
+                pass
+
+        store.add_listener(on_state)
+        try:
+            last_seq = 0
+            while not store.closed:
+                if store.latest[0] == last_seq:
+                    await updated.wait()
+                    updated.clear()
+                    continue
+                seq, stamp, pkg = store.snapshot()
+                last_seq = seq
+                yield seq, stamp, pkg
+        finally:
+            store.remove_listener(on_state)
+
+    async def wait_until(self, predicate, timeout=None, after_seq=None):
+        """
+        等待状态条件满足，不占用线程
+        @param predicate 判断函数，参数为 RobotStatePkg
+        @param after_seq 只接受序号大于该值的状态帧，None 表示当前状态即可
+        @return True-条件满足，False-超时或RPC已关闭
+        """
+        async def wait():
+            async for seq, stamp, pkg in self.states():
+                if (after_seq is None or seq > after_seq) and predicate(pkg):
+                    return True
+            return False
+
+        seq, stamp, pkg = self.rpc.snapshot()
+        if seq > 0 and (after_seq is None or seq > after_seq) and predicate(pkg):
+            return True
+        try:
+            return await asyncio.wait_for(wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    async def wait_motion_done(self, timeout=None):
+        """等待机器人运动到位，只判断调用之后收到的状态帧"""
+        return await self.wait_until(lambda pkg: pkg.motion_done == 1, timeout, self.rpc.state_store.latest[0])
+
+    async def wait_program_state(self, state, timeout=None):
+        """等待程序运行状态，state：1-停止；2-运行；3-暂停"""
+        state = int(state)
+        return await self.wait_until(lambda pkg: pkg.program_state == state, timeout)
+
+    async def wait_program_done(self, after_seq=None, timeout=None, stop_dwell=1.0):
+        """等待 ProgramRun 启动的程序运行结束，参数与 RPC.wait_program_done 相同"""
+        if after_seq is None:
+            after_seq = self.rpc.state_store.latest[0]
+        return await self.wait_until(ProgramDoneCondition(stop_dwell), timeout, after_seq)
+
+    async def wait_di(self, id, status, timeout=None):
+        """等待控制箱数字输入 id [0~15] 达到电平 status"""
+        id = int(id)
+        status = int(status)
+        if 0 <= id < 8:
+            return await self.wait_until(lambda pkg: ((pkg.cl_dgt_input_l >> id) & 0x01) == status, timeout)
+        elif 8 <= id < 16:
+            bit = id - 8
+            return await self.wait_until(lambda pkg: ((pkg.cl_dgt_input_h >> bit) & 0x01) == status, timeout)
+        return False
@@ -0,0 +1,169 @@
+"""
+@brief  Lua/点位表文件增量上传
+        本地清单记录 控制器IP -> 文件名 -> MD5，与 GetLuaList、ComputeFileMD5 对照后只上传内容有变化的文件。
+        本地MD5与控制器MD5校验并行执行；上传共用 20010 端口且由 FileUpload 指定文件名，因此逐个进行。
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .Robot import calculate_file_md5
+
+
+class FileSync:
+    LUA_REMOTE_DIR = "/fruser/"
+    DEFAULT_MANIFEST = "fairino_upload_manifest.json"
+    SKIPPED = "skipped"
+    UPLOADED = "uploaded"
+
+    def __init__(self, rpc, manifest_path="", max_workers=4):
+        """
+        @param rpc RPC 实例
+        @param manifest_path 清单文件路径，为空时使用当前工作目录下的 fairino_upload_manifest.json
+        @param max_workers MD5 计算与校验的线程数
+        """
+        self.rpc = rpc
+        if not manifest_path:
+            manifest_path = os.path.join(os.getcwd(), self.DEFAULT_MANIFEST)
+        self.manifest_path = os.path.abspath(manifest_path)
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.manifest = self.load_manifest()
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self):
+        with self.lock:
+            data = json.dumps(self.manifest, indent=2, sort_keys=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.manifest_path)
+
+    def entries(self, kind):
+        """返回当前控制器某类文件的 {文件名: MD5}"""
+        with self.lock:
+            return self.manifest.setdefault(self.rpc.ip_address, {}).setdefault(kind, {})
+
+    def forget(self, name=None):
+        """清除清单记录，name 为空时清除当前控制器的全部记录"""
+        with self.lock:
+            robot = self.manifest.setdefault(self.rpc.ip_address, {})
+            if name is None:
+                robot.clear()
+            else:
+                for files in robot.values():
+                    files.pop(name, None)
+        self.save_manifest()
+
+    def local_md5(self, paths):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(paths, pool.map(lambda p: calculate_file_md5(p, use_cache=True), paths)))
+
+    def remote_md5(self, names):
+        def compute(name):
+            # 未连接/重连时 xmlrpc_timeout 只返回错误码(int)，此时该文件MD5视为未知
+            ret = self.rpc.ComputeFileMD5(self.LUA_REMOTE_DIR + name)
+            if isinstance(ret, tuple) and ret[0] == 0:
+                return ret[1]
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(names, pool.map(compute, names)))
+
+    def sync_lua(self, paths, force=False, verify_remote=False, progress=None):
+        """
+        上传有变化的 Lua 文件
+        @param paths 本地 Lua 文件路径列表
+        @param force True-全部重新上传
+        @param verify_remote True-清单一致时仍用 ComputeFileMD5 校验控制器上的文件
+        @param progress 单个文件的上传进度回调 progress(文件名, 已发送字节数, 文件总字节数)
+        @return {文件名: "skipped" | "uploaded" | 错误码}
+        """
+        paths = [os.path.abspath(p) for p in paths]
+        hashes = self.local_md5(paths)
+        entries = self.entries("lua")
+
+        # 未连接/重连时 xmlrpc_timeout 只返回错误码(int)；列表未知时不跳过任何文件
+        ret = self.rpc.GetLuaList()
+        remote = set(n for n in (ret[2] or []) if n) if isinstance(ret, tuple) and ret[0] == 0 else None
+        if remote is not None:
+            with self.lock:
+                for name in [n for n in entries if n not in remote]:
+                    del entries[name]  # 控制器上已不存在
+
+        results = {}
+        to_check = []
+        for path in paths:
+            name = os.path.basename(path)
+            if force or remote is None or name not in remote:
+                continue
+            if not verify_remote and entries.get(name) == hashes[path]:
+                results[name] = self.SKIPPED
+            else:
+                to_check.append(name)
+        # 清单中没有记录(或要求校验)的已存在文件，用控制器的MD5确认
+        for name, md5 in self.remote_md5(to_check).items():
+            path = next(p for p in paths if os.path.basename(p) == name)
+            if md5 == hashes[path]:
+                results[name] = self.SKIPPED
+                with self.lock:
+                    entries[name] = md5
+
+        for path in paths:
+            name = os.path.basename(path)
+            if name in results:
+                continue
+            callback = None if progress is None else (lambda sent, total, name=name: progress(name, sent, total))
+            result = self.rpc.LuaUpload(path, callback)
+            if result == 0:
+                results[name] = self.UPLOADED
+                with self.lock:
+                    entries[name] = hashes[path]
+            else:
+                results[name] = result
+                with self.lock:
+                    entries.pop(name, None)
+        self.save_manifest()
+        return results
+
+    def sync_point_tables(self, paths, force=False, progress=None):
+        """
+        上传有变化的点位表(.db)；控制器不提供点位表列表与MD5，仅依据本地清单判断
+        @return {文件名: "skipped" | "uploaded" | 错误码}
+        """
+        paths = [os.path.abspath(p) for p in paths]
+        hashes = self.local_md5(paths)
+        entries = self.entries("pointtable")
+        results = {}
+        for path in paths:
+            name = os.path.basename(path)
+            if not force and entries.get(name) == hashes[path]:
+                results[name] = self.SKIPPED
+                continue
+            callback = None if progress is None else (lambda sent, total, name=name: progress(name, sent, total))
+            result = self.rpc.PointTableUpLoad(path, callback)
+            if result == 0:
+                results[name] = self.UPLOADED
+                with self.lock:
+                    entries[name] = hashes[path]
+            else:
+                results[name] = result
+                with self.lock:
+                    entries.pop(name, None)
+        self.save_manifest()
+        return results
+
+    def sync_dir(self, directory, force=False, progress=None):
+        """同步目录下的全部 .lua 与 .db 文件"""
+        files = sorted(os.path.join(directory, f) for f in os.listdir(directory))
+        results = self.sync_lua([f for f in files if f.endswith('.lua')], force, progress=progress)
+        results.update(self.sync_point_tables([f for f in files if f.endswith('.db')], force, progress))
+        return results
@@ -0,0 +1,444 @@
+"""
+@brief  FR5 本地正/逆运动学
+        按 DH 参数(FR5 标称值 + 控制器 GetDHCompensation 补偿，或调用方给出的配置)用 NumPy 向量化计算，一次可求解 N 组关节/位姿；
+        逆解为 6 轴 UR 构型的解析解，每个位姿 8 组候选解，按参考关节位置选取最近且在关节限位内的一组。
+        单点求解经 LRU 缓存，键为量化后的关节/位姿与工具坐标系。
+        位姿为 [x,y,z,rx,ry,rz]，单位 [mm][°]，姿态按固定轴 X-Y-Z 顺序旋转(R = Rz·Ry·Rx)。
+        需要 NumPy，SDK 其余部分不依赖本模块。
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# FR5 标称 DH 参数(标准 DH)，单位 mm
+FR5_DH = {"d1": 152.0, "a2": -425.0, "a3": -395.0, "d4": 102.0, "d5": 102.0, "d6": 100.0}
+DH_COMPENSATION_KEYS = ("d1", "a2", "a3", "d4", "d5", "d6")  # GetDHCompensation 返回值顺序
+DH_ALPHA = (np.pi / 2, 0.0, 0.0, np.pi / 2, -np.pi / 2, 0.0)
+# 关节限位 [min, max]，单位 [°]
+FR5_JOINT_LIMITS = ((-175.0, 175.0), (-265.0, 85.0), (-160.0, 160.0), (-265.0, 85.0), (-175.0, 175.0), (-175.0, 175.0))
+SOLUTION_TOLERANCE = 1e-3  # 候选逆解回代正解的位置误差上限(mm)
+
+
+def pose_to_matrix(poses):
+    """[x,y,z,rx,ry,rz] (...,6) -> 齐次变换矩阵 (...,4,4)"""
+    poses = np.asarray(poses, dtype=float)
+    rx, ry, rz = np.radians(poses[..., 3]), np.radians(poses[..., 4]), np.radians(poses[..., 5])
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    T = np.zeros(poses.shape[:-1] + (4, 4))
+    T[..., 0, 0] = cz * cy
+    T[..., 0, 1] = cz * sy * sx - sz * cx
+    T[..., 0, 2] = cz * sy * cx + sz * sx
+    T[..., 1, 0] = sz * cy
+    T[..., 1, 1] = sz * sy * sx + cz * cx
+    T[..., 1, 2] = sz * sy * cx - cz * sx
+    T[..., 2, 0] = -sy
+    T[..., 2, 1] = cy * sx
+    T[..., 2, 2] = cy * cx
+    T[..., :3, 3] = poses[..., :3]
+    T[..., 3, 3] = 1.0
+    return T
+
+
+def matrix_to_pose(T):
+    """齐次变换矩阵 (...,4,4) -> [x,y,z,rx,ry,rz] (...,6)；ry=±90° 时取 rz=0"""
+    R = T[..., :3, :3]
+    cy = np.hypot(R[..., 0, 0], R[..., 1, 0])
+    singular = cy < 1e-9
+    ry = np.arctan2(-R[..., 2, 0], cy)
+    rz = np.where(singular, 0.0, np.arctan2(R[..., 1, 0], R[..., 0, 0]))
+    rx = np.where(singular, np.arctan2(-R[..., 2, 0] * R[..., 0, 1], R[..., 1, 1]),
+                  np.arctan2(R[..., 2, 1], R[..., 2, 2]))
+    return np.concatenate([T[..., :3, 3], np.degrees(np.stack([rx, ry, rz], axis=-1))], axis=-1)
+
+
+def invert_transform(T):
+    """齐次变换矩阵求逆 (...,4,4)"""
+    inv = np.zeros_like(T)
+    Rt = np.swapaxes(T[..., :3, :3], -1, -2)
+    inv[..., :3, :3] = Rt
+    inv[..., :3, 3] = -np.einsum('...ij,...j->...i', Rt, T[..., :3, 3])
+    inv[..., 3, 3] = 1.0
+    return inv
+
+
+def wrap_degrees(angles):
+    """角度归一化到 (-180, 180]"""
+    return 180.0 - np.mod(180.0 - angles, 360.0)
+
+
+def poses_close(pose1, pose2, tolerance):
+    """
+    比较两个位姿，姿态按旋转矩阵比较，不受欧拉角多值影响
+    @param tolerance (位置容差 mm, 角度容差 °)
+    """
+    T1, T2 = pose_to_matrix(pose1), pose_to_matrix(pose2)
+    if np.linalg.norm(T1[:3, 3] - T2[:3, 3]) > tolerance[0]:
+        return False
+    cos_angle = (np.trace(T1[:3, :3].T @ T2[:3, :3]) - 1.0) / 2.0
+    return np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0))) <= tolerance[1]
+
+
+def joints_close(joints1, joints2, tolerance):
+    return bool(np.all(np.abs(wrap_degrees(np.subtract(joints1, joints2))) <= tolerance[1]))
+
+
+class LRUCache:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self.lock:
+            value = self.items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            if len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+    def stats(self):
+        return {"size": len(self.items), "hits": self.hits, "misses": self.misses}
+
+
+class FR5Kinematics:
+    def __init__(self, dh=None, compensation=None, joint_offsets=None, joint_limits=FR5_JOINT_LIMITS,
+                 quantum=1e-4, cache_size=4096):
+        """
+        @param dh DH 参数 {d1,a2,a3,d4,d5,d6}(mm)，未给出的项使用 FR5 标称值
+        @param compensation DH 补偿值 [cmpstD1,cmpstA2,cmpstA3,cmpstD4,cmpstD5,cmpstD6](mm)，即 GetDHCompensation 的返回值
+        @param joint_offsets 关节零位与 DH 零位之差 [°]，默认全 0
+        @param joint_limits 关节限位 [[min, max]*6] [°]
+        @param quantum 缓存键的量化步长，单位 [mm][°]
+        @param cache_size 正解、逆解缓存各自的最大条数
+        """
+        dh = dict(FR5_DH, **(dh or {}))
+        if compensation is not None:
+            for key, value in zip(DH_COMPENSATION_KEYS, compensation):
+                dh[key] += float(value)
+        self.dh = dh
+        self.a = np.array([0.0, dh["a2"], dh["a3"], 0.0, 0.0, 0.0])
+        self.d = np.array([dh["d1"], 0.0, 0.0, dh["d4"], dh["d5"], dh["d6"]])
+        self.alpha = np.array(DH_ALPHA)
+        self.joint_offsets = np.radians(np.zeros(6) if joint_offsets is None else np.asarray(joint_offsets, float))
+        self.joint_limits = np.asarray(joint_limits, dtype=float)
+        self.quantum = quantum
+        self.fk_cache = LRUCache(cache_size)
+        self.ik_cache = LRUCache(cache_size)
+
+    def link_transforms(self, theta, joints=range(6)):
+        """各连杆 DH 变换 (...,len(joints),4,4)，theta 为对应关节的 DH 角(rad)"""
+        joints = list(joints)
+        a, d, alpha = self.a[joints], self.d[joints], self.alpha[joints]
+        ct, st, ca, sa = np.cos(theta), np.sin(theta), np.cos(alpha), np.sin(alpha)
+        A = np.zeros(theta.shape + (4, 4))
+        A[..., 0, 0] = ct
+        A[..., 0, 1] = -st * ca
+        A[..., 0, 2] = st * sa
+        A[..., 0, 3] = a * ct
+        A[..., 1, 0] = st
+        A[..., 1, 1] = ct * ca
+        A[..., 1, 2] = -ct * sa
+        A[..., 1, 3] = a * st
+        A[..., 2, 1] = sa
+        A[..., 2, 2] = ca
+        A[..., 2, 3] = d
+        A[..., 3, 3] = 1.0
+        return A
+
+    def flange(self, joints):
+        """关节位置 (...,6) [°] -> 末端法兰在基坐标系下的变换 (...,4,4)"""
+        A = self.link_transforms(np.radians(np.asarray(joints, dtype=float)) + self.joint_offsets)
+        T = A[..., 0, :, :]
+        for i in range(1, 6):
+            T = T @ A[..., i, :, :]
+        return T
+
+    def forward(self, joints, tool=None):
+        """
+        向量化正运动学
+        @param joints 关节位置 (N,6) 或 (6,) [°]
+        @param tool 工具坐标系 [x,y,z,rx,ry,rz]，None 为末端法兰
+        @return 工具位姿 (N,6) 或 (6,)
+        """
+        T = self.flange(joints)
+        if tool is not None:
+            T = T @ pose_to_matrix(tool)
+        return matrix_to_pose(T)
+
+    def inverse_all(self, poses, tool=None):
+        """
+        向量化逆运动学，求全部 8 组候选解(肩、腕、肘各两种构型)
+        @param poses 工具位姿 (N,6) [mm][°]
+        @return (solutions (N,8,6) [°] 已归一化到 (-180,180]，valid (N,8) 候选解存在且回代误差在容差内)，未检查关节限位
+        """
+        poses = np.atleast_2d(np.asarray(poses, dtype=float))
+        T = pose_to_matrix(poses)
+        if tool is not None:
+            T = T @ invert_transform(pose_to_matrix(tool))
+        a2, a3, d4, d6 = self.a[1], self.a[2], self.d[3], self.d[5]
+        R, p = T[:, :3, :3], T[:, :3, 3]
+
+        # 关节 1：腕心(关节 5 原点)在 z1 方向上的分量恒为 d4
+        p05 = p - d6 * R[:, :, 2]
+        r = np.hypot(p05[:, 0], p05[:, 1])
+        ratio = d4 / np.maximum(r, 1e-12)
+        valid = np.abs(ratio) <= 1.0
+        shoulder = np.arcsin(np.clip(ratio, -1.0, 1.0))
+        phi = np.arctan2(p05[:, 1], p05[:, 0])
+        theta1 = np.stack([phi + shoulder, phi + np.pi - shoulder], axis=1)  # (N,2)
+        valid = np.repeat(valid[:, None], 2, axis=1)
+
+        # 关节 5、6：R16 第三行为 [s5·c6, -s5·s6, c5]
+        z1 = np.stack([np.sin(theta1), -np.cos(theta1), np.zeros_like(theta1)], axis=-1)  # (N,2,3)
+        c5 = (np.einsum('nki,ni->nk', z1, p) - d4) / d6
+        valid = valid & (np.abs(c5) <= 1.0)
+        wrist = np.arccos(np.clip(c5, -1.0, 1.0))
+        theta5 = np.stack([wrist, -wrist], axis=2)  # (N,2,2)
+        row = np.einsum('nki,nij->nkj', z1, R)  # (N,2,3)
+        s5 = np.sin(theta5)
+        sign = np.where(s5 < 0, -1.0, 1.0)
+        theta6 = np.where(np.abs(s5) < 1e-9, 0.0,
+                          np.arctan2(-row[:, :, None, 1] * sign, row[:, :, None, 0] * sign))  # 腕部奇异时取 0
+        valid = np.repeat(valid[:, :, None], 2, axis=2)
+
+        # 关节 2、3、4：关节 2~4 轴线平行，化为平面两连杆
+        theta1_b = np.broadcast_to(theta1[:, :, None], theta5.shape)
+        T01 = self.link_transforms(theta1_b[..., None], joints=[0])[..., 0, :, :]
+        T46 = self.link_transforms(np.stack([theta5, theta6], axis=-1), joints=[4, 5])
+        T46 = T46[..., 0, :, :] @ T46[..., 1, :, :]
+        T14 = invert_transform(T01) @ T[:, None, None] @ invert_transform(T46)  # (N,2,2,4,4)
+        x, y = T14[..., 0, 3], T14[..., 1, 3]
+        c3 = (x * x + y * y - a2 * a2 - a3 * a3) / (2.0 * a2 * a3)
+        valid = valid & (np.abs(c3) <= 1.0)
+        elbow = np.arccos(np.clip(c3, -1.0, 1.0))
+        theta3 = np.stack([elbow, -elbow], axis=-1)  # (N,2,2,2)
+        theta2 = np.arctan2(y, x)[..., None] - np.arctan2(a3 * np.sin(theta3), a2 + a3 * np.cos(theta3))
+        theta234 = np.arctan2(T14[..., 1, 0], T14[..., 0, 0])[..., None]
+        theta4 = theta234 - theta2 - theta3
+        valid = np.repeat(valid[..., None], 2, axis=-1)
+
+        shape = theta3.shape
+        theta = np.stack([np.broadcast_to(theta1[:, :, None, None], shape), theta2, theta3, theta4,
+                          np.broadcast_to(theta5[..., None], shape), np.broadcast_to(theta6[..., None], shape)],
+                         axis=-1).reshape(len(poses), 8, 6)
+        solutions = wrap_degrees(np.degrees(theta - self.joint_offsets))
+        valid = valid.reshape(len(poses), 8)
+
+        # 回代检查，剔除数值误差导致的无效解
+        error = np.linalg.norm(self.flange(solutions)[..., :3, 3] - T[:, None, :3, 3], axis=-1)
+        valid &= error <= SOLUTION_TOLERANCE
+        return solutions, valid
+
+    def select(self, solutions, valid, reference=None):
+        """
+        从候选解中选取在关节限位内且离参考关节位置最近的解，关节角可按 ±360° 取值以落入限位
+        @param reference 参考关节位置 (N,6) 或 (6,)，None 为零位
+        @return (joints (N,6)，reachable (N,))，不可达的行为 NaN
+        """
+        n = solutions.shape[0]
+        reference = np.zeros((n, 6)) if reference is None else np.broadcast_to(np.asarray(reference, float), (n, 6))
+        candidates = solutions[..., None] + np.array([-360.0, 0.0, 360.0])  # (N,8,6,3)
+        lower, upper = self.joint_limits[:, 0, None], self.joint_limits[:, 1, None]
+        distance = np.abs(candidates - reference[:, None, :, None])
+        distance = np.where((candidates >= lower) & (candidates <= upper), distance, np.inf)
+        choice = np.argmin(distance, axis=-1)
+        joints = np.take_along_axis(candidates, choice[..., None], axis=-1)[..., 0]  # (N,8,6)
+        cost = np.take_along_axis(distance, choice[..., None], axis=-1)[..., 0]
+        cost = np.where(valid, np.sum(cost * cost, axis=-1), np.inf)
+        best = np.argmin(cost, axis=1)
+        reachable = np.isfinite(cost[np.arange(n), best])
+        result = joints[np.arange(n), best]
+        result[~reachable] = np.nan
+        return result, reachable
+
+    def inverse(self, poses, reference=None, tool=None):
+        """
+        向量化逆运动学
+        @param poses 工具位姿 (N,6) [mm][°]
+        @param reference 参考关节位置 (N,6) 或 (6,) [°]，选取离参考最近的解
+        @return (joints (N,6)，reachable (N,))
+        """
+        solutions, valid = self.inverse_all(poses, tool)
+        return self.select(solutions, valid, reference)
+
+    def key(self, values, tool):
+        quantized = np.rint(np.asarray(values, dtype=float) / self.quantum).astype(np.int64)
+        return tuple(quantized.tolist()), None if tool is None else tuple(tool)
+
+    def fk(self, joint_pos, tool=None):
+        """单点正运动学(经缓存)，返回 [x,y,z,rx,ry,rz]"""
+        key = self.key(joint_pos, tool)
+        pose = self.fk_cache.get(key)
+        if pose is None:
+            pose = self.forward(np.array(key[0], dtype=float) * self.quantum, tool).tolist()
+            self.fk_cache.put(key, pose)
+        return list(pose)
+
+    def ik(self, desc_pos, reference=None, tool=None):
+        """单点逆运动学，候选解经缓存，返回离 reference 最近的 [j1..j6]，不可达返回 None"""
+        key = self.key(desc_pos, tool)
+        entry = self.ik_cache.get(key)
+        if entry is None:
+            entry = self.inverse_all(np.array(key[0], dtype=float)[None] * self.quantum, tool)
+            self.ik_cache.put(key, entry)
+        joints, reachable = self.select(entry[0], entry[1], reference)
+        return joints[0].tolist() if reachable[0] else None
+
+    def clear(self):
+        self.fk_cache.clear()
+        self.ik_cache.clear()
+
+    def stats(self):
+        return {"fk_cache": self.fk_cache.stats(), "ik_cache": self.ik_cache.stats()}
+
+
+class LocalKinematics:
+    """
+    RPC 的本地运动学：按当前工具坐标系求解，返回值格式与控制器 GetForwardKin/GetInverseKin 相同，
+    本地无法求解时返回 None，由调用方改为请求控制器
+    """
+
+    def __init__(self, rpc, solver, verify=10, tolerance=(0.05, 0.05)):
+        """
+        @param solver FR5Kinematics
+        @param verify 前 verify 次本地求解同时请求控制器交叉校验，-1 表示每次都校验；结果不一致时停用本地求解
+        @param tolerance (位置容差 mm, 角度容差 °)
+        """
+        self.rpc = rpc
+        self.solver = solver
+        self.verify = verify
+        self.tolerance = tolerance
+        self.enabled = True
+        self.tools = {}  # 工具号 -> 工具坐标系 [x,y,z,rx,ry,rz]
+        self.lock = threading.Lock()
+        self.local = 0
+        self.verified = 0
+        self.mismatches = 0
+
+    def tool_offset(self):
+        """当前工具坐标系，首次使用某工具号时向控制器查询一次"""
+        tool_id = self.rpc.read_state("tool")
+        offset = self.tools.get(tool_id)
+        if offset is None:
+            ret = self.rpc.query("GetTCPOffset", 1)
+            if ret[0] != 0:
+                return None
+            offset = self.tools[tool_id] = tuple(map(float, ret[1:7]))
+        return offset
+
+    def forget_tools(self):
+        """工具坐标系被修改后调用"""
+        self.tools.clear()
+
+    def need_verify(self):
+        with self.lock:
+            if self.verify >= 0 and self.verified >= self.verify:
+                return False
+            self.verified += 1
+            return True
+
+    def mismatch(self, name, args, local, remote):
+        self.mismatches += 1
+        self.enabled = False
+        self.rpc.log_warning(f"{name}{args}: local result {local} differs from controller {remote}, "
+                             f"local kinematics disabled")
+
+    def forward_kin(self, joint_pos):
+        if not self.enabled:
+            return None
+        tool = self.tool_offset()
+        if tool is None:
+            return None
+        pose = self.solver.fk(joint_pos, tool)
+        self.local += 1
+        if self.need_verify():
+            ret = self.rpc.query("GetForwardKin", joint_pos)
+            if ret[0] == 0 and not poses_close(pose, ret[1:7], self.tolerance):
+                self.mismatch("GetForwardKin", (joint_pos,), pose, ret[1:7])
+                return ret
+        return [0] + pose
+
+    def inverse_kin(self, type, desc_pos, config):
+        """只处理绝对位姿(type=0)且参考当前关节位置(config=-1)的逆解"""
+        if not self.enabled or type != 0 or config != -1:
+            return None
+        tool = self.tool_offset()
+        if tool is None:
+            return None
+        joints = self.solver.ik(desc_pos, self.rpc.read_state("jt_cur_pos"), tool)
+        if joints is None:
+            return None  # 由控制器给出不可达的错误码
+        self.local += 1
+        if self.need_verify():
+            ret = self.rpc.query("GetInverseKin", type, desc_pos, config)
+            if ret[0] == 0 and not joints_close(joints, ret[1:7], self.tolerance):
+                self.mismatch("GetInverseKin", (type, desc_pos, config), joints, ret[1:7])
+                return ret
+        return [0] + joints
+
+    def forward_batch(self, joint_pos):
+        """
+        批量正运动学，joint_pos 为 (N,6) 数组
+        @return (desc_pos (N,6)，ok (N,))，本地无法求解或交叉校验不一致时返回 None
+        """
+        if not self.enabled:
+            return None
+        tool = self.tool_offset()
+        if tool is None:
+            return None
+        poses = self.solver.forward(joint_pos, tool)
+        self.local += len(poses)
+        if len(poses) and self.need_verify():
+            ret = self.rpc.query("GetForwardKin", joint_pos[0].tolist())
+            if ret[0] == 0 and not poses_close(poses[0], ret[1:7], self.tolerance):
+                self.mismatch("GetForwardKin", (joint_pos[0].tolist(),), poses[0].tolist(), ret[1:7])
+                return None
+        return poses, np.ones(len(poses), dtype=bool)
+
+    def inverse_batch(self, type, desc_pos, config, reference=None):
+        """
+        批量逆运动学，desc_pos 为 (N,6) 数组，只处理绝对位姿(type=0)且 config=-1
+        @param reference 参考关节位置 (N,6) 或 (6,)，None 为当前关节位置
+        @return (joint_pos (N,6)，reachable (N,))，本地无法求解或交叉校验不一致时返回 None
+        """
+        if not self.enabled or type != 0 or config != -1:
+            return None
+        tool = self.tool_offset()
+        if tool is None:
+            return None
+        if reference is None:
+            reference = self.rpc.read_state("jt_cur_pos")
+        joints, reachable = self.solver.inverse(desc_pos, reference, tool)
+        self.local += len(joints)
+        if reachable.any() and self.need_verify():
+            i = int(np.argmax(reachable))
+            ref = np.broadcast_to(np.asarray(reference, dtype=float), joints.shape)[i].tolist()
+            ret = self.rpc.query("GetInverseKinRef", type, desc_pos[i].tolist(), ref)
+            if ret[0] == 0 and not joints_close(joints[i], ret[1:7], self.tolerance):
+                self.mismatch("GetInverseKinRef", (type, desc_pos[i].tolist(), ref), joints[i].tolist(), ret[1:7])
+                return None
+        return joints, reachable
+
+    def stats(self):
+        """@return {enabled, local, verified, mismatches, fk_cache, ik_cache}"""
+        stats = {"enabled": self.enabled, "local": self.local, "verified": self.verified,
+                 "mismatches": self.mismatches}
+        stats.update(self.solver.stats())
+        return stats
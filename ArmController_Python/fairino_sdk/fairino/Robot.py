@@ -1,19 +1,27 @@
 import xmlrpc.client
+import http.client
 import os
+import random
 import socket
 import hashlib
+import importlib
+import inspect
+import itertools
 import time
 from datetime import datetime
 import logging
 from functools import wraps
 from logging.handlers import RotatingFileHandler
 from queue import Queue
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 import threading
 import struct
 import sys
 import ctypes
 from ctypes import *
 
+from .Signatures import floats, signature
+
 # from Cython.Compiler.Options import error_on_unknown_names
 
 is_init =False
@@ -144,6 +152,775 @@ class RobotStatePkg(Structure):
         ("check_sum", ctypes.c_uint16)]  # 校验和
 
 
+"""
+@brief  20004 实时状态帧解析器
+"""
+class RobotStateParser:
+    """使用 bytes.find 查找帧头、整段校验，RobotStatePkg 直接映射在可复用的接收缓冲区上，不逐字节遍历"""
+    FRAME_HEAD = b"\x5a\x5a"
+    HEAD_LEN = 5  # 帧头(2) + 帧计数(1) + 数据长度(2)
+    CHECKSUM_LEN = 2
+
+    def __init__(self, buffer_size=1024 * 1024):
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.pkg_size = sizeof(RobotStatePkg)
+        self.short_frame = bytearray(self.pkg_size)  # 帧长小于结构体时(旧版控制器)使用的补零缓冲区
+        self.start = 0  # 未解析数据起始位置
+        self.end = 0  # 已接收数据结束位置
+        self.frame_count = 0
+        self.checksum_errors = 0
+        self.dropped_bytes = 0
+
+    def reset(self):
+        """丢弃缓冲区中的全部数据，重连后调用"""
+        self.start = 0
+        self.end = 0
+
+    def recv_from(self, sock):
+        """从套接字接收数据追加到缓冲区尾部，返回接收字节数"""
+        if self.end == len(self.buffer):
+            self.compact()
+            if self.end == len(self.buffer):  # 缓冲区满且没有完整帧，整体丢弃
+                self.dropped_bytes += self.end
+                self.reset()
+        recvbyte = sock.recv_into(self.view[self.end:])
+        self.end += recvbyte
+        return recvbyte
+
+    def feed(self, data):
+        """追加一段已接收的数据(用于测试及回放)，返回追加字节数"""
+        size = len(data)
+        if self.end + size > len(self.buffer):
+            self.compact()
+            if self.end + size > len(self.buffer):
+                self.dropped_bytes += self.end
+                self.reset()
+                size = min(size, len(self.buffer))
+        self.view[self.end:self.end + size] = data[:size]
+        self.end += size
+        return size
+
+    def compact(self):
+        """将未解析的残余数据移动到缓冲区头部"""
+        if self.start == 0:
+            return
+        remain = self.end - self.start
+        if remain > 0:
+            self.buffer[:remain] = self.buffer[self.start:self.end]
+        self.start = 0
+        self.end = remain
+
+    def frames(self):
+        """
+        依次返回缓冲区中校验通过的状态帧
+        返回的 RobotStatePkg 直接映射在接收缓冲区上，仅在下一次 recv_from/feed 前有效，需要保存时请拷贝
+        """
+        buf = self.buffer
+        view = self.view
+        find = buf.find
+        head = self.FRAME_HEAD
+        end = self.end
+        pos = self.start
+        while True:
+            pos = find(head, pos, end)
+            if pos < 0:
+                # 末尾单个 0x5A 可能是被拆开的帧头，保留到下次接收
+                pos = end - 1 if end > self.start and buf[end - 1] == 0x5A else end
+                break
+            if pos + self.HEAD_LEN > end:
+                break
+            length = buf[pos + 3] | (buf[pos + 4] << 8)
+            body_end = pos + self.HEAD_LEN + length
+            frame_len = self.HEAD_LEN + length + self.CHECKSUM_LEN
+            if frame_len > len(buf):  # 长度字段异常，为误匹配的帧头
+                pos += 1
+                continue
+            if pos + frame_len > end:  # 帧未接收完整
+                break
+            checkdata = buf[body_end] | (buf[body_end + 1] << 8)
+            if sum(view[pos:body_end]) & 0xFFFF != checkdata:
+                self.checksum_errors += 1
+                pos += 1
+                continue
+            self.frame_count += 1
+            self.start = pos + frame_len
+            yield self.map_frame(pos, frame_len)
+            pos += frame_len
+        self.start = pos
+        self.compact()
+
+    def map_frame(self, pos, frame_len):
+        """将位于 pos 的帧映射为 RobotStatePkg"""
+        if frame_len >= self.pkg_size:
+            return RobotStatePkg.from_buffer(self.buffer, pos)
+        self.short_frame[:frame_len] = self.view[pos:pos + frame_len]
+        self.short_frame[frame_len:] = bytes(self.pkg_size - frame_len)
+        return RobotStatePkg.from_buffer(self.short_frame)
+
+
+"""
+@brief  机器人状态快照存储
+"""
+class RobotStateStore:
+    """三缓冲状态存储，槽位预分配，写入时不再分配对象；读取端通过序号校验得到一致的快照，无需加锁"""
+    SLOT_NUM = 3
+
+    def __init__(self, log_error=None):
+        """@param log_error 发布回调抛出异常时的日志函数，如 RPC.log_error"""
+        self.slots = [RobotStatePkg() for _ in range(self.SLOT_NUM)]
+        self.pkg_size = sizeof(RobotStatePkg)
+        self.latest = (0, 0.0, self.slots[0])  # (序号, 接收时间戳, 槽位)，整体替换保证原子性
+        self.cond = threading.Condition()  # 每发布一帧唤醒等待者
+        self.closed = False
+        self.listeners = ()  # 发布回调，写时复制，状态线程中遍历无需加锁
+        self.log_error = log_error
+
+    def publish(self, pkg):
+        """拷贝一帧状态到下一个槽位并发布，返回该槽位"""
+        seq = self.latest[0] + 1
+        slot = self.slots[seq % self.SLOT_NUM]
+        ctypes.memmove(ctypes.addressof(slot), ctypes.addressof(pkg), self.pkg_size)
+        stamp = time.time()
+        with self.cond:
+            self.latest = (seq, stamp, slot)
+            self.cond.notify_all()
+        self.notify(seq, stamp, slot)
+        return slot
+
+    def notify(self, seq, stamp, slot):
+        # 单个回调出错不影响其余回调，也不中断状态线程
+        for listener in self.listeners:
+            try:
+                listener(seq, stamp, slot)
+            except Exception as ex:
+                if self.log_error is not None:
+                    self.log_error(f"State listener failed: {ex}")
+
+    def add_listener(self, callback):
+        """
+        注册发布回调 callback(seq, stamp, slot)，在状态线程中调用，应尽快返回
+        关闭时以 slot=None 调用一次
+        """
+        with self.cond:
+            self.listeners = self.listeners + (callback,)
+
+    def remove_listener(self, callback):
+        with self.cond:
+            self.listeners = tuple(l for l in self.listeners if l is not callback)
+
+    def close(self):
+        """唤醒全部等待者并使其返回 False"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        seq, stamp, slot = self.latest
+        self.notify(seq, stamp, None)
+
+    def wait_until(self, predicate, timeout=None, after_seq=None):
+        """
+        等待直到 predicate(最新状态) 为真，每发布一帧重新判断一次
+        @param after_seq 只接受序号大于该值的状态帧，None 表示当前状态即可
+        @return True-条件满足，False-超时或已关闭
+        """
+        def ready():
+            if self.closed:
+                return True
+            seq, stamp, slot = self.latest
+            if after_seq is not None and seq <= after_seq:
+                return False
+            return predicate(slot)
+
+        # 判断在锁内进行，写入端无法发布新帧，也就不会覆盖正在读取的槽位
+        with self.cond:
+            result = self.cond.wait_for(ready, timeout)
+            return bool(result) and not self.closed
+
+    def read(self, *names):
+        """
+        读取最新状态中的字段，数组字段转为 list；只拷贝所需字段，校验方式同 snapshot
+        @return 单个字段返回其值，多个字段返回来自同一帧的值列表
+        """
+        while True:
+            seq, stamp, slot = self.latest
+            values = [getattr(slot, name) for name in names]
+            values = [list(v) if isinstance(v, ctypes.Array) else v for v in values]
+            if self.latest[0] - seq < self.SLOT_NUM - 1:
+                return values[0] if len(values) == 1 else values
+
+    def snapshot(self):
+        """返回 (序号, 接收时间戳, RobotStatePkg拷贝)，拷贝期间槽位被覆盖时自动重试"""
+        while True:
+            seq, stamp, slot = self.latest
+            pkg = RobotStatePkg.from_buffer_copy(slot)
+            # 写入端最多领先两帧时才会回到同一槽位
+            if self.latest[0] - seq < self.SLOT_NUM - 1:
+                return seq, stamp, pkg
+
+
+class ProgramDoneCondition:
+    """
+    wait_program_done 的判断条件，须按状态帧顺序调用
+    ProgramRun 返回后控制器可能仍发送若干停止帧才进入运行状态，只有在运行状态之后的停止帧才可直接判定结束
+    """
+
+    def __init__(self, stop_dwell):
+        self.stop_dwell = stop_dwell
+        self.running = False  # 已看到运行状态
+        self.stopped_since = None  # 未看到运行状态时，本次连续停止的开始时间
+
+    def __call__(self, pkg):
+        state = pkg.program_state
+        if state == 2:
+            self.running = True
+        if state != 1:
+            self.stopped_since = None
+            return False
+        if self.running:
+            return True
+        now = time.monotonic()
+        if self.stopped_since is None:
+            self.stopped_since = now
+        return now - self.stopped_since >= self.stop_dwell
+
+
+"""
+@brief  XML-RPC 长连接传输层
+"""
+class PooledTransport(xmlrpc.client.Transport):
+    """
+    HTTP/1.1 keep-alive 连接池，多线程共用一个 ServerProxy 时每次调用独占一个连接
+    连接开启 TCP_NODELAY，并按指令名统计调用耗时
+    """
+    POOL_SIZE = 4  # 最多保留的空闲连接数
+    RETRY_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+    def __init__(self, pool_size=POOL_SIZE, use_builtin_types=False, timeout=None):
+        super().__init__(use_builtin_types=use_builtin_types)
+        self.pool_size = pool_size
+        self.timeout = timeout  # 连接与收发超时(s)，None 使用全局默认
+        self.idle = []  # [(host, HTTPConnection)]
+        self.pool_lock = threading.Lock()
+        self.stats = {}  # 指令名 -> [次数, 失败次数, 总耗时, 最大耗时, 最近耗时]
+        self.stats_lock = threading.Lock()
+        self.connect_count = 0
+        self.supervisor = None  # ConnectionSupervisor，发送前检查连接状态并报告连接故障
+
+    def acquire(self, host):
+        """取一个空闲连接，没有则新建，返回 (连接, 是否复用)"""
+        with self.pool_lock:
+            for i in range(len(self.idle) - 1, -1, -1):
+                if self.idle[i][0] == host:
+                    return self.idle.pop(i)[1], True
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        if self.timeout is None:
+            conn = http.client.HTTPConnection(chost)
+        else:
+            conn = http.client.HTTPConnection(chost, timeout=self.timeout)
+        conn.connect()
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.pool_lock:
+            self.connect_count += 1
+        return conn, False
+
+    def release(self, host, conn):
+        with self.pool_lock:
+            if len(self.idle) < self.pool_size:
+                self.idle.append((host, conn))
+                return
+        conn.close()
+
+    def request(self, host, handler, request_body, verbose=False):
+        if self.supervisor is not None:
+            self.supervisor.gate()
+        method = self.method_name(request_body)
+        start = time.perf_counter()
+        ok = False
+        try:
+            for attempt in range(2):
+                conn, reused = self.acquire(host)
+                try:
+                    result = self.request_on(conn, host, handler, request_body, verbose)
+                    ok = True
+                    return result
+                except xmlrpc.client.Fault:
+                    ok = True
+                    raise
+                except self.RETRY_ERRORS:
+                    # 空闲连接可能已被控制器关闭，丢弃全部空闲连接后用新连接重发一次
+                    conn.close()
+                    if not reused or attempt:
+                        raise
+                    self.close()
+                except BaseException:
+                    conn.close()
+                    raise
+        except OSError as ex:
+            if self.supervisor is not None:
+                self.supervisor.lost(ConnectionSupervisor.CHANNEL_CMD, ex)
+            raise
+        finally:
+            self.record(method, time.perf_counter() - start, ok)
+
+    def request_on(self, conn, host, handler, request_body, verbose):
+        conn.set_debuglevel(1 if verbose else 0)
+        headers = dict(self._headers + self._extra_headers)
+        headers["Content-Type"] = "text/xml"
+        headers["User-Agent"] = self.user_agent
+        conn.request("POST", handler, request_body, headers)
+        resp = conn.getresponse()
+        data = resp.read()
+        if resp.status != 200:
+            conn.close()
+            raise xmlrpc.client.ProtocolError(host + handler, resp.status, resp.reason, dict(resp.getheaders()))
+        if resp.will_close:
+            conn.close()
+        else:
+            self.release(host, conn)
+        self.verbose = verbose
+        p, u = self.getparser()
+        p.feed(data)
+        p.close()
+        return u.close()
+
+    def pipeline(self, host, handler, request_bodies, verbose=False):
+        """
+        在同一连接上连续发送多个请求后按顺序读取响应(HTTP/1.1 pipelining)
+        @return 与请求顺序一致的结果列表，出错的调用为 xmlrpc.client.Fault；
+                控制器中途关闭连接时，剩余请求逐个重发
+        """
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        headers = dict(self._headers + self._extra_headers)
+        headers["Content-Type"] = "text/xml"
+        headers["User-Agent"] = self.user_agent
+        header_lines = "".join("%s: %s\r\n" % item for item in headers.items())
+        requests = [("POST %s HTTP/1.1\r\nHost: %s\r\n%sContent-Length: %d\r\n\r\n"
+                     % (handler, chost, header_lines, len(body))).encode("latin-1") + body
+                    for body in request_bodies]
+
+        if self.supervisor is not None:
+            self.supervisor.gate()
+        start = time.perf_counter()
+        try:
+            conn, reused = self.acquire(host)
+        except OSError as ex:
+            if self.supervisor is not None:
+                self.supervisor.lost(ConnectionSupervisor.CHANNEL_CMD, ex)
+            raise
+        results = []
+        try:
+            conn.sock.sendall(b"".join(requests))
+            stream = PipelineStream(conn.sock.makefile("rb"))
+            will_close = False
+            while len(results) < len(requests) and not will_close:
+                resp = http.client.HTTPResponse(stream)
+                resp.begin()
+                data = resp.read()
+                if resp.status != 200:
+                    raise xmlrpc.client.ProtocolError(host + handler, resp.status, resp.reason, dict(resp.getheaders()))
+                will_close = resp.will_close
+                self.verbose = verbose
+                p, u = self.getparser()
+                p.feed(data)
+                p.close()
+                try:
+                    results.append(u.close())
+                except xmlrpc.client.Fault as fault:
+                    results.append(fault)
+            if will_close:
+                conn.close()
+            else:
+                self.release(host, conn)
+        except BaseException as ex:
+            conn.close()
+            if isinstance(ex, OSError) and self.supervisor is not None:
+                self.supervisor.lost(ConnectionSupervisor.CHANNEL_CMD, ex)
+            raise
+        finally:
+            self.record("pipeline", time.perf_counter() - start, len(results) == len(requests))
+
+        for body in request_bodies[len(results):]:
+            try:
+                results.append(self.request(host, handler, body, verbose))
+            except xmlrpc.client.Fault as fault:
+                results.append(fault)
+        return results
+
+    @staticmethod
+    def method_name(request_body):
+        start = request_body.find(b"<methodName>")
+        end = request_body.find(b"</methodName>", start)
+        if start < 0 or end < 0:
+            return "?"
+        return request_body[start + 12:end].decode("ascii", "replace")
+
+    def record(self, method, elapsed, ok):
+        with self.stats_lock:
+            stat = self.stats.get(method)
+            if stat is None:
+                stat = self.stats[method] = [0, 0, 0.0, 0.0, 0.0]
+            stat[0] += 1
+            if not ok:
+                stat[1] += 1
+            stat[2] += elapsed
+            stat[3] = max(stat[3], elapsed)
+            stat[4] = elapsed
+
+    def latency_stats(self, reset=False):
+        """返回 {指令名: {count, errors, avg_ms, max_ms, last_ms}}"""
+        with self.stats_lock:
+            result = {name: {"count": s[0], "errors": s[1], "avg_ms": s[2] * 1000 / s[0],
+                             "max_ms": s[3] * 1000, "last_ms": s[4] * 1000}
+                      for name, s in self.stats.items()}
+            if reset:
+                self.stats = {}
+        return result
+
+    def close(self):
+        with self.pool_lock:
+            idle, self.idle = self.idle, []
+        for host, conn in idle:
+            conn.close()
+
+
+class PipelineStream:
+    """多个 HTTPResponse 共用同一个读缓冲，单个响应读完时不关闭底层文件"""
+
+    def __init__(self, fp):
+        self.fp = fp
+
+    def makefile(self, mode, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self.fp, name)
+
+    def close(self):
+        pass
+
+
+"""
+@brief  连接监管
+"""
+class RobotDisconnected(Exception):
+    """与控制器的连接中断且按重连策略放弃本次指令，由 xmlrpc_timeout 转换为 RobotError.ERROR_RECONN"""
+
+
+class ConnectionSupervisor:
+    """
+    统一管理 20003 指令端口与 20004 状态端口的重连：通道故障时在独立线程中按带抖动的指数退避重连，
+    不占用状态线程与调用线程；状态变化以事件通知监听者，并统计每次重连耗时。
+    重连期间的指令按策略等待恢复(POLICY_WAIT)或立即失败(POLICY_FAIL)，不再轮询 reconnect_flag。
+    """
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+    DISCONNECTED = "disconnected"  # 达到最大重连次数
+    CLOSED = "closed"
+    CHANNEL_CMD = "cmd"  # 20003 XML-RPC
+    CHANNEL_STATE = "state"  # 20004 实时状态
+    POLICY_WAIT = "wait"
+    POLICY_FAIL = "fail"
+    BACKOFF_BASE = 0.1  # 首次重试间隔(s)
+    BACKOFF_MAX = 5.0  # 最大重试间隔(s)
+    MAX_ATTEMPTS = 1000
+
+    def __init__(self, rpc, policy=POLICY_WAIT, command_timeout=None, backoff_base=BACKOFF_BASE,
+                 backoff_max=BACKOFF_MAX, max_attempts=MAX_ATTEMPTS):
+        """
+        @param rpc RPC 实例
+        @param policy 重连期间的指令策略 POLICY_WAIT-等待恢复，POLICY_FAIL-立即返回 ERROR_RECONN
+        @param command_timeout POLICY_WAIT 时指令最长等待时间(s)，None 表示一直等待
+        """
+        self.rpc = rpc
+        self.policy = policy
+        self.command_timeout = command_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.state = self.CONNECTED
+        self.lost_channels = set()
+        self.cond = threading.Condition()
+        self.listeners = ()  # 事件回调，写时复制
+        self.lost_at = 0.0
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.last_reconnect_time = 0.0
+        self.max_reconnect_time = 0.0
+        self.total_reconnect_time = 0.0
+
+    def add_listener(self, callback):
+        """
+        注册状态事件回调 callback(state, info)，在监管线程或报告故障的线程中调用，应尽快返回
+        info：reconnecting 含 channel/error/attempt/delay，connected 含 reconnect_time/attempts
+        """
+        with self.cond:
+            self.listeners = self.listeners + (callback,)
+
+    def remove_listener(self, callback):
+        with self.cond:
+            self.listeners = tuple(l for l in self.listeners if l is not callback)
+
+    def publish(self, state, **info):
+        for listener in self.listeners:
+            try:
+                listener(state, info)
+            except Exception as ex:
+                self.rpc.log_error(f"Connection listener failed: {ex}")
+
+    def lost(self, channel, error=None):
+        """报告通道故障，未在重连时启动监管线程，立即返回"""
+        with self.cond:
+            if self.state == self.CLOSED:
+                return
+            self.lost_channels.add(channel)
+            if self.state == self.RECONNECTING:
+                return
+            self.state = self.RECONNECTING
+            self.lost_at = time.perf_counter()
+            self.rpc.reconnect_flag = True
+        self.rpc.log_warning(f"Connection lost on {channel} channel: {error}")
+        self.publish(self.RECONNECTING, channel=channel, error=error, attempt=0, delay=0.0)
+        thread = threading.Thread(target=self.run, name="fairino-reconnect")
+        thread.daemon = True
+        thread.start()
+
+    def backoff(self, attempt):
+        """第 attempt 次失败后的等待时间：指数增长并加入抖动，避免多个客户端同时重连"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** min(attempt - 1, 30)))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def run(self):
+        attempt = 0
+        while True:
+            with self.cond:
+                if self.state == self.CLOSED:
+                    return
+                channels = set(self.lost_channels)
+            error = self.try_connect(channels)
+            if error is None:
+                self.connected(attempt + 1)
+                return
+            attempt += 1
+            self.failed_attempts += 1
+            if attempt >= self.max_attempts:
+                print("已达到最大重连次数，连接失败")
+                self.rpc.SDK_state = False
+                self.finish(self.DISCONNECTED)
+                self.publish(self.DISCONNECTED, attempts=attempt, error=error)
+                return
+            delay = self.backoff(attempt)
+            self.publish(self.RECONNECTING, channel=",".join(sorted(channels)), error=error, attempt=attempt, delay=delay)
+            with self.cond:
+                self.cond.wait_for(lambda: self.state == self.CLOSED, delay)
+
+    def try_connect(self, channels):
+        """重新连接故障通道，返回 None-成功，否则为错误"""
+        rpc = self.rpc
+        if self.CHANNEL_STATE in channels:
+            if rpc.sock_cli_state:
+                rpc.sock_cli_state.close()  # 关闭旧的 socket
+                rpc.sock_cli_state = None
+            if not rpc.connect_to_robot():
+                return ConnectionError("realtime port %d unreachable" % rpc.ROBOT_REALTIME_PORT)
+            with self.cond:
+                self.lost_channels.discard(self.CHANNEL_STATE)
+        # 指令端口用独立的短超时连接探测，不影响正在等待的指令
+        probe = PooledTransport(0, timeout=rpc.CONNECT_TIMEOUT)
+        try:
+            xmlrpc.client.ServerProxy("http://%s:%d" % (rpc.ip_address, rpc.ROBOT_CMD_PORT),
+                                      transport=probe).GetControllerIP()
+        except Exception as ex:
+            return ex
+        finally:
+            probe.close()
+        return None
+
+    def connected(self, attempts):
+        elapsed = time.perf_counter() - self.lost_at
+        self.rpc.transport.close()  # 丢弃中断前建立的空闲连接
+        RPC.is_conect = True
+        self.rpc.SDK_state = True
+        self.reconnects += 1
+        self.last_reconnect_time = elapsed
+        self.max_reconnect_time = max(self.max_reconnect_time, elapsed)
+        self.total_reconnect_time += elapsed
+        self.finish(self.CONNECTED)
+        self.rpc.log_info(f"Reconnected in {elapsed:.3f}s after {attempts} attempt(s).")
+        self.publish(self.CONNECTED, reconnect_time=elapsed, attempts=attempts)
+
+    def finish(self, state):
+        with self.cond:
+            if self.state == self.CLOSED:
+                return
+            self.state = state
+            self.lost_channels.clear()
+            self.rpc.reconnect_flag = False
+            self.cond.notify_all()
+
+    def wait_connected(self, timeout=None):
+        """等待重连结束，返回 True-已连接，False-超时、重连失败或已关闭"""
+        with self.cond:
+            self.cond.wait_for(lambda: self.state != self.RECONNECTING, timeout)
+            return self.state == self.CONNECTED
+
+    def gate(self):
+        """指令发送前调用：已连接时立即返回，否则按策略等待或抛出 RobotDisconnected"""
+        state = self.state
+        if state == self.CONNECTED:
+            return
+        if state == self.RECONNECTING and self.policy == self.POLICY_WAIT and self.wait_connected(self.command_timeout):
+            return
+        raise RobotDisconnected(self.state)
+
+    def close(self):
+        with self.cond:
+            self.state = self.CLOSED
+            self.rpc.reconnect_flag = False
+            self.cond.notify_all()
+        self.publish(self.CLOSED)
+
+    def stats(self):
+        """@return {state, reconnects, failed_attempts, last_s, max_s, avg_s}"""
+        return {
+            "state": self.state,
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "last_s": self.last_reconnect_time,
+            "max_s": self.max_reconnect_time,
+            "avg_s": self.total_reconnect_time / self.reconnects if self.reconnects else 0.0,
+        }
+
+
+"""
+@brief  批量指令提交
+"""
+class RobotBatch:
+    """
+    录制 SDK 指令，submit() 时一次提交：控制器支持 system.multicall 时一个请求完成，
+    否则在同一连接上流水线发送。指令在控制器上按顺序逐条执行，某条失败不影响后续指令。
+    只能录制直接返回 XML-RPC 结果的指令(设置类指令)，需要处理返回值或读取本地状态的接口会抛出 ValueError。
+    """
+
+    def __init__(self, rpc):
+        self.rpc = rpc
+        self.calls = []  # [(方法名, 参数)]
+        self.pending = []  # 与 calls 对应的 BatchResult
+        self.results = None
+        self.robot = BatchRecorder(self)
+
+    def __getattr__(self, name):
+        attr = getattr(self.rpc, name)
+        func = getattr(type(self.rpc), name, None)
+        if not hasattr(func, "__wrapped__"):  # 只录制带 @log_call/@xmlrpc_timeout 的 SDK 指令
+            return attr
+        func = inspect.unwrap(func)
+
+        def record(*args, **kwargs):
+            num = len(self.calls)
+            try:
+                result = func(self, *args, **kwargs)
+            except Exception as ex:
+                del self.calls[num:], self.pending[num:]
+                raise ValueError(f"{name} 不支持批量提交") from ex
+            if len(self.calls) != num + 1 or result is not self.pending[num]:
+                del self.calls[num:], self.pending[num:]
+                raise ValueError(f"{name} 不支持批量提交")
+            return result
+
+        record.__name__ = name
+        return record
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.submit()
+
+    def __len__(self):
+        return len(self.calls)
+
+    def command(self, name, *args):
+        """录制 RPC.command 发送的指令"""
+        sig = signature(name)
+        return getattr(self.robot, sig.name)(*sig.coerce(*args))
+
+    def query(self, name, *args):
+        """查询类指令同样只录制；调用方解析返回值时失败，由 record() 撤销并报告不支持批量提交"""
+        return self.command(name, *args)
+
+    def submit(self):
+        """
+        提交全部已录制的指令
+        @return 与录制顺序一致的返回值列表，错误码或 xmlrpc.client.Fault
+        """
+        calls, self.calls = self.calls, []
+        pending, self.pending = self.pending, []
+        if not calls:
+            self.results = []
+            return self.results
+        if RPC.is_conect == False:
+            results = [RobotError.ERR_RPC_ERROR] * len(calls)
+        else:
+            self.rpc.log_info(f"Submitting batch of {len(calls)} calls: {', '.join(name for name, params in calls)}.")
+            results = None
+            if self.rpc.multicall_supported is not False:
+                try:
+                    results = self.multicall(calls)
+                    self.rpc.multicall_supported = True
+                except xmlrpc.client.Fault:
+                    self.rpc.multicall_supported = False
+            if results is None:
+                results = self.pipeline(calls)
+        for result, value in zip(pending, results):
+            result.value = value
+        self.results = results
+        return results
+
+    def multicall(self, calls):
+        entries = self.rpc.robot.system.multicall(
+            [{"methodName": name, "params": list(params)} for name, params in calls])
+        return [entry[0] if isinstance(entry, list)
+                else xmlrpc.client.Fault(entry["faultCode"], entry["faultString"])
+                for entry in entries]
+
+    def pipeline(self, calls):
+        bodies = [xmlrpc.client.dumps(params, name, encoding="utf-8").encode("utf-8", "xmlcharrefreplace")
+                  for name, params in calls]
+        host = "%s:%d" % (self.rpc.ip_address, self.rpc.ROBOT_CMD_PORT)
+        results = self.rpc.transport.pipeline(host, "/RPC2", bodies)
+        # 与 ServerProxy 相同，单个返回值从元组中取出
+        return [result[0] if isinstance(result, tuple) and len(result) == 1 else result for result in results]
+
+
+class BatchRecorder:
+    """代替 ServerProxy 记录 XML-RPC 调用"""
+
+    def __init__(self, batch):
+        self.batch = batch
+
+    def __getattr__(self, name):
+        def call(*params):
+            result = BatchResult(name)
+            self.batch.calls.append((name, params))
+            self.batch.pending.append(result)
+            return result
+
+        return call
+
+
+class BatchResult:
+    """批量指令的返回值，submit() 之后 value 有效"""
+
+    def __init__(self, name):
+        self.name = name
+        self.value = None
+
+    def __repr__(self):
+        return f"BatchResult({self.name}={self.value!r})"
+
+
 class BufferedFileHandler(RotatingFileHandler):
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False):
         super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
@@ -179,14 +956,199 @@ class LogWriterThread(threading.Thread):
             self.log_handler.flush()
 
 
-def calculate_file_md5(file_path):
+"""
+@brief  SDK 调用二进制跟踪
+"""
+class CallTrace:
+    """
+    预分配环形缓冲区，每次 SDK 调用写入一条定长记录，缓冲区满后覆盖最旧的记录
+    记录格式 RECORD：方法编号 uint16，调用开始时间 monotonic ns uint64，耗时 ns uint32，返回码 int32
+    """
+    RECORD = struct.Struct('<HQIi')
+    MAGIC = b'FRTRACE1'
+    METHOD_NAMES = []  # 方法编号 -> 方法名，@log_call 装饰时注册
+    DEFAULT_SIZE = 65536
+
+    def __init__(self, size=DEFAULT_SIZE):
+        self.size = size
+        self.buffer = bytearray(self.RECORD.size * size)
+        self.counter = itertools.count()  # next() 在 GIL 下是原子的，多线程写入无需加锁
+        self.written = 0
+        self.written_lock = threading.Lock()  # 只保护 written 单调递增
+
+    @classmethod
+    def register(cls, name):
+        cls.METHOD_NAMES.append(name)
+        return len(cls.METHOD_NAMES) - 1
+
+    def add(self, method_id, start_ns, duration_ns, code):
+        index = next(self.counter)
+        self.RECORD.pack_into(self.buffer, (index % self.size) * self.RECORD.size,
+                              method_id, start_ns, min(duration_ns, 0xFFFFFFFF), code)
+        with self.written_lock:
+            if index >= self.written:
+                self.written = index + 1
+
+    def records(self):
+        """
+        按时间顺序返回 [(方法名, 开始时间ns, 耗时ns, 返回码)]
+        尽力读取：有其它线程正在写入时，编号较小但尚未写完的槽位可能仍是旧记录
+        """
+        written = self.written
+        start = max(0, written - self.size)
+        result = []
+        for index in range(start, written):
+            method_id, start_ns, duration_ns, code = self.RECORD.unpack_from(
+                self.buffer, (index % self.size) * self.RECORD.size)
+            result.append((self.METHOD_NAMES[method_id], start_ns, duration_ns, code))
+        return result
+
+    def dump(self, file_path):
+        """
+        写入二进制文件：MAGIC，方法名表(uint16 个数 + 每项 uint8 长度与 utf-8 名称)，
+        uint32 记录数，按时间顺序的记录
+        """
+        written = self.written
+        count = min(written, self.size)
+        with open(file_path, 'wb') as file:
+            file.write(self.MAGIC)
+            file.write(struct.pack('<H', len(self.METHOD_NAMES)))
+            for name in self.METHOD_NAMES:
+                data = name.encode('utf-8')
+                file.write(struct.pack('<B', len(data)) + data)
+            file.write(struct.pack('<I', count))
+            view = memoryview(self.buffer)
+            head = (written % self.size) * self.RECORD.size
+            if written >= self.size:
+                file.write(view[head:])
+            file.write(view[:head])
+        return count
+
+
+class CallArgs:
+    """延迟格式化调用参数，只有日志记录真正输出时才生成字符串"""
+    __slots__ = ('args', 'kwargs')
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        args_str = ', '.join(map(repr, self.args))
+        if not self.kwargs:
+            return args_str
+        return args_str + "," + ', '.join([f"{key}={value}" for key, value in self.kwargs.items()])
+
+
+FILE_CHUNK_SIZE = 4 * 1024 * 1024  # 文件读取/发送块大小
+file_md5_cache = {}  # (绝对路径, 大小, mtime_ns) -> md5
+
+
+def calculate_file_md5(file_path, use_cache=False):
+    """
+    计算文件MD5，读入可复用缓冲区，不为每块分配新对象
+    @param use_cache 文件大小与修改时间未变时直接返回上次结果
+    """
     if not os.path.exists(file_path):
         raise ValueError(f"{file_path} 不存在")
+    if use_cache:
+        st = os.stat(file_path)
+        key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+        md5 = file_md5_cache.get(key)
+        if md5 is not None:
+            return md5
     md5 = hashlib.md5()
+    buffer = bytearray(FILE_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, 'rb', buffering=0) as file:
+        while n := file.readinto(buffer):
+            md5.update(view[:n])
+    md5 = md5.hexdigest()
+    if use_cache:
+        file_md5_cache[key] = md5
+    return md5
+
+
+def send_file_stream(client, head_data, file_path, progress=None):
+    """
+    发送 文件头 + 文件内容 + "/b/f"，文件内容用 socket.sendfile 发送(不支持时自动退化为 send 循环)
+    sendall/sendfile 内部处理部分写入
+    @param progress 进度回调 progress(已发送字节数, 文件总字节数)
+    @return 发送的文件字节数
+    """
+    file_size = os.path.getsize(file_path)
+    client.sendall(head_data)
+    offset = 0
     with open(file_path, 'rb') as file:
-        while chunk := file.read(8192):  # Read in 8KB chunks
-            md5.update(chunk)
-    return md5.hexdigest()
+        while offset < file_size:
+            sent = client.sendfile(file, offset, min(FILE_CHUNK_SIZE, file_size - offset))
+            if sent == 0:
+                raise ConnectionError("sendfile sent 0 bytes")
+            offset += sent
+            if progress is not None:
+                progress(offset, file_size)
+    client.sendall(b"/b/f")
+    return offset
+
+
+def recv_exact(client, view):
+    """接收直到填满 view，连接关闭返回 False"""
+    pos = 0
+    while pos < len(view):
+        n = client.recv_into(view[pos:])
+        if n == 0:
+            return False
+        pos += n
+    return True
+
+
+def recv_file_stream(client, file_path, size_digits, progress=None):
+    """
+    接收 "/f/b" + 总长度(size_digits位) + MD5(32) + 文件内容 + "/b/f"
+    文件头只解析一次，内容按块 recv_into 复用缓冲区后直接写入文件，同时计算MD5，内存占用与文件大小无关
+    @param progress 进度回调 progress(已接收字节数, 文件总字节数)
+    @return (错误码, 接收的文件字节数)，校验失败时删除文件
+    """
+    head_len = 4 + size_digits + 32
+    head = bytearray(head_len)
+    if not recv_exact(client, memoryview(head)) or head[:4] != b"/f/b":
+        return RobotError.ERR_DOWN_LOAD_FILE_FAILED, 0
+    try:
+        total_size = int(head[4:4 + size_digits])
+    except ValueError:
+        return RobotError.ERR_DOWN_LOAD_FILE_FAILED, 0
+    recv_md5 = head[4 + size_digits:head_len].decode('utf-8')
+    file_size = total_size - head_len - 4
+
+    md5 = hashlib.md5()
+    buffer = bytearray(min(FILE_CHUNK_SIZE, max(file_size, 4)))
+    view = memoryview(buffer)
+    received = 0
+    try:
+        with open(file_path, 'wb') as file_writer:
+            while received < file_size:
+                n = client.recv_into(view[:min(len(buffer), file_size - received)])
+                if n == 0:
+                    break
+                file_writer.write(view[:n])
+                md5.update(view[:n])
+                received += n
+                if progress is not None:
+                    progress(received, file_size)
+    except OSError:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        return RobotError.ERR_DOWN_LOAD_FILE_WRITE_FAILED, received
+    tail = memoryview(buffer)[:4]
+    if received < file_size or not recv_exact(client, tail) or tail != b"/b/f":
+        os.remove(file_path)
+        return RobotError.ERR_DOWN_LOAD_FILE_FAILED, received
+    if md5.hexdigest() != recv_md5:
+        client.send("FAIL".encode('utf-8'))
+        os.remove(file_path)
+        return RobotError.ERR_DOWN_LOAD_FILE_CHECK_FAILED, received
+    client.send("SUCCESS".encode('utf-8'))
+    return RobotError.ERR_SUCCESS, received
 
 
 def xmlrpc_timeout(func):
@@ -195,7 +1157,12 @@ def xmlrpc_timeout(func):
         if RPC.is_conect == False:
             return -4
         else:
-            result = func(self, *args, **kwargs)
+            # 重连期间按策略等待恢复或直接返回，不在指令内轮询 reconnect_flag
+            try:
+                self.supervisor.gate()
+                result = func(self, *args, **kwargs)
+            except RobotDisconnected:
+                return RobotError.ERROR_RECONN
             return result
 
     return wrapper
@@ -223,14 +1190,87 @@ class RobotError:
     ERR_SAVE_FILE_PATH_NOT_FOUND=-6     #/* 保存文件路径不存在 */
 
 
+# 按功能拆分、首次调用时才导入的接口：模块名 -> 接口名
+SDK_FAMILIES = {
+    "RobotForce": (  # 力控
+        "FT_GetConfig", "FT_SetConfig", "FT_Activate", "FT_SetZero", "FT_SetRCS", "FT_PdIdenCompute", "FT_PdIdenRecord",
+        "FT_PdCogIdenCompute", "FT_PdCogIdenRecord", "FT_GetForceTorqueRCS", "FT_GetForceTorqueOrigin", "FT_Guard",
+        "FT_Control", "FT_SpiralSearch", "FT_RotInsertion", "FT_LinInsertion", "FT_CalCenterStart", "FT_CalCenterEnd",
+        "FT_FindSurface", "FT_ComplianceStop", "FT_ComplianceStart", "LoadIdentifyDynFilterInit",
+        "LoadIdentifyDynVarInit", "LoadIdentifyMain", "LoadIdentifyGetResult", "EndForceDragControl",
+        "SetForceSensorDragAutoFlag", "ForceAndJointImpedanceStartStop", "GetForceAndTorqueDragState",
+        "SetForceSensorPayload", "SetForceSensorPayloadCog", "GetForceSensorPayload", "GetForceSensorPayloadCog",
+        "ForceSensorAutoComputeLoad", "ForceSensorSetSaveDataFlag", "ForceSensorComputeLoad",
+        "ImpedanceControlStartStop",
+    ),
+    "RobotConveyor": (  # 传送带
+        "ConveyorStartEnd", "ConveyorPointIORecord", "ConveyorPointARecord", "ConveyorRefPointRecord",
+        "ConveyorPointBRecord", "ConveyorIODetect", "ConveyorGetTrackData", "ConveyorTrackStart", "ConveyorTrackEnd",
+        "ConveyorSetParam", "ConveyorCatchPointComp", "ConveyorTrackMoveL", "ConveyorComDetect",
+        "ConveyorComDetectTrigger",
+    ),
+    "RobotWeld": (  # 焊接
+        "ARCStart", "ARCEnd", "WeldingSetCurrentRelation", "WeldingSetVoltageRelation", "WeldingGetCurrentRelation",
+        "WeldingGetVoltageRelation", "WeldingSetCurrent", "WeldingSetVoltage", "WeaveSetPara", "WeaveOnlineSetPara",
+        "WeaveStart", "WeaveEnd", "SetForwardWireFeed", "SetReverseWireFeed", "SetAspirated", "GetSegmentWeldPoint",
+        "SegmentWeldStart", "SegmentWeldEnd", "WireSearchStart", "WireSearchEnd", "GetWireSearchOffset",
+        "WireSearchWait", "SetPointToDatabase", "ArcWeldTraceControl", "ArcWeldTraceExtAIChannelConfig",
+        "WeaveStartSim", "WeaveEndSim", "WeaveInspectStart", "WeaveInspectEnd", "WeldingSetProcessParam",
+        "WeldingGetProcessParam", "SetAirControlExtDoNum", "SetArcStartExtDoNum", "SetWireReverseFeedExtDoNum",
+        "SetWireForwardFeedExtDoNum", "SetArcDoneExtDiNum", "SetWeldReadyExtDiNum", "SetExtDIWeldBreakOffRecover",
+        "ArcWeldTraceReplayStart", "ArcWeldTraceReplayEnd", "MultilayerOffsetTrsfToBase", "TractorEnable",
+        "TractorHoming", "TractorMoveL", "TractorMoveC", "TractorStop", "SetWireSearchExtDIONum",
+        "SetWeldMachineCtrlModeExtDoNum", "SetWeldMachineCtrlMode", "WeldingSetCheckArcInterruptionParam",
+        "WeldingGetCheckArcInterruptionParam", "WeldingSetReWeldAfterBreakOffParam",
+        "WeldingGetReWeldAfterBreakOffParam", "WeldingStartReWeldAfterBreakOff", "WeldingAbortWeldAfterBreakOff",
+        "WeaveChangeStart", "WeaveChangeEnd", "ArcWeldTraceAIChannelCurrent", "ArcWeldTraceAIChannelVoltage",
+        "ArcWeldTraceCurrentPara", "ArcWeldTraceVoltagePara", "WeldingSetVoltageGradualChangeStart",
+        "WeldingSetVoltageGradualChangeEnd", "WeldingSetCurrentGradualChangeStart", "WeldingSetCurrentGradualChangeEnd",
+        "CustomWeaveSetPara", "CustomWeaveGetPara",
+    ),
+    "RobotLaser": (  # 激光跟踪
+        "LaserSensorRecord", "LaserTrackingLaserOn", "LaserTrackingLaserOff", "LaserTrackingTrackOn",
+        "LaserTrackingTrackOff", "LaserTrackingSearchStart", "LaserTrackingSearchStop", "SetFocusCalibPoint",
+        "ComputeFocusCalib", "FocusStart", "FocusEnd", "SetFocusPosition", "LaserRecordPoint",
+        "LaserTrackingLaserOnOff", "LaserTrackingTrackOnOff", "LaserTrackingSearchStart_xyz",
+        "LaserTrackingSearchStart_point", "LaserTrackingSensorConfig", "LaserTrackingSensorSamplePeriod",
+        "LoadPosSensorDriver", "UnLoadPosSensorDriver", "LaserSensorRecord1", "LaserSensorReplay", "MoveLTR",
+        "LaserSensorRecordandReplay", "MoveToLaserRecordStart", "MoveToLaserRecordEnd", "MoveToLaserSeamPos",
+        "GetLaserSeamPos",
+    ),
+    "RobotExtAxis": (  # 扩展轴
+        "AuxServoSetParam", "AuxServoGetParam", "AuxServoEnable", "AuxServoSetControlMode", "AuxServoSetTargetPos",
+        "AuxServoSetTargetSpeed", "AuxServoSetTargetTorque", "AuxServoHoming", "AuxServoClearError",
+        "AuxServoGetStatus", "AuxServosetStatusID", "SetExDevProtocol", "GetExDevProtocol", "ExtDevSetUDPComParam",
+        "ExtDevGetUDPComParam", "ExtDevLoadUDPDriver", "ExtDevUnloadUDPDriver", "ExtDevUDPClientComReset",
+        "ExtDevUDPClientComClose", "SetRobotPosToAxis", "SetAxisDHParaConfig", "ExtAxisParamConfig",
+        "GetExAxisDriverConfig", "ExtAxisSetRefPoint", "ExtAxisComputeECoordSys", "SetRefPointInExAxisEnd",
+        "PositionorSetRefPoint", "PositionorComputeECoordSys", "ExtAxisActiveECoordSys", "ExtAxisServoOn",
+        "ExtAxisSetHoming", "ExtAxisStartJog", "ExtAxisStopJog", "SetAuxDO", "SetAuxAO", "SetAuxDIFilterTime",
+        "SetAuxAIFilterTime", "WaitAuxDI", "WaitAuxAI", "GetAuxDI", "GetAuxAI", "ExtAxisMove", "ExtAxisSyncMoveJ",
+        "ExtAxisSyncMoveL", "ExtAxisSyncMoveC", "AuxServoSetAcc", "AuxServoSetEmergencyStopAcc",
+        "AuxServoGetEmergencyStopAcc", "AuxServoGetAcc", "ExtAxisGetCoord", "SetExAxisRobotPlan",
+    ),
+    "RobotUpgrade": (  # 固件升级
+        "SoftwareUpgrade", "GetSoftwareUpgradeState", "SetEncoderUpgrade", "SetJointFirmwareUpgrade",
+        "SetCtrlFirmwareUpgrade", "SetEndFirmwareUpgrade", "JointAllParamUpgrade", "KernelUpgrade",
+        "GetKernelUpgradeResult",
+    ),
+}
+SDK_FAMILY_OF = {name: module for module, names in SDK_FAMILIES.items() for name in names}
+
+
 class RPC():
     ip_address = "192.168.58.2"
 
     logger = None
+    trace = None
+    file_transfer_stats = None  # 最近一次文件传输 {bytes, seconds, MBps}
     log_output_model = -1
     queue = Queue(maxsize=10000 * 1024)
     logging_thread = None
     is_conect = True
+    ROBOT_CMD_PORT = 20003
     ROBOT_REALTIME_PORT = 20004
     # BUFFER_SIZE = 1024 * 2
     BUFFER_SIZE = 1024 * 1024
@@ -240,48 +1280,122 @@ class RPC():
     sock_cli_state_state = False
     closeRPC_state = False
     reconnect_lock = False
-    reconnect_flag = False
+    reconnect_flag = False  # 只读状态：ConnectionSupervisor 重连期间为 True；指令由 xmlrpc_timeout 按重连策略处理，不轮询此标志
     g_sock_com_err = RobotError.ERROR_RECONN
-
-
-    def __init__(self, ip="192.168.58.2"):
+    CONNECT_TIMEOUT = 1  # XML-RPC 探测与等待第一帧状态的超时时间(s)
+    KINEMATICS_BATCH_SIZE = 500  # 批量运动学每次提交给控制器的请求数
+    families = {}  # 已导入的功能模块 -> 接口类
+    family_lock = threading.Lock()
+
+
+    def __init__(self, ip="192.168.58.2", blocking=True, state_broker=None):
+        """
+        @param ip 控制器IP
+        @param blocking True-等待连接完成后返回(默认)；False-立即返回，连接在后台建立，需要确认连接结果时调用 wait_ready
+        @param state_broker StateBroker 地址，设置后从转发端订阅实时状态，不再直接连接 20004；
+                            为 None 时使用环境变量 FAIRINO_STATE_BROKER
+        """
         self.lock = threading.Lock()  # 增加锁
         self.ip_address = ip
+        self.state_broker = state_broker if state_broker is not None else os.environ.get("FAIRINO_STATE_BROKER")
         link = 'http://' + self.ip_address + ":20003"
-        self.robot = xmlrpc.client.ServerProxy(link)#xmlrpc连接机器人20003端口，用于发送机器人指令数据帧
+        self.cmd_host = "%s:%d" % (self.ip_address, self.ROBOT_CMD_PORT)
+        self.transport = PooledTransport()#长连接池，多线程共用
+        self.robot = xmlrpc.client.ServerProxy(link, transport=self.transport)#xmlrpc连接机器人20003端口，用于发送机器人指令数据帧
+        self.multicall_supported = None#控制器是否支持 system.multicall，首次批量提交时探测
+        self.supervisor = ConnectionSupervisor(self)#20003/20004 断线重连
+        self.transport.supervisor = self.supervisor
+        self.kinematics = None#本地运动学 LocalKinematics，enable_local_kinematics 启用
 
         self.sock_cli_state = None
         self.robot_realstate_exit = False
-        self.robot_state_pkg = RobotStatePkg#机器人状态数据
+        self.state_store = RobotStateStore(self.log_error)#机器人状态快照存储
+        self.robot_state_pkg = self.state_store.slots[0]#机器人状态数据，指向最新发布的槽位，随状态线程实时变化；读取一致的数据用 read_state/snapshot
+        self.state_parser = None#实时状态帧解析器，由状态线程创建
+        self.thread = None#状态接收线程，CloseRPC 时等待其结束
 
         self.stop_event = threading.Event()  # 停止事件
-        self.connect_to_robot()
-        thread= threading.Thread(target=self.robot_state_routine_thread)#创建线程循环接收机器人状态数据
-        thread.daemon = True
-        thread.start()
-        time.sleep(1)
-        print(self.robot)
-
-
+        self.ready = Future()#连接完成后结果为 True-XML-RPC 可用，False-连接失败
+        connect_thread = threading.Thread(target=self.connect_routine, args=(link,))#后台连接，不阻塞构造
+        connect_thread.daemon = True
+        connect_thread.start()
+        if blocking:
+            self.wait_ready()
+
+    def connect_routine(self, link):
+        """后台建立连接：连接实时端口并启动状态线程，探测 XML-RPC 端口，等待第一帧状态数据后完成 ready"""
         try:
-            # 调用 XML-RPC 方法
-            socket.setdefaulttimeout(1)
-            self.robot.GetControllerIP()
-        except socket.timeout:
-            print("XML-RPC connection timed out.")
-            RPC.is_conect = False
-
-        except socket.error as e:
-            print("可能是网络故障，请检查网络连接。")
-            RPC.is_conect = False
-        except Exception as e:
-            print("An error occurred during XML-RPC call:", e)
-            RPC.is_conect = False
+            if self.state_broker:
+                self.connect_to_broker()
+                thread = threading.Thread(target=self.broker_state_routine)#从转发端接收机器人状态数据
+            else:
+                self.connect_to_robot()
+                thread= threading.Thread(target=self.robot_state_routine_thread)#创建线程循环接收机器人状态数据
+            thread.daemon = True
+            thread.start()
+            self.thread = thread
+
+            probe = PooledTransport(0, timeout=self.CONNECT_TIMEOUT)#探测使用独立的短超时连接，不修改全局默认超时
+            try:
+                xmlrpc.client.ServerProxy(link, transport=probe).GetControllerIP()
+            except socket.timeout:
+                print("XML-RPC connection timed out.")
+                RPC.is_conect = False
+            except socket.error as e:
+                print("可能是网络故障，请检查网络连接。")
+                RPC.is_conect = False
+            except Exception as e:
+                print("An error occurred during XML-RPC call:", e)
+                RPC.is_conect = False
+            finally:
+                probe.close()
+            if RPC.is_conect == False:
+                self.supervisor.lost(ConnectionSupervisor.CHANNEL_CMD, "XML-RPC probe failed")
+
+            if self.sock_cli_state_state:
+                self.state_store.wait_until(lambda pkg: True, self.CONNECT_TIMEOUT, after_seq=0)
         finally:
-            # 恢复默认超时时间
-            self.robot = None
-            socket.setdefaulttimeout(None)
-            self.robot = xmlrpc.client.ServerProxy(link)
+            self.ready.set_result(RPC.is_conect)
+
+    def wait_ready(self, timeout=None):
+        """
+        等待后台连接完成
+        @param timeout 超时时间(s)，None 表示一直等待
+        @return True-XML-RPC 可用，False-连接失败或超时
+        """
+        try:
+            return self.ready.result(timeout)
+        except FutureTimeoutError:
+            return False
+
+    @staticmethod
+    def load_family(module):
+        """导入一个功能模块并将其接口类的方法并入 RPC，返回接口类"""
+        with RPC.family_lock:
+            mixin = RPC.families.get(module)
+            if mixin is None:
+                mixin = getattr(importlib.import_module("." + module, __package__), module[len("Robot"):] + "Mixin")
+                for name in SDK_FAMILIES[module]:
+                    setattr(RPC, name, mixin.__dict__[name])
+                RPC.families[module] = mixin
+        return mixin
+
+    @classmethod
+    def load_all_families(cls):
+        """立即导入全部功能模块，用于需要完整类定义的场合(如编译、文档生成)"""
+        for module in SDK_FAMILIES:
+            cls.load_family(module)
+
+    def __getattr__(self, name):
+        # 只在常规查找失败时调用：按需导入该接口所在的功能模块
+        module = SDK_FAMILY_OF.get(name)
+        if module is None or module in RPC.families:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self.load_family(module)
+        return getattr(self, name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(SDK_FAMILY_OF))
 
     def connect_to_robot(self):
         """连接到机器人的实时端口"""
@@ -301,267 +1415,143 @@ class RPC():
             return False
         return True
 
-    def reconnect(self):
-        """自动重连"""
-        max_retries = 1000
-        retry_interval = 2  # 2秒
-        # with self.lock:  # 加锁
-        # RPC.is_conect = False
-        # print("断联")
-        self.reconnect_flag = True
-        for attempt in range(max_retries):
-            # print(f"尝试重新连接，第 {attempt + 1} 次")
-            # print(f"尝试重新连接")
-            # 确保 self.sock_cli_state 是新的 socket 对象
-            if self.sock_cli_state:
-                self.sock_cli_state.close()  # 关闭旧的 socket
-                self.sock_cli_state = None  # 重置为 None
-            # 重新初始化 XML-RPC 连接
-            # self.robot = None
-            # link = 'http://' + self.ip_address + ":20003"
-            # self.robot = xmlrpc.client.ServerProxy(link)
-            # 尝试连接
-
-            if self.connect_to_robot():
-                # print("重新连接成功")
-                self.SDK_state = True
-                self.reconnect_flag = False
-                return True
-                # 验证 XML-RPC 连接
-                # try:
-                #     time.sleep(1)
-                #     self.Mode(0)  # 调用一个简单的 XML-RPC 方法
-                #     time.sleep(1)
-                #     self.Mode(1)  # 调用一个简单的 XML-RPC 方法
-                #     time.sleep(1)
-                #     # self.robot.Mode(0)  # 调用一个简单的 XML-RPC 方法
-                #     # time.sleep(1)
-                #     # self.robot.Mode(1)  # 调用一个简单的 XML-RPC 方法
-                #     # time.sleep(1)
-                #     # self.Mode(0)  # 调用一个简单的 XML-RPC 方法
-                #     print("XML-RPC 连接验证成功")
-                #     self.reconnect_flag = False
-                #     # RPC.is_conect = True
-                #     return True
-                # except Exception as ex:
-                #     print("XML-RPC 连接验证失败:", ex)
-                #     self.SDK_state = False
-            else:
-                # print(f"重新连接失败，等待 {retry_interval} 秒后重试...")
-                time.sleep(retry_interval)
+    def connect_to_broker(self):
+        """订阅 StateBroker 转发的完整状态包，代替连接实时端口"""
+        from .StateBroker import StateSubscriber
+        try:
+            self.sock_cli_state = StateSubscriber(self.state_broker)#close() 结束接收
+            self.sock_cli_state_state = True
+        except (OSError, ValueError) as ex:
+            self.sock_cli_state = None
+            self.sock_cli_state_state = False
+            print("SDK连接状态转发端失败", ex)
+        return self.sock_cli_state_state
+
+    def broker_state_routine(self):
+        """处理转发端状态数据的线程例程，转发端断开后每秒重新订阅一次"""
+        while not self.closeRPC_state and not self.stop_event.is_set():
+            subscriber = self.sock_cli_state
+            if subscriber is None:
+                if self.stop_event.wait(1) or not self.connect_to_broker():
+                    continue
+                subscriber = self.sock_cli_state
+            try:
+                for seq, stamp, pkg in subscriber:
+                    self.robot_state_pkg = self.state_store.publish(pkg)
+            except (OSError, ValueError):
+                pass
+            if self.closeRPC_state:
+                return
+            subscriber.close()
+            self.sock_cli_state = None
+            self.sock_cli_state_state = False
 
-        print("已达到最大重连次数，连接失败")
-        self.SDK_state = False
-        return False
-        #
-        # print("自动重连机制")
-        # for i in range(1,6):
-        #     print("---")
-        #     time.sleep(2)
-        #     try:
-        #         self.sock_cli_state = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        #         self.sock_cli_state.connect((self.ip_address, self.ROBOT_REALTIME_PORT))
-        #         self.sock_cli_state_state = True
-        #     except Exception as ex:
-        #         self.sock_cli_state_state = False
-        #         print("SDK连接机器人实时端口失败", ex)
-        #     if self.sock_cli_state_state:
-        #         # self.sock_cli_state_state = True
-        #         return
-
-
-    def robot_state_routine_thread_old(self):
-        """处理机器人状态数据包的线程例程"""
+    def reconnect(self, channel=ConnectionSupervisor.CHANNEL_STATE, error=None):
+        """
+        自动重连：通知连接监管线程重连并等待结果，重连本身不在调用线程中进行
+        @return True-已恢复连接，False-达到最大重连次数或RPC已关闭
+        """
+        self.supervisor.lost(channel, error)
+        return self.supervisor.wait_connected()
+
+    def set_reconnect_policy(self, policy=ConnectionSupervisor.POLICY_WAIT, command_timeout=None):
+        """
+        设置重连期间的指令策略
+        @param policy ConnectionSupervisor.POLICY_WAIT-等待连接恢复后发送，POLICY_FAIL-立即返回 ERROR_RECONN(-8)
+        @param command_timeout POLICY_WAIT 时最长等待时间(s)，超时返回 ERROR_RECONN，None 表示一直等待
+        """
+        self.supervisor.policy = policy
+        self.supervisor.command_timeout = command_timeout
+        return 0
 
-        while not self.closeRPC_state:
-            recvbuf = bytearray(self.BUFFER_SIZE)
-            tmp_recvbuf = bytearray(self.BUFFER_SIZE)
-            state_pkg = bytearray(self.BUFFER_SIZE)
-            find_head_flag = False
-            index = 0
-            length = 0
-            tmp_len = 0
-            # if not self.sock_cli_state_state:
-            #     if not self.connect_to_robot():
-            #         return
+    def connection_stats(self):
+        """
+        连接状态与重连统计
+        @return {state, reconnects, failed_attempts, last_s, max_s, avg_s}，耗时为从发现断线到两个端口均恢复的时间(s)
+        """
+        return self.supervisor.stats()
+
+    def enable_local_kinematics(self, dh=None, compensation=None, verify=10, tolerance=(0.05, 0.05), **options):
+        """
+        启用本地运动学(需要 NumPy)：MoveJ/MoveL 等未给出目标位姿/关节时在本地求解，省去一次 GetForwardKin/GetInverseKin 往返
+        @param dh DH 参数配置 {d1,a2,a3,d4,d5,d6}(mm)，未给出的项使用 FR5 标称值
+        @param compensation DH 补偿值，None 时读取控制器 GetDHCompensation
+        @param verify 前 verify 次本地求解同时请求控制器交叉校验，结果不一致时自动停用本地求解；0-不校验，-1-每次都校验
+        @param tolerance 交叉校验容差 (位置 mm, 角度 °)
+        @param options FR5Kinematics 的其余参数：joint_offsets, joint_limits, quantum, cache_size；
+                       未给出 joint_limits 时使用控制器 GetJointSoftLimitDeg 的软限位
+        @return 错误码 成功-0  失败-错误码
+        """
+        from .Kinematics import FR5Kinematics, LocalKinematics
+        # 未连接/重连时 xmlrpc_timeout 只返回错误码(int)，不能直接解包
+        if compensation is None:
+            ret = self.GetDHCompensation()
+            if not isinstance(ret, tuple):
+                return ret
+            error, compensation = ret
+            if error != 0:
+                return error
+        if "joint_limits" not in options:
+            ret = self.GetJointSoftLimitDeg()
+            if not isinstance(ret, tuple):
+                return ret
+            error, limits = ret
+            if error != 0:
+                return error
+            options["joint_limits"] = [limits[i:i + 2] for i in range(0, 12, 2)]
+        solver = FR5Kinematics(dh, compensation, **options)
+        self.kinematics = LocalKinematics(self, solver, verify, tolerance)
+        return 0
 
+    def disable_local_kinematics(self):
+        self.kinematics = None
+        return 0
 
-            try:
-                # while not self.robot_realstate_exit:
-                while not self.robot_realstate_exit and not self.stop_event.is_set():
-                    recvbyte = self.sock_cli_state.recv_into(recvbuf)
-                    # timestamp_ms = int(datetime.now().timestamp() * 1000)
-                    # print("当前时间戳（毫秒级）:", timestamp_ms)
-                    if recvbyte <= 0:
-                        self.sock_cli_state.close()
-                        print("接收机器人状态字节 -1")
-                        # self.reconnect()
-                        return
-                    else:
-                        if tmp_len > 0:
-                            if tmp_len + recvbyte <= self.BUFFER_SIZE:
-                                recvbuf = tmp_recvbuf[:tmp_len] + recvbuf[:recvbyte]
-                                recvbyte += tmp_len
-                                tmp_len = 0
-                            else:
-                                tmp_len = 0
-
-                        for i in range(recvbyte):
-                            if format(recvbuf[i], '02X') == "5A" and not find_head_flag:
-                                if i + 4 < recvbyte:
-                                    if format(recvbuf[i+1], '02X') == "5A":
-                                        find_head_flag = True
-                                        state_pkg[0] = recvbuf[i]
-                                        index += 1
-                                        length = length | recvbuf[i + 4]
-                                        length = length << 8
-                                        length = length | recvbuf[i + 3]
-                                    else:
-                                        continue
-                                else:
-                                    tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                    break
-                            elif find_head_flag and index < length + 5:
-                                state_pkg[index] = recvbuf[i]
-                                index += 1
-                            elif find_head_flag and index >= length + 5:
-                                if i + 1 < recvbyte:
-                                    checksum = sum(state_pkg[:index])
-                                    checkdata = 0
-                                    checkdata = checkdata | recvbuf[i + 1]
-                                    checkdata = checkdata << 8
-                                    checkdata = checkdata | recvbuf[i]
-
-                                    if checksum == checkdata:
-                                        self.robot_state_pkg = RobotStatePkg.from_buffer_copy(recvbuf)
-                                        find_head_flag = False
-                                        index = 0
-                                        length = 0
-                                        i += 1
-                                    else:
-                                        # print(checksum,":",checkdata,"===========================")
-                                        self.robot_state_pkg.jt_cur_pos[0] = 0
-                                        self.robot_state_pkg.jt_cur_pos[1] = 0
-                                        self.robot_state_pkg.jt_cur_pos[2] = 0
-                                        find_head_flag = False
-                                        index = 0
-                                        length = 0
-                                        i += 1
-                                else:
-                                    print("4.2")
-                                    tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                    break
-                            else:
-                                continue
-            except Exception as ex:
-                if not self.closeRPC_state:
-                    self.sock_cli_state.close()
-                    self.sock_cli_state_state = False
-                    self.SDK_state=False
-                    # self.reconnect()
-                    # print("SDK读取机器人实时数据失败", ex)
-                    self.reconnect()
+    def kinematics_stats(self):
+        """
+        本地运动学统计
+        @return {enabled, local, verified, mismatches, fk_cache, ik_cache}，未启用时返回 None
+        """
+        return None if self.kinematics is None else self.kinematics.stats()
+
+    def solve_forward_kin(self, joint_pos):
+        """运动指令内部使用的正运动学，返回值格式与控制器 GetForwardKin 相同 [错误码, x, y, z, rx, ry, rz]"""
+        kinematics = self.kinematics
+        if kinematics is not None:
+            ret = kinematics.forward_kin(joint_pos)
+            if ret is not None:
+                return ret
+        return self.query("GetForwardKin", joint_pos)
+
+    def solve_inverse_kin(self, type, desc_pos, config=-1):
+        """运动指令内部使用的逆运动学，返回值格式与控制器 GetInverseKin 相同 [错误码, j1, ..., j6]"""
+        kinematics = self.kinematics
+        if kinematics is not None:
+            ret = kinematics.inverse_kin(type, desc_pos, config)
+            if ret is not None:
+                return ret
+        return self.query("GetInverseKin", type, desc_pos, config)
 
     def robot_state_routine_thread(self):
         """处理机器人状态数据包的线程例程"""
+        parser = RobotStateParser(self.BUFFER_SIZE)
+        self.state_parser = parser
 
         while not self.closeRPC_state:
-            recvbuf = bytearray(self.BUFFER_SIZE)
-            tmp_recvbuf = bytearray(self.BUFFER_SIZE)
-            state_pkg = bytearray(self.BUFFER_SIZE)
-            find_head_flag = False
-            index = 0
-            length = 0
-            tmp_len = 0
-            expected_length = self.BUFFER_SIZE  # 初始期望接收长度
-
+            parser.reset()
             try:
                 while not self.robot_realstate_exit and not self.stop_event.is_set():
-                    recvbyte = self.sock_cli_state.recv_into(recvbuf)
-                    # print(f"接收机器人状态字节 {recvbyte}")
-                    # print("Python 结构体大小:", sizeof(self.robot_state_pkg))
+                    recvbyte = parser.recv_from(self.sock_cli_state)
                     if recvbyte <= 0:
                         self.sock_cli_state.close()
                         print("接收机器人状态字节 -1")
                         if not self.reconnect():
                             return
+                        parser.reset()
                         continue
 
-                    # 处理临时缓冲区数据
-                    if tmp_len > 0:
-                        if tmp_len + recvbyte <= self.BUFFER_SIZE:
-                            recvbuf[:tmp_len + recvbyte] = tmp_recvbuf[:tmp_len] + recvbuf[:recvbyte]
-                            recvbyte += tmp_len
-                            tmp_len = 0
-                        else:
-                            tmp_len = 0
-
-                    i = 0
-                    while i < recvbyte:
-                        # 查找包头
-                        if format(recvbuf[i], '02X') == "5A" and not find_head_flag:
-                            if i + 4 < recvbyte and format(recvbuf[i + 1], '02X') == "5A":
-                                find_head_flag = True
-                                state_pkg[0] = recvbuf[i]
-                                index = 1
-                                length = (recvbuf[i + 4] << 8) | recvbuf[i + 3]
-
-                                #检查长度是否超过预期
-                                if length + 7 > expected_length:
-                                    expected_length = length + 7
-                                    # 需要接收更多数据
-                                    tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                    find_head_flag = False
-                                    break
-
-                                i += 1
-                            else:
-                                i += 1
-                                continue
-
-                        # 已找到包头，收集数据
-                        elif find_head_flag and index < length + 5:
-                            if i >= recvbyte:
-                                break
-
-                            state_pkg[index] = recvbuf[i]
-                            index += 1
-                            i += 1
-
-                        # 检查校验和
-                        elif find_head_flag and index >= length + 5:
-                            if i + 1 < recvbyte:
-                                checksum = sum(state_pkg[:index])
-                                checkdata = (recvbuf[i + 1] << 8) | recvbuf[i]
-
-                                if checksum == checkdata:
-                                    self.robot_state_pkg = RobotStatePkg.from_buffer_copy(state_pkg[:sizeof(self.robot_state_pkg)])
-
-                                    # print(f"@@@@@@{self.robot_state_pkg.toolCoord[0]}")
-                                    find_head_flag = False
-                                    index = 0
-                                    length = 0
-                                    expected_length = self.BUFFER_SIZE  # 重置期望长度
-                                    i += 2
-                                else:
-                                    # 校验失败处理
-                                    self.robot_state_pkg.jt_cur_pos[0] = 0
-                                    self.robot_state_pkg.jt_cur_pos[1] = 0
-                                    self.robot_state_pkg.jt_cur_pos[2] = 0
-                                    find_head_flag = False
-                                    index = 0
-                                    length = 0
-                                    i += 2
-                            else:
-                                # 数据不足，保存到临时缓冲区
-                                tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                tmp_len = recvbyte - i
-                                break
-                        else:
-                            i += 1
+                    for pkg in parser.frames():
+                        self.robot_state_pkg = self.state_store.publish(pkg)
 
             except Exception as ex:
                 if not self.closeRPC_state:
@@ -569,151 +1559,133 @@ class RPC():
                     self.sock_cli_state_state = False
                     self.SDK_state = False
                     # print("SDK读取机器人实时数据失败", ex)
-                    self.reconnect()
-
-    def robot_state_routine_thread_new(self):
-        """处理机器人状态数据包的线程例程"""
-
-        while not self.closeRPC_state:
-            # 使用动态缓冲区大小，初始为 self.BUFFER_SIZE
-            current_buffer_size = self.BUFFER_SIZE
-            recvbuf = bytearray(current_buffer_size)
-            tmp_recvbuf = bytearray(current_buffer_size)
-            state_pkg = bytearray(current_buffer_size)
-            find_head_flag = False
-            index = 0
-            length = 0
-            tmp_len = 0
-
-            try:
-                while not self.robot_realstate_exit and not self.stop_event.is_set():
-                    recvbyte = self.sock_cli_state.recv_into(recvbuf)
+                    if not self.reconnect(error=ex):
+                        return
 
-                    if recvbyte <= 0:
-                        self.sock_cli_state.close()
-                        print("接收机器人状态字节 -1")
-                        if not self.reconnect():
-                            return
-                        continue
+    def snapshot(self):
+        """
+        获取一致的机器人状态快照
+        @return (seq, stamp, pkg) seq 状态帧序号(单调递增，0表示尚未收到状态)，stamp 接收时间戳(s)，pkg RobotStatePkg拷贝
+        """
+        return self.state_store.snapshot()
+
+    def read_state(self, *names):
+        """
+        读取最新状态中的字段，如 read_state("jt_cur_pos") 或 read_state("main_code", "sub_code")
+        只拷贝所需字段，开销低于 snapshot()；多个字段来自同一帧
+        @return 单个字段返回其值(数组为 list)，多个字段返回值列表
+        """
+        return self.state_store.read(*names)
+
+    def wait_until(self, predicate, timeout=None, after_seq=None):
+        """
+        阻塞等待状态条件满足，由 20004 状态帧驱动，条件变化后一个状态周期内返回，可多线程同时等待
+        @param predicate 判断函数，参数为最新的 RobotStatePkg，返回 True 表示条件满足
+        @param timeout 超时时间(s)，None 表示一直等待
+        @param after_seq 只接受序号大于该值的状态帧(见 snapshot)，None 表示当前状态即可
+        @return True-条件满足，False-超时或RPC已关闭
+        """
+        return self.state_store.wait_until(predicate, timeout, after_seq)
+
+    def wait_motion_done(self, timeout=None):
+        """
+        等待机器人运动到位(motion_done == 1)，只判断调用之后收到的状态帧
+        @return True-运动完成，False-超时或RPC已关闭
+        """
+        return self.wait_until(lambda pkg: pkg.motion_done == 1, timeout, self.state_store.latest[0])
+
+    def wait_program_state(self, state, timeout=None):
+        """
+        等待程序运行状态
+        @param state 1-停止；2-运行；3-暂停
+        @return True-状态满足，False-超时或RPC已关闭
+        """
+        state = int(state)
+        return self.wait_until(lambda pkg: pkg.program_state == state, timeout)
+
+    def wait_program_done(self, after_seq=None, timeout=None, stop_dwell=1.0):
+        """
+        等待 ProgramRun 启动的程序运行结束，只判断序号大于 after_seq 的状态帧：
+        看到运行状态(2)之后的第一帧停止状态(1)即为结束；始终未采样到运行状态时(程序过短或启动较慢)，
+        停止状态需连续保持 stop_dwell 秒才视为结束
+        用法：seq = robot.snapshot()[0]; robot.ProgramRun(); robot.wait_program_done(seq, 10)
+        @param after_seq ProgramRun 之前 snapshot() 返回的序号，None 表示调用时的最新序号
+        @param timeout 超时时间(s)，None 表示一直等待
+        @param stop_dwell 未采样到运行状态时，停止状态需保持的时间(s)
+        @return True-程序已结束，False-超时或RPC已关闭
+        """
+        if after_seq is None:
+            after_seq = self.state_store.latest[0]
+        return self.wait_until(ProgramDoneCondition(stop_dwell), timeout, after_seq)
+
+    def wait_di(self, id, status, timeout=None):
+        """
+        等待控制箱数字输入达到指定电平
+        @param id io编号，范围 [0~15]
+        @param status 0-低电平，1-高电平
+        @return True-电平满足，False-超时、编号错误或RPC已关闭
+        """
+        id = int(id)
+        status = int(status)
+        if 0 <= id < 8:
+            return self.wait_until(lambda pkg: ((pkg.cl_dgt_input_l >> id) & 0x01) == status, timeout)
+        elif 8 <= id < 16:
+            bit = id - 8
+            return self.wait_until(lambda pkg: ((pkg.cl_dgt_input_h >> bit) & 0x01) == status, timeout)
+        return False
 
-                    # 处理临时缓冲区数据
-                    if tmp_len > 0:
-                        if tmp_len + recvbyte <= current_buffer_size:
-                            recvbuf[:tmp_len + recvbyte] = tmp_recvbuf[:tmp_len] + recvbuf[:recvbyte]
-                            recvbyte += tmp_len
-                            tmp_len = 0
-                        else:
-                            # 需要扩大接收缓冲区
-                            new_buffer_size = tmp_len + recvbyte
-                            new_recvbuf = bytearray(new_buffer_size)
-                            new_recvbuf[:tmp_len] = tmp_recvbuf[:tmp_len]
-                            new_recvbuf[tmp_len:tmp_len + recvbyte] = recvbuf[:recvbyte]
-                            recvbuf = new_recvbuf
-                            current_buffer_size = new_buffer_size
-                            recvbyte += tmp_len
-                            tmp_len = 0
-
-                    i = 0
-                    while i < recvbyte:
-                        # 查找包头
-                        if format(recvbuf[i], '02X') == "5A" and not find_head_flag:
-                            if i + 4 < recvbyte and format(recvbuf[i + 1], '02X') == "5A":
-                                find_head_flag = True
-                                state_pkg[0] = recvbuf[i]
-                                index = 1
-                                length = (recvbuf[i + 4] << 8) | recvbuf[i + 3]
-
-                                # 检查长度是否超过当前缓冲区
-                                if length + 7 > current_buffer_size:
-                                    # 需要扩大缓冲区
-                                    new_buffer_size = length + 7 + 100  # 加一些额外空间
-                                    # 扩大所有相关缓冲区
-                                    new_recvbuf = bytearray(new_buffer_size)
-                                    new_state_pkg = bytearray(new_buffer_size)
-                                    new_tmp_recvbuf = bytearray(new_buffer_size)
-
-                                    # 复制现有数据
-                                    if recvbyte - i > 0:
-                                        new_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                    tmp_recvbuf = new_tmp_recvbuf
-
-                                    recvbuf = new_recvbuf
-                                    state_pkg = new_state_pkg
-                                    current_buffer_size = new_buffer_size
-
-                                    find_head_flag = False
-                                    break  # 跳出内层循环，重新接收数据
-
-                                i += 1
-                            else:
-                                i += 1
-                                continue
-
-                        # 已找到包头，收集数据
-                        elif find_head_flag and index < length + 5:
-                            if i >= recvbyte:
-                                break
-
-                            # 检查索引是否越界
-                            if index >= len(state_pkg):
-                                # 需要扩大 state_pkg 缓冲区
-                                new_size = index + 100
-                                new_state_pkg = bytearray(new_size)
-                                new_state_pkg[:len(state_pkg)] = state_pkg
-                                state_pkg = new_state_pkg
-
-                            state_pkg[index] = recvbuf[i]
-                            index += 1
-                            i += 1
-
-                        # 检查校验和
-                        elif find_head_flag and index >= length + 5:
-                            if i + 1 < recvbyte:
-                                checksum = sum(state_pkg[:index])
-                                checkdata = (recvbuf[i + 1] << 8) | recvbuf[i]
-
-                                if checksum == checkdata:
-                                    # 确保有足够的数据来解析
-                                    if index >= 1184:  # 根据错误信息，至少需要1184字节
-                                        try:
-                                            self.robot_state_pkg = RobotStatePkg.from_buffer_copy(state_pkg[:index])
-                                            print(f"@@@@@@{self.robot_state_pkg.toolCoord[0]}")
-                                        except Exception as e:
-                                            print(f"解析数据包失败: {e}")
-                                    else:
-                                        print(f"数据包大小不足: {index} < 1184")
-
-                                    find_head_flag = False
-                                    index = 0
-                                    length = 0
-                                    i += 2
-                                else:
-                                    # 校验失败处理
-                                    print(f"校验和失败: {checksum} != {checkdata}")
-                                    self.robot_state_pkg.jt_cur_pos[0] = 0
-                                    self.robot_state_pkg.jt_cur_pos[1] = 0
-                                    self.robot_state_pkg.jt_cur_pos[2] = 0
-                                    find_head_flag = False
-                                    index = 0
-                                    length = 0
-                                    i += 2
-                            else:
-                                # 数据不足，保存到临时缓冲区
-                                if recvbyte - i > 0:
-                                    tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                break
-                        else:
-                            i += 1
+    def rpc_latency_stats(self, reset=False):
+        """
+        XML-RPC 指令耗时统计
+        @param reset 读取后清零
+        @return {指令名: {count, errors, avg_ms, max_ms, last_ms}}
+        """
+        return self.transport.latency_stats(reset)
+
+    def batch(self):
+        """
+        批量提交指令，用法：
+            with robot.batch() as b:
+                b.SetSpeed(20)
+                r = b.SetDO(1, 1)
+            print(b.results, r.value)
+        @return RobotBatch，退出 with 时自动提交，也可手动调用 submit()
+        """
+        return RobotBatch(self)
+
+    @xmlrpc_timeout
+    def command(self, name, *args):
+        """
+        按 Signatures.SDK_SIGNATURES 转换参数并发送 XML-RPC 指令 name
+        请求体只编组一次。网络错误由传输层报告给 ConnectionSupervisor，重发前 gate() 按重连策略
+        等待连接恢复或返回 ERROR_RECONN；恢复后仍失败则返回 ERR_SOCKET_COM_FAILED
+        @return 控制器返回值
+        """
+        try:
+            return self.send_request(signature(name).marshal(*args))
+        except socket.error as ex:
+            self.log_error(f"{name} failed after reconnect: {ex}")
+            return RobotError.ERR_SOCKET_COM_FAILED
+
+    def query(self, name, *args):
+        """
+        发送返回数据的查询类指令(GetXXX、ComputeXXX 等)，编组与重发方式同 command
+        @return 控制器返回值，通常为 [错误码, 数据...]，由调用方解析；不以错误码代替返回值：
+                断线按重连策略放弃或重发仍失败时抛出 RobotDisconnected，由调用方的 xmlrpc_timeout 转换为 ERROR_RECONN
+        """
+        try:
+            return self.send_request(signature(name).marshal(*args))
+        except socket.error as ex:
+            self.log_error(f"{name} failed after reconnect: {ex}")
+            raise RobotDisconnected(ex) from ex
 
-            except Exception as ex:
-                if not self.closeRPC_state:
-                    self.sock_cli_state.close()
-                    self.sock_cli_state_state = False
-                    self.SDK_state = False
-                    # print("SDK读取机器人实时数据失败", ex)
-                    self.reconnect()
+    def send_request(self, body):
+        """发送已编组的请求体；网络错误重发一次，重发前传输层的 gate() 按重连策略等待恢复或抛出 RobotDisconnected"""
+        try:
+            result = self.transport.request(self.cmd_host, "/RPC2", body)
+        except socket.error:
+            result = self.transport.request(self.cmd_host, "/RPC2", body)
+        return result[0] if len(result) == 1 else result
 
     def setup_logging(self, output_model=1, file_path="", file_num=5):
         """用于处理日志"""
@@ -779,33 +1751,65 @@ class RPC():
         return log_level
 
     def log_call(func):
-        """记录函数调用的日志操作"""
+        """记录函数调用的日志操作；未配置日志且未开启跟踪时直接调用，不做任何格式化"""
+        name = func.__name__
+        method_id = CallTrace.register(name)
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            args_str = ', '.join(map(repr, args))
-            kwargs_str = ', '.join([f"{key}={value}" for key, value in kwargs.items()])
-            if (kwargs_str) == "":
-                call_message = f"Calling {func.__name__}" + f"({args_str}" + ")."
-            else:
-                call_message = f"Calling {func.__name__}" + f"({args_str}" + "," + f"{kwargs_str})."
-
-            self.log_info(call_message)
-            result = func(self, *args, **kwargs)
-            if isinstance(result, (list, tuple)) and len(result) > 0:
-                if result[0] == 0:
-                    self.log_debug(f"{func.__name__} returned: {result}.")
-                else:
-                    self.log_error(f"{func.__name__} Error occurred. returned: {result}")
-            else:
-                if result == 0:
-                    self.log_debug(f"{func.__name__} returned: {result}.")
+            logger = self.logger
+            trace = self.trace
+            if logger is None and trace is None:
+                return func(self, *args, **kwargs)
+
+            if logger is not None and logger.isEnabledFor(logging.INFO):
+                logger.info("Calling %s(%s).", name, CallArgs(args, kwargs))
+            start_ns = time.monotonic_ns()
+            try:
+                result = func(self, *args, **kwargs)
+            except BaseException:
+                if trace is not None:
+                    trace.add(method_id, start_ns, time.monotonic_ns() - start_ns, RobotError.ERR_OTHER)
+                raise
+            code = result[0] if isinstance(result, (list, tuple)) and len(result) > 0 else result
+            if trace is not None:
+                trace.add(method_id, start_ns, time.monotonic_ns() - start_ns,
+                          code if isinstance(code, int) and -0x80000000 <= code <= 0x7FFFFFFF else 0)
+            if logger is not None:
+                if code == 0:
+                    logger.debug("%s returned: %s.", name, result)
                 else:
-                    self.log_error(f"{func.__name__} Error occurred. returned: {result}")
+                    logger.error("%s Error occurred. returned: %s", name, result)
 
             return result
 
         return wrapper
 
+    def enable_trace(self, size=CallTrace.DEFAULT_SIZE):
+        """
+        开启 SDK 调用二进制跟踪
+        @param size 环形缓冲区记录条数
+        """
+        self.trace = CallTrace(size)
+        return 0
+
+    def disable_trace(self):
+        """关闭 SDK 调用跟踪，返回已记录的 CallTrace"""
+        trace, self.trace = self.trace, None
+        return trace
+
+    def dump_trace(self, file_path=None):
+        """
+        导出跟踪记录
+        @param file_path 二进制文件路径，为空时直接返回记录
+        @return file_path 为空：[(方法名, 开始时间ns, 耗时ns, 返回码)]；否则写入的记录条数
+        """
+        if self.trace is None:
+            return [] if file_path is None else 0
+        if file_path is None:
+            return self.trace.records()
+        return self.trace.dump(file_path)
+
     def log_debug(self, message):
         """用于记录debug等级日志"""
         if self.logger:
@@ -861,7 +1865,8 @@ class RPC():
     """
 
     def GetSafetyCode(self):
-        if (self.robot_state_pkg.safety_stop0_state == 1) or (self.robot_state_pkg.safety_stop1_state == 1):
+        stop0, stop1 = self.read_state("safety_stop0_state", "safety_stop1_state")
+        if (stop0 == 1) or (stop1 == 1):
             return 99
         return 0
     """2024.12.23"""
@@ -893,15 +1898,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetControllerIP(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetControllerIP()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetControllerIP")
         error = _error[0]
         if _error[0] == 0:
             return error, _error[1]
@@ -917,18 +1914,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def Mode(self, state):
-        flag = True
-        while self.reconnect_flag:
-            time.sleep(0.1)
 
-        state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.Mode(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("Mode", state)
 
         return error
 
@@ -941,17 +1928,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def DragTeachSwitch(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        state = int(state)  # 强制转换为int型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.DragTeachSwitch(state)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("DragTeachSwitch", state)
 
     """   
     @brief  查询机器人是否处于拖动示教模式
@@ -963,15 +1940,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def IsInDragTeach(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.IsInDragTeach()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("IsInDragTeach")
         error = _error[0]
         if _error[0] == 0:
             return error, _error[1]
@@ -987,17 +1956,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def RobotEnable(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        state = int(state)  # 强制转换为int型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.RobotEnable(state)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("RobotEnable", state)
 
     """   
     ***************************************************************************机器人运动********************************************************************************************
@@ -1017,23 +1976,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def StartJOG(self, ref, nb, dir, max_dis, vel=20.0, acc=100.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        ref = int(ref)  # 强制转换为int型
-        nb = int(nb)  # 强制转换为int型
-        dir = int(dir)  # 强制转换为int型
-        max_dis = float(max_dis)  # 强制转换为float型
-        vel = float(vel)  # 强制转换为float型
-        acc = float(acc)  # 强制转换为float型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.StartJOG(ref, nb, dir, vel, acc, max_dis)
-                flag = False
-            except socket.error as e:
-                flag = True
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        error = self.command("StartJOG", ref, nb, dir, vel, acc, max_dis)
         return error
 
     """   
@@ -1045,17 +1991,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def StopJOG(self, ref):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ref = int(ref)  # 强制转换为int型
-        flag = True
-        while flag:
-            try:
-                error = self.robot.StopJOG(ref)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("StopJOG", ref)
 
     """   
     @brief  jog 点动立即停止
@@ -1066,16 +2002,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ImmStopJOG(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ImmStopJOG()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("ImmStopJOG")
 
     """   
     @brief  关节空间运动(自动正/逆运动学计算)
@@ -1095,40 +2022,20 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def MoveJ(self, joint_pos, tool, user, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
-              exaxis_pos=[0.0, 0.0, 0.0, 0.0], blendT=-1.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        joint_pos = list(map(float, joint_pos))
-        tool = int(tool)
-        user = int(user)
-        desc_pos = list(map(float, desc_pos))
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        exaxis_pos = list(map(float, exaxis_pos))
-        blendT = float(blendT)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-        if (desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0) and (
-                desc_pos[4] == 0.0) and (desc_pos[5] == 0.0):  # 若未输入参数则调用正运动学求解
-            ret = self.robot.GetForwardKin(joint_pos)  # 正运动学求解
-            if ret[0] == 0:
-                desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error = ret[0]
-                return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveJ(joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
-                                 offset_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def MoveJ(self, joint_pos, tool, user, desc_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=20.0, acc=0.0, ovl=100.0,
+              exaxis_pos=(0.0, 0.0, 0.0, 0.0), blendT=-1.0, offset_flag=0, offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        joint_pos = floats(joint_pos, 6, "MoveJ joint_pos")
+        desc_pos = floats(desc_pos, 6, "MoveJ desc_pos")
+        if not any(desc_pos):  # 若未输入参数则调用正运动学求解
+            ret = self.solve_forward_kin(joint_pos)  # 正运动学求解
+            if ret[0] != 0:
+                return ret[0]
+            desc_pos = ret[1:7]
+        return self.command("MoveJ", joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
+                            offset_pos)
 
     """   
     @brief  笛卡尔空间直线运动(自动正/逆运动学计算)
@@ -1154,56 +2061,30 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def MoveL(self, desc_pos, tool, user, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
-              blendR=-1.0, blendMode = 0,exaxis_pos=[0.0, 0.0, 0.0, 0.0], search=0, offset_flag=0,
-              offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],config=-1,velAccParamMode=0,overSpeedStrategy=0,speedPercent=10):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos = list(map(float, desc_pos))
-        tool = int(tool)
-        user = int(user)
-        joint_pos = list(map(float, joint_pos))
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        blendR = float(blendR)
-        blendMode = int(blendMode)
-        exaxis_pos = list(map(float, exaxis_pos))
-        search = int(search)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-        config = int(config)
-        velAccParamMode = int(velAccParamMode)
+    def MoveL(self, desc_pos, tool, user, joint_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=20.0, acc=0.0, ovl=100.0,
+              blendR=-1.0, blendMode = 0,exaxis_pos=(0.0, 0.0, 0.0, 0.0), search=0, offset_flag=0,
+              offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),config=-1,velAccParamMode=0,overSpeedStrategy=0,speedPercent=10):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos = floats(desc_pos, 6, "MoveL desc_pos")
+        joint_pos = floats(joint_pos, 6, "MoveL joint_pos")
+        if not any(joint_pos):  # 若未输入参数则调用逆运动学求解
+            ret = self.solve_inverse_kin(0, desc_pos, config)  # 逆运动学求解
+            if ret[0] != 0:
+                return ret[0]
+            joint_pos = ret[1:7]
         overSpeedStrategy = int(overSpeedStrategy)
-        speedPercent = int(speedPercent)
-        if (overSpeedStrategy > 0):
-            error = self.robot.JointOverSpeedProtectStart(overSpeedStrategy, speedPercent)
-            if error!=0:
+        if overSpeedStrategy > 0:
+            error = self.command("JointOverSpeedProtectStart", overSpeedStrategy, speedPercent)
+            if error != 0:
                 return error
-        if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
-                and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
-            if ret[0] == 0:
-                joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error1 = ret[0]
-                return error1
-
-        flag = True
-        while flag:
-            try:
-                error1 = self.robot.MoveL([joint_pos[0],joint_pos[1],joint_pos[2],joint_pos[3],joint_pos[4],joint_pos[5], desc_pos[0],desc_pos[1],desc_pos[2],desc_pos[3],desc_pos[4],desc_pos[5], tool, user, vel, acc, ovl, blendR, blendMode, exaxis_pos[0],exaxis_pos[1],exaxis_pos[2],exaxis_pos[3], search,offset_flag, offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5],100.0,velAccParamMode])
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if (overSpeedStrategy > 0):
-            error = self.robot.JointOverSpeedProtectEnd()
-            if error!=0:
+        error1 = self.command("MoveL", (joint_pos, desc_pos, tool, user, vel, acc, ovl, blendR, blendMode, exaxis_pos,
+                                        search, offset_flag, offset_pos, 100.0, velAccParamMode))
+        if overSpeedStrategy > 0:
+            error = self.command("JointOverSpeedProtectEnd")
+            if error != 0:
                 return error
-
         return error1
 
     """   
@@ -1235,69 +2116,33 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def MoveC(self, desc_pos_p, tool_p, user_p, desc_pos_t, tool_t, user_t, joint_pos_p=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-              joint_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-              vel_p=20.0, acc_p=100.0, exaxis_pos_p=[0.0, 0.0, 0.0, 0.0], offset_flag_p=0,
-              offset_pos_p=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-              vel_t=20.0, acc_t=100.0, exaxis_pos_t=[0.0, 0.0, 0.0, 0.0], offset_flag_t=0,
-              offset_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    def MoveC(self, desc_pos_p, tool_p, user_p, desc_pos_t, tool_t, user_t, joint_pos_p=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+              joint_pos_t=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+              vel_p=20.0, acc_p=100.0, exaxis_pos_p=(0.0, 0.0, 0.0, 0.0), offset_flag_p=0,
+              offset_pos_p=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+              vel_t=20.0, acc_t=100.0, exaxis_pos_t=(0.0, 0.0, 0.0, 0.0), offset_flag_t=0,
+              offset_pos_t=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
               ovl=100.0, blendR=-1.0,config=-1,velAccParamMode=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos_p = list(map(float, desc_pos_p))
-        tool_p = int(tool_p)
-        user_p = int(user_p)
-        joint_pos_p = list(map(float, joint_pos_p))
-        vel_p = float(vel_p)
-        acc_p = float(acc_p)
-        exaxis_pos_p = list(map(float, exaxis_pos_p))
-        offset_flag_p = int(offset_flag_p)
-        offset_pos_p = list(map(float, offset_pos_p))
-
-        desc_pos_t = list(map(float, desc_pos_t))
-        tool_t = int(tool_t)
-        user_t = int(user_t)
-        joint_pos_t = list(map(float, joint_pos_t))
-        vel_t = float(vel_t)
-        acc_t = float(acc_t)
-        exaxis_pos_t = list(map(float, exaxis_pos_t))
-        offset_flag_t = int(offset_flag_t)
-        offset_pos_t = list(map(float, offset_pos_t))
-
-        ovl = float(ovl)
-        blendR = float(blendR)
-        config = int(config)
-        velAccParamMode = int(velAccParamMode)
-
-        if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
-                and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            retp = self.robot.GetInverseKin(0, desc_pos_p, config)  # 逆运动学求解
-            if retp[0] == 0:
-                joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
-            else:
-                error = retp[0]
-                return error
-
-        if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
-                and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            rett = self.robot.GetInverseKin(0, desc_pos_t, config)  # 逆运动学求解
-            if rett[0] == 0:
-                joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
-            else:
-                error = rett[0]
-                return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveC([joint_pos_p[0],joint_pos_p[1],joint_pos_p[2],joint_pos_p[3],joint_pos_p[4],joint_pos_p[5], desc_pos_p[0],desc_pos_p[1],desc_pos_p[2],desc_pos_p[3],desc_pos_p[4],desc_pos_p[5], tool_p, user_p, vel_p, acc_p, exaxis_pos_p[0],exaxis_pos_p[1],exaxis_pos_p[2],exaxis_pos_p[3], offset_flag_p,
-                                         offset_pos_p[0],offset_pos_p[1],offset_pos_p[2],offset_pos_p[3],offset_pos_p[4],offset_pos_p[5], joint_pos_t[0],joint_pos_t[1],joint_pos_t[2],joint_pos_t[3],joint_pos_t[4],joint_pos_t[5], desc_pos_t[0],desc_pos_t[1],desc_pos_t[2],desc_pos_t[3],desc_pos_t[4],desc_pos_t[5], tool_t, user_t, vel_t, acc_t, exaxis_pos_t[0],exaxis_pos_t[1],exaxis_pos_t[2],exaxis_pos_t[3],
-                                         offset_flag_t, offset_pos_t[0],offset_pos_t[1],offset_pos_t[2],offset_pos_t[3],offset_pos_t[4],offset_pos_t[5], ovl, blendR,100.0,velAccParamMode])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos_p = floats(desc_pos_p, 6, "MoveC desc_pos_p")
+        joint_pos_p = floats(joint_pos_p, 6, "MoveC joint_pos_p")
+        desc_pos_t = floats(desc_pos_t, 6, "MoveC desc_pos_t")
+        joint_pos_t = floats(joint_pos_t, 6, "MoveC joint_pos_t")
+        if not any(joint_pos_p):  # 若未输入参数则调用逆运动学求解
+            retp = self.solve_inverse_kin(0, desc_pos_p, config)  # 逆运动学求解
+            if retp[0] != 0:
+                return retp[0]
+            joint_pos_p = retp[1:7]
+        if not any(joint_pos_t):  # 若未输入参数则调用逆运动学求解
+            rett = self.solve_inverse_kin(0, desc_pos_t, config)  # 逆运动学求解
+            if rett[0] != 0:
+                return rett[0]
+            joint_pos_t = rett[1:7]
+        return self.command("MoveC", (joint_pos_p, desc_pos_p, tool_p, user_p, vel_p, acc_p, exaxis_pos_p, offset_flag_p,
+                                      offset_pos_p, joint_pos_t, desc_pos_t, tool_t, user_t, vel_t, acc_t, exaxis_pos_t,
+                                      offset_flag_t, offset_pos_t, ovl, blendR, 100.0, velAccParamMode))
 
     """   
     @brief  笛卡尔空间整圆运动(自动正/逆运动学计算)
@@ -1327,68 +2172,31 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def Circle(self, desc_pos_p, tool_p, user_p, desc_pos_t, tool_t, user_t, joint_pos_p=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-               joint_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-               vel_p=20.0, acc_p=0.0, exaxis_pos_p=[0.0, 0.0, 0.0, 0.0], vel_t=20.0, acc_t=0.0,
-               exaxis_pos_t=[0.0, 0.0, 0.0, 0.0],
-               ovl=100.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], oacc=100.0, blendR=-1,config=-1,velAccParamMode=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos_p = list(map(float, desc_pos_p))
-        tool_p = int(tool_p)
-        user_p = int(user_p)
-        joint_pos_p = list(map(float, joint_pos_p))
-        vel_p = float(vel_p)
-        acc_p = float(acc_p)
-        exaxis_pos_p = list(map(float, exaxis_pos_p))
-
-        desc_pos_t = list(map(float, desc_pos_t))
-        tool_t = int(tool_t)
-        user_t = int(user_t)
-        joint_pos_t = list(map(float, joint_pos_t))
-        vel_t = float(vel_t)
-        acc_t = float(acc_t)
-        exaxis_pos_t = list(map(float, exaxis_pos_t))
-
-        ovl = float(ovl)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-
-        oacc = float(oacc)
-        blendR = float(blendR)
-        config = int(config)
-        velAccParamMode = int(velAccParamMode)
-
-        if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
-                and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            retp = self.robot.GetInverseKin(0, desc_pos_p, config)  # 逆运动学求解
-            if retp[0] == 0:
-                joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
-            else:
-                error = retp[0]
-                return error
-
-        if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
-                and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            rett = self.robot.GetInverseKin(0, desc_pos_t, config)  # 逆运动学求解
-            if rett[0] == 0:
-                joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
-            else:
-                error = rett[0]
-                return error
-
-        flag = True
-        while flag:
-            try:
-                error = self.robot.Circle([joint_pos_p[0],joint_pos_p[1],joint_pos_p[2],joint_pos_p[3],joint_pos_p[4],joint_pos_p[5], desc_pos_p[0],desc_pos_p[1],desc_pos_p[2],desc_pos_p[3],desc_pos_p[4],desc_pos_p[5], tool_p, user_p, vel_p, acc_p, exaxis_pos_p[0],exaxis_pos_p[1],exaxis_pos_p[2],exaxis_pos_p[3],
-                                           joint_pos_t[0],joint_pos_t[1],joint_pos_t[2],joint_pos_t[3],joint_pos_t[4],joint_pos_t[5], desc_pos_t[0],desc_pos_t[1],desc_pos_t[2],desc_pos_t[3],desc_pos_t[4],desc_pos_t[5],
-                                          tool_t, user_t, vel_t, acc_t, exaxis_pos_t[0],exaxis_pos_t[1],exaxis_pos_t[2],exaxis_pos_t[3], ovl, offset_flag, offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5], oacc, blendR,velAccParamMode])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def Circle(self, desc_pos_p, tool_p, user_p, desc_pos_t, tool_t, user_t, joint_pos_p=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+               joint_pos_t=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+               vel_p=20.0, acc_p=0.0, exaxis_pos_p=(0.0, 0.0, 0.0, 0.0), vel_t=20.0, acc_t=0.0,
+               exaxis_pos_t=(0.0, 0.0, 0.0, 0.0),
+               ovl=100.0, offset_flag=0, offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), oacc=100.0, blendR=-1,config=-1,velAccParamMode=0):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos_p = floats(desc_pos_p, 6, "Circle desc_pos_p")
+        joint_pos_p = floats(joint_pos_p, 6, "Circle joint_pos_p")
+        desc_pos_t = floats(desc_pos_t, 6, "Circle desc_pos_t")
+        joint_pos_t = floats(joint_pos_t, 6, "Circle joint_pos_t")
+        if not any(joint_pos_p):  # 若未输入参数则调用逆运动学求解
+            retp = self.solve_inverse_kin(0, desc_pos_p, config)  # 逆运动学求解
+            if retp[0] != 0:
+                return retp[0]
+            joint_pos_p = retp[1:7]
+        if not any(joint_pos_t):  # 若未输入参数则调用逆运动学求解
+            rett = self.solve_inverse_kin(0, desc_pos_t, config)  # 逆运动学求解
+            if rett[0] != 0:
+                return rett[0]
+            joint_pos_t = rett[1:7]
+        return self.command("Circle", (joint_pos_p, desc_pos_p, tool_p, user_p, vel_p, acc_p, exaxis_pos_p, joint_pos_t,
+                                       desc_pos_t, tool_t, user_t, vel_t, acc_t, exaxis_pos_t, ovl, offset_flag,
+                                       offset_pos, oacc, blendR, velAccParamMode))
 
     # @log_call
     # @xmlrpc_timeout
@@ -1471,53 +2279,22 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def NewSpiral(self, desc_pos, tool, user, param, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0,
-                  exaxis_pos=[0.0, 0.0, 0.0, 0.0],
-                  ovl=100.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos = list(map(float, desc_pos))
-        tool = int(tool)
-        user = int(user)
-        param[0] = int(param[0])
-        param[1] = float(param[1])
-        param[2] = float(param[2])
-        param[3] = float(param[3])
-        param[4] = float(param[4])
-        param[5] = int(param[5])
-        param[6] = int(param[6])
-        joint_pos = list(map(float, joint_pos))
-        vel = float(vel)
-        acc = float(acc)
-        exaxis_pos = list(map(float, exaxis_pos))
-        ovl = float(ovl)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-        config = int(config)
-
-        if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
-                and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
-            if ret[0] == 0:
-                joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error = ret[0]
-                return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSpiral([joint_pos[0],joint_pos[1],joint_pos[2],joint_pos[3],joint_pos[4],joint_pos[5],
-                                              desc_pos[0],desc_pos[1],desc_pos[2],desc_pos[3],desc_pos[4],desc_pos[5],
-                                              tool, user, vel, acc, exaxis_pos[0],exaxis_pos[1],exaxis_pos[2],exaxis_pos[3],
-                                              ovl, offset_flag,
-                                             offset_pos[0],offset_pos[1],offset_pos[2],offset_pos[3],offset_pos[4],offset_pos[5],
-                                              float(param[0]),param[1],param[2],param[3],param[4],int(param[5]),param[6]])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def NewSpiral(self, desc_pos, tool, user, param, joint_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=20.0, acc=0.0,
+                  exaxis_pos=(0.0, 0.0, 0.0, 0.0),
+                  ovl=100.0, offset_flag=0, offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),config=-1):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos = floats(desc_pos, 6, "NewSpiral desc_pos")
+        joint_pos = floats(joint_pos, 6, "NewSpiral joint_pos")
+        if not any(joint_pos):  # 若未输入参数则调用逆运动学求解
+            ret = self.solve_inverse_kin(0, desc_pos, config)  # 逆运动学求解
+            if ret[0] != 0:
+                return ret[0]
+            joint_pos = ret[1:7]
+        # param 中 circle_num 取整后按 float 下发，rot_direction/velAccMode 为 int
+        return self.command("NewSpiral", (joint_pos, desc_pos, tool, user, vel, acc, exaxis_pos, ovl, offset_flag,
+                                          offset_pos, int(param[0]), *param[1:7]))
 
     """   
     @brief  伺服运动开始，配合ServoJ、ServoCart指令使用
@@ -1528,16 +2305,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoMoveStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoMoveStart()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("ServoMoveStart")
 
     """   
     @brief  伺服运动结束，配合ServoJ、ServoCart指令使用
@@ -1548,16 +2316,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoMoveEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoMoveEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("ServoMoveEnd")
 
     """   
     @brief  关节空间伺服模式运动
@@ -1575,26 +2334,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJ(self, joint_pos,axisPos, acc=0.0, vel=0.0, cmdT=0.008, filterT=0.0, gain=0.0, id=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        joint_pos = list(map(float, joint_pos))
-        axisPos = list(map(float, axisPos))
-        acc = float(acc)
-        vel = float(vel)
-        cmdT = float(cmdT)
-        filterT = float(filterT)
-        gain = float(gain)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJ(joint_pos,axisPos,acc, vel, cmdT, filterT, gain, id)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ServoJ", joint_pos, axisPos, acc, vel, cmdT, filterT, gain, id)
 
     """   
     @brief  笛卡尔空间伺服模式运动
@@ -1611,28 +2354,12 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def ServoCart(self, mode, desc_pos, pos_gain=[1.0, 1.0, 1.0, 1.0, 1.0, 1.0], acc=0.0, vel=0.0, cmdT=0.008,
+    def ServoCart(self, mode, desc_pos, pos_gain=(1.0, 1.0, 1.0, 1.0, 1.0, 1.0), acc=0.0, vel=0.0, cmdT=0.008,
                   filterT=0.0, gain=0.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        mode = int(mode)
-        desc_pos = list(map(float, desc_pos))
-        pos_gain = list(map(float, pos_gain))
-        acc = float(acc)
-        vel = float(vel)
-        cmdT = float(cmdT)
-        filterT = float(filterT)
-        gain = float(gain)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoCart(mode, desc_pos, pos_gain, acc, vel, cmdT, filterT, gain)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ServoCart", mode, desc_pos, pos_gain, acc, vel, cmdT, filterT, gain)
 
     """   
     @brief  关节扭矩控制开始
@@ -1643,17 +2370,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJTStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJTStart()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ServoJTStart")
 
     """   
     @brief  关节扭矩控制
@@ -1665,21 +2382,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJT(self, torque, interval):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        torque = list(map(float, torque))
-        interval = float(interval)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJT(torque, interval)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ServoJT", torque, interval)
 
     """   
     @brief  关节扭矩控制结束
@@ -1690,17 +2396,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ServoJTEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ServoJTEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ServoJTEnd")
 
     """   
     @brief  笛卡尔空间点到点运动
@@ -1718,27 +2414,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveCart(self, desc_pos, tool, user, vel=20.0, acc=0.0, ovl=100.0, blendT=-1.0, config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos = list(map(float, desc_pos))
-        tool = int(tool)
-        user = int(user)
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        blendT = float(blendT)
-        config = int(config)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveCart(desc_pos, tool, user, vel, acc, ovl, blendT, config)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("MoveCart", desc_pos, tool, user, vel, acc, ovl, blendT, config)
 
     """   
     @brief  样条运动开始
@@ -1749,17 +2428,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SplineStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SplineStart()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SplineStart")
 
     """   
     @brief  样条运动 PTP(自动正/逆运动学计算)
@@ -1775,35 +2444,18 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def SplinePTP(self, joint_pos, tool, user, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=100.0, ovl=100.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        joint_pos = list(map(float, joint_pos))
-        tool = int(tool)
-        user = int(user)
-        desc_pos = list(map(float, desc_pos))
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        if ((desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0)
-                and (desc_pos[4] == 0.0) and (desc_pos[5] == 0.0)):  # 若未输入参数则调用正运动学求解
-            ret = self.robot.GetForwardKin(joint_pos)  # 正运动学求解
-            if ret[0] == 0:
-                desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error = ret[0]
-                return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SplinePTP(joint_pos, desc_pos, tool, user, vel, acc, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SplinePTP(self, joint_pos, tool, user, desc_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=20.0, acc=100.0, ovl=100.0):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        joint_pos = floats(joint_pos, 6, "SplinePTP joint_pos")
+        desc_pos = floats(desc_pos, 6, "SplinePTP desc_pos")
+        if not any(desc_pos):  # 若未输入参数则调用正运动学求解
+            ret = self.solve_forward_kin(joint_pos)  # 正运动学求解
+            if ret[0] != 0:
+                return ret[0]
+            desc_pos = ret[1:7]
+        return self.command("SplinePTP", joint_pos, desc_pos, tool, user, vel, acc, ovl)
 
     """   
     @brief  样条运动结束
@@ -1814,17 +2466,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SplineEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SplineEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SplineEnd")
 
     """   
     @brief  新样条运动开始
@@ -1836,19 +2478,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def NewSplineStart(self, type, averageTime=2000):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type = int(type)
-        averageTime = int(averageTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSplineStart(type, averageTime)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("NewSplineStart", type, averageTime)
 
     """   
     @brief  新样条指令点(自动正/逆运动学计算)
@@ -1867,39 +2497,19 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def NewSplinePoint(self, desc_pos, tool, user, lastFlag, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=0.0,
+    def NewSplinePoint(self, desc_pos, tool, user, lastFlag, joint_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=0.0,
                        acc=0.0, ovl=100.0, blendR=0.0, config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos = list(map(float, desc_pos))
-        tool = int(tool)
-        user = int(user)
-        lastFlag = int(lastFlag)
-        joint_pos = list(map(float, joint_pos))
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        blendR = float(blendR)
-        config = int(config)
-        if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
-                and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
-            if ret[0] == 0:
-                joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error = ret[0]
-                return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSplinePoint(joint_pos, desc_pos, tool, user, vel, acc, ovl, blendR, lastFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos = floats(desc_pos, 6, "NewSplinePoint desc_pos")
+        joint_pos = floats(joint_pos, 6, "NewSplinePoint joint_pos")
+        if not any(joint_pos):  # 若未输入参数则调用逆运动学求解
+            ret = self.solve_inverse_kin(0, desc_pos, int(config))  # 逆运动学求解
+            if ret[0] != 0:
+                return ret[0]
+            joint_pos = ret[1:7]
+        return self.command("NewSplinePoint", joint_pos, desc_pos, tool, user, vel, acc, ovl, blendR, lastFlag)
 
     """   
     @brief  新样条运动结束
@@ -1910,17 +2520,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def NewSplineEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.NewSplineEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("NewSplineEnd")
 
     """   
     @brief  终止运动
@@ -1931,17 +2531,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def StopMotion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.StopMotion()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("StopMotion")
 
     """   
     @brief  暂停运动
@@ -1967,8 +2557,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ResumeMotion(self):
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
         # error = self.robot.ResumeMotion()
         error = self.send_message("/f/bIII0III104III6IIIRESUMEIII/b/f")
         return error
@@ -1983,19 +2574,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PointsOffsetEnable(self, flag, offset_pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        offset_pos = list(map(float, offset_pos))
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.PointsOffsetEnable(flag, offset_pos)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-
-        return error
+        return self.command("PointsOffsetEnable", flag, offset_pos)
 
     """   
     @brief  点位整体偏移结束
@@ -2006,17 +2585,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def PointsOffsetDisable(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PointsOffsetDisable()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("PointsOffsetDisable")
 
     """   
     ***************************************************************************机器人IO********************************************************************************************
@@ -2034,21 +2603,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetDO(self, id, status, smooth=0, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        status = int(status)
-        smooth = int(smooth)
-        block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetDO(id, status, smooth, block)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetDO", id, status, smooth, block)
 
     """   
     @brief  设置工具数字量输出
@@ -2062,21 +2617,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolDO(self, id, status, smooth=0, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        status = int(status)
-        smooth = int(smooth)
-        block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolDO(id, status, smooth, block)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetToolDO", id, status, smooth, block)
 
     """   
     @brief  设置控制箱模拟量输出
@@ -2089,18 +2630,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAO(self, id, value, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
         value = float(value)
-        block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAO(id, value * 40.95, block)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("SetAO", id, value * 40.95, block)
 
         return error
 
@@ -2115,18 +2646,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolAO(self, id, value, block=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
         value = float(value)
-        block = int(block)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolAO(id, value * 40.95, block)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("SetToolAO", id, value * 40.95, block)
 
         return error
 
@@ -2152,11 +2673,11 @@ class RPC():
         # else:
         #     return error
         if 0 <= id < 8:
-            level = (self.robot_state_pkg.cl_dgt_input_l & (0x01 << id)) >> id
+            level = (self.read_state("cl_dgt_input_l") & (0x01 << id)) >> id
             return 0, level
         elif 8 <= id < 16:
             id -= 8
-            level = (self.robot_state_pkg.cl_dgt_input_h & (0x01 << id)) >> id
+            level = (self.read_state("cl_dgt_input_h") & (0x01 << id)) >> id
             return 0, level
         else:
             return -1,None
@@ -2184,7 +2705,7 @@ class RPC():
         #     return error
         if 0 <= id < 2:
             id+=1
-            level = (self.robot_state_pkg.tl_dgt_input_l & (0x01 << id)) >> id
+            level = (self.read_state("tl_dgt_input_l") & (0x01 << id)) >> id
             return 0,level
         else:
             return -1,None
@@ -2201,21 +2722,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitDI(self, id, status, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        status = int(status)
-        maxtime = int(maxtime)
-        opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitDI(id, status, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("WaitDI", id, status, maxtime, opt)
 
     """   
     @brief  等待控制箱多路数字量输入
@@ -2230,22 +2737,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitMultiDI(self, mode, id, status, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        mode = int(mode)
-        id = int(id)
-        status = int(status)
-        maxtime = int(maxtime)
-        opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitMultiDI(mode, id, status, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("WaitMultiDI", mode, id, status, maxtime, opt)
 
     """   
     @brief  等待工具数字量输入
@@ -2259,20 +2751,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitToolDI(self, id, status, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
         id = int(id)
         id = id+1 #控制器内部1对应di0,2对应di1
-        status = int(status)
-        maxtime = int(maxtime)
-        opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitToolDI(id, status, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("WaitToolDI", id, status, maxtime, opt)
 
         return error
 
@@ -2297,7 +2778,7 @@ class RPC():
         # else:
         #     return error
         if 0 <= id < 2:
-            return 0,self.robot_state_pkg.cl_analog_input[id] / 40.95
+            return 0,self.read_state("cl_analog_input")[id] / 40.95
         else:
             return -1
 
@@ -2322,7 +2803,7 @@ class RPC():
         #     return error, value
         # else:
         #     return error
-        return 0, self.robot_state_pkg.tl_anglog_input / 40.95
+        return 0, self.read_state("tl_anglog_input") / 40.95
 
     """   
     @brief  获取机器人末端点记录按钮状态
@@ -2350,7 +2831,7 @@ class RPC():
         #     return error, value
         # else:
         #     return error,None
-        return 0,(self.robot_state_pkg.tl_dgt_input_l & 0x10) >> 4
+        return 0,(self.read_state("tl_dgt_input_l") & 0x10) >> 4
 
 
     """   
@@ -2370,7 +2851,7 @@ class RPC():
         #     return error, value
         # else:
         #     return error
-        return 0,self.robot_state_pkg.tl_dgt_output_l
+        return 0,self.read_state("tl_dgt_output_l")
 
     """   
     @brief  获取机器人控制器DO输出状态
@@ -2390,7 +2871,7 @@ class RPC():
         #     return error, [do_state_h, do_state_l]
         # else:
         #     return error
-        return 0, [self.robot_state_pkg.cl_dgt_output_h,self.robot_state_pkg.cl_dgt_output_l]
+        return 0, self.read_state("cl_dgt_output_h", "cl_dgt_output_l")
 
     """   
     @brief  等待控制箱模拟量输入
@@ -2405,20 +2886,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitAI(self, id, sign, value, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        sign = int(sign)
         value = float(value)
-        maxtime = int(maxtime)
-        opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitAI(id, sign, value*40.95, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("WaitAI", id, sign, value*40.95, maxtime, opt)
 
         return error
 
@@ -2435,20 +2904,8 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitToolAI(self, id, sign, value, maxtime, opt):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        sign = int(sign)
         value = float(value)
-        maxtime = int(maxtime)
-        opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitToolAI(id, sign, value*40.95, maxtime, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("WaitToolAI", id, sign, value*40.95, maxtime, opt)
 
         return error
 
@@ -2465,18 +2922,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSpeed(self, vel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        vel = int(vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSpeed(vel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetSpeed", vel)
 
     """   
     @brief  设置系统变量
@@ -2488,19 +2934,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSysVarValue(self, id, value):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        value = float(value)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSysVarValue(id, value)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetSysVarValue", id, value)
 
     """   
     @brief  设置工具参考点-六点法
@@ -2511,18 +2945,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetToolPoint", point_num)
 
     """   
     @brief  计算工具坐标系-六点法
@@ -2534,15 +2957,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeTool(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeTool()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputeTool")
 
         error = _error[0]
         if _error[0] == 0:
@@ -2559,18 +2974,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTcp4RefPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTcp4RefPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTcp4RefPoint", point_num)
 
     """   
     @brief  计算工具坐标系-四点法
@@ -2582,15 +2986,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeTcp4(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeTcp4()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputeTcp4")
 
         error = _error[0]
         if _error[0] == 0:
@@ -2612,22 +3008,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolCoord(self, id, t_coord, type, install, toolID, loadNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        t_coord = list(map(float, t_coord))
-        type = int(type)
-        install = int(install)
-        toolID = int(toolID)
-        loadNum = int(loadNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolCoord(id, t_coord, type, install, toolID, loadNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
+        error = self.command("SetToolCoord", id, t_coord, type, install, toolID, loadNum)
+        if self.kinematics is not None:
+            self.kinematics.forget_tools()
         return error
 
     """   
@@ -2643,21 +3026,9 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetToolList(self, id, t_coord, type, install , loadNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        t_coord = list(map(float, t_coord))
-        type = int(type)
-        install = int(install)
-        loadNum = int(loadNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetToolList(id, t_coord, type, install, loadNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
+        error = self.command("SetToolList", id, t_coord, type, install, loadNum)
+        if self.kinematics is not None:
+            self.kinematics.forget_tools()
         return error
 
     """   
@@ -2669,18 +3040,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExTCPPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExTCPPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetExTCPPoint", point_num)
 
     """   
     @brief  计算外部工具坐标系-三点法
@@ -2692,15 +3052,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeExTCF(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeExTCF()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputeExTCF")
 
         error = _error[0]
         if _error[0] == 0:
@@ -2719,20 +3071,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExToolCoord(self, id, etcp, etool):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        etcp = list(map(float, etcp))
-        etool = list(map(float, etool))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExToolCoord(id, etcp, etool)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetExToolCoord", id, etcp, etool)
 
     """   
     @brief  设置外部工具坐标系列表
@@ -2745,20 +3084,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetExToolList(self, id, etcp, etool):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        etcp = list(map(float, etcp))
-        etool = list(map(float, etool))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExToolList(id, etcp, etool)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetExToolList", id, etcp, etool)
 
     """   
     @brief  设置工件参考点-三点法
@@ -2769,18 +3095,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWObjCoordPoint(self, point_num):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        point_num = int(point_num)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWObjCoordPoint(point_num)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetWObjCoordPoint", point_num)
 
     """   
     @brief  计算工件坐标系
@@ -2793,17 +3108,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeWObjCoord(self, method, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        method = int(method)
-        refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeWObjCoord(method, refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputeWObjCoord", method, refFrame)
 
         error = _error[0]
         if _error[0] == 0:
@@ -2822,20 +3127,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWObjCoord(self, id, coord, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        coord = list(map(float, coord))
-        refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWObjCoord(id, coord, refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetWObjCoord", id, coord, refFrame)
 
     """   
     @brief  设置工件坐标系列表
@@ -2848,20 +3140,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWObjList(self, id, coord, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        coord = list(map(float, coord))
-        refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWObjList(id, coord, refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetWObjList", id, coord, refFrame)
 
     """   
     @brief  设置末端负载重量
@@ -2873,19 +3152,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLoadWeight(self, loadNum, weight):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        loadNum = int(loadNum)
-        weight = float(weight)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLoadWeight(loadNum,weight)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetLoadWeight", loadNum, weight)
 
     """   
     @brief  设置机器人安装方式-固定安装
@@ -2896,18 +3163,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRobotInstallPos(self, method):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        method = int(method)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotInstallPos(method)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetRobotInstallPos", method)
 
     """   
     @brief  设置机器人安装角度
@@ -2919,19 +3175,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetRobotInstallAngle(self, yangle, zangle):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        yangle = float(yangle)
-        zangle = float(zangle)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotInstallAngle(yangle, zangle)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetRobotInstallAngle", yangle, zangle)
 
     """   
     @brief  设置末端负载质心坐标
@@ -2945,21 +3189,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLoadCoord(self, x, y, z, loadNum = 0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        x = float(x)
-        y = float(y)
-        z = float(z)
-        loadNum = int(loadNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLoadCoord(x, y, z, loadNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetLoadCoord", x, y, z, loadNum)
 
     """   
     @brief  等待指定时间
@@ -2970,18 +3200,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def WaitMs(self, t_ms):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        t_ms = int(t_ms)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitMs(t_ms)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("WaitMs", t_ms)
 
     """   
     ***************************************************************************机器人安全设置********************************************************************************************
@@ -2998,20 +3217,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetAnticollision(self, mode, level, config):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        mode = int(mode)
-        level = list(map(float, level))
-        config = int(config)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAnticollision(mode, level, config)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetAnticollision", mode, level, config)
 
     """   
     @brief  设置碰撞后策略
@@ -3025,23 +3231,8 @@ class RPC():
 
     @log_call
     @xmlrpc_timeout
-    def SetCollisionStrategy(self, strategy,safeTime=1000,safeDistance=100,safeVel=250,safetyMargin=[10,10,10,10,10,10]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        strategy = int(strategy)
-        safeTime = int(safeTime)
-        safeDistance = int(safeDistance)
-        safeVel = int(safeVel)
-        safetyMargin = list(map(int, safetyMargin))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCollisionStrategy(strategy,safeTime,safeDistance,safeVel,safetyMargin)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetCollisionStrategy(self, strategy,safeTime=1000,safeDistance=100,safeVel=250,safetyMargin=(10,10,10,10,10,10)):
+        return self.command("SetCollisionStrategy", strategy, safeTime, safeDistance, safeVel, safetyMargin)
 
     """   
     @brief  设置正限位
@@ -3052,18 +3243,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLimitPositive(self, p_limit):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        p_limit = list(map(float, p_limit))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLimitPositive(p_limit)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetLimitPositive", p_limit)
 
     """   
     @brief  设置负限位
@@ -3074,18 +3254,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetLimitNegative(self, n_limit):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        n_limit = list(map(float, n_limit))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetLimitNegative(n_limit)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetLimitNegative", n_limit)
 
     """   
     @brief  错误状态清除，只能清除可复位的错误
@@ -3096,17 +3265,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ResetAllError(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ResetAllError()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ResetAllError")
 
     """   
     @brief  关节摩擦力补偿开关
@@ -3117,18 +3276,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def FrictionCompensationOnOff(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FrictionCompensationOnOff(state)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("FrictionCompensationOnOff", state)
 
     """   
     @brief  设置关节摩擦力补偿系数-固定安装-正装
@@ -3139,18 +3287,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_level(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_level(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetFrictionValue_level", coeff)
 
     """   
     @brief  设置关节摩擦力补偿系数-固定安装-侧装
@@ -3161,18 +3298,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_wall(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_wall(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetFrictionValue_wall", coeff)
 
     """   
     @brief  设置关节摩擦力补偿系数-固定安装-倒装
@@ -3183,18 +3309,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_ceiling(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_ceiling(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetFrictionValue_ceiling", coeff)
 
     """   
     @brief  设置关节摩擦力补偿系数-自由安装
@@ -3205,18 +3320,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetFrictionValue_freedom(self, coeff):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        coeff = list(map(float, coeff))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFrictionValue_freedom(coeff)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetFrictionValue_freedom", coeff)
 
     """   
     ***************************************************************************机器人状态查询********************************************************************************************
@@ -3232,15 +3336,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotInstallAngle(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotInstallAngle()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetRobotInstallAngle")
 
         error = _error[0]
         if error == 0:
@@ -3258,16 +3354,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSysVarValue(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSysVarValue(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSysVarValue", id)
 
         error = _error[0]
         if error == 0:
@@ -3292,8 +3379,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.jt_cur_pos[0],self.robot_state_pkg.jt_cur_pos[1],self.robot_state_pkg.jt_cur_pos[2],
-                  self.robot_state_pkg.jt_cur_pos[3],self.robot_state_pkg.jt_cur_pos[4],self.robot_state_pkg.jt_cur_pos[5]]
+        return 0,self.read_state("jt_cur_pos")
     """   
     @brief  获取关节当前位置 (弧度)
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
@@ -3304,16 +3390,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetActualJointPosRadian(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetActualJointPosRadian(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.query("GetActualJointPosRadian", flag)
 
         error = _error[0]
         if error == 0:
@@ -3338,8 +3415,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.actual_qd[0],self.robot_state_pkg.actual_qd[1],self.robot_state_pkg.actual_qd[2],
-                  self.robot_state_pkg.actual_qd[3],self.robot_state_pkg.actual_qd[4],self.robot_state_pkg.actual_qd[5]]
+        return 0,self.read_state("actual_qd")
 
     """   
     @brief  获取关节反馈加速度-deg/s^2
@@ -3358,8 +3434,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.actual_qdd[0],self.robot_state_pkg.actual_qdd[1],self.robot_state_pkg.actual_qdd[2],
-                  self.robot_state_pkg.actual_qdd[3],self.robot_state_pkg.actual_qdd[4],self.robot_state_pkg.actual_qdd[5]]
+        return 0,self.read_state("actual_qdd")
 
     """   
     @brief  获取TCP指令合速度
@@ -3378,7 +3453,7 @@ class RPC():
         #     return error, [_error[1], _error[2]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.target_TCP_CmpSpeed[0],self.robot_state_pkg.target_TCP_CmpSpeed[1]]
+        return 0,self.read_state("target_TCP_CmpSpeed")
 
     """   
     @brief  获取TCP反馈合速度
@@ -3397,7 +3472,7 @@ class RPC():
         #     return error, [_error[1], _error[2]]
         # else:
         #     return error
-        return 0, [self.robot_state_pkg.actual_TCP_CmpSpeed[0], self.robot_state_pkg.actual_TCP_CmpSpeed[1]]
+        return 0, self.read_state("actual_TCP_CmpSpeed")
 
     """   
     @brief  获取TCP指令速度
@@ -3416,8 +3491,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.target_TCP_Speed[0],self.robot_state_pkg.target_TCP_Speed[1],self.robot_state_pkg.target_TCP_Speed[2],
-                  self.robot_state_pkg.target_TCP_Speed[3],self.robot_state_pkg.target_TCP_Speed[4],self.robot_state_pkg.target_TCP_Speed[5]]
+        return 0,self.read_state("target_TCP_Speed")
 
     """   
     @brief  获取TCP反馈速度
@@ -3436,8 +3510,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.actual_TCP_Speed[0],self.robot_state_pkg.actual_TCP_Speed[1],self.robot_state_pkg.actual_TCP_Speed[2],
-                  self.robot_state_pkg.actual_TCP_Speed[3],self.robot_state_pkg.actual_TCP_Speed[4],self.robot_state_pkg.actual_TCP_Speed[5]]
+        return 0,self.read_state("actual_TCP_Speed")
 
     """   
     @brief  获取当前工具位姿
@@ -3456,8 +3529,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.tl_cur_pos[0],self.robot_state_pkg.tl_cur_pos[1],self.robot_state_pkg.tl_cur_pos[2],
-                  self.robot_state_pkg.tl_cur_pos[3],self.robot_state_pkg.tl_cur_pos[4],self.robot_state_pkg.tl_cur_pos[5]]
+        return 0,self.read_state("tl_cur_pos")
 
     """   
     @brief  获取当前工具坐标系编号
@@ -3476,7 +3548,7 @@ class RPC():
         #     return error, _error[1]
         # else:
         #     return error
-        return 0,self.robot_state_pkg.tool
+        return 0,self.read_state("tool")
 
     """   
     @brief  获取当前工件坐标系编号 
@@ -3495,7 +3567,7 @@ class RPC():
         #     return error, _error[1]
         # else:
         #     return error
-        return 0, self.robot_state_pkg.user
+        return 0, self.read_state("user")
 
     """   
     @brief  获取当前末端法兰位姿
@@ -3514,8 +3586,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.flange_cur_pos[0],self.robot_state_pkg.flange_cur_pos[1],self.robot_state_pkg.flange_cur_pos[2],
-                  self.robot_state_pkg.flange_cur_pos[3],self.robot_state_pkg.flange_cur_pos[4],self.robot_state_pkg.flange_cur_pos[5]]
+        return 0,self.read_state("flange_cur_pos")
     """   
     @brief  逆运动学，笛卡尔位姿求解关节位置
     @param  [in] 必选参数 type:0-绝对位姿 (基坐标系)，1-相对位姿（基坐标系），2-相对位姿（工具坐标系）
@@ -3528,18 +3599,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetInverseKin(self, type, desc_pos, config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type = int(type)
-        desc_pos = list(map(float, desc_pos))
-        config = int(config)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetInverseKin(type, desc_pos, config)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetInverseKin", type, desc_pos, config)
 
         error = _error[0]
         if error == 0:
@@ -3559,18 +3619,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetInverseKinRef(self, type, desc_pos, joint_pos_ref):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type = int(type)
-        desc_pos = list(map(float, desc_pos))
-        joint_pos_ref = list(map(float, joint_pos_ref))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetInverseKinRef(type, desc_pos, joint_pos_ref)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetInverseKinRef", type, desc_pos, joint_pos_ref)
 
         error = _error[0]
         if error == 0:
@@ -3590,18 +3639,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetInverseKinHasSolution(self, type, desc_pos, joint_pos_ref):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type = int(type)
-        desc_pos = list(map(float, desc_pos))
-        joint_pos_ref = list(map(float, joint_pos_ref))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetInverseKinHasSolution(type, desc_pos, joint_pos_ref)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetInverseKinHasSolution", type, desc_pos, joint_pos_ref)
 
         error = _error[0]
         if error == 0:
@@ -3619,16 +3657,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetForwardKin(self, joint_pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        joint_pos = list(map(float, joint_pos))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForwardKin(joint_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetForwardKin", joint_pos)
 
         error = _error[0]
         if error == 0:
@@ -3636,6 +3665,75 @@ class RPC():
         else:
             return error,None
 
+    """   
+    @brief  批量正运动学，用于路径校验等大量点位的求解
+    @param  [in] 必选参数 joint_pos: (N,6) 关节位置数组，单位 [°]
+    @param  [in] 默认参数 local: True-已启用本地运动学时本地向量化计算，False-全部请求控制器 默认True
+    @return 错误码 成功- 0,  失败-错误码
+    @return 返回值（调用成功返回） desc_pos (N,6) 工具位姿数组，ok (N,) 各点是否求解成功，失败的行为 NaN
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetForwardKinBatch(self, joint_pos, local=True):
+        import numpy as np
+        joint_pos = np.asarray(joint_pos, dtype=float).reshape(-1, 6)
+        kinematics = self.kinematics
+        if local and kinematics is not None:
+            result = kinematics.forward_batch(joint_pos)
+            if result is not None:
+                return (0,) + result
+        return self.kinematics_batch("GetForwardKin", [(row,) for row in joint_pos.tolist()])
+
+    """   
+    @brief  批量逆运动学，用于路径校验等大量点位的求解
+    @param  [in] 必选参数 type:0-绝对位姿 (基坐标系)，1-相对位姿（基坐标系），2-相对位姿（工具坐标系）
+    @param  [in] 必选参数 desc_pos: (N,6) 工具位姿数组，单位 [mm][°]
+    @param  [in] 默认参数 config: 关节配置，[-1]-参考关节位置求解，[0~7]-依据关节配置求解 默认-1
+    @param  [in] 默认参数 joint_pos_ref: (N,6) 或 (6,) 参考关节位置，None 为当前关节位置 默认None
+    @param  [in] 默认参数 local: True-已启用本地运动学时本地向量化计算(仅 type=0、config=-1)，False-全部请求控制器 默认True
+    @return 错误码 成功- 0,  失败-错误码
+    @return 返回值（调用成功返回） joint_pos (N,6) 关节位置数组，reachable (N,) 各点是否有解，无解的行为 NaN
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetInverseKinBatch(self, type, desc_pos, config=-1, joint_pos_ref=None, local=True):
+        import numpy as np
+        type = int(type)
+        desc_pos = np.asarray(desc_pos, dtype=float).reshape(-1, 6)
+        config = int(config)
+        kinematics = self.kinematics
+        if local and kinematics is not None:
+            result = kinematics.inverse_batch(type, desc_pos, config, joint_pos_ref)
+            if result is not None:
+                return (0,) + result
+        if joint_pos_ref is None:
+            params = [(type, pose, config) for pose in desc_pos.tolist()]
+            return self.kinematics_batch("GetInverseKin", params)
+        joint_pos_ref = np.broadcast_to(np.asarray(joint_pos_ref, dtype=float), desc_pos.shape)
+        params = [(type, pose, ref) for pose, ref in zip(desc_pos.tolist(), joint_pos_ref.tolist())]
+        return self.kinematics_batch("GetInverseKinRef", params)
+
+    def kinematics_batch(self, name, params):
+        """将运动学请求分块批量提交给控制器，返回 (错误码, (N,6) 结果, (N,) 成功标志)"""
+        import numpy as np
+        values = np.full((len(params), 6), np.nan)
+        ok = np.zeros(len(params), dtype=bool)
+        for start in range(0, len(params), self.KINEMATICS_BATCH_SIZE):
+            batch = RobotBatch(self)
+            for args in params[start:start + self.KINEMATICS_BATCH_SIZE]:
+                getattr(batch.robot, name)(*args)
+            try:
+                results = batch.submit()
+            except (OSError, xmlrpc.client.ProtocolError):
+                return RobotError.ERR_SOCKET_COM_FAILED, None, None
+            for i, ret in enumerate(results, start):
+                if isinstance(ret, list) and ret[0] == 0:
+                    values[i] = ret[1:7]
+                    ok[i] = True
+        return 0, values, ok
+
     """   
     @brief  获取当前关节转矩
     @param  [in] 默认参数 flag：0-阻塞，1-非阻塞 默认1
@@ -3653,8 +3751,7 @@ class RPC():
         #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
         # else:
         #     return error
-        return 0,[self.robot_state_pkg.jt_cur_tor[0],self.robot_state_pkg.jt_cur_tor[1],self.robot_state_pkg.jt_cur_tor[2],
-                  self.robot_state_pkg.jt_cur_tor[3],self.robot_state_pkg.jt_cur_tor[4],self.robot_state_pkg.jt_cur_tor[5]]
+        return 0,self.read_state("jt_cur_tor")
 
     """   
     @brief  获取当前负载的质量
@@ -3666,16 +3763,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTargetPayload(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetTargetPayload(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.query("GetTargetPayload", flag)
 
         error = _error[0]
         if error == 0:
@@ -3693,16 +3781,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTargetPayloadCog(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetTargetPayloadCog(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.query("GetTargetPayloadCog", flag)
 
         error = _error[0]
         if error == 0:
@@ -3720,16 +3799,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTCPOffset(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetTCPOffset(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.query("GetTCPOffset", flag)
 
         error = _error[0]
         if error == 0:
@@ -3747,16 +3817,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetWObjOffset(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetWObjOffset(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.query("GetWObjOffset", flag)
 
         error = _error[0]
         if error == 0:
@@ -3774,16 +3835,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetJointSoftLimitDeg(self, flag=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                _error = self.robot.GetJointSoftLimitDeg(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+        _error = self.query("GetJointSoftLimitDeg", flag)
 
         error = _error[0]
         if error == 0:
@@ -3802,15 +3854,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSystemClock(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSystemClock()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSystemClock")
 
         error = _error[0]
         if error == 0:
@@ -3828,15 +3872,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotCurJointsConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotCurJointsConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetRobotCurJointsConfig")
 
         error = _error[0]
         if error == 0:
@@ -3854,15 +3890,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetDefaultTransVel(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetDefaultTransVel()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetDefaultTransVel")
 
         error = _error[0]
         if error == 0:
@@ -3886,7 +3914,7 @@ class RPC():
         #     return error, _error[1]
         # else:
         #     return error
-            return 0,self.robot_state_pkg.motion_done
+            return 0,self.read_state("motion_done")
     """   
     @brief  查询机器人错误码
     @param  [in] NULL
@@ -3903,7 +3931,7 @@ class RPC():
         #     return error, [_error[1], _error[2]]
         # else:
         #     return error
-        return 0, [self.robot_state_pkg.main_code,self.robot_state_pkg.sub_code]
+        return 0, self.read_state("main_code", "sub_code")
 
     """   
     @brief  查询机器人示教管理点位数据
@@ -3915,16 +3943,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetRobotTeachingPoint(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotTeachingPoint(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetRobotTeachingPoint", name)
 
         error = _error[0]
         if error == 0:
@@ -3954,7 +3973,7 @@ class RPC():
         #     return error, _error[1]
         # else:
         #     return error
-        return 0, self.robot_state_pkg.mc_queue_len
+        return 0, self.read_state("mc_queue_len")
 
     """   
     @brief  获取机器人急停状态
@@ -3972,7 +3991,7 @@ class RPC():
         #     return error, _error[1]
         # else:
         #     return error
-        return 0, self.robot_state_pkg.EmergencyStop
+        return 0, self.read_state("EmergencyStop")
 
     """   
     @brief  获取安全停止信号
@@ -3991,7 +4010,7 @@ class RPC():
         # else:
         #     return error
 
-        return 0, [self.robot_state_pkg.safety_stop0_state,self.robot_state_pkg.safety_stop1_state]
+        return 0, self.read_state("safety_stop0_state", "safety_stop1_state")
 
     """   
     @brief  获取SDK与机器人的通讯状态
@@ -4035,15 +4054,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSSHKeygen(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSSHKeygen()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSSHKeygen")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4064,22 +4075,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetSSHScpCmd(self, mode, sshname, sship, usr_file_url, robot_file_url):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        mode = int(mode)
-        sshname = str(sshname)
-        sship = str(sship)
-        usr_file_url = str(usr_file_url)
-        robot_file_url = str(robot_file_url)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSSHScpCmd(mode, sshname, sship, usr_file_url, robot_file_url)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetSSHScpCmd", mode, sshname, sship, usr_file_url, robot_file_url)
 
     """   
     @brief  计算指定路径下文件的MD5值
@@ -4091,16 +4087,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputeFileMD5(self, file_path):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        file_path = str(file_path)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeFileMD5(file_path)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputeFileMD5", file_path)
 
         error = _error[0]
         if _error[0] == 0:
@@ -4120,15 +4107,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSoftwareVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSoftwareVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSoftwareVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4153,15 +4132,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSlaveHardVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveHardVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSlaveHardVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4172,15 +4143,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetHardwareversion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveHardVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSlaveHardVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4205,15 +4168,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSlaveFirmVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveFirmVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSlaveFirmVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4224,15 +4179,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetFirmwareVersion(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlaveFirmVersion()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSlaveFirmVersion")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4250,15 +4197,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetDHCompensation(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetDHCompensation()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetDHCompensation")
 
         error = _error[0]
         if _error[0] == 0:
@@ -4283,20 +4222,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTPDParam(self, name, period_ms, type=1, di_choose=0, do_choose=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        period_ms = int(period_ms)
-        type = int(type)
-        di_choose = int(di_choose)
-        do_choose = int(do_choose)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTPDParam(type, name, period_ms, di_choose, do_choose)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("SetTPDParam", type, name, period_ms, di_choose, do_choose)
 
         return error
 
@@ -4313,20 +4239,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTPDStart(self, name, period_ms, type=1, di_choose=0, do_choose=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        period_ms = int(period_ms)
-        type = int(type)
-        di_choose = int(di_choose)
-        do_choose = int(do_choose)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTPDStart(type, name, period_ms, di_choose, do_choose)
-                flag = False
-            except socket.error as e:
-                flag = True
+        error = self.command("SetTPDStart", type, name, period_ms, di_choose, do_choose)
 
         return error
 
@@ -4339,17 +4252,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetWebTPDStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWebTPDStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetWebTPDStop")
 
     """   
     @brief  删除轨迹记录
@@ -4360,18 +4263,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTPDDelete(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTPDDelete(name)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTPDDelete", name)
 
     """   
     @brief  轨迹预加载
@@ -4382,18 +4274,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadTPD(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadTPD(name)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("LoadTPD", name)
 
     """   
     @brief  获取轨迹起始位姿
@@ -4405,16 +4286,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTPDStartPose(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTPDStartPose(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetTPDStartPose", name)
 
         error = _error[0]
         if error == 0:
@@ -4433,22 +4305,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveTPD(self, name, blend, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        name = str(name)
-        blend = int(blend)
-        ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveTPD(name, blend, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("MoveTPD", name, blend, ovl)
 
     """   
     @brief  轨迹预处理
@@ -4461,20 +4321,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadTrajectoryJ(self, name, ovl, opt=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        ovl = float(ovl)
-        opt = int(opt)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadTrajectoryJ(name, ovl, opt)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("LoadTrajectoryJ", name, ovl, opt)
 
     """   
     @brief  轨迹复现
@@ -4485,19 +4332,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveTrajectoryJ(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveTrajectoryJ()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("MoveTrajectoryJ")
 
     """   
     @brief  获取轨迹起始位姿
@@ -4509,16 +4347,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTrajectoryStartPose(self, name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        name = str(name)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTrajectoryStartPose(name)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetTrajectoryStartPose", name)
 
         error = _error[0]
         if error == 0:
@@ -4536,15 +4365,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTrajectoryPointNum(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTrajectoryPointNum()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetTrajectoryPointNum")
 
         error = _error[0]
         if error == 0:
@@ -4561,18 +4382,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJSpeed(self, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJSpeed(ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJSpeed", ovl)
 
     """   
     @brief  设置轨迹运行中的力和扭矩
@@ -4583,18 +4393,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceTorque(self, ft):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ft = list(map(float, ft))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceTorque(ft)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJForceTorque", ft)
 
     """   
     @brief  设置轨迹运行中的沿x方向的力
@@ -4605,18 +4404,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceFx(self, fx):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        fx = float(fx)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceFx(fx)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJForceFx", fx)
 
     """   
     @brief  设置轨迹运行中的沿y方向的力
@@ -4627,18 +4415,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceFy(self, fy):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        fy = float(fy)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceFy(fy)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJForceFy", fy)
 
     """   
     @brief  设置轨迹运行中的沿z方向的力
@@ -4649,18 +4426,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJForceFz(self, fz):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        fz = float(fz)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJForceFy(fz)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJForceFy", fz)
 
     """   
     @brief  设置轨迹运行中的绕x轴的扭矩
@@ -4671,18 +4437,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJTorqueTx(self, tx):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        tx = float(tx)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJTorqueTx(tx)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJTorqueTx", tx)
 
     """   
     @brief  设置轨迹运行中的绕y轴的扭矩
@@ -4693,18 +4448,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJTorqueTy(self, ty):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ty = float(ty)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJTorqueTx(ty)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJTorqueTx", ty)
 
     """   
     @brief  设置轨迹运行中的绕z轴的扭矩
@@ -4715,18 +4459,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetTrajectoryJTorqueTz(self, tz):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        tz = float(tz)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetTrajectoryJTorqueTx(tz)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetTrajectoryJTorqueTx", tz)
 
     """   
     ***************************************************************************机器人WebAPP程序使用********************************************************************************************
@@ -4742,19 +4475,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def LoadDefaultProgConfig(self, flag, program_name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        program_name = str(program_name)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.LoadDefaultProgConfig(flag, program_name)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-
-        return error
+        return self.command("LoadDefaultProgConfig", flag, program_name)
 
     """   
     @brief  加载指定的作业程序
@@ -4765,18 +4486,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramLoad(self, program_name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        program_name = str(program_name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramLoad(program_name)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ProgramLoad", program_name)
 
     """   
     @brief  获取当前机器人作业程序的执行行号
@@ -4788,15 +4498,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurrentLine(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetCurrentLine()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetCurrentLine")
 
         error = _error[0]
         if error == 0:
@@ -4813,19 +4515,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramRun(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramRun()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ProgramRun")
 
     """   
     @brief  暂停当前运行的作业程序
@@ -4836,17 +4529,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramPause(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramPause()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ProgramPause")
 
     """   
     @brief  恢复当前暂停的作业程序
@@ -4857,19 +4540,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramResume(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramResume()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ProgramResume")
 
     """   
     @brief  终止当前运行的作业程序
@@ -4880,17 +4554,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ProgramStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ProgramStop")
 
     """   
     @brief  获取机器人作业程序执行状态
@@ -4908,7 +4572,7 @@ class RPC():
         #     return error, _error[1]
         # else:
         #     return error
-        return 0,self.robot_state_pkg.robot_state
+        return 0,self.read_state("robot_state")
 
     """   
     @brief  获取已加载的作业程序名
@@ -4920,15 +4584,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetLoadedProgram(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetLoadedProgram()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetLoadedProgram")
 
         error = _error[0]
         if error == 0:
@@ -4954,15 +4610,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetGripperConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetGripperConfig")
 
         error = _error[0]
         if error == 0:
@@ -4980,19 +4628,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ActGripper(self, index, action):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        index = int(index)
-        action = int(action)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ActGripper(index, action)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("ActGripper", index, action)
 
     """   
     @brief  控制夹爪
@@ -5012,29 +4648,10 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MoveGripper(self, index, pos, vel, force, maxtime, block, type, rotNum, rotVel, rotTorque):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        index = int(index)
-        pos = int(pos)
-        vel = int(vel)
-        force = int(force)
-        maxtime = int(maxtime)
-        block = int(block)
-        type = int(type)
-        rotNum = float(rotNum)
-        rotVel = int(rotVel)
-        rotTorque = int(rotTorque)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveGripper(index, pos, vel, force, maxtime, block, type, rotNum, rotVel, rotTorque)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("MoveGripper", index, pos, vel, force, maxtime, block, type, rotNum, rotVel, rotTorque)
 
     """   
     @brief  获取夹爪运动状态
@@ -5046,15 +4663,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetGripperMotionDone(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetGripperMotionDone()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetGripperMotionDone")
 
         error = _error[0]
         if error == 0:
@@ -5074,21 +4683,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetGripperConfig(self, company, device, softversion=0, bus=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        company = int(company)
-        device = int(device)
-        softversion = int(softversion)
-        bus = int(bus)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetGripperConfig(company, device, softversion, bus)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+        return self.command("SetGripperConfig", company, device, softversion, bus)
 
     """   
     @brief  计算预抓取点-视觉
@@ -5102,18 +4697,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputePrePick(self, desc_pos, zlength, zangle):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        desc_pos = list(map(float, desc_pos))
-        zlength = float(zlength)
-        zangle = float(zangle)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputePrePick(desc_pos, zlength, zangle)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputePrePick", desc_pos, zlength, zangle)
 
         error = _error[0]
         if error == 0:
@@ -5133,18 +4717,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def ComputePostPick(self, desc_pos, zlength, zangle):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        desc_pos = list(map(float, desc_pos))
-        zlength = float(zlength)
-        zangle = float(zangle)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputePostPick(desc_pos, zlength, zangle)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("ComputePostPick", desc_pos, zlength, zangle)
 
         error = _error[0]
         if error == 0:
@@ -5153,8412 +4726,1815 @@ class RPC():
             return error,None
 
     """   
-    ***************************************************************************机器人力控********************************************************************************************
+    力控、传送带、焊接、激光跟踪、扩展轴与固件升级接口位于同目录的独立模块，首次调用时加载，见 SDK_FAMILIES
     """
 
     """   
-    @brief  获取力传感器配置
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）[number,company,device,softversion,bus]
-            number 传感器编号
-            company  力传感器厂商，17-坤维科技，19-航天十一院，20-ATI 传感器，21-中科米点，22-伟航敏芯
-            device  设备号，坤维 (0-KWR75B)，航天十一院 (0-MCS6A-200-4)，ATI(0-AXIA80-M8)，中科米点 (0-MST2010)，伟航敏芯 (0-WHC6L-YB10A)
-            softvesion  软件版本号，暂不使用，默认为0    
+    @brief  初始化日志参数
+    @param  [in]默认参数 output_model：输出模式，0-直接输出；1-缓冲输出；2-异步输出，默认1
+    @param  [in]默认参数 file_path： 文件保存路径+名称，名称必须是xxx.log的形式，比如/home/fr/linux/fairino.log。
+                    默认执行程序所在路径，默认名称fairino_ year+month+data.log(如:fairino_2024_03_13.log);
+    @param  [in]默认参数 file_num：滚动存储的文件数量，1~20个，默认值为5。单个文件上限50M;
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_GetConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_GetConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1] + 1, _error[2] + 1, _error[3], _error[4]]
-        else:
-            return error,None
+    def LoggerInit(self, output_model=1, file_path="", file_num=5):
+        return self.setup_logging(output_model, file_path, file_num)
 
     """   
-    @brief  力传感器配置
-    @param  [in] 必选参数 company：传感器厂商，17-坤维科技，19-航天十一院，20-ATI 传感器，21-中科米点，22-伟航敏芯，23-NBIT，24-鑫精诚(XJC)，26-NSR；
-    @param  [in] 必选参数 device：设备号，坤维 (0-KWR75B)，航天十一院 (0-MCS6A-200-4)，ATI(0-AXIA80-M8)，中科米点 (0-MST2010)，伟航敏芯 (0-WHC6L-YB10A)，NBIT(0-XLH93003ACS)，鑫精诚XJC(0-XJC-6F-D82)，NSR(0-NSR-FTSensorA)；
-    @param  [in] 默认参数 softversion：软件版本号，暂不使用，默认为 0
-    @param  [in] 默认参数 bus：设备挂载末端总线位置，暂不使用，默认为 0；
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置日志过滤等级
+    @param  [in] 默认参数 lvl: 过滤等级值，值越小输出日志越少, 1-error, 2-warnning, 3-inform, 4-debug,默认值是1.
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_SetConfig(self, company, device, softversion=0, bus=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        company = int(company)
-        device = int(device)
-        softversion = int(softversion)
-        bus = int(bus)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SetConfig(company, device, softversion, bus)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetLoggerLevel(self, lvl=1):
+        lvl=int(lvl)
+        log_level = self.set_log_level(lvl)
+        return 0
 
     """   
-    @brief  力传感器激活
-    @param  [in] 必选参数 state：0-复位，1-激活
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  下载点位表数据库
+    @param  [in] pointTableName 要下载的点位表名称    pointTable1.db
+    @param  [in] saveFilePath 下载点位表的存储路径   C://test/
+    @param  [in] progress 进度回调 progress(已接收字节数, 文件总字节数)，默认None
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_Activate(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_Activate(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def PointTableDownLoad(self, point_table_name, save_file_path, progress=None):
+        if not os.path.exists(save_file_path):
+            return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
 
-        return error
+        rtn = self.command("PointTableDownload", point_table_name)
+        if rtn == -1:
+            return RobotError.ERR_POINTTABLE_NOTFOUND
+        elif rtn != 0:
+            return rtn
+        error = self.__recv_file(20011, 8, os.path.join(save_file_path, point_table_name), progress)
+        if error == RobotError.ERR_SUCCESS:
+            return 0
+        return RobotError.ERR_OTHER
 
     """   
-    @brief  力传感器校零
-    @param  [in] 必选参数 state：0-去除零点，1-零点矫正
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  上传点位表数据库
+    @param  [in] pointTableFilePath 上传点位表的全路径名   C://test/pointTable1.db
+    @param  [in] progress 进度回调 progress(已发送字节数, 文件总字节数)，默认None
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_SetZero(self, state):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        state = int(state)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SetZero(state)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def PointTableUpLoad(self, point_table_file_path, progress=None):
+        MAX_UPLOAD_FILE_SIZE = 2 * 1024 * 1024  # 最大上传文件为2Mb
+        # 判断上传文件是否存在
+        if not os.path.exists(point_table_file_path):
+            return RobotError.ERR_UPLOAD_FILE_NOT_FOUND
 
-        return error
+        file_info = os.path.getsize(point_table_file_path)
+        total_size = file_info + 16 + 32
+        if total_size > MAX_UPLOAD_FILE_SIZE:
+            print("Files larger than 2 MB are not supported!")
+            return -1
 
-    """   
-    @brief  设置力传感器参考坐标系
-    @param  [in] 必选参数 ref：0-工具坐标系，1-基坐标系
-    @param  [in] 默认参数 coord：[x,y,z,rx,ry,rz] 自定义坐标系值,默认[0,0,0,0,0,0]
-    @return 错误码 成功- 0, 失败-错误码
-    """
+        point_table_name = os.path.basename(point_table_file_path)
+        send_md5 = calculate_file_md5(point_table_file_path, use_cache=True)
 
-    @log_call
-    @xmlrpc_timeout
-    def FT_SetRCS(self, ref,coord=[0,0,0,0,0,0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ref = int(ref)
-        coord = list(map(float, coord))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SetRCS(ref,coord)
-                flag = False
-            except socket.error as e:
-                flag = True
+        rtn = self.command("PointTableUpload", point_table_name)
+        if rtn != 0:
+            return rtn
 
-        return error
+        head_data = f"/f/b{total_size:08d}{send_md5}"
+        return self.__send_file(20010, head_data.encode('utf-8'), point_table_file_path, 2, progress)
 
     """   
-    @brief  负载重量辨识计算
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）weight-负载重量，单位 kg
+    @brief  点位表切换
+    @param  [in] PointTableSwitch 要切换的点位表名称   "pointTable1.db",当点位表为空，即""时，表示将lua程序更新为未应用点位表的初始程序
+    @return 错误码 成功-0   失败-错误码 
+    @return 错误errorStr
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_PdIdenCompute(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_PdIdenCompute()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1]
-        else:
-            return error,None
+    def PointTableSwitch(self, point_table_name):
+        rtn = self.command("PointTableSwitch", point_table_name)  # 切换点位表
+        if rtn != 0:
+            if rtn == RobotError.ERR_POINTTABLE_NOTFOUND:
+                error_str = "PointTable not Found!"
+            else:
+                error_str = "PointTable not Found!"
+            return rtn, error_str
+        return rtn
 
     """   
-    @brief  负载重量辨识记录
-    @param  [in] 必选参数 tool_id：传感器坐标系编号，范围 [1~14]
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  点位表更新lua文件
+    @param  [in] pointTableName 要切换的点位表名称   "pointTable1.db",当点位表为空，即""时，表示将lua程序更新为未应用点位表的初始程序
+    @param  [in] luaFileName 要更新的lua文件名称   "testPointTable.lua"
+    @return 错误码 成功-0   失败-错误码 
+    @return 错误errorStr
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_PdIdenRecord(self, tool_id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        tool_id = int(tool_id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_PdIdenRecord(tool_id)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def PointTableUpdateLua(self, point_table_name, lua_file_name):
+        try:
 
-        return error
+            rtn = self.command("PointTableSwitch", point_table_name)  # 切换点位表
+            if rtn != 0:
+                if rtn == RobotError.ERR_POINTTABLE_NOTFOUND:
+                    error_str = "PointTable not Found!"
+                else:
+                    error_str = "PointTable not Found!"
+                return rtn, error_str
 
-    """   
-    @brief  负载质心辨识计算
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）cog=[cogx,cogy,cogz] ，负载质心，单位 mm
-    """
+            time.sleep(0.3)  # 增加延时确保切换后后端确实收到切换后的点位表名称
 
-    @log_call
-    @xmlrpc_timeout
-    def FT_PdCogIdenCompute(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_PdCogIdenCompute()
-                flag = False
-            except socket.error as e:
-                flag = True
+            result = self.query("PointTableUpdateLua", lua_file_name)
+            error_str = result[1]
+            if not error_str:
+                error_str = "fail to update lua, please inspect pointtable"
+            return result[0], error_str
 
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3]]
-        else:
-            return error,None
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR, ""
 
     """   
-    @brief  负载质心辨识记录
-    @param  [in] 必选参数 tool_id：传感器坐标系编号，范围 [0~14]
-    @param  [in] 必选参数 index 点编号，范围[1~3]
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  下载文件
+    @param  [in] fileType 文件类型    0-lua文件
+    @param  [in] fileName 文件名称    “test.lua”
+    @param  [in] saveFilePath 保存文件路径    “C：//test/”
+    @param  [in] progress 进度回调 progress(已接收字节数, 文件总字节数)
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_PdCogIdenRecord(self, tool_id, index):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        tool_id = int(tool_id)
-        index = int(index)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_PdCogIdenRecord(tool_id, index)
-                flag = False
-            except socket.error as e:
-                flag = True
-
+    def __FileDownLoad(self, fileType, fileName, saveFilePath, progress=None):
+        if not os.path.exists(saveFilePath):
+            return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
+        rtn = self.command("FileDownload", fileType, fileName)
+        if rtn == -1:
+            return RobotError.ERR_POINTTABLE_NOTFOUND
+        elif rtn != 0:
+            return rtn
+        error = self.__recv_file(20011, 10, os.path.join(saveFilePath, fileName), progress)
+        if error == RobotError.ERR_DOWN_LOAD_FILE_CHECK_FAILED:
+            return RobotError.ERR_DOWN_LOAD_FILE_FAILED
+        elif error == RobotError.ERR_DOWN_LOAD_FILE_FAILED:
+            return RobotError.ERR_OTHER
         return error
 
-    """   
-    @brief  获取参考坐标系下力/扭矩数据
-    @param  [in] 必选参数 NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）data=[fx,fy,fz,tx,ty,tz]
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def FT_GetForceTorqueRCS(self):
-        # _error = self.robot.FT_GetForceTorqueRCS(0)
-        # error = _error[0]
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.ft_sensor_data[0],self.robot_state_pkg.ft_sensor_data[1],self.robot_state_pkg.ft_sensor_data[2],
-                  self.robot_state_pkg.ft_sensor_data[3],self.robot_state_pkg.ft_sensor_data[4],self.robot_state_pkg.ft_sensor_data[5]]
+    def __recv_file(self, port, size_digits, file_path, progress):
+        """连接文件端口接收文件，记录传输速率到 file_transfer_stats"""
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.settimeout(2)
+        try:
+            try:
+                client.connect((self.ip_address, port))
+            except Exception as e:
+                return RobotError.ERR_OTHER
+            start = time.perf_counter()
+            try:
+                error, received = recv_file_stream(client, file_path, size_digits, progress)
+            except OSError:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                return RobotError.ERR_SOCKET_RECV_FAILED
+            self.__record_transfer(received, time.perf_counter() - start)
+            return error
+        finally:
+            client.close()
 
     """   
-    @brief  获取力传感器原始力/扭矩数据
-    @param  [in] 必选参数 NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）data=[fx,fy,fz,tx,ty,tz]
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def FT_GetForceTorqueOrigin(self):
-        # _error = self.robot.FT_GetForceTorqueOrigin(0)
-        # error = _error[0]
-        # return error
-        # if error == 0:
-        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        # else:
-        #     return error
-        return 0,[self.robot_state_pkg.ft_sensor_raw_data[0],self.robot_state_pkg.ft_sensor_raw_data[1],self.robot_state_pkg.ft_sensor_raw_data[2],
-                  self.robot_state_pkg.ft_sensor_raw_data[3],self.robot_state_pkg.ft_sensor_raw_data[4],self.robot_state_pkg.ft_sensor_raw_data[5]]
-
-    """   
-    @brief  碰撞守护
-    @param  [in] 必选参数 flag：0-关闭碰撞守护，1-开启碰撞守护；
-    @param  [in] 必选参数 sensor_num：力传感器编号
-    @param  [in] 必选参数 select：六个自由度是否检测碰撞 [fx,fy,fz,mx,my,mz]，0-不生效，1-生效
-    @param  [in] 必选参数 force_torque：碰撞检测力/力矩，单位 N 或 Nm
-    @param  [in] 必选参数 max_threshold：最大阈值
-    @param  [in] 必选参数 min_threshold：最小阈值
-    力/力矩检测范围:(force_torque-min_threshold,force_torque+max_threshold)
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  上传文件
+    @param  [in] fileType 文件类型    0-lua文件
+    @param  [in] filePath上传文件的全路径名    C://test/test.lua     
+    @param  [in] progress 进度回调 progress(已发送字节数, 文件总字节数)
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_Guard(self, flag, sensor_num, select, force_torque, max_threshold, min_threshold):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        sensor_num = int(sensor_num)
-        select = list(map(int, select))
-        force_torque = list(map(float, force_torque))
-        max_threshold = list(map(float, max_threshold))
-        min_threshold = list(map(float, min_threshold))
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.FT_Guard(flag, sensor_num, select, force_torque, max_threshold, min_threshold)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+    def __FileUpLoad(self, fileType, filePath, progress=None):
 
-        return error
+        if not os.path.exists(filePath):
+            return RobotError.ERR_POINTTABLE_NOTFOUND
 
-    """   
-    @brief  恒力控制
-    @param  [in] 必选参数 flag：0-关闭碰撞守护，1-开启碰撞守护；
-    @param  [in] 必选参数 sensor_id：力传感器编号
-    @param  [in] 必选参数 select：[fx,fy,fz,mx,my,mz]六个自由度是否检测碰撞 ，0-不生效，1-生效
-    @param  [in] 必选参数 ft：[fx,fy,fz,mx,my,mz]碰撞检测力/力矩，单位 N 或 Nm
-    @param  [in] 必选参数 ft_pid：[f_p,f_i,f_d,m_p,m_i,m_d], 力PID参数，力矩PID参数
-    @param  [in] 必选参数 adj_sign：自适应启停状态，0-关闭，1-开启
-    @param  [in] 必选参数 ILC_sign: ILC 控制启停状态，0-停止，1-训练，2-实操
-    @param  [in] 必选参数 max_dis：最大调整距离，单位mm
-    @param  [in] 必选参数 max_ang：最大调整角度，单位deg
-    @param  [in] 必选参数 M 质量参数
-    @param  [in] 必选参数 B 阻尼参数
-    @param  [in] 默认参数 polishRadio：打磨盘半径，单位mm
-    @param  [in] 默认参数 filter_Sign 滤波开启标志 0-关；1-开，默认 0-关闭
-    @param  [in] 默认参数 posAdapt_sign 姿态顺应开启标志 0-关；1-开，默认 0-关闭
-    @param  [in] 默认参数 isNoBlock 阻塞标志，0-阻塞；1-非阻塞 默认0-阻塞
-    @return 错误码 成功- 0, 失败-错误码
-    """
+        MAX_UPLOAD_FILE_SIZE = 500 * 1024 * 1024;  # 最大上传文件为500Mb
+        file_info = os.path.getsize(filePath)
+        total_size = file_info + 46 + 4
+        if total_size > MAX_UPLOAD_FILE_SIZE:
+            print("Files larger than 500 MB are not supported!")
+            return -1
+        file_name = os.path.basename(filePath)
+        # MD5 在文件头中发送，必须先于文件内容算出；结果按文件大小与修改时间缓存
+        send_md5 = calculate_file_md5(filePath, use_cache=True)
+        rtn = self.command("FileUpload", fileType, file_name)
+        if rtn != 0:
+            return rtn
+        head_data = f"/f/b{total_size:10d}{send_md5}"
+        return self.__send_file(20010, head_data.encode('utf-8'), filePath, 20, progress)
 
-    @log_call
-    @xmlrpc_timeout
-    def FT_Control(self, flag, sensor_id, select, ft, ft_pid, adj_sign, ILC_sign, max_dis, max_ang, M=None, B=None, polishRadio=0, filter_Sign=0, posAdapt_sign=0, isNoBlock=0):
-        if M is None:
-            M = [0, 0]
-        if B is None:
-            B = [0, 0]
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        sensor_id = int(sensor_id)
-        select = list(map(int, select))
-        ft = list(map(float, ft))
-        ft_pid = list(map(float, ft_pid))
-        adj_sign = int(adj_sign)
-        ILC_sign = int(ILC_sign)
-        max_dis = float(max_dis)
-        max_ang = float(max_ang)
-
-
-        M = list(map(float, M))
-        B = list(map(float, B))
-        polishRadio = float(polishRadio)
-        filter_Sign = int(filter_Sign)
-        posAdapt_sign = int(posAdapt_sign)
-        isNoBlock = int(isNoBlock)
-        flag_tmp = True
-        while flag_tmp:
+    def __send_file(self, port, head_data, file_path, timeout, progress):
+        """连接文件端口发送文件并读取结果，记录传输速率到 file_transfer_stats"""
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.settimeout(timeout)
+        try:
             try:
-                error = self.robot.FT_Control(flag, sensor_id, select, ft, ft_pid, adj_sign, ILC_sign, max_dis,
-                                              max_ang,polishRadio, filter_Sign, posAdapt_sign,[M[0],M[1],B[0],B[0]],isNoBlock)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
+                client.connect((self.ip_address, port))
+            except Exception as e:
+                return RobotError.ERR_OTHER
+            start = time.perf_counter()
+            try:
+                sent = send_file_stream(client, head_data, file_path, progress)
+            except OSError:
+                return RobotError.ERR_SOCKET_SEND_FAILED
+            try:
+                result_buf = client.recv(1024)
+            except OSError:
+                return RobotError.ERR_SOCKET_RECV_FAILED
+            self.__record_transfer(sent, time.perf_counter() - start)
+            if result_buf[:7].decode('utf-8') == "SUCCESS":
+                return RobotError.ERR_SUCCESS
+            else:
+                return RobotError.ERR_OTHER
+        finally:
+            client.close()
 
-        return error
+    def __record_transfer(self, size, seconds):
+        self.file_transfer_stats = {
+            "bytes": size,
+            "seconds": seconds,
+            "MBps": size / seconds / (1024 * 1024) if seconds > 0 else 0.0,
+        }
 
     """   
-    @brief  螺旋线探索
-    @param  [in] 必选参数 rcs 参考坐标系，0-工具坐标系，1-基坐标系
-    @param  [in] 必选参数 ft：力或力矩阈值 (0~100)，单位 N 或 Nm
-    @param  [in] 默认参数 dr：每圈半径进给量，单位 mm 默认0.7
-    @param  [in] 默认参数 max_t_ms：最大探索时间，单位 ms 默认 60000
-    @param  [in] 默认参数 max_vel：线速度最大值，单位 mm/s 默认 5
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  删除文件
+    @param  [in] fileType 文件类型    0-lua文件
+    @param  [in] fileName 文件名称    “test.lua”
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_SpiralSearch(self, rcs, ft, dr=0.7, max_t_ms=60000, max_vel=5):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        rcs = int(rcs)
-        ft = float(ft)
-        dr = float(dr)
-        max_t_ms = float(max_t_ms)
-        max_vel = float(max_vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_SpiralSearch(rcs, ft, dr, max_t_ms, max_vel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def __FileDelete(self, fileType, fileName):
+        rtn = self.command("FileDelete", fileType, fileName)
+        return rtn
 
     """   
-    @brief  旋转插入
-    @param  [in] 必选参数 rcs 参考坐标系，0-工具坐标系，1-基坐标系
-    @param  [in] 必选参数 ft：力或力矩阈值 (0~100)，单位 N 或 Nm
-    @param  [in] 必选参数 orn 力/扭矩方向，1-沿z轴方向，2-绕z轴方向
-    @param  [in] 默认参数 angVelRot：旋转角速度，单位 °/s  默认 3
-    @param  [in] 默认参数 angleMax：最大旋转角度，单位 ° 默认 45
-    @param  [in] 默认参数 angAccmax：最大旋转加速度，单位 °/s^2，暂不使用 默认0
-    @param  [in] 默认参数 rotorn：旋转方向，1-顺时针，2-逆时针 默认1
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  下载Lua文件
+    @param  [in] fileName 要下载的lua文件名“test.lua”
+    @param  [in] savePath 保存文件本地路径“D://Down/”
+    @param  [in] progress 进度回调 progress(已接收字节数, 文件总字节数)，默认None
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_RotInsertion(self, rcs, ft, orn, angVelRot=3, angleMax=45, angAccmax=0, rotorn=1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        rcs = int(rcs)
-        ft = float(ft)
-        orn = int(orn)
-        angVelRot = float(angVelRot)
-        angleMax = float(angleMax)
-        angAccmax = float(angAccmax)
-        rotorn = int(rotorn)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_RotInsertion(rcs, angVelRot, ft, angleMax, orn, angAccmax, rotorn)
-                flag = False
-            except socket.error as e:
-                flag = True
-
+    def LuaDownLoad(self, fileName, savePath, progress=None):
+        error = self.__FileDownLoad(0, fileName, savePath, progress)
         return error
 
     """   
-    @brief  直线插入
-    @param  [in] 必选参数 rcs 参考坐标系，0-工具坐标系，1-基坐标系
-    @param  [in] 必选参数 ft：力或力矩阈值 (0~100)，单位 N 或 Nm
-    @param  [in] 必选参数 disMax：最大插入距离，单位 mm
-    @param  [in] 必选参数 linorn：插入方向:0-负方向，1-正方向
-    @param  [in] 默认参数 lin_v：直线速度，单位 mm/s 默认1
-    @param  [in] 默认参数 lin_a：直线加速度，单位 mm/s^2，暂不使用 默认1
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  上传Lua文件
+    @param  [in] filePath上传文件的全路径名   C://test/test.lua  
+    @param  [in] progress 进度回调 progress(已发送字节数, 文件总字节数)，默认None
+    @return 错误码 成功-0  失败-错误码
     """
 
-    @log_call
-    @xmlrpc_timeout
-    def FT_LinInsertion(self, rcs, ft, disMax, linorn, lin_v=1.0, lin_a=1.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        rcs = int(rcs)
-        ft = float(ft)
-        disMax = float(disMax)
-        linorn = int(linorn)
-        lin_v = float(lin_v)
-        lin_a = float(lin_a)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_LinInsertion(rcs, ft, lin_v, lin_a, disMax, linorn)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def LuaUpload(self, filePath, progress=None):
+        error = self.__FileUpLoad(0, filePath, progress)
+        if error == 0:
+            file_name = os.path.basename(filePath)
+            _error = self.query("LuaUpLoadUpdate", file_name)
+            tmp_error = _error[0]
+            if tmp_error == 0:
+                return tmp_error
+            else:
+                return tmp_error, _error[1]
+        else:
+            return error
 
     """   
-    @brief  计算中间平面位置开始
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  删除Lua文件
+    @param  [in] fileName 要删除的lua文件名“test.lua”
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_CalCenterStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_CalCenterStart()
-                flag = False
-            except socket.error as e:
-                flag = True
-
+    def LuaDelete(self, fileName):
+        error = self.__FileDelete(0, fileName)
         return error
 
     """   
-    @brief  计算中间平面位置结束
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）pos=[x,y,z,rx,ry,rz]
+    @brief  获取当前所有lua文件名称
+    @return 错误码 成功-0  失败-错误码
+    @return 返回值（调用成功返回） lua_num lua文件数量
+    @return 返回值（调用成功返回） luaNames lua文件名列表
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_CalCenterEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FT_CalCenterEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
+    def GetLuaList(self):
+        _error = self.query("GetLuaList")
+        # size = len(_error)
         error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        if _error[0] == 0:
+            lua_num = _error[1]
+            lua_name = _error[2].split(';')
+            return error, lua_num, lua_name
         else:
-            return error,None
+            return error,None,None
 
     """   
-    @brief  表面定位
-    @param  [in] 必选参数 rcs：参考坐标系，0-工具坐标系，1-基坐标系
-    @param  [in] 必选参数 dir：移动方向，1-正方向，2-负方向
-    @param  [in] 必选参数 axis：移动轴，1-x，2-y，3-z
-    @param  [in] 必选参数 disMax：最大探索距离，单位 mm
-    @param  [in] 必选参数 ft：动作终止力阈值，单位 N
-    @param  [in] 默认参数 lin_v：探索直线速度，单位 mm/s 默认3
-    @param  [in] 默认参数 lin_a：探索直线加速度，单位 mm/s^2 默认0
+    @brief  设置机器人加速度
+    @param [in]必选参数 acc 机器人加速度百分比
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_FindSurface(self, rcs, dir, axis, disMax, ft, lin_v=3.0, lin_a=0.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        rcs = int(rcs)
-        dir = int(dir)
-        axis = int(axis)
-        ft = float(ft)
-        lin_v = float(lin_v)
-        lin_a = float(lin_a)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_FindSurface(rcs, dir, axis, lin_v, lin_a, disMax, ft)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOaccScale(self, acc):
+        return self.command("SetOaccScale", acc)
 
     """   
-    @brief  柔顺控制关闭
-    @param  [in] NULL
+    @brief  控制箱AO飞拍开始
+    @param [in]必选参数 AONum 控制箱AO编号
+    @param [in]默认参数 maxTCPSpeed 最大TCP速度值[1-5000mm/s]，默认1000
+    @param [in]默认参数 maxAOPercent 最大TCP速度值对应的AO百分比，默认100%
+    @param [in]必选参数 zeroZoneCmp 死区补偿值AO百分比，整形，默认为20%，范围[0-100]
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_ComplianceStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_ComplianceStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def MoveAOStart(self, AONum, maxTCPSpeed=1000, maxAOPercent=100, zeroZoneCmp=20):
+        return self.command("MoveAOStart", AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
 
     """   
-    @brief  柔顺控制开启
-    @param  [in] 必选参数 p: 位置调节系数或柔顺系数
-    @param  [in] 必选参数 force：柔顺开启力阈值，单位 N
+    @brief  控制箱AO飞拍停止
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FT_ComplianceStart(self, p, force):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        p = float(p)
-        force = float(force)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FT_ComplianceStart(p, force)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def MoveAOStop(self):
+        return self.command("MoveAOStop")
 
     """   
-    @brief  负载辨识滤波初始化
-    @param  [in] NULL
+    @brief  末端AO飞拍开始
+    @param [in]必选参数 AONum 末端AO编号
+    @param [in]必选参数 maxTCPSpeed 最大TCP速度值[1-5000mm/s]，默认1000
+    @param [in]必选参数 maxAOPercent 最大TCP速度值对应的AO百分比，默认100%
+    @param [in]必选参数 zeroZoneCmp 死区补偿值AO百分比，整形，默认为20%，范围[0-100]
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoadIdentifyDynFilterInit(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadIdentifyDynFilterInit()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def MoveToolAOStart(self, AONum, maxTCPSpeed=1000, maxAOPercent=100, zeroZoneCmp=20):
+        return self.command("MoveToolAOStart", AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
 
     """   
-    @brief  负载辨识变量初始化
-    @param  [in] NULL
+    @brief  末端AO飞拍停止
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoadIdentifyDynVarInit(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadIdentifyDynVarInit()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def MoveToolAOStop(self):
+        return self.command("MoveToolAOStop")
 
     """   
-    @brief  负载辨识主程序
-    @param  [in] 必选参数 joint_torque 关节扭矩 j1-j6
-    @param  [in] 必选参数 joint_pos 关节位置 j1-j6
-    @param  [in] 必选参数 t 采样周期
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  末端传感器配置
+    @param  [in]必选参数 idCompany 厂商，18-JUNKONG；25-HUIDE
+    @param  [in]必选参数 idDevice 类型，0-JUNKONG/RYR6T.V1.0
+    @param  [in]必选参数 idSoftware 软件版本，0-J1.0/HuiDe1.0(暂未开放)
+    @param  [in]必选参数 idBus 挂载位置，1-末端1号口；2-末端2号口...8-末端8号口(暂未开放)
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoadIdentifyMain(self, joint_torque, joint_pos, t):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        joint_torque = list(map(float, joint_torque))
-        joint_pos = list(map(float, joint_pos))
-        t = float(t)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadIdentifyMain(joint_torque, joint_pos, t)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def AxleSensorConfig(self,idCompany, idDevice, idSoftware, idBus):
+        return self.command("AxleSensorConfig", idCompany, idDevice, idSoftware, idBus)
 
     """   
-    @brief  获取负载辨识结果
-    @param  [in] 必选参数 gain 重力项系数double[6]，离心项系数double[6] 
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）weight 负载重量
-    @return 返回值（调用成功返回）cog 负载质心 [x,y,z]
+    @brief  获取末端传感器配置    
+    @return 错误码 成功- 0, 失败-错误码  
+    @return 返回值（调用成功返回） idCompany 厂商，18-JUNKONG；25-HUIDE
+    @return 返回值（调用成功返回） idDevice 类型，0-JUNKONG/RYR6T.V1.0
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoadIdentifyGetResult(self, gain):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        gain = list(map(float, gain))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.LoadIdentifyGetResult(gain)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def AxleSensorConfigGet(self):
+        _error = self.query("AxleSensorConfigGet")
 
         error = _error[0]
         if error == 0:
-            return error, _error[1], [_error[2], _error[3], _error[4]]
+            return error, _error[1], _error[2]
         else:
             return error,None,None
 
     """   
-    ***************************************************************************传送带功能********************************************************************************************
-    """
-
-    """   
-    @brief  传动带启动、停止
-    @param  [in] 必选参数 status 状态，1-启动，0-停止 
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  末端传感器激活
+    @param  [in]必选参数 actFlag 0-复位；1-激活
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorStartEnd(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorStartEnd(status)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def AxleSensorActivate(self,actFlag):
+        return self.command("AxleSensorActivate", actFlag)
 
     """   
-    @brief  记录IO检测点
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  末端传感器寄存器写入
+    @param  [in]必选参数 devAddr  设备地址编号 0-255
+    @param  [in]必选参数 regHAddr 寄存器地址高8位
+    @param  [in]必选参数 regLAddr 寄存器地址低8位
+    @param  [in]必选参数 regNum  寄存器个数 0-255
+    @param  [in]必选参数 data1 写入寄存器数值1
+    @param  [in]必选参数 data2 写入寄存器数值2
+    @param  [in]必选参数 isNoBlock 是否阻塞 0-阻塞；1-非阻塞
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorPointIORecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorPointIORecord()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def AxleSensorRegWrite(self,devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock):
+        return self.command("AxleSensorRegWrite", devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock)
 
     """   
-    @brief  记录A点
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置控制箱DO停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorPointARecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorPointARecord()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOutputResetCtlBoxDO(self,resetFlag):
+        return self.command("SetOutputResetCtlBoxDO", resetFlag)
 
     """   
-    @brief  记录参考点
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置控制箱AO停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorRefPointRecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorRefPointRecord()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOutputResetCtlBoxAO(self,resetFlag):
+        return self.command("SetOutputResetCtlBoxAO", resetFlag)
 
     """   
-    @brief  记录B点
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置末端工具DO停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorPointBRecord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorPointBRecord()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOutputResetAxleDO(self,resetFlag):
+        return self.command("SetOutputResetAxleDO", resetFlag)
 
     """   
-    @brief  传送带工件IO检测
-    @param  [in] 必选参数 max_t 最大检测时间，单位ms
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置末端工具AO停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorIODetect(self, max_t):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        max_t = int(max_t)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorIODetect(max_t)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOutputResetAxleAO(self,resetFlag):
+        return self.command("SetOutputResetAxleAO", resetFlag)
 
     """   
-    @brief  获取物体当前位置
-    @param  [in] 必选参数  mode 1-跟踪抓取 2-跟踪运动 3-TPD跟踪
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置扩展DO停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorGetTrackData(self, mode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        mode = int(mode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorGetTrackData(mode)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOutputResetExtDO(self,resetFlag):
+        return self.command("SetOutputResetExtDO", resetFlag)
 
     """   
-    @brief  传动带跟踪开始
-    @param  [in] 必选参数  status 状态，1-启动，0-停止
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置扩展AO停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorTrackStart(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorTrackStart(status)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetOutputResetExtAO(self,resetFlag):
+        return self.command("SetOutputResetExtAO", resetFlag)
 
     """   
-    @brief  传动带跟踪停止
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置SmartTool停止/暂停后输出是否复位
+    @param  [in]必选参数 resetFlag  0-不复位；1-复位
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorTrackEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorTrackEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
+    def SetOutputResetSmartToolDO(self,resetFlag):
+        return self.command("SetOutputResetSmartToolDO", resetFlag)
 
-        return error
 
     """   
-    @brief  传动带参数配置
-    @param  [in] 必选参数  param = [encChannel,resolution,lead,wpAxis,vision,speedRadio]  encChannel编码器通道 1-2,resolution 编码器分辨率 编码器旋转一圈脉冲个数,
-    lead机械传动比 编码器旋转一圈传送带移动距离,wpAxis  工件坐标系编号 针对跟踪运动功能选择工件坐标系编号，跟踪抓取、TPD跟踪设为0,vision 是否配视觉  0 不配  1 配,
-    speedRadio 速度比  针对传送带跟踪抓取速度范围为（1-100）  跟踪运动、TPD跟踪设置为1
-    @param  [in] 必选参数 followType 跟踪运动类型，0-跟踪运动；1-追检运动
-    @param  [in] 默认参数 startDis 追检抓取需要设置， 跟踪起始距离， -1：自动计算(工件到达机器人下方后自动追检)，单位mm， 默认值0
-    @param  [in] 默认参数 endDis 追检抓取需要设置，跟踪终止距离， 单位mm， 默认值100
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置机器人碰撞检测方法
+    @param  [in]必选参数 method 碰撞检测方法：0-电流模式；1-双编码器；2-电流和双编码器同时开启
+    @param  [in]必选参数 thresholdMode 碰撞等级阈值方式；0-碰撞等级固定阈值方式；1-自定义碰撞检测阈值
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorSetParam(self, param, followType, startDis=0, endDis=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        param = list(map(float, param))
-        followType = int(followType)
-        startDis = int(startDis)
-        endDis = int(endDis)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorSetParam(param, followType, startDis, endDis)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetCollisionDetectionMethod(self,method,thresholdMode):
+        return self.command("SetCollisionDetectionMethod", method, thresholdMode)
 
     """   
-    @brief  传动带抓取点补偿
-    @param  [in] 必选参数 cmp 补偿位置 [x,y,z]
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置静态下碰撞检测开始关闭
+    @param  [in]必选参数 status 0-关闭；1-开启
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorCatchPointComp(self, cmp):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        cmp = list(map(float, cmp))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorCatchPointComp(cmp)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetStaticCollisionOnOff(self,status):
+        return self.command("SetStaticCollisionOnOff", status)
 
     """   
-    @brief  直线运动
-    @param  [in] 必选参数  name cvrCatchPoint和cvrRaisePoint
-    @param  [in] 必选参数 tool 工具号
-    @param  [in] 必选参数 wobj 工件号
-    @param  [in] 默认参数 vel 速度 默认20
-    @param  [in] 默认参数 acc 加速度 默认100
-    @param  [in] 默认参数 ovl 速度缩放因子 默认100
-    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  关节扭矩功率检测
+    @param  [in]必选参数 status 0-关闭；1-开启
+    @param  [in]必选参数 power 设定最大功率(W)
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ConveyorTrackMoveL(self, name, tool, wobj, vel=20, acc=100, ovl=100, blendR=-1.0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        name = str(name)
-        tool = int(tool)
-        wobj = int(wobj)
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        blendR = float(blendR)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ConveyorTrackMoveL(name, tool, wobj, vel, acc, ovl, blendR, 0, 0)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    ***************************************************************************焊接功能********************************************************************************************
-    """
-
+    def SetPowerLimit(self,status, power):
+        return self.command("SetPowerLimit", status, power)
 
     """   
-    @brief  焊接开始 
-    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
-    @param  [in] 必选参数 arcNum 焊机配置文件编号
-    @param  [in] 必选参数 timeout 起弧超时时间
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置机器人 20004 端口反馈周期
+    @param  [in]必选参数 period 机器人 20004 端口反馈周期(ms)
+    @return 错误码 成功- 0, 失败-错误码    
     """
 
     @log_call
     @xmlrpc_timeout
-    def ARCStart(self, ioType, arcNum, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        arcNum = int(arcNum)
-        timeout = int(timeout)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ARCStart(ioType, arcNum, timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetRobotRealtimeStateSamplePeriod(self,period):
+        return self.command("SetRobotRealtimeStateSamplePeriod", period)
 
     """   
-    @brief  焊接结束 
-    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
-    @param  [in] 必选参数 arcNum 焊机配置文件编号
-    @param  [in] 必选参数 timeout 熄弧超时时间
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  获取机器人 20004 端口反馈周期
+    @param  [in]NULL
+    @return 错误码 成功- 0, 失败-错误码    
+    @return 返回值（调用成功返回） period 机器人 20004 端口反馈周期(ms)
     """
 
     @log_call
     @xmlrpc_timeout
-    def ARCEnd(self, ioType, arcNum, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        arcNum = int(arcNum)
-        timeout = int(timeout)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ARCEnd(ioType, arcNum, timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def GetRobotRealtimeStateSamplePeriod(self):
+        _error = self.query("GetRobotRealtimeStateSamplePeriod")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1]
+        else:
+            return error,None
 
-        return error
 
     """   
-    @brief  设置焊接电流与输出模拟量对应关系 
-    @param  [in] 必选参数 currentMin 焊接电流-模拟量输出线性关系左侧点电流值(A)
-    @param  [in] 必选参数 currentMax 焊接电流-模拟量输出线性关系右侧点电流值(A)
-    @param  [in] 必选参数 outputVoltageMin 焊接电流-模拟量输出线性关系左侧点模拟量输出电压值(V)
-    @param  [in] 必选参数 outputVoltageMax 焊接电流-模拟量输出线性关系右侧点模拟量输出电压值(V)
-    @param  [in] 必选参数 AOIndex 焊接电流模拟量输出端口
+    @brief  获取关节驱动器当前扭矩
+    @param  [in] 必选参数 NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）data=[j1,j2,j3,j4,j5,j6] 关节扭矩    [fx,fy,fz,tx,ty,tz]
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeldingSetCurrentRelation(self, currentMin, currentMax, outputVoltageMin, outputVoltageMax,AOIndex):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        currentMin = float(currentMin)
-        currentMax = float(currentMax)
-        outputVoltageMin = float(outputVoltageMin)
-        outputVoltageMax = float(outputVoltageMax)
-        AOIndex =int(AOIndex)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrentRelation(currentMin, currentMax, outputVoltageMin, outputVoltageMax,AOIndex)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def GetJointDriverTorque(self):
+        return 0,self.read_state("jointDriverTorque")
 
-        return error
 
     """   
-    @brief  设置焊接电压与输出模拟量对应关系 
-    @param  [in] 必选参数 weldVoltageMin 焊接电压-模拟量输出线性关系左侧点焊接电压值(A)
-    @param  [in] 必选参数 weldVoltageMax 焊接电压-模拟量输出线性关系右侧点焊接电压值(A)
-    @param  [in] 必选参数 outputVoltageMin 焊接电压-模拟量输出线性关系左侧点模拟量输出电压值(V)
-    @param  [in] 必选参数 outputVoltageMax 焊接电压-模拟量输出线性关系右侧点模拟量输出电压值(V)    
-    @param  [in] 必选参数 AOIndex 焊接电压模拟量输出端口
+    @brief  获取关节驱动器当前温度
+    @param  [in] 必选参数 NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）data=[t1,t2,t3,t4,t5,t6]
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeldingSetVoltageRelation(self, weldVoltageMin, weldVoltageMax, outputVoltageMin, outputVoltageMax,AOIndex):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weldVoltageMin = float(weldVoltageMin)
-        weldVoltageMax = float(weldVoltageMax)
-        outputVoltageMin = float(outputVoltageMin)
-        outputVoltageMax = float(outputVoltageMax)
-        AOIndex =int(AOIndex)
+    def GetJointDriverTemperature (self):
+        return 0,self.read_state("jointDriverTemperature")
 
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltageRelation(weldVoltageMin, weldVoltageMax, outputVoltageMin, outputVoltageMax,AOIndex)
-                flag = False
-            except socket.error as e:
-                flag = True
 
-        return error
 
     """   
-    @brief  获取焊接电流与输出模拟量对应关系 
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）currentMin 焊接电流-模拟量输出线性关系左侧点电流值(A)
-    @return 返回值（调用成功返回）currentMax 焊接电流-模拟量输出线性关系右侧点电流值(A)
-    @return 返回值（调用成功返回）outputVoltageMin 焊接电流-模拟量输出线性关系左侧点模拟量输出电压值(V)
-    @return 返回值（调用成功返回）outputVoltageMax 焊接电流-模拟量输出线性关系右侧点模拟量输出电压值(V)
-    @return 返回值（调用成功返回） AOIndex 焊接电压电流模拟量输出端口
+    @brief  指定姿态速度开启
+    @param  [in]必选参数 ratio 姿态速度百分比[0-300]
+    @return 错误码 成功- 0, 失败-错误码    
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeldingGetCurrentRelation(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-
-        try:
-            flag = True
-            while flag:
-                try:
-                    _error = self.robot.WeldingGetCurrentRelation()
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def AngularSpeedStart(self, ratio):
+        return self.command("AngularSpeedStart", ratio)
 
-            error = _error[0]
-            if error == 0:
-                return error, _error[1], _error[2], _error[3], _error[4], _error[5]
-            return _error,None,None,None,None,None
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR,None,None,None,None,None
 
     """   
-    @brief  获取焊接电压与输出模拟量对应关系 
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）weldVoltageMin 焊接电压-模拟量输出线性关系左侧点焊接电压值(A)
-    @return 返回值（调用成功返回）weldVoltageMax 焊接电压-模拟量输出线性关系右侧点焊接电压值(A)
-    @return 返回值（调用成功返回）outputVoltageMin 焊接电压-模拟量输出线性关系左侧点模拟量输出电压值(V)
-    @return 返回值（调用成功返回）outputVoltageMax 焊接电流-模拟量输出线性关系右侧点模拟量输出电压值(V)
-    @return 返回值（调用成功返回） AOIndex 焊接电压模拟量输出端口
+    @brief  指定姿态速度关闭
+    @return 错误码 成功- 0, 失败-错误码    
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeldingGetVoltageRelation(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-
-        try:
-            flag = True
-            while flag:
-                try:
-                    _error = self.robot.WeldingGetVoltageRelation()
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def AngularSpeedEnd(self):
+        return self.command("AngularSpeedEnd")
 
-            error = _error[0]
-            if error == 0:
-                return error, _error[1], _error[2], _error[3], _error[4], _error[5]
-            return _error,None,None,None,None,None
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR,None,None,None,None,None
 
     """   
-    @brief  设置焊接电流 
-    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
-    @param  [in] 必选参数 float current 焊接电流值(A)
-    @param  [in] 必选参数 AOIndex 焊接电流控制箱模拟量输出端口(0-1)
-    @param  [in] 必选参数 blend 是否平滑 0-不平滑，1-平滑
-    @return 错误码 成功- 0, 失败-
+    @brief  获取末端通讯参数
+    @return 错误码 成功- 0, 失败-错误码        
+    @return 返回值（调用成功返回） baudRate 波特率：支持 1-9600，2-14400，3-19200，4-38400，5-56000，6-67600，7-115200，8-128000；
+    @return 返回值（调用成功返回） dataBit 数据位：数据位支持（8,9），目前常用为 8
+    @return 返回值（调用成功返回） stopBit 停止位：1-1，2-0.5，3-2，4-1.5，目前常用为 1
+    @return 返回值（调用成功返回） verify 校验位：0-None，1-Odd，2-Even,目前常用为 0；
+    @return 返回值（调用成功返回） timeout 超时时间：1~1000ms，此值需要结合外设搭配设置合理的时间参数
+    @return 返回值（调用成功返回） timeoutTimes  超时次数：1~10，主要进行超时重发，减少偶发异常提高用户体验
+    @return 返回值（调用成功返回） period 周期性指令时间间隔：1~1000ms，主要用于周期性指令每次下发的时间间隔
     """
 
     @log_call
     @xmlrpc_timeout
-    def WeldingSetCurrent(self, ioType, current, AOIndex,blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        current = float(current)
-        AOIndex = int(AOIndex)
-        blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrent(ioType, current, AOIndex,blend)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def GetAxleCommunicationParam(self):
+        error = self.query("GetAxleCommunicationParam")
 
-        return error
+        if error[0] == 0:
+            return error[0], error[1], error[2], error[3], error[4], error[5], error[6], error[7]
+        else:
+            return error
 
     """   
-    @brief  设置焊接电压 
-    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
-    @param  [in] 必选参数 float voltage 焊接电压值(A)
-    @param  [in] 必选参数 AOIndex 焊接电压控制箱模拟量输出端口(0-1)
-    @param  [in] 必选参数 blend 是否平滑 0-不平滑，1-平滑
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置末端通讯参数
+    @param  [in]  baudRate 波特率：支持 1-9600，2-14400，3-19200，4-38400，5-56000，6-67600，7-115200，8-128000；
+    @param  [in]  dataBit 数据位：数据位支持（8,9），目前常用为 8
+    @param  [in]  stopBit 停止位：1-1，2-0.5，3-2，4-1.5，目前常用为 1
+    @param  [in]  verify 校验位：0-None，1-Odd，2-Even,目前常用为 0；
+    @param  [in]  timeout 超时时间：1~1000ms，此值需要结合外设搭配设置合理的时间参数
+    @param  [in]  timeoutTimes  超时次数：1~10，主要进行超时重发，减少偶发异常提高用户体验
+    @param  [in]  period 周期性指令时间间隔：1~1000ms，主要用于周期性指令每次下发的时间间隔
+    @return 错误码 成功- 0, 失败-错误码        
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeldingSetVoltage(self, ioType, voltage, AOIndex,blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        voltage = float(voltage)
-        AOIndex = int(AOIndex)
-        blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltage(ioType, voltage, AOIndex,blend)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetAxleCommunicationParam(self,baudRate,dataBit,stopBit,verify,timeout,timeoutTimes,period):
+        return self.command("SetAxleCommunicationParam", baudRate, dataBit, stopBit, verify, timeout, timeoutTimes,
+                            period)
 
     """   
-    @brief  设置摆动参数 
-    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
-    @param  [in] 必选参数 int weaveType 摆动类型 0-平面三角波摆动；1-垂直L型三角波摆动；2-顺时针圆形摆动；3-逆时针圆形摆动；4-平面正弦波摆动；5-垂直L型正弦波摆动；6-垂直三角波摆动；7-垂直正弦波摆动
-    @param  [in] 必选参数 float weaveFrequency 摆动频率(Hz)
-    @param  [in] 必选参数 int weaveIncStayTime 等待模式 0-周期不包含等待时间；1-周期包含等待时间
-    @param  [in] 必选参数 float weaveRange 摆动幅度(mm)
-    @param  [in] 必选参数 float weaveLeftRange 垂直三角摆动左弦长度(mm)
-    @param  [in] 必选参数 float weaveRightRange 垂直三角摆动右弦长度(mm)
-    @param  [in] 必选参数 int additionalStayTime 垂直三角摆动垂三角点停留时间(ms)
-    @param  [in] 必选参数 int weaveLeftStayTime 摆动左停留时间(ms)
-    @param  [in] 必选参数 int weaveRightStayTime 摆动右停留时间(ms)
-    @param  [in] 必选参数 int weaveCircleRadio 圆形摆动-回调比率(0-100%)
-    @param  [in] 必选参数 int weaveStationary 摆动位置等待，0-等待时间内位置继续移动；1-等待时间内位置静止
-    @param  [in] 必选参数 float weaveYawAngle 摆动方向方位角（绕摆动Z轴旋转），单位°,默认0
-    @param  [in] 必选参数 float weaveRotAngle 摆动方向方位角（绕摆动X轴旋转），单位°,默认0
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置末端文件传输类型
+    @param  [in] type 1-MCU升级文件；2-LUA文件
+    @return 错误码 成功- 0, 失败-错误码        
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeaveSetPara(self, weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
-                     weaveLeftRange, weaveRightRange, additionalStayTime, weaveLeftStayTime,
-                     weaveRightStayTime, weaveCircleRadio, weaveStationary,weaveYawAngle=0,weaveRotAngle=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        weaveType = int(weaveType)
-        weaveFrequency = float(weaveFrequency)
-        weaveIncStayTime = int(weaveIncStayTime)
-        weaveRange = float(weaveRange)
-        weaveLeftRange = float(weaveLeftRange)
-        weaveRightRange = float(weaveRightRange)
-        additionalStayTime = int(additionalStayTime)
-        weaveLeftStayTime = int(weaveLeftStayTime)
-        weaveRightStayTime = int(weaveRightStayTime)
-        weaveCircleRadio = int(weaveCircleRadio)
-        weaveStationary = int(weaveStationary)
-        weaveYawAngle = float(weaveYawAngle)
-        weaveRotAngle = float(weaveRotAngle)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveSetPara(weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
-                                                weaveLeftRange, weaveRightRange, additionalStayTime,
-                                                weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio, weaveStationary,weaveYawAngle,weaveRotAngle)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
+    def SetAxleFileType(self,type):
+        return self.command("SetAxleFileType", type)
 
     """   
-    @brief  即时设置摆动参数 
-    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
-    @param  [in] 必选参数 int weaveType 摆动类型 0-平面三角波摆动；1-垂直L型三角波摆动；2-顺时针圆形摆动；3-逆时针圆形摆动；4-平面正弦波摆动；5-垂直L型正弦波摆动；6-垂直三角波摆动；7-
-    @param  [in] 必选参数 float weaveFrequency 摆动频率(Hz)
-    @param  [in] 必选参数 int weaveIncStayTime 等待模式 0-周期不包含等待时间；1-周期包含等待时间
-    @param  [in] 必选参数 float weaveRange 摆动幅度(mm)
-    @param  [in] 必选参数 int weaveLeftStayTime 摆动左停留时间(ms)
-    @param  [in] 必选参数 int weaveRightStayTime 摆动右停留时间(ms)
-    @param  [in] 必选参数 int weaveCircleRadio 圆形摆动-回调比率(0-100%)
-    @param  [in] 必选参数 int weaveStationary 摆动位置等待，0-等待时间内位置继续移动；1-等待时间内位置静止
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置启用末端LUA执行
+    @param  [in] enable 0-不启用；1-启用
+    @return 错误码 成功- 0, 失败-错误码        
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeaveOnlineSetPara(self, weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange, weaveLeftStayTime,
-                           weaveRightStayTime, weaveCircleRadio, weaveStationary):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        weaveType = int(weaveType)
-        weaveFrequency = float(weaveFrequency)
-        weaveIncStayTime = int(weaveIncStayTime)
-        weaveRange = float(weaveRange)
-        weaveLeftStayTime = int(weaveLeftStayTime)
-        weaveRightStayTime = int(weaveRightStayTime)
-        weaveCircleRadio = int(weaveCircleRadio)
-        weaveStationary = int(weaveStationary)
-        try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.WeaveOnlineSetPara(weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
-                                                          weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio,
-                                                          weaveStationary)
-                    flag = False
-                except socket.error as e:
-                    flag = True
-
-            return error
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR
+    def SetAxleLuaEnable(self,enable):
+        return self.command("SetAxleLuaEnable", enable)
 
     """   
-    @brief  摆动开始 
-    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  末端LUA文件异常错误恢复
+    @param  [in] status 0-不恢复；1-恢复
+    @return 错误码 成功- 0, 失败-错误码        
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeaveStart(self, weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.WeaveStart(weaveNum)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def SetRecoverAxleLuaErr(self,enable):
+        error = self.command("SetRecoverAxleLuaErr", enable)
 
-            return error
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR
+        return error
 
     """   
-    @brief  摆动结束 
-    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  获取末端LUA执行使能状态
+    @return 错误码 成功- 0, 失败-错误码   
+    @return 返回值（调用成功返回） enable 0-不启用；1-启用
     """
-
     @log_call
     @xmlrpc_timeout
-    def WeaveEnd(self, weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.WeaveEnd(weaveNum)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def GetAxleLuaEnableStatus(self):
+        error = self.query("GetAxleLuaEnableStatus")
 
+        if error[0] == 0:
+            return error[0], error[1]
+        else:
             return error
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR
 
     """   
-    @brief  正向送丝 
-    @param  [in] 必选参数 int ioType io类型  0-控制器IO；1-扩展IO
-    @param  [in] 必选参数 int wireFeed 送丝控制  0-停止送丝；1-送丝
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置末端LUA末端设备启用类型
+    @param  [in] forceSensorEnable 力传感器启用状态，0-不启用；1-启用
+    @param  [in] gripperEnable 夹爪启用状态，0-不启用；1-启用
+    @param  [in] IOEnable IO设备启用状态，0-不启用；1-启用
+    @return 错误码 成功- 0, 失败-错误码        
     """
+    @log_call
+    @xmlrpc_timeout
+    def SetAxleLuaEnableDeviceType(self,forceSensorEnable,gripperEnable,IOEnable):
+        return self.command("SetAxleLuaEnableDeviceType", forceSensorEnable, gripperEnable, IOEnable)
 
+    """   
+    @brief  获取末端LUA末端设备启用类型
+    @return 错误码 成功- 0, 失败-错误码   
+    @return 返回值（调用成功返回） forceSensorEnable 力传感器启用状态，0-不启用；1-启用
+    @return 返回值（调用成功返回） gripperEnable 夹爪启用状态，0-不启用；1-启用
+    @return 返回值（调用成功返回） IOEnable IO设备启用状态，0-不启用；1-启用
+    """
     @log_call
     @xmlrpc_timeout
-    def SetForwardWireFeed(self, ioType, wireFeed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        wireFeed = int(wireFeed)
-        try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.SetForwardWireFeed(ioType, wireFeed)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def GetAxleLuaEnableDeviceType(self):
+        error = self.query("GetAxleLuaEnableDeviceType")
 
+        if error[0] == 0:
+            return error[0], error[1], error[2], error[3]
+        else:
             return error
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR
 
     """   
-    @brief  反向送丝 
-    @param  [in] 必选参数 int ioType io类型  0-控制器IO；1-扩展IO
-    @param  [in] 必选参数 int wireFeed 送丝控制  0-停止送丝；1-送丝
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  获取当前配置的末端设备
+    @return 错误码 成功- 0, 失败-错误码   
+    @return 返回值（调用成功返回） forceSensorEnable[8] 力传感器启用状态，0-不启用；1-启用
+    @return 返回值（调用成功返回） gripperEnable[8] 夹爪启用状态，0-不启用；1-启用
+    @return 返回值（调用成功返回） IOEnable[8]  IO设备启用状态，0-不启用；1-启用
     """
-
     @log_call
     @xmlrpc_timeout
-    def SetReverseWireFeed(self, ioType, wireFeed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        wireFeed = int(wireFeed)
-        try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.SetReverseWireFeed(ioType, wireFeed)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def GetAxleLuaEnableDevice(self):
+        error = self.query("GetAxleLuaEnableDevice")
 
-            return error
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR
+        if error[0] == 0:
+            par= error[1].split(',')
+            if 24 != len(par):
+                self.log_error("GetAxleLuaEnableDevice fail")
+                return -1,None,None,None
+            else:
+                print(par)
+                return (error[0], [par[0],par[1], par[2], par[3], par[4], par[5], par[6], par[7]],
+                        [par[8], par[9], par[10], par[11], par[12], par[13], par[14], par[15]],
+                        [par[16], par[17], par[18], par[19], par[20], par[21], par[22], par[23]])
+        else:
+            return error,None,None,None
 
     """   
-    @brief  送气
-    @param  [in] 必选参数 int ioType io类型  0-控制器IO；1-扩展IO
-    @param  [in] 必选参数 int airControl 送气控制  0-停止送气；1-送气
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  设置启用夹爪动作控制功能
+    @param  [in] id 夹爪设备编号
+    @param  [in] func 0-夹爪使能；1-夹爪初始化；2-位置设置；3-速度设置；4-力矩设置；6-读夹爪状态；7-读初始化状态；8-读故障码；9-读位置；10-读速度；11-读力矩,12-15预留
+    @return 错误码 成功- 0, 失败-错误码        
     """
+    @log_call
+    @xmlrpc_timeout
+    def SetAxleLuaGripperFunc(self,id,func):
+        return self.command("SetAxleLuaGripperFunc", id, func)
 
+    """   
+    @brief  获取启用夹爪动作控制功能
+    @param  [in] id 夹爪设备编号
+    @return 错误码 成功- 0, 失败-错误码   
+    @return 返回值（调用成功返回） func 0-夹爪使能；1-夹爪初始化；2-位置设置；3-速度设置；4-力矩设置；6-读夹爪状态；7-读初始化状态；8-读故障码；9-读位置；10-读速度；11-读力矩
+    """
     @log_call
     @xmlrpc_timeout
-    def SetAspirated(self, ioType, airControl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        airControl = int(airControl)
-        try:
-            flag = True
-            while flag:
-                try:
-                    error = self.robot.SetAspirated(ioType, airControl)
-                    flag = False
-                except socket.error as e:
-                    flag = True
+    def GetAxleLuaGripperFunc(self,id):
+        id=int(id)
+        error = self.query("GetAxleLuaGripperFunc", id)
 
+        if error[0] == 0:
+            par = error[1].split(',')
+            print(len(par))
+            if 16 != len(par):
+                self.log_error("GetAxleLuaEnableDevice fail")
+                return -1
+            else:
+                return (error[0], [par[0],par[1],par[2], par[3], par[4], par[5], par[6], par[7], par[8],
+                        par[9], par[10], par[11], par[12], par[13], par[14], par[15]])
+        else:
             return error
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR
-
 
     """   
-    @brief  段焊获取位置和姿态
-    @param  [in]必选参数 startPos=[x,y,z,rx,ry,rz] 起始点坐标
-    @param  [in]必选参数 endPos=[x,y,z,rx,ry,rz] 终止点坐标
-    @param  [in]必选参数 startDistance 焊接点至起点的长度
-    @return 错误码 成功- 0, 失败-错误码    
-    @return 返回值（调用成功返回） weldPointDesc=[x,y,z,rx,ry,rz] 焊接点的笛卡尔坐标信息
-    @return 返回值（调用成功返回） weldPointJoint=[j1,j2,j3,j4,j5,j6] 焊接点的关节坐标信息
-    @return 返回值（调用成功返回） tool 工具号
-    @return 返回值（调用成功返回） user 工件号
+    @brief  设置控制器外设协议LUA文件名
+    @param  [in]  id 协议编号
+    @param  [in] name lua文件名称 “CTRL_LUA_test.lua”
+    @return 错误码 成功- 0, 失败-错误码        
     """
+    @log_call
+    @xmlrpc_timeout
+    def SetCtrlOpenLUAName(self,id,name):
+        return self.command("SetCtrlOpenLUAName", id, name)
 
+    """   
+    @brief  获取当前配置的控制器外设协议LUA文件名
+    @return 错误码 成功- 0, 失败-错误码     
+    @return 返回值（调用成功返回） name[4] lua文件名称 “CTRL_LUA_test.lua”
+    """
     @log_call
     @xmlrpc_timeout
-    def GetSegmentWeldPoint(self, startPos, endPos, startDistance):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        startPos = list(map(float, startPos))
-        endPos = list(map(float, endPos))
-        startDistance = float(startDistance)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSegmentWeldPoint(startPos, endPos, startDistance)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def GetCtrlOpenLUAName(self):
+        error = self.query("GetCtrlOpenLUAName")
 
-        error = _error[0]
-        if error == 0:
-            data = _error[1].split(',')
-            if len(data) != 14:
-                self.log_error("GetSegmentWeldPoint fail")
+        if error[0] == 0:
+            par = error[2].split(',')
+            if 4 != sizeof(par):
+                self.log_error("GetCtrlOpenLUAName fail")
                 return -1
             else:
-                data = list(map(float,data))
-                tool = int(data[12])
-                work = int(data[13])
-                return (error, [ data[0],data[1],data[3],data[4],data[4],data[5]],
-                        [data[6],data[7],data[8],data[9],data[10],data[11]],tool, work)
+                return error[0], [error[1], error[2], error[3], error[4]]
         else:
-            return error,None,None,None
+            return error
 
     """   
-    @brief  分段焊接启动
-    @param  [in] 必选参数 startDesePos: 初始笛卡尔位姿，单位 [mm][°]
-    @param  [in] 必选参数 endDesePos: 目标笛卡尔位姿，单位 [mm][°]
-    @param  [in] 必选参数 startJPos: 目标关节位置，单位 [°]
-    @param  [in] 必选参数 endJPos: 目标关节位置，单位 [°] 
-    @param  [in] 必选参数 weldLength: 焊接长度，单位 [mm]
-    @param  [in] 必选参数 noWeldLength: 非焊接长度，单位 [mm]    
-    @param  [in] 必选参数 weaveType 摆动类型 0-平面三角波摆动；1-垂直L型三角波摆动；2-顺时针圆形摆动；3-逆时针圆形摆动；4-平面正弦波摆动；5-垂直L型正弦波摆动；6-垂直三角波摆动；7-垂直正弦波摆动
-    @param  [in] 必选参数 arcNum 焊机配置文件编号
-    @param  [in] 必选参数 timeout 熄弧超时时间
-    @param  [in] 必选参数 isWeave true-焊接 false-不焊接
-    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
-    @param  [in] 必选参数 tool: 工具号，[0~14]
-    @param  [in] 必选参数 tool: 工具号，[0~14]
-    @param  [in] 必选参数 user: 工件号，[0~14]
-    @param  [in] 默认参数 vel：速度百分比，[0~100] 默认20.0
-    @param  [in] 默认参数 acc：加速度百分比，[0~100] 暂不开放 默认0.0
-    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0
-    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0
-    @param  [in] 默认参数 exaxis_pos: 外部轴 1 位置 ~ 外部轴 4 位置 默认[0.0,0.0,0.0,0.0]
-    @param  [in] 默认参数 search:[0]-不焊丝寻位，[1]-焊丝寻位
-    @param  [in] 默认参数 offset_flag:[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
-    @param  [in] 默认参数 offset_pos: 位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
-    @return 错误码 成功- 0, 失败-错误码
+    @brief  加载控制器LUA协议
+    @param  [in] id 控制器LUA协议编号
+    @return 错误码 成功- 0, 失败-错误码     
     """
 
     @log_call
     @xmlrpc_timeout
-    def SegmentWeldStart(self, startDesePos, endDesePos, startJPos, endJPos, weldLength, noWeldLength, weldIOType,
-                         arcNum, weldTimeout, isWeave, weaveNum, tool, user,
-                         vel=20.0, acc=0.0, ovl=100.0, blendR=-1.0, exaxis_pos=[0.0, 0.0, 0.0, 0.0], search=0,
-                         offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
-        startDesePos = list(map(float, startDesePos))
-        endDesePos = list(map(float, endDesePos))
-        startJPos = list(map(float, startJPos))
-        endJPos = list(map(float, endJPos))
-
-        weldLength = float(weldLength)
-        noWeldLength = float(noWeldLength)
-        weldIOType = int(weldIOType)
-        arcNum = int(arcNum)
-        weldTimeout = int(weldTimeout)
-        isWeave = bool(isWeave)
-        weaveNum = int(weaveNum)
-        tool = int(tool)
-        user = int(user)
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        blendR = float(blendR)
-        exaxis_pos = list(map(float, exaxis_pos))
-        search = int(search)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-
-        rtn = 0
-        # 获取起点到终点之间的距离和各方向角度余弦值
-        # print("1",startDesePos,endDesePos)
-        result = self.robot.GetSegWeldDisDir(startDesePos[0], startDesePos[1], startDesePos[2], endDesePos[0],
-                                             endDesePos[1], endDesePos[2])
-        # print("result",result)
-        if result[0] != 0:
-            return int(result[0])
-
-        distance = result[1]
-        endOffPos = list(offset_pos)
-
-        rtn = self.robot.MoveJ(startJPos, startDesePos, tool, user, vel, acc, ovl, exaxis_pos, blendR, offset_flag,
-                               offset_pos)
-        # print("rtn1", rtn)
-        if rtn != 0:
-            return rtn
-
-        weldNum = 0
-        noWeldNum = 0
-        i = 0
-        while i < int(distance / (weldLength + noWeldLength)) * 2 + 2:
-            if i % 2 == 0:
-                weldNum += 1
-                if weldNum * weldLength + noWeldNum * noWeldLength > distance:
-
-                    rtn = self.robot.ARCStart(weldIOType, arcNum, weldTimeout)
-                    # print("rtn2", rtn)
-                    if rtn != 0:
-                        return rtn
-                    if isWeave:
-                        rtn = self.robot.WeaveStart(weaveNum)
-                        if rtn != 0:
-                            # print("rtn3", rtn)
-                            return rtn
-
-                    # getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
-                    # # print("getsegmentrtn", getsegmentrtn)
-                    # # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
-                    # # print("weldNum", weldNum, "weldLength", weldLength)
-                    # # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
-                    # if getsegmentrtn[0] != 0  :
-                    #     return getsegmentrtn[0]
-                    # data = getsegmentrtn[1].split(',')
-                    # data = list(map(float, data))
-                    # if len(data) != 14:
-                    #     self.log_error("GetSegmentWeldPoint fail")
-                    #     return -1
-                    # tmpJoint = [data[0],data[1],data[2],data[3],data[4],data[5]]
-                    # tmpWeldDesc = [data[6],data[7],data[8],data[9],data[10],data[11]]
-                    # tmpTool = int(data[12])
-                    # tmpUser = int(data[13])
-                    rtn = self.robot.MoveL(endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
-                    # print("rtn3", rtn,endJPos,endDesePos)
-                    if rtn != 0:
-                        self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
-                        if isWeave:
-                            rtn = self.robot.WeaveEnd(weaveNum)
-                            # print("rtn4", rtn)
-                            if rtn != 0:
-                                return rtn
-                        return rtn
-                    rtn = self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
-                    # print("rtn5", rtn)
-                    if rtn != 0:
-                        break
-                    if isWeave:
-                        rtn = self.robot.WeaveEnd(weaveNum)
-                        # print("rtn6", rtn)
-                        if rtn != 0:
-                            break
-
-                else:
-                    rtn = self.robot.ARCStart(weldIOType, arcNum, weldTimeout)
-                    # print("rtn7", rtn)
-                    if rtn != 0:
-                        return rtn
-                    if isWeave:
-                        rtn = self.robot.WeaveStart(weaveNum)
-                        # print("rtn8", rtn)
-                        if rtn != 0:
-                            return rtn
-
-                    getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos, endDesePos,
-                                                                   weldNum * weldLength + noWeldNum * noWeldLength)
-                    # print("rtn9", getsegmentrtn)
-                    # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
-                    # print("weldNum", weldNum, "weldLength", weldLength)
-                    # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
-                    if getsegmentrtn[0] != 0:
-                        return getsegmentrtn[0]
-                    data = getsegmentrtn[1].split(',')
-                    data = list(map(float, data))
-                    if len(data) != 14:
-                        self.log_error("GetSegmentWeldPoint fail")
-                        return -1
-                    tmpJoint = [data[0], data[1], data[2], data[3], data[4], data[5]]
-                    tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
-                    tmpTool = int(data[12])
-                    tmpUser = int(data[13])
-                    # print("tmpJoint",tmpJoint,tmpWeldDesc,tmpTool,tmpUser)
-                    time.sleep(1)
-                    nihao = self.robot.MoveL(tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
-                    # print("rtn10nihao", nihao)
-                    if nihao != 0:
-                        self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
-                        if isWeave:
-                            rtn = self.robot.WeaveEnd(weaveNum)
-                            # print("rtn11", rtn)
-                            if rtn != 0:
-                                return rtn
-                        return rtn
-                    rtn = self.robot.ARCEnd(weldIOType, arcNum, weldTimeout)
-                    # print("rtn12", rtn)
-                    if rtn != 0:
-                        return rtn
-                    if isWeave:
-                        rtn = self.robot.WeaveEnd(weaveNum)
-                        # print("rtn13", rtn)
-                        if rtn != 0:
-                            return rtn
-            else:
-                noWeldNum += 1
-                if weldNum * weldLength + noWeldNum * noWeldLength > distance:
-                    # getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos, endDesePos, weldNum* weldLength + noWeldNum * noWeldLength)
-                    # # print("rtn14", getsegmentrtn)
-                    # # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
-                    # # print("weldNum", weldNum, "weldLength", weldLength)
-                    # # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
-                    # if getsegmentrtn[0] != 0:
-                    #     return getsegmentrtn[0]
-                    # data = getsegmentrtn[1].split(',')
-                    # data = list(map(float,data))
-                    # if len(data) != 14:
-                    #     self.log_error("GetSegmentWeldPoint fail")
-                    #     return -1
-                    # tmpJoint = [data[0], data[1], data[2], data[3], data[4], data[5]]
-                    # tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
-                    # tmpTool = int(data[12])
-                    # tmpUser = int(data[13])
-                    rtn = self.robot.MoveL(endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
-                    # print("rtn15", rtn,endJPos,endDesePos)
-                    if rtn != 0:
-                       return rtn
-                    break
-                else:
-                    getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos, endDesePos, weldNum* weldLength + noWeldNum * noWeldLength)
-                    # print("rtn16", getsegmentrtn,startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
-
-                    # print(startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
-                    # print("weldNum",weldNum,"weldLength",weldLength)
-                    # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
-                    if getsegmentrtn[0] != 0:
-                        return getsegmentrtn[0]
-                    data = getsegmentrtn[1].split(',')
-                    data = list(map(float, data))
-                    if len(data) != 14:
-                        self.log_error("GetSegmentWeldPoint fail")
-                        return -1
-                    tmpJoint = [data[0], data[1], data[2], data[3], data[4], data[5]]
-                    tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
-                    tmpTool = int(data[12])
-                    tmpUser = int(data[13])
-                    rtn = self.robot.MoveL(tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
-                                           search, 0, endOffPos)
-                    # print("rtn17", rtn)
-                    if rtn != 0:
-                        return rtn
-            i =i + 1
-        return rtn
+    def LoadCtrlOpenLUA(self,id):
+        return self.command("LoadCtrlOpenLUA", id)
 
     """   
-    @brief  分段焊接终止
-    @param  [in] 必选参数 ioType：io类型 0-控制器IO； 1-扩展IO
-    @param  [in] 必选参数 arcNum：焊机配置文件编号
-    @param  [in] 必选参数 timeout：熄弧超时时间
-    @return 错误码 成功- 0, 失败-错误码
+    @brief   卸载控制器LUA协议
+    @param  [in] id 控制器LUA协议编号
+    @return 错误码 成功- 0, 失败-错误码     
     """
 
     @log_call
     @xmlrpc_timeout
-    def SegmentWeldEnd(self, ioType, arcNum, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ioType = int(ioType)
-        arcNum = int(arcNum)
-        timeout = int(timeout)
+    def UnloadCtrlOpenLUA(self,id):
+        return self.command("UnloadCtrlOpenLUA", id)
 
-        flag = True
-        while flag:
-            try:
-                rtn = self.robot.SegmentWeldEnd(ioType, arcNum, timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
+    """   
+    @brief  设置控制器LUA协议错误码
+    @param  [in] id 控制器LUA协议编号
+    @return 错误码 成功- 0, 失败-错误码     
+    """
 
-        return rtn
+    @log_call
+    @xmlrpc_timeout
+    def SetCtrlOpenLuaErrCode(self,id):
+        return self.command("SetCtrlOpenLuaErrCode", id)
 
     """   
-    @brief  初始化日志参数
-    @param  [in]默认参数 output_model：输出模式，0-直接输出；1-缓冲输出；2-异步输出，默认1
-    @param  [in]默认参数 file_path： 文件保存路径+名称，名称必须是xxx.log的形式，比如/home/fr/linux/fairino.log。
-                    默认执行程序所在路径，默认名称fairino_ year+month+data.log(如:fairino_2024_03_13.log);
-    @param  [in]默认参数 file_num：滚动存储的文件数量，1~20个，默认值为5。单个文件上限50M;
-    @return 错误码 成功-0  失败-错误码
+    @brief  机器人Ethercat从站文件写入
+    @param  [in] type 从站文件类型，1-升级从站文件；2-升级从站配置文件
+    @param  [in] slaveID 从站号
+    @param  [in] fileName 上传文件名
+    @return 错误码 成功- 0, 失败-错误码     
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoggerInit(self, output_model=1, file_path="", file_num=5):
-        return self.setup_logging(output_model, file_path, file_num)
+    def SlaveFileWrite(self,type,slaveID,fileName):
+        return self.command("SlaveFileWrite", type, slaveID, fileName)
 
     """   
-    @brief  设置日志过滤等级
-    @param  [in] 默认参数 lvl: 过滤等级值，值越小输出日志越少, 1-error, 2-warnning, 3-inform, 4-debug,默认值是1.
-    @return 错误码 成功-0  失败-错误码
+    @brief  机器人Ethercat从站进入boot模式
+    @return 错误码 成功- 0, 失败-错误码     
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetLoggerLevel(self, lvl=1):
-        lvl=int(lvl)
-        log_level = self.set_log_level(lvl)
-        return 0
+    def SetSysServoBootMode(self):
+        return self.command("SetSysServoBootMode")
 
     """   
-    @brief  下载点位表数据库
-    @param  [in] pointTableName 要下载的点位表名称    pointTable1.db
-    @param  [in] saveFilePath 下载点位表的存储路径   C://test/
-    @return 错误码 成功-0  失败-错误码
+    @brief  上传末端Lua开放协议文件
+    @param  [in] filePath 本地lua文件路径名 ".../AXLE_LUA_End_DaHuan.lua"
+    @return 错误码 成功- 0, 失败-错误码     
     """
 
     @log_call
     @xmlrpc_timeout
-    def PointTableDownLoad(self, point_table_name, save_file_path):
-        if not os.path.exists(save_file_path):
-            return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
+    def AxleLuaUpload(self,filePath):
 
-        rtn = self.robot.PointTableDownload(point_table_name)
-        if rtn == -1:
-            return RobotError.ERR_POINTTABLE_NOTFOUND
-        elif rtn != 0:
+        error = self.__FileUpLoad(10,filePath)
+        file_name = "/tmp/" + os.path.basename(filePath)
+        # file_name = os.path.basename(filePath)
+        if 0!= error :
+            return error
+        else:
+            rtn = self.SetAxleFileType(2)
+            if(rtn!=0):
+                return -1
+            rtn = self.SetSysServoBootMode()
+            if(rtn!=0):
+                return -1
+            rtn = self.SlaveFileWrite(1,7,file_name)
+            if(rtn!=0):
+                return -1
             return rtn
-        port = 20011
-        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client.settimeout(2)
-        try:
-            client.connect((self.ip_address, port))
-        except Exception as e:
-            client.close()
-            return RobotError.ERR_OTHER
-        total_buffer = bytearray(1024 * 1024 * 50)  # 50Mb
-        total_size = 0
-        recv_md5 = ""
-        recv_size = 0
-        find_head_flag = False
-        while True:
-            buffer = client.recv(1024)
-            length = len(buffer)
-            if length < 1:
-                return RobotError.ERR_OTHER
-            total_buffer[total_size:total_size + len(buffer)] = buffer
-
-            total_size += len(buffer)
-            if not find_head_flag and total_size > 4 and total_buffer[:4].decode('utf-8') == "/f/b":
-                find_head_flag = True
-            # 找到文件头后，提取文件大小和MD5校验码。文件大小的信息位于总数据的第5到第12个字节，MD5校验码的信息位于总数据的第13到第44个字节。
-            if find_head_flag and total_size > 12 + 32:
-                recv_size = int(total_buffer[4:12].decode('utf-8'))
-                recv_md5 = total_buffer[12:44].decode('utf-8')
-            # 接收到整个文件跳出循环
-            if find_head_flag and total_size == recv_size:
-                break
-        if total_size == 0:
-            return RobotError.ERR_OTHER
-        file_buffer = total_buffer[12 + 32:total_size - 4]
 
-        with open(os.path.join(save_file_path, point_table_name), 'wb') as file_writer:
-            file_writer.write(file_buffer[:total_size - 16 - 32])
 
-        check_md5 = calculate_file_md5(save_file_path + point_table_name)
-        if check_md5 == recv_md5:
-            client.send("SUCCESS".encode('utf-8'))
-            return 0
-        else:
-            client.send("FAIL".encode('utf-8'))
-            os.remove(os.path.join(save_file_path, point_table_name))
-            return RobotError.ERR_OTHER
+    """   
+    ***************************************************************************新增********************************************************************************************
+    """
 
     """   
-    @brief  上传点位表数据库
-    @param  [in] pointTableFilePath 上传点位表的全路径名   C://test/pointTable1.db
-    @return 错误码 成功-0  失败-错误码
+    @brief 关闭RPC
+    @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
-    @xmlrpc_timeout
-    def PointTableUpLoad(self, point_table_file_path):
-        MAX_UPLOAD_FILE_SIZE = 2 * 1024 * 1024  # 最大上传文件为2Mb
-        # 判断上传文件是否存在
-        if not os.path.exists(point_table_file_path):
-            return RobotError.ERR_UPLOAD_FILE_NOT_FOUND
+    def CloseRPC(self):
+        # 设置停止事件以通知线程停止
+        self.stop_event.set()
+        # 唤醒正在等待状态的线程
+        self.state_store.close()
+        # 停止重连并唤醒等待重连的指令
+        self.supervisor.close()
 
-        file_info = os.path.getsize(point_table_file_path)
-        total_size = file_info + 16 + 32
-        if total_size > MAX_UPLOAD_FILE_SIZE:
-            print("Files larger than 2 MB are not supported!")
-            return -1
-
-        point_table_name = os.path.basename(point_table_file_path)
-
-        rtn = self.robot.PointTableUpload(point_table_name)
-        if rtn != 0:
-            return rtn
-
-        port = 20010
-
-        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client.settimeout(2)
-
-        try:
-            client.connect((self.ip_address, port))
-        except Exception as e:
-            client.close()
-            return RobotError.ERR_OTHER
-
-        client.settimeout(2)
-
-        # client.receive_timeout = 2000
-        # client.send_timeout = 2000
-
-        send_md5 = calculate_file_md5(point_table_file_path)
+        # 如果线程仍在运行，则等待其结束
+        # if self.thread.is_alive():
+        #     self.thread.join()
 
-        head_data = f"/f/b{total_size:08d}{send_md5}"
-        num = client.send(head_data.encode('utf-8'))
-        if num < 1:
-            return RobotError.ERR_OTHER
+        # 清理 XML-RPC 代理
+        if self.robot is not None:
+            self.robot = None  # 将代理设置为 None，释放资源
+            self.transport.close()
+            if self.sock_cli_state:
+                self.sock_cli_state.close()
+            self.sock_cli_state = None
+            self.robot_state_pkg = None
+            self.closeRPC_state = True
+            # self.robot_realstate_exit = False
 
-        with open(point_table_file_path, 'rb') as fs:
-            file_bytes = fs.read()
+        # 如果线程仍在运行，则等待其结束
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join()
 
-        num = client.send(file_bytes)
-        if num < 1:
-            return RobotError.ERR_OTHER
-        end_data = "/b/f"
-        num = client.send(end_data.encode('utf-8'))
-        if num < 1:
-            return RobotError.ERR_OTHER
 
-        result_buf = client.recv(1024)
-        if result_buf[:7].decode('utf-8') == "SUCCESS":
-            return RobotError.ERR_SUCCESS
-        else:
-            return RobotError.ERR_OTHER
+        print("RPC connection closed.")
+        return
 
     """   
-    @brief  点位表切换
-    @param  [in] PointTableSwitch 要切换的点位表名称   "pointTable1.db",当点位表为空，即""时，表示将lua程序更新为未应用点位表的初始程序
-    @return 错误码 成功-0   失败-错误码 
-    @return 错误errorStr
+    @brief 记录示教点
+    @param [in] name 示教点名称
+    @param [in] update_allprogramfile 是否覆盖 0-不覆盖 1-覆盖
+    @return 错误码 成功- 0, 失败-错误码
     """
 
-    @log_call
-    @xmlrpc_timeout
-    def PointTableSwitch(self, point_table_name):
-        rtn = self.robot.PointTableSwitch(point_table_name)  # 切换点位表
-        if rtn != 0:
-            if rtn == RobotError.ERR_POINTTABLE_NOTFOUND:
-                error_str = "PointTable not Found!"
-            else:
-                error_str = "PointTable not Found!"
-            return rtn, error_str
-        return rtn
+    # @log_call
+    # @xmlrpc_timeout
+    #
+    # def SavePoint(self,name,update_allprogramfile=0):
+    #     name = str(name)
+    #     update_allprogramfile = int(update_allprogramfile)
+    #     error = self.robot.save_point(name,update_allprogramfile)
+    #     return error
 
     """   
-    @brief  点位表更新lua文件
-    @param  [in] pointTableName 要切换的点位表名称   "pointTable1.db",当点位表为空，即""时，表示将lua程序更新为未应用点位表的初始程序
-    @param  [in] luaFileName 要更新的lua文件名称   "testPointTable.lua"
-    @return 错误码 成功-0   失败-错误码 
-    @return 错误errorStr
+    @brief 开始奇异位姿保护
+    @param [in] protectMode 奇异保护模式，0：关节模式；1-笛卡尔模式
+    @param [in] minShoulderPos 肩奇异调整范围(mm), 默认100.0
+    @param [in] minElbowPos 肘奇异调整范围(mm), 默认50.0
+    @param [in] minWristPos 腕奇异调整范围(°), 默认10.0
+    @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def PointTableUpdateLua(self, point_table_name, lua_file_name):
-        try:
-
-            rtn = self.robot.PointTableSwitch(point_table_name)  # 切换点位表
-            if rtn != 0:
-                if rtn == RobotError.ERR_POINTTABLE_NOTFOUND:
-                    error_str = "PointTable not Found!"
-                else:
-                    error_str = "PointTable not Found!"
-                return rtn, error_str
-
-            time.sleep(0.3)  # 增加延时确保切换后后端确实收到切换后的点位表名称
 
-            result = self.robot.PointTableUpdateLua(lua_file_name)
-            error_str = result[1]
-            if not error_str:
-                error_str = "fail to update lua, please inspect pointtable"
-            return result[0], error_str
-
-        except Exception as e:
-            return RobotError.ERR_RPC_ERROR, ""
+    def SingularAvoidStart(self, protectMode, minShoulderPos=100,minElbowPos=50,minWristPos=10):
+        return self.command("SingularAvoidStart", protectMode, minShoulderPos, minElbowPos, minWristPos)
 
     """   
-    @brief  下载文件
-    @param  [in] fileType 文件类型    0-lua文件
-    @param  [in] fileName 文件名称    “test.lua”
-    @param  [in] saveFilePath 保存文件路径    “C：//test/”
-    @return 错误码 成功-0  失败-错误码
+    @brief 停止奇异位姿保护
+    @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def __FileDownLoad(self, fileType, fileName, saveFilePath):
-        if not os.path.exists(saveFilePath):
-            return RobotError.ERR_SAVE_FILE_PATH_NOT_FOUND
-        rtn = self.robot.FileDownload(fileType, fileName)
-        if rtn == -1:
-            return RobotError.ERR_POINTTABLE_NOTFOUND
-        elif rtn != 0:
-            return rtn
-        port = 20011
-        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client.settimeout(2)
-        try:
-            client.connect((self.ip_address, port))
-        except Exception as e:
-            client.close()
-            return RobotError.ERR_OTHER
-        total_buffer = bytearray(1024 * 1024 * 50)  # 50Mb
-        total_size = 0
-        recv_md5 = ""
-        recv_size = 0
-        find_head_flag = False
-        while True:
-            buffer = client.recv(1024)
-            length = len(buffer)
-            if length < 1:
-                return RobotError.ERR_OTHER
-            total_buffer[total_size:total_size + len(buffer)] = buffer
-            total_size += len(buffer)
-            if not find_head_flag and total_size > 4 and total_buffer[:4].decode('utf-8') == "/f/b":
-                find_head_flag = True
-            # 找到文件头后，提取文件大小和MD5校验码。文件大小的信息位于总数据的第5到第12个字节，MD5校验码的信息位于总数据的第13到第44个字节。
-            # if find_head_flag and total_size > 12 + 32:
-            if find_head_flag and total_size > 14 + 32:
-                # recv_size = int(total_buffer[4:12].decode('utf-8'))
-                recv_size = int(total_buffer[4:14].decode('utf-8'))
-                # recv_md5 = total_buffer[12:44].decode('utf-8')
-                recv_md5 = total_buffer[14:46].decode('utf-8')
-            # 接收到整个文件跳出循环
-            if find_head_flag and total_size == recv_size:
-                break
-        if total_size == 0:
-            return RobotError.ERR_OTHER
-        # file_buffer = total_buffer[12 + 32:total_size - 4]
-        file_buffer = total_buffer[14 + 32:total_size - 4]
-        with open(os.path.join(saveFilePath, fileName), 'wb') as file_writer:
-            # file_writer.write(file_buffer[:total_size - 16 - 32])
-            file_writer.write(file_buffer[:total_size - 16 - 32 - 2])
-        check_md5 = calculate_file_md5(saveFilePath + fileName)
-        if check_md5 == recv_md5:
-            client.send("SUCCESS".encode('utf-8'))
-            return 0
-        else:
-            client.send("FAIL".encode('utf-8'))
-            os.remove(os.path.join(saveFilePath, fileName))
-            # return RobotError.ERR_OTHER
-            return RobotError.ERR_DOWN_LOAD_FILE_FAILED
+
+    def SingularAvoidEnd(self):
+        return self.command("SingularAvoidEnd")
 
     """   
-    @brief  上传文件
-    @param  [in] fileType 文件类型    0-lua文件
-    @param  [in] filePath上传文件的全路径名    C://test/test.lua     
-    @return 错误码 成功-0  失败-错误码
+        @brief 获取旋转夹爪的旋转圈数
+        @return 错误码 成功- 0, 失败-错误码
+        @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+        @return 返回值（调用成功返回） num 旋转圈数
     """
 
     @log_call
     @xmlrpc_timeout
-    def __FileUpLoad(self, fileType, filePath):
-
-        if not os.path.exists(filePath):
-            return RobotError.ERR_POINTTABLE_NOTFOUND
-
-        MAX_UPLOAD_FILE_SIZE = 500 * 1024 * 1024;  # 最大上传文件为500Mb
-        file_info = os.path.getsize(filePath)
-        total_size = file_info + 46 + 4
-        if total_size > MAX_UPLOAD_FILE_SIZE:
-            print("Files larger than 500 MB are not supported!")
-            return -1
-        file_name = os.path.basename(filePath)
-        rtn = self.robot.FileUpload(fileType, file_name)
-        if rtn != 0:
-            return rtn
-
-        port = 20010
-
-        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client.settimeout(20)
-
-        try:
-            client.connect((self.ip_address, port))
-        except Exception as e:
-            client.close()
-            return RobotError.ERR_OTHER
-        client.settimeout(20)
-
-        send_md5 = calculate_file_md5(filePath)
-        head_data = f"/f/b{total_size:10d}{send_md5}"
-        num = client.send(head_data.encode('utf-8'))
-
-        if num < 1:
-            return RobotError.ERR_OTHER
 
-        with open(filePath, "rb") as f:
-            while True:
-                data = f.read(2 * 1024 * 1024)
-                if not data:  # 如果读取到文件末尾
-                    end_data = "/b/f"
-                    num = client.send(end_data.encode('utf-8'))  # 发送文件传输完成的标志
-                    if num < 1:
-                        return RobotError.ERR_OTHER
-                    break  # 跳出循环
-                num = client.send(data)  # 将读取的数据通过socket连接发送给客户端
-                if num < 1:
-                    return RobotError.ERR_OTHER
-        time.sleep(0.5)
-        result_buf = client.recv(1024)
-        if result_buf[:7].decode('utf-8') == "SUCCESS":
-            return RobotError.ERR_SUCCESS
-        else:
-            return RobotError.ERR_OTHER
+    def GetGripperRotNum(self):
+        fault, value = self.read_state("gripper_fault", "gripperRotNum")
+        return 0, fault, value
 
     """   
-    @brief  删除文件
-    @param  [in] fileType 文件类型    0-lua文件
-    @param  [in] fileName 文件名称    “test.lua”
-    @return 错误码 成功-0  失败-错误码
+        @brief 获取旋转夹爪的旋转速度百分比
+        @return 错误码 成功- 0, 失败-错误码
+        @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+        @return 返回值（调用成功返回） speed 旋转速度百分比
     """
 
     @log_call
     @xmlrpc_timeout
-    def __FileDelete(self, fileType, fileName):
-        rtn = self.robot.FileDelete(fileType, fileName)
-        return rtn
+
+    def GetGripperRotSpeed(self):
+        fault, value = self.read_state("gripper_fault", "gripperRotSpeed")
+        return 0, fault, value
 
     """   
-    @brief  下载Lua文件
-    @param  [in] fileName 要下载的lua文件名“test.lua”
-    @param  [in] savePath 保存文件本地路径“D://Down/”
-    @return 错误码 成功-0  失败-错误码
+        @brief 获取旋转夹爪的旋转力矩百分比
+        @return 错误码 成功- 0, 失败-错误码
+        @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+        @return 返回值（调用成功返回） torque 旋转力矩百分比
     """
 
     @log_call
     @xmlrpc_timeout
-    def LuaDownLoad(self, fileName, savePath):
-        error = self.__FileDownLoad(0, fileName, savePath)
-        return error
-
-    """   
-    @brief  上传Lua文件
-    @param  [in] filePath上传文件的全路径名   C://test/test.lua  
-    @return 错误码 成功-0  失败-错误码
-    """
 
-    def LuaUpload(self, filePath):
-        error = self.__FileUpLoad(0, filePath)
-        if error == 0:
-            file_name = os.path.basename(filePath)
-            _error = self.robot.LuaUpLoadUpdate(file_name)
-            tmp_error = _error[0]
-            if tmp_error == 0:
-                return tmp_error
-            else:
-                return tmp_error, _error[1]
-        else:
-            return error
+    def GetGripperRotTorque(self):
+        fault, value = self.read_state("gripper_fault", "gripperRotTorque")
+        return 0, fault, value
 
     """   
-    @brief  删除Lua文件
-    @param  [in] fileName 要删除的lua文件名“test.lua”
-    @return 错误码 成功-0  失败-错误码
+       @brief 开始Ptp运动FIR滤波
+       @param  [in] maxAcc 最大加速度极值(deg/s2)
+       @param  [in] maxJek 统一关节急动度极值(deg/s3)
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LuaDelete(self, fileName):
-        error = self.__FileDelete(0, fileName)
-        return error
+
+    def PtpFIRPlanningStart(self, maxAcc,maxJek):
+        return self.command("PtpFIRPlanningStart", maxAcc, maxJek)
 
     """   
-    @brief  获取当前所有lua文件名称
-    @return 错误码 成功-0  失败-错误码
-    @return 返回值（调用成功返回） lua_num lua文件数量
-    @return 返回值（调用成功返回） luaNames lua文件名列表
+       @brief 关闭Ptp运动FIR滤波
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetLuaList(self):
-        _error = self.robot.GetLuaList()
-        # size = len(_error)
-        error = _error[0]
-        if _error[0] == 0:
-            lua_num = _error[1]
-            lua_name = _error[2].split(';')
-            return error, lua_num, lua_name
-        else:
-            return error,None,None
+
+    def PtpFIRPlanningEnd(self):
+        return self.command("PtpFIRPlanningEnd")
 
     """   
-    @brief  设置485扩展轴参数
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 int servoCompany 伺服驱动器厂商，1-戴纳泰克
-    @param  [in] 必选参数 int servoModel 伺服驱动器型号，1-FD100-750C
-    @param  [in] 必选参数 int servoSoftVersion 伺服驱动器软件版本，1-V1.0
-    @param  [in] 必选参数 int servoResolution 编码器分辨率
-    @param  [in] 必选参数 float axisMechTransRatio 机械传动比  
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 上传轨迹J文件
+       @param  [in] filePath 上传轨迹文件的全路径名   C://test/testJ.txt
+       @param  [in] progress 进度回调 progress(已发送字节数, 文件总字节数)，默认None
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def AuxServoSetParam(self, servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
-                         axisMechTransRatio):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        servoCompany = int(servoCompany)
-        servoModel = int(servoModel)
-        servoSoftVersion = int(servoSoftVersion)
-        servoResolution = int(servoResolution)
-        axisMechTransRatio = float(axisMechTransRatio)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetParam(servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
-                                                    axisMechTransRatio)
-                flag = False
-            except socket.error as e:
-                flag = True
 
+    def TrajectoryJUpLoad(self,filePath, progress=None):
+        error = self.__FileUpLoad(20, filePath, progress)
         return error
 
+    """2024.12.16"""
     """   
-    @brief  获取485扩展轴配置参数
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） int servoCompany 伺服驱动器厂商，1-戴纳泰克
-    @return 返回值（调用成功返回） servoModel 伺服驱动器型号，1-FD100-750C 
-    @return 返回值（调用成功返回） servoSoftVersion 伺服驱动器软件版本，1-V1.0
-    @return 返回值（调用成功返回） int servoResolution 编码器分辨率
-    @return 返回值（调用成功返回） float axisMechTransRatio 机械传动比
+       @brief 删除轨迹J文件
+       @param  [in] filePath 删除轨迹文件的全路径名   C://test/testJ.txt
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def AuxServoGetParam(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.AuxServoGetParam(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
 
-        error = _error[0]
-        if _error[0] == 0:
-            return error, _error[1], _error[2], _error[3], _error[4], _error[5]
-        else:
-            return error,None,None,None,None,None
+    def TrajectoryJDelete(self, fileName):
+        error = self.__FileDelete(20, fileName)
+        return error
 
+    """2024.12.18"""
     """   
-    @brief  设置485扩展轴使能/去使能
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 int status 使能状态，0-去使能， 1-使能
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 开始LIN、ARC运动FIR滤波
+       @param  [in] maxAccLin 线加速度极值(mm/s2)
+       @param  [in] maxAccDeg 角加速度极值(deg/s2)
+       @param  [in] maxJerkLin 线加加速度极值(mm/s3)
+       @param  [in] maxJerkDeg 角加加速度极值(deg/s3)
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def AuxServoEnable(self, servoId, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoEnable(servoId, status)
-                flag = False
-            except socket.error as e:
-                flag = True
 
-        return error
-
-    """   
-    @brief  设置485扩展轴控制模式
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 mode 控制模式，0-位置模式，1-速度模式
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoSetControlMode(self, servoId, mode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        mode = int(mode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetControlMode(servoId, mode)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置485扩展轴目标位置(位置模式)
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 float pos 目标位置，mm或°
-    @param  [in] 必选参数 float speed 目标速度，mm/s或°/s
-    @param  [in] 必选参数 acc 加速度百分比[0-100] 
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoSetTargetPos(self, servoId, pos, speed,acc=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        pos = float(pos)
-        speed = float(speed)
-        acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetTargetPos(servoId, pos, speed,acc)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置485扩展轴目标速度(速度模式)
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 float speed 目标速度，mm/s或°/s
-    @param  [in] 必选参数 acc 加速度百分比[0-100] 
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoSetTargetSpeed(self, servoId, speed,acc):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        speed = float(speed)
-        acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetTargetSpeed(servoId, speed,acc)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置485扩展轴目标转矩(力矩模式)
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 float torque 目标力矩，Nm
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoSetTargetTorque(self, servoId, torque):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        torque = float(torque)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetTargetTorque(servoId, torque)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置485扩展轴回零
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @param  [in] 必选参数 int mode 回零模式，1-当前位置回零；2-负限位回零；3-正限位回零
-    @param  [in] 必选参数 float searchVel 回零速度，mm/s或°/s
-    @param  [in] 必选参数 float latchVel 箍位速度，mm/s或°/s
-    @param  [in] 必选参数 acc 加速度百分比[0-100] 
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoHoming(self, servoId, mode, searchVel, latchVel,acc=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        mode = int(mode)
-        searchVel = float(searchVel)
-        latchVel = float(latchVel)
-        acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoHoming(servoId, mode, searchVel, latchVel,acc)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  清除485扩展轴错误信息
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoClearError(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoClearError(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取485扩展轴伺服状态
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） servoErrCode 伺服驱动器故障码
-    @return 返回值（调用成功返回） servoState 伺服驱动器状态 bit0:0-未使能；1-使能;  bit1:0-未运动；1-正在运动;bit2:0-正限位未触发，1-正限位触发；bit3:0-负限位未触发，1-负限位触发；   bit4 0-未定位完成；1-定位完成；  bit5：0-未回零；1-回零完成
-    @return 返回值（调用成功返回） servoPos 伺服当前位置 mm或°
-    @return 返回值（调用成功返回） servoSpeed 伺服当前速度 mm/s或°/s
-    @return 返回值（调用成功返回） servoTorque 伺服当前转矩Nm
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoGetStatus(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.AuxServoGetStatus(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if _error[0] == 0:
-            return error, _error[1], _error[2], _error[3], _error[4], _error[5]
-        else:
-            return error,None,None,None,None,None
-
-    """   
-    @brief  设置状态反馈中485扩展轴数据轴号
-    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServosetStatusID(self, servoId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        servoId = int(servoId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetStatusID(servoId)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置机器人外设协议
-    @param  [in] 必选参数 int protocol 机器人外设协议号 4096-扩展轴控制卡；4097-ModbusSlave；4098-ModbusMaster
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetExDevProtocol(self, protocol):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        protocol = int(protocol)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExDevProtocol(protocol)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取机器人外设协议
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） int protocol 机器人外设协议号 4096-扩展轴控制卡；4097-ModbusSlave；4098-ModbusMaster
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetExDevProtocol(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetExDevProtocol()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if _error[0] == 0:
-            return error, _error[1]
-        else:
-            return error,None
-
-    """   
-    @brief  设置机器人加速度
-    @param [in]必选参数 acc 机器人加速度百分比
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOaccScale(self, acc):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        acc = float(acc)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOaccScale(acc)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  控制箱AO飞拍开始
-    @param [in]必选参数 AONum 控制箱AO编号
-    @param [in]默认参数 maxTCPSpeed 最大TCP速度值[1-5000mm/s]，默认1000
-    @param [in]默认参数 maxAOPercent 最大TCP速度值对应的AO百分比，默认100%
-    @param [in]必选参数 zeroZoneCmp 死区补偿值AO百分比，整形，默认为20%，范围[0-100]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def MoveAOStart(self, AONum, maxTCPSpeed=1000, maxAOPercent=100, zeroZoneCmp=20):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AONum = int(AONum)
-        maxTCPSpeed = int(maxTCPSpeed)
-        maxAOPercent = int(maxAOPercent)
-        zeroZoneCmp = int(zeroZoneCmp)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveAOStart(AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  控制箱AO飞拍停止
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def MoveAOStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveAOStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  末端AO飞拍开始
-    @param [in]必选参数 AONum 末端AO编号
-    @param [in]必选参数 maxTCPSpeed 最大TCP速度值[1-5000mm/s]，默认1000
-    @param [in]必选参数 maxAOPercent 最大TCP速度值对应的AO百分比，默认100%
-    @param [in]必选参数 zeroZoneCmp 死区补偿值AO百分比，整形，默认为20%，范围[0-100]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def MoveToolAOStart(self, AONum, maxTCPSpeed=1000, maxAOPercent=100, zeroZoneCmp=20):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AONum = int(AONum)
-        maxTCPSpeed = int(maxTCPSpeed)
-        maxAOPercent = int(maxAOPercent)
-        zeroZoneCmp = int(zeroZoneCmp)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToolAOStart(AONum, maxTCPSpeed, maxAOPercent, zeroZoneCmp)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  末端AO飞拍停止
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def MoveToolAOStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToolAOStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴通讯参数配置
-    @param [in]必选参数 ip PLC IP地址
-    @param [in]必选参数 port	端口号
-    @param [in]必选参数 period 通讯周期(ms，暂不开放)
-    @param [in]必选参数 lossPkgTime	丢包检测时间(ms)
-    @param [in]必选参数 lossPkgNum	丢包次数
-    @param [in]必选参数 disconnectTime	通讯断开确认时长
-    @param [in]必选参数 reconnectEnable	通讯断开自动重连使能 0-不使能 1-使能
-    @param [in]必选参数 reconnectPeriod	重连周期间隔(ms)
-    @param [in]必选参数 reconnectNum	重连次数
-    @param [in]必选参数 selfConnect 断电重启是否自动建立连接；0-不建立连接；1-建立连接
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtDevSetUDPComParam(self, ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
-                             reconnectEnable, reconnectPeriod, reconnectNum,selfConnect):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ip = str(ip)
-        port = int(port)
-        period = int(period)
-        period = 2  # 暂不开放，必须是2
-        lossPkgTime = int(lossPkgTime)
-        lossPkgNum = int(lossPkgNum)
-        disconnectTime = int(disconnectTime)
-        reconnectEnable = int(reconnectEnable)
-        reconnectPeriod = int(reconnectPeriod)
-        reconnectNum = int(reconnectNum)
-        selfConnect = int(selfConnect)
-
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevSetUDPComParam(ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
-                                                        reconnectEnable, reconnectPeriod, reconnectNum,selfConnect)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取UDP扩展轴通讯参数
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）ip PLC IP地址
-    @return 返回值（调用成功返回）port	端口号
-    @return 返回值（调用成功返回）period 通讯周期(ms，暂不开放)
-    @return 返回值（调用成功返回） lossPkgTime	丢包检测时间(ms)
-    @return 返回值（调用成功返回） lossPkgNum	丢包次数
-    @return 返回值（调用成功返回） disconnectTime	通讯断开确认时长
-    @return 返回值（调用成功返回） reconnectEnable	通讯断开自动重连使能 0-不使能 1-使能
-    @return 返回值（调用成功返回） reconnectPeriod	重连周期间隔(ms)
-    @return 返回值（调用成功返回） reconnectNum	重连次数
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtDevGetUDPComParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ExtDevGetUDPComParam()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if _error[0] == 0:
-            return _error[0], [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6], _error[7], _error[8],
-                               _error[9]]
-        else:
-            return _error[0],None
-
-    """   
-    @brief  加载UDP通信
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtDevLoadUDPDriver(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevLoadUDPDriver()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  卸载UDP通信
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtDevUnloadUDPDriver(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevUnloadUDPDriver()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴通信异常断开后恢复连接
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtDevUDPClientComReset(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevUDPClientComReset()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴通信异常断开后关闭通讯
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtDevUDPClientComClose(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtDevUDPClientComClose()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展机器人相对扩展轴位置
-    @param [in]必选参数 installType 0-机器人安装在外部轴上，1-机器人安装在外部轴外
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetRobotPosToAxis(self, installType):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        installType = int(installType)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotPosToAxis(installType)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展轴系统DH参数配置
-    @param [in]必选参数 axisConfig 外部轴构型，0-单自由度直线滑轨，1-两自由度L型变位机，2-三自由度，3-四自由度，4-单自由度变位机
-    @param [in]必选参数  axisDHd1 外部轴DH参数d1 mm
-    @param [in]必选参数  axisDHd2 外部轴DH参数d2 mm
-    @param [in]必选参数  axisDHd3 外部轴DH参数d3 mm
-    @param [in]必选参数  axisDHd4 外部轴DH参数d4 mm
-    @param [in]必选参数  axisDHa1 外部轴DH参数a1 mm
-    @param [in]必选参数  axisDHa2 外部轴DH参数a2 mm
-    @param [in]必选参数  axisDHa3 外部轴DH参数a3 mm
-    @param [in]必选参数  axisDHa4 外部轴DH参数a4 mm
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetAxisDHParaConfig(self, axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1, axisDHa2, axisDHa3,
-                            axisDHa4):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        axisConfig = int(axisConfig)
-        axisDHd1 = float(axisDHd1)
-        axisDHd2 = float(axisDHd2)
-        axisDHd3 = float(axisDHd3)
-        axisDHd4 = float(axisDHd4)
-        axisDHa1 = float(axisDHa1)
-        axisDHa2 = float(axisDHa2)
-        axisDHa3 = float(axisDHa3)
-        axisDHa4 = float(axisDHa4)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxisDHParaConfig(axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1, axisDHa2,
-                                                       axisDHa3, axisDHa4)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴参数配置
-    @param [in]必选参数 axisId 轴号[1-4]
-    @param [in]必选参数 axisType 扩展轴类型 0-平移；1-旋转
-    @param [in]必选参数 axisDirection 扩展轴方向 0-正向；1-反向
-    @param [in]必选参数 axisMax 扩展轴最大位置 mm
-    @param [in]必选参数 axisMin 扩展轴最小位置 mm
-    @param [in]必选参数 axisVel 速度mm/s
-    @param [in]必选参数 axisAcc 加速度mm/s2
-    @param [in]必选参数 axisLead 导程mm
-    @param [in]必选参数 encResolution 编码器分辨率
-    @param [in]必选参数 axisOffect 焊缝起始点扩展轴偏移量
-    @param [in]必选参数 axisCompany 驱动器厂家 1-禾川；2-汇川；3-松下
-    @param [in]必选参数 axisModel 驱动器型号 1-禾川-SV-XD3EA040L-E，2-禾川-SV-X2EA150A-A，1-汇川-SV620PT5R4I，1-松下-MADLN15SG，2-松下-MSDLN25SG，3-松下-MCDLN35SG
-    @param [in]必选参数 axisEncType 编码器类型  0-增量；1-绝对值
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisParamConfig(self, axisId, axisType, axisDirection, axisMax, axisMin, axisVel, axisAcc, axisLead,
-                           encResolution, axisOffect, axisCompany, axisModel, axisEncType):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        axisId = int(axisId)
-        axisType = int(axisType)
-        axisDirection = int(axisDirection)
-        axisMax = float(axisMax)
-        axisMin = float(axisMin)
-        axisVel = float(axisVel)
-        axisAcc = float(axisAcc)
-        axisLead = float(axisLead)
-        encResolution = int(encResolution)
-        axisOffect = float(axisOffect)
-        axisCompany = int(axisCompany)
-        axisModel = int(axisModel)
-        axisEncType = int(axisEncType)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisParamConfig(axisId, axisType, axisDirection, axisMax, axisMin, axisVel, axisAcc,
-                                                      axisLead, encResolution, axisOffect, axisCompany, axisModel, axisEncType)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取扩展轴驱动器配置信息
-    @param [in]必选参数 axisId 轴号[1-4]
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） axisCompany 驱动器厂家 1-禾川；2-汇川；3-松下
-    @return 返回值（调用成功返回） axisModel 驱动器型号 1-禾川-SV-XD3EA040L-E，2-禾川-SV-X2EA150A-A，1-汇川-SV620PT5R4I，1-松下-MADLN15SG，2-松下-MSDLN25SG，3-松下-MCDLN35SG
-    @return 返回值（调用成功返回） axisEncType 编码器类型  0-增量；1-绝对值
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetExAxisDriverConfig(self, axisId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        axisId = int(axisId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetExAxisDriverConfig(axisId)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], [error[1], error[2], error[3]]
-        else:
-            return error
-
-    """   
-    @brief  设置扩展轴坐标系参考点-四点法
-    @param [in]必选参数 pointNum 点编号[1-4]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisSetRefPoint(self, pointNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pointNum = int(pointNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisSetRefPoint(pointNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  计算扩展轴坐标系-四点法
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） coord 坐标系值[x,y,z,rx,ry,rz]
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisComputeECoordSys(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisComputeECoordSys()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置标定参考点在变位机末端坐标系下位姿
-    @param [in]必选参数 pos 位姿值[x,y,z,rx,ry,rz]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetRefPointInExAxisEnd(self, pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pos = list(map(float, pos))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRefPointInExAxisEnd(pos[0], pos[1], pos[2], pos[3], pos[4], pos[5])
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  变位机坐标系参考点设置
-    @param [in]必选参数 pointNum 点编号[1-4]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def PositionorSetRefPoint(self, pointNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pointNum = int(pointNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PositionorSetRefPoint(pointNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  变位机坐标系计算-四点法
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） coord 坐标系值[x,y,z,rx,ry,rz]
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def PositionorComputeECoordSys(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.PositionorComputeECoordSys()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        else:
-            return error,None
-
-    """   
-    @brief  应用扩展轴坐标系
-    @param [in]必选参数 axisCoordNum 坐标系编号
-    @param [in]必选参数 toolNum 工具号
-    @param [in]必选参数 coord 坐标系值[x,y,z,rx,ry,rz]
-    @param [in]必选参数 calibFlag 标定标志 0-否，1-是    
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisActiveECoordSys(self, axisCoordNum, toolNum, coord, calibFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        axisCoordNum = int(axisCoordNum)
-        toolNum = int(toolNum)
-        coord = list(map(float, coord))
-        calibFlag = int(calibFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisActiveECoordSys(axisCoordNum, toolNum, coord[0], coord[1], coord[2], coord[3],
-                                                          coord[4], coord[5], calibFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴使能
-    @param [in]必选参数 axisID 轴号[1-4]
-    @param [in]必选参数 status 0-去使能；1-使能
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisServoOn(self, axisID, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        axisID = int(axisID)
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisServoOn(axisID, status)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴回零
-    @param [in]必选参数 axisID 轴号[1-4]
-    @param [in]必选参数 mode 回零方式 0当前位置回零，1负限位回零，2-正限位回零
-    @param [in]必选参数 searchVel 寻零速度(mm/s)
-    @param [in]必选参数 latchVel 寻零箍位速度(mm/s)
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisSetHoming(self, axisID, mode, searchVel, latchVel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        axisID = int(axisID)
-        mode = int(mode)
-        searchVel = float(searchVel)
-        latchVel = float(latchVel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisSetHoming(axisID, mode, searchVel, latchVel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴点动开始
-    @param [in]必选参数 axisID 轴号[1-4]
-    @param [in]必选参数 direction 转动方向 0-反向；1-正向
-    @param [in]必选参数 vel 速度(mm/s)
-    @param [in]必选参数 acc (加速度 mm/s2)
-    @param [in]必选参数 maxDistance 最大点动距离
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisStartJog(self, axisID, direction, vel, acc, maxDistance):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        axisID = int(axisID)
-        direction = int(direction)
-        vel = float(vel)
-        acc = float(acc)
-        maxDistance = float(maxDistance)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisStartJog(6, axisID, direction, vel, acc, maxDistance)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴点动停止
-    @param [in]必选参数 axisID 轴号[1-4]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisStopJog(self, axisID):
-        axisID = int(axisID)
-        error =self.send_message("/f/bIII19III240III14IIIStopExtAxisJogIII/b/f")
-        # error = self.robot.ExtAxisStartJog(7, axisID, 0, 0.0, 0.0, 0.0)
-        return error
-
-    """   
-    @brief  设置扩展DO
-    @param [in]必选参数 DONum DO编号
-    @param [in]必选参数 bOpen 开关 True-开,False-关
-    @param [in]必选参数 smooth 是否平滑 True -是, False -否
-    @param [in]必选参数 block 是否阻塞 True -是, False -否
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetAuxDO(self, DONum, bOpen, smooth, block):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DONum = int(DONum)
-        bOpen = bool(bOpen)
-        smooth = bool(smooth)
-        block = bool(block)
-        open_flag = 1 if bOpen else 0
-        smooth_flag = 1 if smooth else 0
-        no_block_flag = 1 if block else 0
-        print("open_flag",open_flag)
-        print("smooth_flag", smooth_flag)
-        print("no_block_flag", no_block_flag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxDO(DONum, open_flag, smooth_flag, no_block_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展AO
-    @param [in]必选参数 AONum AO编号 
-    @param [in]必选参数 value 模拟量值[0-4095]
-    @param [in]必选参数 block 是否阻塞 True-是,False-否
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetAuxAO(self, AONum, value, block):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AONum = int(AONum)
-        value = float(value)
-        block = bool(block)
-        no_block_flag = 0 if block else 1
-        value =value
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxAO(AONum, value, no_block_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展DI输入滤波时间
-    @param [in]必选参数 filterTime 滤波时间(ms)
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetAuxDIFilterTime(self, filterTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        filterTime = int(filterTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxDIFilterTime(filterTime)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展AI输入滤波时间
-    @param [in]必选参数 AINum AI编号
-    @param [in]必选参数 filterTime 滤波时间(ms)
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetAuxAIFilterTime(self, AINum,filterTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AINum = int(AINum)
-        filterTime = int(filterTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAuxAIFilterTime(AINum,filterTime)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  等待扩展DI输入
-    @param [in]必选参数 DINum DI编号
-    @param [in]必选参数 bOpen 开关 True-开,False-关
-    @param [in]必选参数 time 最大等待时间(ms)
-    @param [in]必选参数 errorAlarm 是否继续运动 True-是,False-否
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WaitAuxDI(self, DINum, bOpen, time, errorAlarm):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DINum = int(DINum)
-        bOpen = bool(bOpen)
-        open_flag = 0 if bOpen else 1
-        time = int(time)
-        errorAlarm = bool(errorAlarm)
-        errorAlarm_flag = 0 if errorAlarm else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitAuxDI(DINum, open_flag, time, errorAlarm_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  等待扩展AI输入
-    @param [in]必选参数 AINum AI编号
-    @param [in]必选参数 sign 0-大于；1-小于
-    @param [in]必选参数 value AI值
-    @param [in]必选参数 time 最大等待时间(ms)
-    @param [in]必选参数 errorAlarm 是否继续运动 True-是,False-否
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WaitAuxAI(self, AINum, sign, value, time, errorAlarm):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AINum = int(AINum)
-        sign = int(sign)
-        value = int(value)
-        time = int(time)
-        errorAlarm = bool(errorAlarm)
-        errorAlarm_flag = 0 if errorAlarm else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitAuxAI(AINum, sign, value, time, errorAlarm_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取扩展DI值
-    @param [in]必选参数 DINum DI编号
-    @param [in]必选参数 isNoBlock 是否阻塞 True-阻塞 false-非阻塞
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） isOpen 0-关；1-开
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetAuxDI(self, DINum, isNoBlock):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DINum = int(DINum)
-        isNoBlock = bool(isNoBlock)
-        isNoBlock_flag = 0 if isNoBlock else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAuxDI(DINum, isNoBlock_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], error[1]
-        else:
-            return error
-
-    """   
-    @brief  获取扩展AI值
-    @param [in]必选参数 AINum AI编号
-    @param [in]必选参数 isNoBlock 是否阻塞 True-阻塞 False-非阻塞
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） value 输入值
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetAuxAI(self, AINum, isNoBlock):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AINum = int(AINum)
-        isNoBlock = bool(isNoBlock)
-        isNoBlock_flag = 0 if isNoBlock else 1
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAuxAI(AINum, isNoBlock_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], error[1]
-        else:
-            return error
-
-    """   
-    @brief  UDP扩展轴运动
-    @param [in]必选参数 pos 目标位置 轴 1 位置 ~ 轴 4 位置[exaxis[0],exaxis[1],exaxis[2],exaxis[3]]
-    @param [in]必选参数 ovl 速度百分比
-    @param [in]必选参数 blend 平滑参数(mm或ms)，-1,等待运动完成
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisMove(self, pos, ovl, blend=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        pos = list(map(float, pos))
-        ovl = float(ovl)
-        blend = float(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ExtAxisMoveJ(0, pos[0], pos[1], pos[2], pos[3], ovl, blend)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴与机器人关节运动同步运动(自动正/逆运动学计算)
-    @param  [in] 必选参数 joint_pos: 目标关节位置，单位 [°]
-    @param  [in] 必选参数 desc_pos: 目标笛卡尔位姿，单位 [mm][°]
-    @param  [in] 必选参数 tool: 工具号，[0~14]
-    @param  [in] 必选参数 user: 工件号，[0~14]
-    @param  [in] 必选参数 exaxis_pos: 外部轴 1 位置 ~ 外部轴 4 位置 
-    @param  [in] 默认参数 vel：速度百分比，[0~100] 默认20.0
-    @param  [in] 默认参数 acc：加速度百分比，[0~100] 暂不开放,默认0.0 
-    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0    
-    @param  [in] 默认参数 blendT:[-1.0]-运动到位 (阻塞)，[0~500.0]-平滑时间 (非阻塞)，单位 [ms] 默认-1.0
-    @param  [in] 默认参数 offset_flag:[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
-    @param  [in] 默认参数 offset_pos: 位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
-    @return 错误码 成功-0  失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisSyncMoveJ(self, joint_pos, tool, user, exaxis_pos, desc_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
-                         blendT=-1.0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0]):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        joint_pos = list(map(float, joint_pos))
-        tool = int(tool)
-        user = int(user)
-        desc_pos = list(map(float, desc_pos))
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        exaxis_pos = list(map(float, exaxis_pos))
-        blendT = float(blendT)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-        if (desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0) and (
-                desc_pos[4] == 0.0) and (desc_pos[5] == 0.0):  # 若未输入参数则调用正运动学求解
-            ret = self.robot.GetForwardKin(joint_pos)  # 正运动学求解
-            if ret[0] == 0:
-                desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error = ret[0]
-                return error
-        error = self.robot.ExtAxisMoveJ(1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendT)
-        if error != 0:
-            return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveJ(joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
-                                         offset_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴与机器人直线运动同步运动(自动正/逆运动学计算)
-    @param  [in] 必选参数 joint_pos: 目标关节位置，单位 [°] 
-    @param  [in] 必选参数 desc_pos: 目标笛卡尔位姿，单位 [mm][°]
-    @param  [in] 必选参数 tool: 工具号，[0~14]
-    @param  [in] 必选参数 user: 工件号，[0~14]
-    @param  [in] 必选参数 exaxis_pos: 外部轴 1 位置 ~ 外部轴 4 位置 
-    @param  [in] 默认参数 vel：速度百分比，[0~100] 默认20.0
-    @param  [in] 默认参数 acc：加速度百分比，[0~100] 暂不开放 默认0.0
-    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0
-    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0    
-    @param  [in] 默认参数 search:[0]-不焊丝寻位，[1]-焊丝寻位
-    @param  [in] 默认参数 offset_flag:[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
-    @param  [in] 默认参数 offset_pos: 位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
-    @param  [in] 默认参数 config 逆解关节空间配置，[-1]-参考当前关节位置解算，[0~7]-依据特定关节空间配置求解，默认-1
-    @return 错误码 成功-0  失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisSyncMoveL(self, desc_pos, tool, user, exaxis_pos, joint_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], vel=20.0, acc=0.0, ovl=100.0,
-                         blendR=-1.0, search=0, offset_flag=0, offset_pos=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos = list(map(float, desc_pos))
-        tool = int(tool)
-        user = int(user)
-        joint_pos = list(map(float, joint_pos))
-        vel = float(vel)
-        acc = float(acc)
-        ovl = float(ovl)
-        blendR = float(blendR)
-        exaxis_pos = list(map(float, exaxis_pos))
-        search = int(search)
-        offset_flag = int(offset_flag)
-        offset_pos = list(map(float, offset_pos))
-        config = int(config)
-
-        if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
-                and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            ret = self.robot.GetInverseKin(0, desc_pos, config)  # 逆运动学求解
-            if ret[0] == 0:
-                joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
-            else:
-                error = ret[0]
-                return error
-        error = self.robot.ExtAxisMoveJ(1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendR)
-        if error != 0:
-            return error
-        flag = True
-        while flag:
-            try:
-                error = self.MoveL(desc_pos=desc_pos,tool= tool,user= user,vel= vel, acc=acc,ovl= ovl,blendR= blendR,blendMode=0,exaxis_pos= exaxis_pos,search= search,
-                                         offset_flag=offset_flag,offset_pos= offset_pos)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  UDP扩展轴与机器人圆弧运动同步运动(自动正/逆运动学计算)
-    @param  [in] 必选参数 joint_pos_p: 路径点关节位置，单位 [°] 
-    @param  [in] 必选参数 desc_pos_p: 路径点笛卡尔位姿，单位 [mm][°]
-    @param  [in] 必选参数 tool_p: 路径点工具号，[0~14]
-    @param  [in] 必选参数 user_p: 路径点工件号，[0~14]
-    @param  [in] 必选参数 exaxis_pos_p: 路径点外部轴 1 位置 ~ 外部轴 4 位置 默认[0.0,0.0,0.0,0.0]
-    @param  [in] 必选参数 joint_pos_t: 目标点关节位置，单位 [°] 
-    @param  [in] 必选参数 desc_pos_t: 目标点笛卡尔位姿，单位 [mm][°]
-    @param  [in] 必选参数 tool_t: 工具号，[0~14]
-    @param  [in] 必选参数 user_t: 工件号，[0~14]
-    @param  [in] 必选参数 exaxis_pos_t: 目标点外部轴 1 位置 ~ 外部轴 4 位置 默认[0.0,0.0,0.0,0.0]    
-    @param  [in] 默认参数 vel_p: 路径点速度百分比，[0~100] 默认20.0
-    @param  [in] 默认参数 acc_p: 路径点加速度百分比，[0~100] 暂不开放,默认0.0    
-    @param  [in] 默认参数 offset_flag_p: 路径点是否偏移[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
-    @param  [in] 默认参数 offset_pos_p: 路径点位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
-    @param  [in] 默认参数 vel_t: 目标点速度百分比，[0~100] 默认20.0
-    @param  [in] 默认参数 acc_t: 目标点加速度百分比，[0~100] 暂不开放 默认0.0
-    @param  [in] 默认参数 offset_flag_t: 目标点是否偏移[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
-    @param  [in] 默认参数 offset_pos_t: 目标点位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
-    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0
-    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0
-    @param  [in] 默认参数 config 逆解关节空间配置，[-1]-参考当前关节位置解算，[0~7]-依据特定关节空间配置求解，默认-1
-    @return 错误码 成功-0  失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisSyncMoveC(self, desc_pos_p, tool_p, user_p, exaxis_pos_p, desc_pos_t, tool_t,
-                         user_t, exaxis_pos_t,
-                         joint_pos_p=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0], joint_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                         vel_p=20.0, acc_p=100.0, offset_flag_p=0,
-                         offset_pos_p=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                         vel_t=20.0, acc_t=100.0, offset_flag_t=0,
-                         offset_pos_t=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-                         ovl=100.0, blendR=-1.0,config=-1):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        desc_pos_p = list(map(float, desc_pos_p))
-        tool_p = float(int(tool_p))
-        user_p = float(int(user_p))
-        joint_pos_p = list(map(float, joint_pos_p))
-        vel_p = float(vel_p)
-        acc_p = float(acc_p)
-        exaxis_pos_p = list(map(float, exaxis_pos_p))
-        offset_flag_p = int(offset_flag_p)
-        offset_pos_p = list(map(float, offset_pos_p))
-
-        desc_pos_t = list(map(float, desc_pos_t))
-        tool_t = float(int(tool_t))
-        user_t = float(int(user_t))
-        joint_pos_t = list(map(float, joint_pos_t))
-        vel_t = float(vel_t)
-        acc_t = float(acc_t)
-        exaxis_pos_t = list(map(float, exaxis_pos_t))
-        offset_flag_t = int(offset_flag_t)
-        offset_pos_t = list(map(float, offset_pos_t))
-
-        ovl = float(ovl)
-        blendR = float(blendR)
-        config = int(config)
-
-        if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
-                and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            retp = self.robot.GetInverseKin(0, desc_pos_p, config)  # 逆运动学求解
-            if retp[0] == 0:
-                joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
-            else:
-                error = retp[0]
-                return error
-
-        if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
-                and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
-            rett = self.robot.GetInverseKin(0, desc_pos_t, config)  # 逆运动学求解
-            if rett[0] == 0:
-                joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
-            else:
-                error = rett[0]
-                return error
-        error = self.robot.ExtAxisMoveJ(1, exaxis_pos_t[0], exaxis_pos_t[1], exaxis_pos_t[2], exaxis_pos_t[3], ovl, blendR)
-        if error != 0:
-            return error
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveC(joint_pos_p, desc_pos_p, [tool_p, user_p, vel_p, acc_p], exaxis_pos_p, offset_flag_p,
-                                         offset_pos_p, joint_pos_t, desc_pos_t, [tool_t, user_t, vel_t, acc_t], exaxis_pos_t,
-                                         offset_flag_t, offset_pos_t, ovl, blendR)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  焊丝寻位开始
-    @param [in]必选参数 refPos  1-基准点 2-接触点
-    @param [in]必选参数 searchVel   寻位速度 %
-    @param [in]必选参数 searchDis  寻位距离 mm
-    @param [in]必选参数 autoBackFlag 自动返回标志，0-不自动；-自动
-    @param [in]必选参数 autoBackVel  自动返回速度 %
-    @param [in]必选参数 autoBackDis  自动返回距离 mm
-    @param [in]必选参数 offectFlag  1-带偏移量寻位；2-示教点寻位
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WireSearchStart(self, refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        refPos = int(refPos)
-        searchVel = float(searchVel)
-        searchDis = int(searchDis)
-        autoBackFlag = int(autoBackFlag)
-        autoBackVel = float(autoBackVel)
-        autoBackDis = int(autoBackDis)
-        offectFlag = int(offectFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WireSearchStart(refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  焊丝寻位结束
-    @param [in]必选参数 refPos  1-基准点 2-接触点
-    @param [in]必选参数 searchVel   寻位速度 %
-    @param [in]必选参数 searchDis  寻位距离 mm
-    @param [in]必选参数 autoBackFlag 自动返回标志，0-不自动；-自动
-    @param [in]必选参数 autoBackVel  自动返回速度 %
-    @param [in]必选参数 autoBackDis  自动返回距离 mm
-    @param [in]必选参数 offectFlag  1-带偏移量寻位；2-示教点寻位
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def WireSearchEnd(self, refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        refPos = int(refPos)
-        searchVel = float(searchVel)
-        searchDis = int(searchDis)
-        autoBackFlag = int(autoBackFlag)
-        autoBackVel = float(autoBackVel)
-        autoBackDis = int(autoBackDis)
-        offectFlag = int(offectFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WireSearchEnd(refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  计算焊丝寻位偏移量
-    @param  [in]必选参数 seamType  焊缝类型
-    @param  [in]必选参数 method   计算方法
-    @param  [in]必选参数 varNameRef 基准点1-6，“#”表示无点变量
-    @param  [in]必选参数 varNameRes 接触点1-6，“#”表示无点变量
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） offectFlag 0-偏移量直接叠加到指令点；1-偏移量需要对指令点进行坐标变换
-    @return 返回值（调用成功返回） offect 偏移位姿[x, y, z, a, b, c]
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetWireSearchOffset(self, seamType, method,varNameRef,varNameRes):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        seamType = int(seamType)
-        method = int(method)
-        if(len(varNameRes)!=6):
-            return 4
-        if(len(varNameRes)!=6):
-            return 4
-        varNameRef = list(map(str, varNameRef))
-        varNameRes = list(map(str, varNameRes))
-
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetWireSearchOffset(seamType, method, varNameRef[0], varNameRef[1], varNameRef[2], varNameRef[3], varNameRef[4], varNameRef[5],
-                                                        varNameRes[0], varNameRes[1], varNameRes[2], varNameRes[3], varNameRes[4], varNameRes[5])
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], [_error[2], _error[3], _error[4], _error[5], _error[6], _error[7]]
-        else:
-            return error,None,None
-
-    """   
-    @brief  等待焊丝寻位完成
-    @param  [in]必选参数 varName  接触点名称 “RES0” ~ “RES99”
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def WireSearchWait(self,varname):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        varname=str(varname)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WireSearchWait(varname)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  焊丝寻位接触点写入数据库
-    @param  [in]必选参数 varName  接触点名称 “RES0” ~ “RES99”
-    @param  [in]必选参数 pos  接触点数据[x, y, x, a, b, c]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetPointToDatabase(self,varName,pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        varName = str(varName)
-        pos = list(map(float,pos))
-
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetPointToDatabase(varName,pos)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  电弧跟踪控制
-    @param  [in]必选参数 flag 开关，0-关；1-开
-    @param  [in]必选参数 delayTime 滞后时间，单位ms
-    @param  [in]必选参数 isLeftRight 左右偏差补偿 0-关闭，1-开启
-    @param  [in]必选参数 klr 左右调节系数(灵敏度)
-    @param  [in]必选参数 tStartLr 左右开始补偿时间cyc
-    @param  [in]必选参数 stepMaxLr 左右每次最大补偿量 mm
-    @param  [in]必选参数 sumMaxLr 左右总计最大补偿量 mm
-    @param  [in]必选参数 isUpLow 上下偏差补偿 0-关闭，1-开启
-    @param  [in]必选参数 kud 上下调节系数(灵敏度)
-    @param  [in]必选参数 tStartUd 上下开始补偿时间cyc
-    @param  [in]必选参数 stepMaxUd 上下每次最大补偿量 mm
-    @param  [in]必选参数 sumMaxUd 上下总计最大补偿量
-    @param  [in]必选参数 axisSelect 上下坐标系选择，0-摆动；1-工具；2-基座
-    @param  [in]必选参数 referenceType 上下基准电流设定方式，0-反馈；1-常数
-    @param  [in]必选参数 referSampleStartUd 上下基准电流采样开始计数(反馈)，cyc
-    @param  [in]必选参数 referSampleCountUd 上下基准电流采样循环计数(反馈)，cyc
-    @param  [in]必选参数 referenceCurrent 上下基准电流mA
-    @param  [in]必选参数 offsetType 偏置跟踪类型，0-不偏置；1-采样；2-百分比
-    @param  [in]必选参数 offsetParameter 偏置参数；采样(偏置采样开始时间，默认采一周期)；百分比(偏置百分比(-100 ~ 100))
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceControl(self,flag,delaytime, isLeftRight, klr, tStartLr, stepMaxLr, sumMaxLr, isUpLow, kud, tStartUd, stepMaxUd,
-                            sumMaxUd, axisSelect, referenceType, referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        delaytime = float(delaytime)
-        isLeftRight = int(isLeftRight)
-        klr = float(klr)
-        tStartLr = float(tStartLr)
-        stepMaxLr = float(stepMaxLr)
-        sumMaxLr = float(sumMaxLr)
-        isUpLow = int(isUpLow)
-        kud = float(kud)
-        tStartUd = float(tStartUd)
-        stepMaxUd = float(stepMaxUd)
-        sumMaxUd = float(sumMaxUd)
-        axisSelect = int(axisSelect)
-        referenceType = int(referenceType)
-        referSampleStartUd = float(referSampleStartUd)
-        referSampleCountUd = float(referSampleCountUd)
-        referenceCurrent = float(referenceCurrent)
-        offsetType = int(offsetType)
-        offsetParameter = int(offsetParameter)
-
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.ArcWeldTraceControl(flag,delaytime, isLeftRight, [klr, tStartLr, stepMaxLr, sumMaxLr], isUpLow, [kud, tStartUd, stepMaxUd,
-                                                       sumMaxUd], axisSelect, referenceType, referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-
-        return error
-
-    """   
-    @brief  电弧跟踪AI通带选择
-    @param  [in]必选参数 channel 电弧跟踪AI通带选择,[0-3]
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceExtAIChannelConfig(self,channel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        channel = int(channel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceExtAIChannelConfig(channel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  力传感器辅助拖动
-    @param  [in]必选参数 status 控制状态，0-关闭；1-开启
-    @param  [in]必选参数 asaptiveFlag 自适应开启标志，0-关闭；1-开启
-    @param  [in]必选参数 interfereDragFlag 干涉区拖动标志，0-关闭；1-开启
-    @param  [in]必选参数 ingularityConstraintsFlag 奇异点策略，0-规避；1-穿越
-    @param  [in]必选参数 forceCollisionFlag 辅助拖动时机器人碰撞检测标志；0-关闭；1-开启
-    @param  [in]必选参数 M=[m1,m2,m3,m4,m5,m6] 惯性系数 
-    @param  [in]必选参数 B=[b1,b2,b3,b4,b5,b6] 阻尼系数
-    @param  [in]必选参数 K=[k1,k2,k3,k4,k5,k6] 刚度系数
-    @param  [in]必选参数 F=[f1,f2,f3,f4,f5,f6] 拖动六维力阈值
-    @param  [in]必选参数 Fmax 最大拖动力限制
-    @param  [in]必选参数 Vmax 最大关节速度限制
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def EndForceDragControl(self, status, asaptiveFlag, interfereDragFlag, ingularityConstraintsFlag, forceCollisionFlag, M, B, K, F, Fmax, Vmax):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        asaptiveFlag = int(asaptiveFlag)
-        interfereDragFlag = int(interfereDragFlag)
-        ingularityConstraintsFlag = int(ingularityConstraintsFlag)
-        M = list(map(float,M))
-        B = list(map(float,B))
-        K = list(map(float,K))
-        F = list(map(float,F))
-        Fmax = float(Fmax)
-        Vmax = float(Vmax)
-        forceCollisionFlag = int(forceCollisionFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.EndForceDragControl(status, asaptiveFlag, interfereDragFlag, ingularityConstraintsFlag,forceCollisionFlag, M, B, K, F, Fmax, Vmax)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  报错清除后力传感器自动开启
-    @param  [in]必选参数 status 控制状态，0-关闭；1-开启
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetForceSensorDragAutoFlag(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetForceSensorDragAutoFlag(status)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置六维力和关节阻抗混合拖动开关及参数
-    @param  [in]必选参数 status 控制状态，0-关闭；1-开启
-    @param  [in]必选参数 impedanceFlag 阻抗开启标志，0-关闭；1-开启
-    @param  [in]必选参数 lamdeDain 拖动增益
-    @param  [in]必选参数 KGain 刚度增益
-    @param  [in]必选参数 BGain 阻尼增益
-    @param  [in]必选参数 dragMaxTcpVel 拖动末端最大线速度限制
-    @param  [in]必选参数 dragMaxTcpOriVel 拖动末端最大角速度限制
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ForceAndJointImpedanceStartStop(self,status, impedanceFlag, lamdeDain, KGain, BGain,dragMaxTcpVel,dragMaxTcpOriVel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        impedanceFlag = int(impedanceFlag)
-        if((len(lamdeDain)!=6)or(len(KGain)!=6)or(len(BGain)!=6)):
-            return 4
-        lamdeDain = list(map(float,lamdeDain))
-        KGain = list(map(float,KGain))
-        BGain = list(map(float,BGain))
-        dragMaxTcpVel = float(dragMaxTcpVel)
-        dragMaxTcpOriVel = float(dragMaxTcpOriVel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ForceAndJointImpedanceStartStop(status, impedanceFlag, lamdeDain, KGain, BGain,dragMaxTcpVel,dragMaxTcpOriVel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-    """   
-    @brief  获取力传感器拖动开关状态
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） dragState 力传感器辅助拖动控制状态，0-关闭；1-开启
-    @return 返回值（调用成功返回） sixDimensionalDragState 六维力辅助拖动控制状态，0-关闭；1-开启
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetForceAndTorqueDragState(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForceAndTorqueDragState()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2]
-        else:
-            return error,None,None
-
-    """   
-    @brief  设置力传感器下负载重量
-    @param  [in]必选参数 weight 负载重量 kg
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetForceSensorPayload(self,weight):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weight = float(weight)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetForceSensorPayload(weight)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置力传感器下负载重量
-    @param  [in]必选参数 x 负载质心x mm 
-    @param  [in]必选参数 y 负载质心y mm 
-    @param  [in]必选参数 z 负载质心z mm 
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetForceSensorPayloadCog(self,x,y,z):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        x = float(x)
-        y = float(y)
-        z = float(z)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetForceSensorPayloadCog(x,y,z)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取力传感器下负载重量
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） weight 负载重量 kg
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetForceSensorPayload(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForceSensorPayload()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1]
-        else:
-            return error,None
-
-
-    """   
-    @brief  获取力传感器下负载质心
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） x 负载质心x mm 
-    @return 返回值（调用成功返回） y 负载质心y mm 
-    @return 返回值（调用成功返回） z 负载质心z mm 
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetForceSensorPayloadCog(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetForceSensorPayloadCog()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2], _error[3]
-        else:
-            return error,None,None,None
-
-    """   
-    @brief  力传感器自动校零
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） weight 传感器质量 kg 
-    @return 返回值（调用成功返回） pos=[x,y,z] 传感器质心 mm
-    """
-    @log_call
-    @xmlrpc_timeout
-    def ForceSensorAutoComputeLoad(self):
-        rtn = self.ForceSensorSetSaveDataFlag(1)
-        if rtn!=0:
-            return rtn,None,None
-        error =self.GetActualJointPosDegree()
-        start_joint = error[1]
-        error = self.GetActualJointPosDegree()
-        if error[0]==0:
-            joint =error[1]
-            if joint[2]<0:
-                joint[3] = joint[3] + 90
-            else:
-                joint[3] = joint[3] - 90
-            rtn = self.MoveJ(joint,0,0,vel=10)
-            if rtn!=0:
-                return rtn,None,None
-        else:
-            return error,None,None
-
-        rtn = self.ForceSensorSetSaveDataFlag(2)
-        if rtn!=0:
-            return rtn,None,None
-
-        error = self.GetActualJointPosDegree()
-        if error[0] == 0:
-            joint = error[1]
-            if joint[5] < 0:
-                joint[5] = joint[5] + 90
-            else:
-                joint[5] = joint[5] - 90
-            rtn = self.MoveJ(joint, 0, 0,vel=10)
-            if rtn != 0:
-                return rtn,None,None
-        else:
-            return error,None,None
-
-        rtn = self.ForceSensorSetSaveDataFlag(3)
-        if rtn!=0:
-            return rtn,None,None
-
-        _error = self.robot.ForceSensorComputeLoad()
-        error = _error[0]
-        self.MoveJ(start_joint,0,0,vel=10)
-        if error == 0:
-            return error, _error[1],[_error[2],_error[3],_error[4]]
-        else:
-            return error,None,None
-
-    """   
-    @brief  传感器自动校零数据记录
-    @param  [in]必选参数 recordCount 记录数据个数 1-3
-    @return 错误码 成功- 0, 失败-错误码
-    """
-    @log_call
-    @xmlrpc_timeout
-    def ForceSensorSetSaveDataFlag(self,recordCount):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ForceSensorSetSaveDataFlag(recordCount)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  传感器自动校零计算
-    @return 错误码 成功- 0, 失败-错误码    
-    @return 返回值（调用成功返回） weight 传感器质量 kg 
-    @return 返回值（调用成功返回） pos=[x,y,z] 传感器质心 mm
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ForceSensorComputeLoad(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ForceSensorComputeLoad()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1],[_error[2],_error[3],_error[4]]
-        else:
-            return error,None,None
-
-    """   
-    @brief  末端传感器配置
-    @param  [in]必选参数 idCompany 厂商，18-JUNKONG；25-HUIDE
-    @param  [in]必选参数 idDevice 类型，0-JUNKONG/RYR6T.V1.0
-    @param  [in]必选参数 idSoftware 软件版本，0-J1.0/HuiDe1.0(暂未开放)
-    @param  [in]必选参数 idBus 挂载位置，1-末端1号口；2-末端2号口...8-末端8号口(暂未开放)
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AxleSensorConfig(self,idCompany, idDevice, idSoftware, idBus):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        idCompany = int(idCompany)
-        idDevice = int(idDevice)
-        idSoftware = int(idSoftware)
-        idBus = int(idBus)
-
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AxleSensorConfig(idCompany, idDevice, idSoftware, idBus)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取末端传感器配置    
-    @return 错误码 成功- 0, 失败-错误码  
-    @return 返回值（调用成功返回） idCompany 厂商，18-JUNKONG；25-HUIDE
-    @return 返回值（调用成功返回） idDevice 类型，0-JUNKONG/RYR6T.V1.0
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AxleSensorConfigGet(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.AxleSensorConfigGet()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2]
-        else:
-            return error,None,None
-
-    """   
-    @brief  末端传感器激活
-    @param  [in]必选参数 actFlag 0-复位；1-激活
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AxleSensorActivate(self,actFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        actFlag = int(actFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AxleSensorActivate(actFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  末端传感器寄存器写入
-    @param  [in]必选参数 devAddr  设备地址编号 0-255
-    @param  [in]必选参数 regHAddr 寄存器地址高8位
-    @param  [in]必选参数 regLAddr 寄存器地址低8位
-    @param  [in]必选参数 regNum  寄存器个数 0-255
-    @param  [in]必选参数 data1 写入寄存器数值1
-    @param  [in]必选参数 data2 写入寄存器数值2
-    @param  [in]必选参数 isNoBlock 是否阻塞 0-阻塞；1-非阻塞
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AxleSensorRegWrite(self,devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        devAddr = int(devAddr)
-        regHAddr = int(regHAddr)
-        regLAddr = int(regLAddr)
-        regNum = int(regNum)
-        data1 = int(data1)
-        data2 = int(data2)
-        isNoBlock = int(isNoBlock)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AxleSensorRegWrite(devAddr, regHAddr, regLAddr, regNum, data1, data2, isNoBlock)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置控制箱DO停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetCtlBoxDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetCtlBoxDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置控制箱AO停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetCtlBoxAO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetCtlBoxAO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置末端工具DO停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetAxleDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetAxleDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置末端工具AO停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetAxleAO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetAxleAO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展DO停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetExtDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetExtDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置扩展AO停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetExtAO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetExtAO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置SmartTool停止/暂停后输出是否复位
-    @param  [in]必选参数 resetFlag  0-不复位；1-复位
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetOutputResetSmartToolDO(self,resetFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        resetFlag = int(resetFlag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetOutputResetSmartToolDO(resetFlag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-    """   
-    @brief  仿真摆动开始
-    @param  [in]必选参数 weaveNum  摆动参数编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeaveStartSim(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveStartSim(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  仿真摆动结束
-    @param  [in]必选参数 weaveNum  摆动参数编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeaveEndSim(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveEndSim(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  开始轨迹检测预警(不运动)
-    @param  [in]必选参数 weaveNum  摆动参数编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeaveInspectStart(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveInspectStart(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  结束轨迹检测预警(不运动)
-    @param  [in]必选参数 weaveNum  摆动参数编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeaveInspectEnd(self,weaveNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveNum = int(weaveNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveInspectEnd(weaveNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-
-    """   
-    @brief  设置焊接工艺曲线参数
-    @param  [in]必选参数 id 焊接工艺编号(1-99)
-    @param  [in]必选参数 startCurrent 起弧电流(A)
-    @param  [in]必选参数 startVoltage 起弧电压(V)
-    @param  [in]必选参数 startTime 起弧时间(ms)
-    @param  [in]必选参数 weldCurrent 焊接电流(A)
-    @param  [in]必选参数 weldVoltage 焊接电压(V)
-    @param  [in]必选参数 endCurrent 收弧电流(A)
-    @param  [in]必选参数 endVoltage 收弧电压(V)
-    @param  [in]必选参数 endTime 收弧时间(ms)
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeldingSetProcessParam(self, id, startCurrent, startVoltage, startTime, weldCurrent, weldVoltage, endCurrent,
-                               endVoltage, endTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        startCurrent = float(startCurrent)
-        startVoltage = float(startVoltage)
-        startTime = float(startTime)
-        weldCurrent = float(weldCurrent)
-        weldVoltage = float(weldVoltage)
-        endCurrent = float(endCurrent)
-        endVoltage = float(endVoltage)
-        endTime = float(endTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetProcessParam(id, startCurrent, startVoltage, startTime, weldCurrent, weldVoltage,
-                                                          endCurrent, endVoltage, endTime)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取焊接工艺曲线参数    
-    @param  [in]必选参数 id 焊接工艺编号(1-99)
-    @return 错误码 成功- 0, 失败-错误码  
-    @return 返回值（调用成功返回） startCurrent 起弧电流(A)
-    @return 返回值（调用成功返回） startVoltage 起弧电压(V)
-    @return 返回值（调用成功返回） startTime 起弧时间(ms)
-    @return 返回值（调用成功返回） weldCurrent 焊接电流(A)
-    @return 返回值（调用成功返回） weldVoltage 焊接电压(V)
-    @return 返回值（调用成功返回） endCurrent 收弧电流(A)
-    @return 返回值（调用成功返回） endVoltage 收弧电压(V)
-    @return 返回值（调用成功返回） endTime 收弧时间(ms)
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeldingGetProcessParam(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.WeldingGetProcessParam(id)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2], _error[3], _error[4], _error[5], _error[6], _error[7], _error[8]
-        else:
-            return error,None,None,None,None,None,None,None,None
-
-    """   
-    @brief  扩展IO-配置焊机气体检测信号
-    @param  [in]必选参数 DONum  气体检测信号扩展DO编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetAirControlExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAirControlExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  扩展IO-配置焊机起弧信号
-    @param  [in]必选参数 DONum  焊机起弧信号扩展DO编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetArcStartExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetArcStartExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  扩展IO-配置焊机反向送丝信号
-    @param  [in]必选参数 DONum  反向送丝信号扩展DO编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetWireReverseFeedExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWireReverseFeedExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  扩展IO-配置焊机正向送丝信号
-    @param  [in]必选参数 DONum  正向送丝信号扩展DO编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetWireForwardFeedExtDoNum(self,DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWireForwardFeedExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  扩展IO-配置焊机起弧成功信号
-    @param  [in]必选参数 DINum  起弧成功信号扩展DI编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetArcDoneExtDiNum(self,DINum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DINum = int(DINum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetArcDoneExtDiNum(DINum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  扩展IO-配置焊机准备信号
-    @param  [in]必选参数 DINum  焊机准备信号扩展DI编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetWeldReadyExtDiNum(self,DINum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DINum = int(DINum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWeldReadyExtDiNum(DINum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  扩展IO-配置焊接中断恢复信号
-    @param  [in]必选参数 reWeldDINum  焊接中断后恢复焊接信号扩展DI编号
-    @param  [in]必选参数 abortWeldDINum  焊接中断后退出焊接信号扩展DI编号
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetExtDIWeldBreakOffRecover(self,reWeldDINum, abortWeldDINum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        reWeldDINum = int(reWeldDINum)
-        abortWeldDINum = int(abortWeldDINum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExtDIWeldBreakOffRecover(reWeldDINum, abortWeldDINum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-
-    """   
-    @brief  设置机器人碰撞检测方法
-    @param  [in]必选参数 method 碰撞检测方法：0-电流模式；1-双编码器；2-电流和双编码器同时开启
-    @param  [in]必选参数 thresholdMode 碰撞等级阈值方式；0-碰撞等级固定阈值方式；1-自定义碰撞检测阈值
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetCollisionDetectionMethod(self,method,thresholdMode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        method = int(method)
-        thresholdMode = int(thresholdMode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCollisionDetectionMethod(method,thresholdMode)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置静态下碰撞检测开始关闭
-    @param  [in]必选参数 status 0-关闭；1-开启
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetStaticCollisionOnOff(self,status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetStaticCollisionOnOff(status)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  关节扭矩功率检测
-    @param  [in]必选参数 status 0-关闭；1-开启
-    @param  [in]必选参数 power 设定最大功率(W)
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetPowerLimit(self,status, power):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        power = float(power)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetPowerLimit(status, power)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置机器人 20004 端口反馈周期
-    @param  [in]必选参数 period 机器人 20004 端口反馈周期(ms)
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetRobotRealtimeStateSamplePeriod(self,period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRobotRealtimeStateSamplePeriod(period)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取机器人 20004 端口反馈周期
-    @param  [in]NULL
-    @return 错误码 成功- 0, 失败-错误码    
-    @return 返回值（调用成功返回） period 机器人 20004 端口反馈周期(ms)
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetRobotRealtimeStateSamplePeriod(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotRealtimeStateSamplePeriod()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1]
-        else:
-            return error,None
-
-
-    """   
-    @brief  获取关节驱动器当前扭矩
-    @param  [in] 必选参数 NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）data=[j1,j2,j3,j4,j5,j6] 关节扭矩    [fx,fy,fz,tx,ty,tz]
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetJointDriverTorque(self):
-        return 0,[self.robot_state_pkg.jointDriverTorque[0],self.robot_state_pkg.jointDriverTorque[1],self.robot_state_pkg.jointDriverTorque[2],
-                  self.robot_state_pkg.jointDriverTorque[3],self.robot_state_pkg.jointDriverTorque[4],self.robot_state_pkg.jointDriverTorque[5]]
-
-
-    """   
-    @brief  获取关节驱动器当前温度
-    @param  [in] 必选参数 NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回）data=[t1,t2,t3,t4,t5,t6]
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetJointDriverTemperature (self):
-        return 0,[self.robot_state_pkg.jointDriverTemperature [0],self.robot_state_pkg.jointDriverTemperature [1],self.robot_state_pkg.jointDriverTemperature[2],
-                  self.robot_state_pkg.jointDriverTemperature [3],self.robot_state_pkg.jointDriverTemperature[4],self.robot_state_pkg.jointDriverTemperature[5]]
-
-
-
-    """   
-    @brief  电弧追踪 + 多层多道补偿开启
-    @param  [in] 必选参数 NULL
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceReplayStart(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceReplayStart()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-    """   
-    @brief  电弧追踪 + 多层多道补偿关闭
-    @param  [in] 必选参数 NULL
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceReplayEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceReplayEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  偏移量坐标变化-多层多道焊
-    @param  [in] pointo 基准点笛卡尔位姿
-    @param  [in] pointX 基准点X向偏移方向点笛卡尔位姿
-    @param  [in] pointZ 基准点Z向偏移方向点笛卡尔位姿
-    @param  [in] dx x方向偏移量(mm)
-    @param  [in] dz z方向偏移量(mm)
-    @param  [in] dry 绕y轴偏移量(°)
-    @return 错误码 成功- 0, 失败-错误码    
-    @return 返回值（调用成功返回） offset 计算结果偏移量
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def MultilayerOffsetTrsfToBase(self,pointo,pointX,pointZ,dx,dz,dry):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pointo =list(map(float,pointo))
-        pointX = list(map(float, pointX))
-        pointZ = list(map(float, pointZ))
-        dx = float(dx)
-        dz = float(dz)
-        dry = float(dry)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.MultilayerOffsetTrsfToBase(pointo[0],pointo[1],pointo[2],
-                                                               pointX[0],pointX[1],pointX[2],pointZ[0],pointZ[1],pointZ[2],dx,dz,dry)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        else:
-            return error,None
-
-
-    """   
-    @brief  指定姿态速度开启
-    @param  [in]必选参数 ratio 姿态速度百分比[0-300]
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-    @log_call
-    @xmlrpc_timeout
-    def AngularSpeedStart(self, ratio):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ratio = int(ratio)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AngularSpeedStart(ratio)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-    """   
-    @brief  指定姿态速度关闭
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-    @log_call
-    @xmlrpc_timeout
-    def AngularSpeedEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AngularSpeedEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-    """   
-    @brief  机器人软件升级
-    @param  [in]必选参数  filePath 软件升级包全路径
-    @param  [in]必选参数 block 是否阻塞至升级完成 true:阻塞；false:非阻塞
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SoftwareUpgrade(self,filePath, block):
-        error = self.__FileUpLoad(1,filePath)
-
-        print("__FileUpLoad", error)
-        if 0==error:
-            self.log_info("Software Upload success!")
-            error =self.robot.SoftwareUpgrade()
-            if 0!=error:
-                return error
-            if block:
-                upgradeState = -1
-                time.sleep(0.5)
-                upgradeState = self.GetSoftwareUpgradeState()
-                if upgradeState == 0:
-                    self.log_error("software upgrade not start")
-                    return -1
-                while (upgradeState > 0 and upgradeState < 100):
-                    time.sleep(0.5)
-                    upgradeState = self.GetSoftwareUpgradeState()
-                    # print("upgradeState",upgradeState,"%")
-                if upgradeState == 100:
-                    error = 0
-                else:
-                    error = upgradeState
-            return error
-        else:
-            self.log_error("execute SoftwareUpgrade fail.")
-            return error
-
-
-    """   
-    @brief  获取机器人软件升级状态
-    @return 错误码 成功- 0, 失败-错误码   
-    @return 返回值（调用成功返回） state 机器人软件包升级状态 0：空闲中或上传升级包中，1~100：升级完成百分比，-1：升级软件失败，-2：校验失败，-3：版本校验失败，-4：解压失败，-5：用户配置升级失败，-6：外设配置升级失败，-7：扩展轴配置升级失败，-8：机器人配置升级失败，-9：DH参数配置升级失败
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetSoftwareUpgradeState(self):
-        error = self.robot_state_pkg.softwareUpgradeState
-        return error
-
-    """   
-    @brief  设置485扩展轴运动加减速度
-    @param  [in]必选参数  acc 485扩展轴运动加速度
-    @param  [in]必选参数 dec 485扩展轴运动减速度
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoSetAcc(self,acc,dec):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        acc = float(acc)
-        dec = float(dec)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetAcc(acc,dec)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置485扩展轴急停加减速度
-    @param  [in]必选参数  acc 485扩展轴急停加速度
-    @param  [in]必选参数 dec 485扩展轴急停减速度
-    @return 错误码 成功- 0, 失败-错误码    
-    """
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoSetEmergencyStopAcc(self,acc,dec):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        acc = float(acc)
-        dec = float(dec)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoSetEmergencyStopAcc(acc,dec)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-
-    """   
-    @brief  获取485扩展轴急停加减速度
-    @return 错误码 成功- 0, 失败-错误码        
-    @return 返回值（调用成功返回） acc 485扩展轴急停加速度   
-    @return 返回值（调用成功返回） dec 485扩展轴急停减速度
-    """
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoGetEmergencyStopAcc(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoGetEmergencyStopAcc()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0]==0:
-            return error[0],error[1],error[2]
-        else:
-            return error
-
-    """   
-    @brief  获取485扩展轴运动加减速度
-    @return 错误码 成功- 0, 失败-错误码        
-    @return 返回值（调用成功返回） acc 485扩展轴运动加速度 
-    @return 返回值（调用成功返回） dec 485扩展轴运动减速度
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AuxServoGetAcc(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AuxServoGetAcc()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], error[1], error[2]
-        else:
-            return error
-
-    """   
-    @brief  获取末端通讯参数
-    @return 错误码 成功- 0, 失败-错误码        
-    @return 返回值（调用成功返回） baudRate 波特率：支持 1-9600，2-14400，3-19200，4-38400，5-56000，6-67600，7-115200，8-128000；
-    @return 返回值（调用成功返回） dataBit 数据位：数据位支持（8,9），目前常用为 8
-    @return 返回值（调用成功返回） stopBit 停止位：1-1，2-0.5，3-2，4-1.5，目前常用为 1
-    @return 返回值（调用成功返回） verify 校验位：0-None，1-Odd，2-Even,目前常用为 0；
-    @return 返回值（调用成功返回） timeout 超时时间：1~1000ms，此值需要结合外设搭配设置合理的时间参数
-    @return 返回值（调用成功返回） timeoutTimes  超时次数：1~10，主要进行超时重发，减少偶发异常提高用户体验
-    @return 返回值（调用成功返回） period 周期性指令时间间隔：1~1000ms，主要用于周期性指令每次下发的时间间隔
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetAxleCommunicationParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleCommunicationParam()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], error[1], error[2], error[3], error[4], error[5], error[6], error[7]
-        else:
-            return error
-
-    """   
-    @brief  设置末端通讯参数
-    @param  [in]  baudRate 波特率：支持 1-9600，2-14400，3-19200，4-38400，5-56000，6-67600，7-115200，8-128000；
-    @param  [in]  dataBit 数据位：数据位支持（8,9），目前常用为 8
-    @param  [in]  stopBit 停止位：1-1，2-0.5，3-2，4-1.5，目前常用为 1
-    @param  [in]  verify 校验位：0-None，1-Odd，2-Even,目前常用为 0；
-    @param  [in]  timeout 超时时间：1~1000ms，此值需要结合外设搭配设置合理的时间参数
-    @param  [in]  timeoutTimes  超时次数：1~10，主要进行超时重发，减少偶发异常提高用户体验
-    @param  [in]  period 周期性指令时间间隔：1~1000ms，主要用于周期性指令每次下发的时间间隔
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetAxleCommunicationParam(self,baudRate,dataBit,stopBit,verify,timeout,timeoutTimes,period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        baudRate = int (baudRate)
-        dataBit = int (dataBit)
-        stopBit = int (stopBit)
-        verify = int (verify)
-        timeout = int (timeout)
-        timeoutTimes = int (timeoutTimes)
-        period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleCommunicationParam(baudRate,dataBit,stopBit,verify,timeout,timeoutTimes,period)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置末端文件传输类型
-    @param  [in] type 1-MCU升级文件；2-LUA文件
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetAxleFileType(self,type):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type=int(type)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleFileType(type)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置启用末端LUA执行
-    @param  [in] enable 0-不启用；1-启用
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetAxleLuaEnable(self,enable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        enable=int(enable)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleLuaEnable(enable)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  末端LUA文件异常错误恢复
-    @param  [in] status 0-不恢复；1-恢复
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetRecoverAxleLuaErr(self,enable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetRecoverAxleLuaErr(enable)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取末端LUA执行使能状态
-    @return 错误码 成功- 0, 失败-错误码   
-    @return 返回值（调用成功返回） enable 0-不启用；1-启用
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetAxleLuaEnableStatus(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaEnableStatus()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], error[1]
-        else:
-            return error
-
-    """   
-    @brief  设置末端LUA末端设备启用类型
-    @param  [in] forceSensorEnable 力传感器启用状态，0-不启用；1-启用
-    @param  [in] gripperEnable 夹爪启用状态，0-不启用；1-启用
-    @param  [in] IOEnable IO设备启用状态，0-不启用；1-启用
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetAxleLuaEnableDeviceType(self,forceSensorEnable,gripperEnable,IOEnable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        forceSensorEnable = int(forceSensorEnable)
-        gripperEnable = int(gripperEnable)
-        IOEnable = int(IOEnable)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleLuaEnableDeviceType(forceSensorEnable,gripperEnable,IOEnable)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取末端LUA末端设备启用类型
-    @return 错误码 成功- 0, 失败-错误码   
-    @return 返回值（调用成功返回） forceSensorEnable 力传感器启用状态，0-不启用；1-启用
-    @return 返回值（调用成功返回） gripperEnable 夹爪启用状态，0-不启用；1-启用
-    @return 返回值（调用成功返回） IOEnable IO设备启用状态，0-不启用；1-启用
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetAxleLuaEnableDeviceType(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaEnableDeviceType()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            return error[0], error[1], error[2], error[3]
-        else:
-            return error
-
-    """   
-    @brief  获取当前配置的末端设备
-    @return 错误码 成功- 0, 失败-错误码   
-    @return 返回值（调用成功返回） forceSensorEnable[8] 力传感器启用状态，0-不启用；1-启用
-    @return 返回值（调用成功返回） gripperEnable[8] 夹爪启用状态，0-不启用；1-启用
-    @return 返回值（调用成功返回） IOEnable[8]  IO设备启用状态，0-不启用；1-启用
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetAxleLuaEnableDevice(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaEnableDevice()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            par= error[1].split(',')
-            if 24 != len(par):
-                self.log_error("GetAxleLuaEnableDevice fail")
-                return -1,None,None,None
-            else:
-                print(par)
-                return (error[0], [par[0],par[1], par[2], par[3], par[4], par[5], par[6], par[7]],
-                        [par[8], par[9], par[10], par[11], par[12], par[13], par[14], par[15]],
-                        [par[16], par[17], par[18], par[19], par[20], par[21], par[22], par[23]])
-        else:
-            return error,None,None,None
-
-    """   
-    @brief  设置启用夹爪动作控制功能
-    @param  [in] id 夹爪设备编号
-    @param  [in] func 0-夹爪使能；1-夹爪初始化；2-位置设置；3-速度设置；4-力矩设置；6-读夹爪状态；7-读初始化状态；8-读故障码；9-读位置；10-读速度；11-读力矩,12-15预留
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetAxleLuaGripperFunc(self,id,func):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        func = list(map(int, func))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetAxleLuaGripperFunc(id,func)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        # error = self.robot.SetAxleLuaGripperFunc(id,func)
-        return error
-
-    """   
-    @brief  获取启用夹爪动作控制功能
-    @param  [in] id 夹爪设备编号
-    @return 错误码 成功- 0, 失败-错误码   
-    @return 返回值（调用成功返回） func 0-夹爪使能；1-夹爪初始化；2-位置设置；3-速度设置；4-力矩设置；6-读夹爪状态；7-读初始化状态；8-读故障码；9-读位置；10-读速度；11-读力矩
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetAxleLuaGripperFunc(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id=int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetAxleLuaGripperFunc(id)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            par = error[1].split(',')
-            print(len(par))
-            if 16 != len(par):
-                self.log_error("GetAxleLuaEnableDevice fail")
-                return -1
-            else:
-                return (error[0], [par[0],par[1],par[2], par[3], par[4], par[5], par[6], par[7], par[8],
-                        par[9], par[10], par[11], par[12], par[13], par[14], par[15]])
-        else:
-            return error
-
-    """   
-    @brief  设置控制器外设协议LUA文件名
-    @param  [in]  id 协议编号
-    @param  [in] name lua文件名称 “CTRL_LUA_test.lua”
-    @return 错误码 成功- 0, 失败-错误码        
-    """
-    @log_call
-    @xmlrpc_timeout
-    def SetCtrlOpenLUAName(self,id,name):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        name = str(name)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCtrlOpenLUAName(id,name)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  获取当前配置的控制器外设协议LUA文件名
-    @return 错误码 成功- 0, 失败-错误码     
-    @return 返回值（调用成功返回） name[4] lua文件名称 “CTRL_LUA_test.lua”
-    """
-    @log_call
-    @xmlrpc_timeout
-    def GetCtrlOpenLUAName(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.GetCtrlOpenLUAName()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        if error[0] == 0:
-            par = error[2].split(',')
-            if 4 != sizeof(par):
-                self.log_error("GetCtrlOpenLUAName fail")
-                return -1
-            else:
-                return error[0], [error[1], error[2], error[3], error[4]]
-        else:
-            return error
-
-    """   
-    @brief  加载控制器LUA协议
-    @param  [in] id 控制器LUA协议编号
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def LoadCtrlOpenLUA(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadCtrlOpenLUA(id)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief   卸载控制器LUA协议
-    @param  [in] id 控制器LUA协议编号
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def UnloadCtrlOpenLUA(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.UnloadCtrlOpenLUA(id)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  设置控制器LUA协议错误码
-    @param  [in] id 控制器LUA协议编号
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetCtrlOpenLuaErrCode(self,id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetCtrlOpenLuaErrCode(id)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  机器人Ethercat从站文件写入
-    @param  [in] type 从站文件类型，1-升级从站文件；2-升级从站配置文件
-    @param  [in] slaveID 从站号
-    @param  [in] fileName 上传文件名
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SlaveFileWrite(self,type,slaveID,fileName):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type = int(type)
-        slaveID = int(slaveID)
-        fileName =str(fileName)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SlaveFileWrite(type,slaveID,fileName)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  机器人Ethercat从站进入boot模式
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def SetSysServoBootMode(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSysServoBootMode()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  上传末端Lua开放协议文件
-    @param  [in] filePath 本地lua文件路径名 ".../AXLE_LUA_End_DaHuan.lua"
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AxleLuaUpload(self,filePath):
-
-        error = self.__FileUpLoad(10,filePath)
-        file_name = "/tmp/" + os.path.basename(filePath)
-        # file_name = os.path.basename(filePath)
-        if 0!= error :
-            return error
-        else:
-            rtn = self.SetAxleFileType(2)
-            if(rtn!=0):
-                return -1
-            rtn = self.SetSysServoBootMode()
-            if(rtn!=0):
-                return -1
-            rtn = self.SlaveFileWrite(1,7,file_name)
-            if(rtn!=0):
-                return -1
-            return rtn
-
-
-    """   
-    ***************************************************************************新增********************************************************************************************
-    """
-
-    """   
-    @brief  可移动装置使能
-    @param  [in] enable 使能状态，0-去使能， 1-使能
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def TractorEnable(self, enable):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        enable = int(enable)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorEnable(enable)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief  可移动装置回零
-    @return 错误码 成功- 0, 失败-错误码     
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def TractorHoming(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorHoming()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 可移动装置直线运动
-    @param [in] distance 直线运动距离（mm）
-    @param [in] vel 直线运动速度百分比（0-100）
-    @return 错误码 成功- 0, 失败-错误码  
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def TractorMoveL(self,distance,vel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        distance = float(distance)
-        vel = float(vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorMoveL(distance,vel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 可移动装置圆弧运动
-    @param [in] radio 圆弧运动半径（mm）
-    @param [in] angle 圆弧运动角度（°）
-    @param [in] vel 圆弧运动速度百分比（0-100）
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def TractorMoveC(self,radio, angle, vel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        radio = float(radio)
-        angle = float(angle)
-        vel = float(vel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.TractorMoveC(radio, angle, vel)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 可移动装置停止运动
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def TractorStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ProgramStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 设置焊丝寻位扩展IO端口
-    @param [in] searchDoneDINum 焊丝寻位成功DO端口(0-127)
-    @param [in] searchStartDONum 焊丝寻位启停控制DO端口(0-127)
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def SetWireSearchExtDIONum(self,searchDoneDINum,searchStartDONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        searchDoneDINum = int(searchDoneDINum)
-        searchStartDONum = int(searchStartDONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWireSearchExtDIONum(searchDoneDINum,searchStartDONum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 设置焊机控制模式扩展DO端口
-    @param [in] DONum 焊机控制模式DO端口(0-127)
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def SetWeldMachineCtrlModeExtDoNum(self, DONum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DONum = int(DONum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWeldMachineCtrlModeExtDoNum(DONum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 设置焊机控制模式
-    @param [in] mode 焊机控制模式;0-一元化
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def SetWeldMachineCtrlMode(self, mode):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        mode = int(mode)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWeldMachineCtrlMode(mode)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 关闭RPC
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def CloseRPC(self):
-        # 设置停止事件以通知线程停止
-        self.stop_event.set()
-
-        # 如果线程仍在运行，则等待其结束
-        # if self.thread.is_alive():
-        #     self.thread.join()
-
-        # 清理 XML-RPC 代理
-        if self.robot is not None:
-            self.robot = None  # 将代理设置为 None，释放资源
-            self.sock_cli_state.close()
-            self.sock_cli_state = None
-            self.robot_state_pkg = None
-            self.closeRPC_state = True
-            # self.robot_realstate_exit = False
-
-        # 如果线程仍在运行，则等待其结束
-        if self.thread.is_alive():
-            self.thread.join()
-
-
-        print("RPC connection closed.")
-        return
-
-    """   
-    @brief 记录示教点
-    @param [in] name 示教点名称
-    @param [in] update_allprogramfile 是否覆盖 0-不覆盖 1-覆盖
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    # @log_call
-    # @xmlrpc_timeout
-    #
-    # def SavePoint(self,name,update_allprogramfile=0):
-    #     name = str(name)
-    #     update_allprogramfile = int(update_allprogramfile)
-    #     error = self.robot.save_point(name,update_allprogramfile)
-    #     return error
-
-    """   
-    @brief 开始奇异位姿保护
-    @param [in] protectMode 奇异保护模式，0：关节模式；1-笛卡尔模式
-    @param [in] minShoulderPos 肩奇异调整范围(mm), 默认100.0
-    @param [in] minElbowPos 肘奇异调整范围(mm), 默认50.0
-    @param [in] minWristPos 腕奇异调整范围(°), 默认10.0
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def SingularAvoidStart(self, protectMode, minShoulderPos=100,minElbowPos=50,minWristPos=10):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        protectMode = int(protectMode)
-        minShoulderPos = float(minShoulderPos)
-        minElbowPos = float(minElbowPos)
-        minWristPos = float(minWristPos)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SingularAvoidStart(protectMode, minShoulderPos,minElbowPos,minWristPos)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-    @brief 停止奇异位姿保护
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def SingularAvoidEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SingularAvoidEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-        @brief 获取旋转夹爪的旋转圈数
-        @return 错误码 成功- 0, 失败-错误码
-        @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-        @return 返回值（调用成功返回） num 旋转圈数
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def GetGripperRotNum(self):
-        return 0,self.robot_state_pkg.gripper_fault,self.robot_state_pkg.gripperRotNum
-
-    """   
-        @brief 获取旋转夹爪的旋转速度百分比
-        @return 错误码 成功- 0, 失败-错误码
-        @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-        @return 返回值（调用成功返回） speed 旋转速度百分比
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def GetGripperRotSpeed(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripperRotSpeed
-
-    """   
-        @brief 获取旋转夹爪的旋转力矩百分比
-        @return 错误码 成功- 0, 失败-错误码
-        @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-        @return 返回值（调用成功返回） torque 旋转力矩百分比
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def GetGripperRotTorque(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripperRotTorque
-
-    """   
-       @brief 开始Ptp运动FIR滤波
-       @param  [in] maxAcc 最大加速度极值(deg/s2)
-       @param  [in] maxJek 统一关节急动度极值(deg/s3)
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def PtpFIRPlanningStart(self, maxAcc,maxJek):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        maxAcc = float(maxAcc)
-        maxJek = float(maxJek)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PtpFIRPlanningStart(maxAcc,maxJek)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-       @brief 关闭Ptp运动FIR滤波
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def PtpFIRPlanningEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.PtpFIRPlanningEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-       @brief 上传轨迹J文件
-       @param  [in] filePath 上传轨迹文件的全路径名   C://test/testJ.txt
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def TrajectoryJUpLoad(self,filePath):
-        error = self.__FileUpLoad(20, filePath)
-        return error
-
-    """2024.12.16"""
-    """   
-       @brief 删除轨迹J文件
-       @param  [in] filePath 删除轨迹文件的全路径名   C://test/testJ.txt
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def TrajectoryJDelete(self, fileName):
-        error = self.__FileDelete(20, fileName)
-        return error
-
-    """2024.12.18"""
-    """   
-       @brief 开始LIN、ARC运动FIR滤波
-       @param  [in] maxAccLin 线加速度极值(mm/s2)
-       @param  [in] maxAccDeg 角加速度极值(deg/s2)
-       @param  [in] maxJerkLin 线加加速度极值(mm/s3)
-       @param  [in] maxJerkDeg 角加加速度极值(deg/s3)
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LinArcFIRPlanningStart(self, maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        maxAccLin = float(maxAccLin)
-        maxAccDeg = float(maxAccDeg)
-        maxJerkLin = float(maxJerkLin)
-        maxJerkDeg = float(maxJerkDeg)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LinArcFIRPlanningStart(maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return  error
-
-    """   
-       @brief 关闭LIN、ARC运动FIR滤波
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LinArcFIRPlanningEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LinArcFIRPlanningEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.01.08"""
-    """   
-       @brief 工具坐标系转换开始
-       @param  [in] toolNum 工具坐标系编号[0-14]
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def ToolTrsfStart(self, toolNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        toolNum = int(toolNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ToolTrsfStart(toolNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """   
-       @brief 工具坐标系转换结束
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def ToolTrsfEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ToolTrsfEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.01.08"""
-    """3.7.8"""
-    """
-       @brief 根据点位信息计算工具坐标系
-       @param  [in] method 计算方法；0-四点法；1-六点法
-       @param  [in] pos 关节位置组，四点法时数组长度为4个，六点法时数组长度为6个
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） tcp_offset=[x,y,z,rx,ry,rz]: 根据点位信息计算得到的工具坐标系，单位 [mm][°]
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def ComputeToolCoordWithPoints(self, method, pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        method = int(method)
-        param = {}
-        param[0] = pos[0]
-        param[1] = pos[1]
-        param[2] = pos[2]
-        param[3] = pos[3]
-
-        if method == 0:  # 四点法
-            param[4] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-            param[5] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        else:  # 六点法
-            param[4] = pos[4]
-            param[5] = pos[5]
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeToolCoordWithPoints(method, param[0], param[1], param[2], param[3], param[4], param[5])
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        return error,None
-
-    """
-       @brief 根据点位信息计算工件坐标系
-       @param  [in] method 计算方法；0：原点-x轴-z轴  1：原点-x轴-xy平面
-       @param  [in] pos 三个TCP位置组
-       @param  [in] refFrame 参考坐标系
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） wobj_offset=[x,y,z,rx,ry,rz]: 根据点位信息计算得到的工件坐标系，单位 [mm][°]
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def ComputeWObjCoordWithPoints(self, method, pos, refFrame):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        method = int(method)
-        param = {}
-        param[0] = pos[0]
-        param[1] = pos[1]
-        param[2] = pos[2]
-        refFrame = int(refFrame)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeWObjCoordWithPoints(method, param[0], param[1], param[2], refFrame)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        return error,None
-
-    """
-       @brief 设置机器人焊接电弧意外中断检测参数
-       @param  [in] checkEnable 是否使能检测；0-不使能；1-使能
-       @param  [in] arcInterruptTimeLength 电弧中断确认时长(ms)
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeldingSetCheckArcInterruptionParam(self, checkEnable, arcInterruptTimeLength):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        checkEnable = int(checkEnable)
-        arcInterruptTimeLength = int(arcInterruptTimeLength)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCheckArcInterruptionParam(checkEnable, arcInterruptTimeLength)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 获取机器人焊接电弧意外中断检测参数
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） checkEnable 是否使能检测；0-不使能；1-使能
-       @return 返回值（调用成功返回） arcInterruptTimeLength 电弧中断确认时长(ms)
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeldingGetCheckArcInterruptionParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.WeldingGetCheckArcInterruptionParam()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2]
-        return error,None,None
-
-    """
-       @brief 设置机器人焊接中断恢复参数
-       @param  [in] enable 是否使能焊接中断恢复
-       @param  [in] length 焊缝重叠距离(mm)
-       @param  [in] velocity 机器人回到再起弧点速度百分比(0-100)
-       @param  [in] moveType 机器人运动到再起弧点方式；0-LIN；1-PTP
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeldingSetReWeldAfterBreakOffParam(self, enable, length, velocity, moveType):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        enable = int(enable)
-        length = float(length)
-        velocity = float(velocity)
-        moveType = int(moveType)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetReWeldAfterBreakOffParam(enable, length, velocity, moveType)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 获取机器人焊接中断恢复参数
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） enable 是否使能焊接中断恢复
-       @return 返回值（调用成功返回） length 焊缝重叠距离(mm)
-       @return 返回值（调用成功返回） velocity 机器人回到再起弧点速度百分比(0-100)
-       @return 返回值（调用成功返回） moveType 机器人运动到再起弧点方式；0-LIN；1-PTP
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeldingGetReWeldAfterBreakOffParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.WeldingGetReWeldAfterBreakOffParam()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2], _error[3], _error[4]
-        return error,None,None,None,None
-
-    """
-       @brief 设置机器人焊接中断后恢复焊接
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeldingStartReWeldAfterBreakOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingStartReWeldAfterBreakOff()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 设置机器人焊接中断后退出焊接
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeldingAbortWeldAfterBreakOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingAbortWeldAfterBreakOff()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.01.09"""
-    """
-       @brief 
-       @param  [in] status
-       @param  [in] delayMode
-       @param  [in] delayTime
-       @param  [in] delayDisExAxisNum
-       @param  [in] delayDis
-       @param  [in] sensitivePara
-       @param  [in] speed
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserSensorRecord(self, status, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        delayMode = int(delayMode)
-        delayTime = int(delayTime)
-        delayDisExAxisNum = int(delayDisExAxisNum)
-        delayDis = float(delayDis)
-        sensitivePara = float(sensitivePara)
-        speed = float(speed)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorRecord(status, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 
-       @param  [in] weldId
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserTrackingLaserOn(self, weldId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weldId = int(weldId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingLaserOn(weldId)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserTrackingLaserOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingLaserOff()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 
-       @param  [in] coordId
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserTrackingTrackOn(self, coordId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        coordId = int(coordId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingTrackOn(coordId)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserTrackingTrackOff(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingTrackOff()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 
-       @param  [in] direction
-       @param  [in] directionPoint
-       @param  [in] vel
-       @param  [in] distance
-       @param  [in] timeout
-       @param  [in] posSensorNum
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserTrackingSearchStart(self, direction, directionPoint, vel, distance, timeout, posSensorNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        direction = int(direction)
-        directionPoint = list(map(float, directionPoint))
-        vel = int(vel)
-        distance = int(distance)
-        timeout = int(timeout)
-        posSensorNum = int(posSensorNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStart(direction, directionPoint[0], directionPoint[1], directionPoint[2], vel, distance, timeout, posSensorNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 激光寻位结束
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LaserTrackingSearchStop(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStop()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.01.24"""
-    """3.7.9"""
-    """
-       @brief 摆动渐变开始
-       @param  [in] weaveChangeFlag 摆动编号 1-变摆动参数；2-变摆动参数+焊接速度
-       @param  [in] weaveNum 摆动编号
-       @param  [in] velStart 焊接开始速度，(cm/min)
-       @param  [in] velEnd 焊接结束速度，(cm/min)
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeaveChangeStart(self, weaveChangeFlag, weaveNum, velStart, velEnd):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        weaveChangeFlag = int(weaveChangeFlag)
-        weaveNum = int(weaveNum)
-        velStart = float(velStart)
-        velEnd = float(velEnd)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveChangeStart(weaveChangeFlag, weaveNum, velStart, velEnd)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 摆动渐变结束
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def WeaveChangeEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeaveChangeEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.02.20"""
-    """3.8.0"""
-    """
-       @brief  轨迹预处理(轨迹前瞻)
-       @param  [in] name  轨迹文件名
-       @param  [in] mode 采样模式，0-不进行采样；1-等数据间隔采样；2-等误差限制采样
-       @param  [in] errorLim 误差限制，使用直线拟合生效
-       @param  [in] type 平滑方式，0-贝塞尔平滑
-       @param  [in] precision 平滑精度，使用贝塞尔平滑时生效
-       @param  [in] vamx 设定的最大速度，mm/s
-       @param  [in] amax 设定的最大加速度，mm/s2
-       @param  [in] jmax 设定的最大加加速度，mm/s3
-       @param  [in] flag 匀速前瞻开启开关 0-不开启；1-开启
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def LoadTrajectoryLA(self, name, mode, errorLim, type, precision, vamx, amax, jmax, flag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        name =str(name)
-        mode = int(mode)
-        errorLim = float(errorLim)
-        type = int(type)
-        precision = float(precision)
-        vamx = float(vamx)
-        amax = float(amax)
-        jmax = float(jmax)
-        flag = int(flag)
-
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.LoadTrajectoryLA(name, mode, errorLim, type, precision, vamx, amax, jmax, flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-
-        return error
-
-    """
-       @brief 轨迹复现(轨迹前瞻)
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def MoveTrajectoryLA(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveTrajectoryLA()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.02.25"""
-    """
-      @brief  自定义碰撞检测阈值功能开始，设置关节端和TCP端的碰撞检测阈值
-      @param  [in] flag 1-仅关节检测开启；2-仅TCP检测开启；3-关节和TCP检测同时开启
-      @param  [in] jointDetectionThreshould 关节碰撞检测阈值 j1-j6
-      @param  [in] tcpDetectionThreshould TCP碰撞检测阈值，xyzabc
-      @param  [in] block 0-非阻塞；1-阻塞
-      @return  错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def CustomCollisionDetectionStart(self, flag, jointDetectionThreshould, tcpDetectionThreshould, block):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = int(flag)
-        jointDetectionThreshould = list(map(float, jointDetectionThreshould))
-        tcpDetectionThreshould = list(map(float, tcpDetectionThreshould))
-        block = int(block)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.CustomCollisionDetectionStart(flag, jointDetectionThreshould, tcpDetectionThreshould, block)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-
-        return error
-
-    """
-       @brief 自定义碰撞检测阈值功能关闭
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-
-    def CustomCollisionDetectionEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.CustomCollisionDetectionEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-        
-        return error
-
-    """2025.03.19"""
-    """3.8.1"""
-    """
-       @brief 获取机器人状态
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回）robot_state_pkg 机器人状态结构体
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetRobotRealTimeState(self):
-        return 0,self.robot_state_pkg
-
-    """   
-    @brief  停止运动
-    @param  [in] NULL
-    @return 错误码 成功-0  失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def StopMove(self):
-        error = self.send_message("/f/bIII0III102III4IIIStopIII/b/f")
-        return error
-
-    """2025.03.28"""
-    """
-       @brief 加速度平滑开启
-       @param  [in] saveFlag 是否断电保存
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AccSmoothStart(self, saveFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        saveFlag = bool(saveFlag)
-        saveFlag_flag = 1 if saveFlag else 0
-        saveFlag_flag = int(saveFlag_flag)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AccSmoothStart(saveFlag_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 加速度平滑关闭
-       @param  [in] saveFlag 是否断电保存
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AccSmoothEnd(self, saveFlag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        saveFlag = bool(saveFlag)
-        saveFlag_flag = 1 if saveFlag else 0
-        saveFlag_flag = int(saveFlag_flag)
-
-        flag = True
-        while flag:
-            try:
-                error = self.robot.AccSmoothEnd(saveFlag_flag)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """2025.04.03"""
-    """
-       @brief 控制器日志下载
-       @param  [in] savePath 保存文件路径"D://zDown/"
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def RbLogDownload(self, savePath):
-        try:
-            error = self.robot.RbLogDownloadPrepare()
-            if error == 0:
-                savePath = str(savePath)
-                fileName = "rblog.tar.gz"
-                try:
-                    error = self.__FileDownLoad(1, fileName, savePath)
-                    return error
-                except socket.error as e:
-                    return RobotError.ERR_DOWN_LOAD_FILE_FAILED
-            else:
-                return error
-        except socket.error as e:
-            return RobotError.ERR_RPC_ERROR
-
-    """
-       @brief 所有数据源下载
-       @param  [in] savePath 保存文件路径"D://zDown/"
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def AllDataSourceDownload(self, savePath):
-        try:
-            error = self.robot.AllDataSourceDownloadPrepare()
-            if error == 0:
-                savePath = str(savePath)
-                fileName = "alldatasource.tar.gz"
-                try:
-                    error = self.__FileDownLoad(2, fileName, savePath)
-                    return error
-                except socket.error as e:
-                    return RobotError.ERR_DOWN_LOAD_FILE_FAILED
-            else:
-                return error
-        except socket.error as e:
-            return RobotError.ERR_RPC_ERROR
-
-    """
-       @brief 数据备份包下载
-       @param  [in] savePath 保存文件路径"D://zDown/"
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def DataPackageDownload(self, savePath):
-        try:
-            error = self.robot.DataPackageDownloadPrepare()
-            if error == 0:
-                savePath = str(savePath)
-                fileName = "fr_user_data.tar.gz"
-                try:
-                    error = self.__FileDownLoad(3, fileName, savePath)
-                    return error
-                except socket.error as e:
-                    return RobotError.ERR_DOWN_LOAD_FILE_FAILED
-            else:
-                return error
-        except socket.error as e:
-            return RobotError.ERR_RPC_ERROR
-
-    """
-       @brief 获取控制箱SN码
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） SNCode 控制箱SN码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetRobotSN(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetRobotSN()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1]
-        return error,None
-
-    """
-       @brief 关闭机器人操作系统
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ShutDownRobotOS(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ShutDownRobotOS()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 传送带通讯输入检测
-       @param  [in] timeout 等待超时时间ms
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ConveyorComDetect(self, timeout):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        timeout = int(timeout)
-        flag = True
-        while flag:
-            try:
-                # error = self.robot.ConveryComDetect(timeout)
-                error = self.robot.ConveyorComDetect(timeout)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        return error
-
-    """
-       @brief 传送带通讯输入检测触发
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ConveyorComDetectTrigger(self):
-        error = self.send_message("/f/bIII0III1149III25IIIConveyorComDetectTrigger()III/b/f")
-        return error
-        # while self.reconnect_flag:
-        #     time.sleep(0.1)
-        # if self.GetSafetyCode() != 0:
-        #     return self.GetSafetyCode()
-        #
-        # flag = True
-        # while flag:
-        #     try:
-        #         error = self.robot.ConveryComDetectTrigger()
-        #         # error = self.robot.ConveyorComDetectTrigger()
-        #         flag = False
-        #     except socket.error as e:
-        #         flag = True
-        #
-        # return error
-
-    """2025.04.14"""
-    """3.8.2"""
-    """
-       @brief 电弧跟踪焊机电流反馈AI通道选择
-       @param  [in] channel 通道；0-扩展AI0；1-扩展AI1；2-扩展AI2；3-扩展AI3；4-控制箱AI0；5-控制箱AI1
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceAIChannelCurrent(self, channel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        channel = int(channel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceAIChannelCurrent(channel)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-       @brief 电弧跟踪焊机电压反馈AI通道选择
-       @param  [in] channel 通道；0-扩展AI0；1-扩展AI1；2-扩展AI2；3-扩展AI3；4-控制箱AI0；5-控制箱AI1
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceAIChannelVoltage(self, channel):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        channel = int(channel)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceAIChannelVoltage(channel)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-       @brief 电弧跟踪焊机电流反馈转换参数
-       @param  [in] AILow AI通道下限，默认值0V，范围[0-10V]
-       @param  [in] AIHigh AI通道上限，默认值10V，范围[0-10V]
-       @param  [in] currentLow AI通道下限对应焊机电流值，默认值0V，范围[0-200V]
-       @param  [in] currentHigh AI通道上限对应焊机电流值，默认值100V，范围[0-200V]
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceCurrentPara(self, AILow=0, AIHigh=10, currentLow=0, currentHigh=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        AILow = float(AILow)
-        AIHigh = float(AIHigh)
-        currentLow = float(currentLow)
-        currentHigh = float(currentHigh)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceCurrentPara(AILow, AIHigh, currentLow, currentHigh)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-       @brief 电弧跟踪焊机电压反馈转换参数
-       @param  [in] AILow AI通道下限，默认值0V，范围[0-10V]
-       @param  [in] AIHigh AI通道上限，默认值10V，范围[0-10V]
-       @param  [in] voltageLow AI通道下限对应焊机电压值，默认值0V，范围[0-200V]
-       @param  [in] voltageHigh AI通道上限对应焊机电压值，默认值100V，范围[0-200V]
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ArcWeldTraceVoltagePara(self, AILow=0, AIHigh=10, voltageLow=0, voltageHigh=100):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        AILow = float(AILow)
-        AIHigh = float(AIHigh)
-        voltageLow = float(voltageLow)
-        voltageHigh = float(voltageHigh)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ArcWeldTraceVoltagePara(AILow, AIHigh, voltageLow, voltageHigh)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """2025.04.16"""
-    """
-       @brief 设置焊接电压渐变开始
-       @param  [in] IOType 控制类型；0-控制箱IO；1-数字通信协议(UDP);2-数字通信协议(ModbusTCP)
-       @param  [in] voltageStart 起始焊接电压(V)
-       @param  [in] voltageEnd 终止焊接电压(V)
-       @param  [in] AOIndex 控制箱AO端口号(0-1)
-       @param  [in] blend 是否平滑 0-不平滑；1-平滑
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeldingSetVoltageGradualChangeStart(self, IOType, voltageStart, voltageEnd, AOIndex, blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        IOType = int(IOType)
-        voltageStart = float(voltageStart)
-        voltageEnd = float(voltageEnd)
-        AOIndex = int(AOIndex)
-        blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltageGradualChangeStart(IOType, voltageStart, voltageEnd, AOIndex, blend)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-       @brief 设置焊接电压渐变结束
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeldingSetVoltageGradualChangeEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetVoltageGradualChangeEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-       @brief 设置焊接电流渐变开始
-       @param  [in] IOType 控制类型；0-控制箱IO；1-数字通信协议(UDP);2-数字通信协议(ModbusTCP)
-       @param  [in] currentStart 起始焊接电流(A)
-       @param  [in] currentEnd 终止焊接电流(A)
-       @param  [in] AOIndex 控制箱AO端口号(0-1)
-       @param  [in] blend 是否平滑 0-不平滑；1-平滑
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeldingSetCurrentGradualChangeStart(self, IOType, currentStart, currentEnd, AOIndex, blend):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        IOType = int(IOType)
-        currentStart = float(currentStart)
-        currentEnd = float(currentEnd)
-        AOIndex = int(AOIndex)
-        blend = int(blend)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrentGradualChangeStart(IOType, currentStart, currentEnd, AOIndex, blend)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-       @brief 设置焊接电流渐变结束
-       @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def WeldingSetCurrentGradualChangeEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WeldingSetCurrentGradualChangeEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """2025.04.27"""
-    """
-       @brief 获取SmartTool按钮状态
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） state SmartTool手柄按钮状态;(bit0:0-通信正常；1-通信掉线；bit1-撤销操作；bit2-清空程序；bit3-A键；bit4-B键；bit5-C键；bit6-D键；bit7-E键；bit8-IO键；bit9-手自动；bit10开始)
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetSmarttoolBtnState(self):
-        return 0,self.robot_state_pkg.smartToolState
-
-    """2025.05.08"""
-    """
-       @brief 获取扩展轴坐标系
-       @return 错误码 成功- 0, 失败-错误码
-       @return 返回值（调用成功返回） coord 扩展轴坐标系
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def ExtAxisGetCoord(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ExtAxisGetCoord()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
-        return error, None
-
-    """2025.06.06"""
-    """   
-    @brief  获取夹爪激活状态
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-    @return 返回值（调用成功返回） gripper_active bit0~bit15对应夹爪编号0~15，bit=0为未激活，bit=1为激活
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetGripperActivateStatus(self):
-        return 0, self.robot_state_pkg.gripper_fault,self.robot_state_pkg.gripper_active
-
-    """   
-    @brief  获取夹爪位置
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-    @return 返回值（调用成功返回） position 位置百分比，范围0~100% 
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetGripperCurPosition(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_position
-
-    """   
-    @brief  获取夹爪电流
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-    @return 返回值（调用成功返回） current 电流百分比，范围0~100%
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetGripperCurCurrent(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_current
-
-    """   
-    @brief  获取夹爪电压
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-    @return 返回值（调用成功返回） voltage 电压,单位0.1V
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetGripperVoltage(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_voltage
-
-    """   
-    @brief  获取夹爪温度
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-    @return 返回值（调用成功返回） temp 温度，单位℃
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetGripperTemp(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_tmp
+    def LinArcFIRPlanningStart(self, maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg):
+        return self.command("LinArcFIRPlanningStart", maxAccLin, maxAccDeg, maxJerkLin, maxJerkDeg)
 
-    """   
-    @brief  获取夹爪速度
-    @param  [in] NULL
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
-    @return 返回值（调用成功返回） speed 速度百分比，范围0~100%
+    """   
+       @brief 关闭LIN、ARC运动FIR滤波
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetGripperCurSpeed(self):
-        return 0, self.robot_state_pkg.gripper_fault, self.robot_state_pkg.gripper_speed
 
-    """2025.06.24"""
-    """3.8.3"""
-    """
-    @brief 设置宽电压控制箱温度及风扇转速监控参数
-    @param  [in] enable 0-不使能监测；1-使能监测
-    @param  [in] period 监测周期(s),范围1-100
-    @return 错误码 成功- 0, 失败-错误码
+    def LinArcFIRPlanningEnd(self):
+        return self.command("LinArcFIRPlanningEnd")
+
+    """2025.01.08"""
+    """   
+       @brief 工具坐标系转换开始
+       @param  [in] toolNum 工具坐标系编号[0-14]
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetWideBoxTempFanMonitorParam(self, enable, period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        if self.GetSafetyCode() != 0:
-            return self.GetSafetyCode()
-        enable = int(enable)
-        period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetWideBoxTempFanMonitorParam(enable, period)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
 
-    """
-    @brief 获取宽电压控制箱温度及风扇转速监控参数
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） enable 0-不使能监测；1-使能监测
-    @return 返回值（调用成功返回） period 监测周期(s),范围1-100
+    def ToolTrsfStart(self, toolNum):
+        return self.command("ToolTrsfStart", toolNum)
+
+    """   
+       @brief 工具坐标系转换结束
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetWideBoxTempFanMonitorParam(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetWideBoxTempFanMonitorParam()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2]
-        return error, None, None
 
-    """2025.07.04"""
-    """3.8.4"""
+    def ToolTrsfEnd(self):
+        return self.command("ToolTrsfEnd")
 
+    """2025.01.08"""
+    """3.7.8"""
     """
-    @brief 设置焦点标定点
-    @param  [in] pointNum 焦点标定点编号 1-8
-    @param  [in] point 标定点坐标
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 根据点位信息计算工具坐标系
+       @param  [in] method 计算方法；0-四点法；1-六点法
+       @param  [in] pos 关节位置组，四点法时数组长度为4个，六点法时数组长度为6个
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） tcp_offset=[x,y,z,rx,ry,rz]: 根据点位信息计算得到的工具坐标系，单位 [mm][°]
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetFocusCalibPoint(self, pointNum, point):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pointNum = int(pointNum)
-        point = list(map(float, point))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFocusCalibPoint(pointNum,point[0],point[1],point[2],point[3],point[4],point[5])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
 
-    """
-    @brief 计算焦点标定结果
-    @param  [in] pointNum 标定点个数
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） resultPos 标定结果XYZ
-    @return 返回值（调用成功返回） accuracy 标定精度误差
-    """
+    def ComputeToolCoordWithPoints(self, method, pos):
+        method = int(method)
+        param = {}
+        param[0] = pos[0]
+        param[1] = pos[1]
+        param[2] = pos[2]
+        param[3] = pos[3]
 
-    @log_call
-    @xmlrpc_timeout
-    def ComputeFocusCalib(self, pointNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pointNum = int(pointNum)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.ComputeFocusCalib(pointNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+        if method == 0:  # 四点法
+            param[4] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            param[5] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        else:  # 六点法
+            param[4] = pos[4]
+            param[5] = pos[5]
+        _error = self.query("ComputeToolCoordWithPoints", method, param[0], param[1], param[2], param[3], param[4],
+                            param[5])
 
         error = _error[0]
         if error == 0:
-            return error, [_error[1], _error[2], _error[3]], _error[4]
-        return error, None, None
+            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        return error,None
 
     """
-    @brief 开启焦点跟随
-    @param  [in] kp 比例参数，默认50.0
-    @param  [in] kpredict 前馈参数，默认19.0
-    @param  [in] aMax 最大角加速度限制，默认1440°/s^2
-    @param  [in] vMax 最大角速度限制，默认180°/s
-    @param  [in] type 锁定X轴指向(0-参考输入矢量；1-水平；2-垂直)
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 根据点位信息计算工件坐标系
+       @param  [in] method 计算方法；0：原点-x轴-z轴  1：原点-x轴-xy平面
+       @param  [in] pos 三个TCP位置组
+       @param  [in] refFrame 参考坐标系
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） wobj_offset=[x,y,z,rx,ry,rz]: 根据点位信息计算得到的工件坐标系，单位 [mm][°]
     """
 
     @log_call
     @xmlrpc_timeout
-    def FocusStart(self, kp=50.0, kpredic=19.0, aMax=1440, vMax=180, type=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        kp = float(kp)
-        kpredic = float(kpredic)
-        aMax = float(aMax)
-        vMax = float(vMax)
-        type = int(type)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FocusStart(kp, kpredic, aMax, vMax, type)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
 
-    """
-    @brief 停止焦点跟随
-    @return 错误码 成功- 0, 失败-错误码
-    """
+    def ComputeWObjCoordWithPoints(self, method, pos, refFrame):
+        param = {}
+        param[0] = pos[0]
+        param[1] = pos[1]
+        param[2] = pos[2]
+        _error = self.query("ComputeWObjCoordWithPoints", method, param[0], param[1], param[2], refFrame)
 
-    @log_call
-    @xmlrpc_timeout
-    def FocusEnd(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FocusEnd()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        return error,None
 
+    """2025.02.20"""
+    """3.8.0"""
     """
-    @brief 设置焦点坐标
-    @param  [in] pos 焦点坐标XYZ
-    @return 错误码 成功- 0, 失败-错误码
+       @brief  轨迹预处理(轨迹前瞻)
+       @param  [in] name  轨迹文件名
+       @param  [in] mode 采样模式，0-不进行采样；1-等数据间隔采样；2-等误差限制采样
+       @param  [in] errorLim 误差限制，使用直线拟合生效
+       @param  [in] type 平滑方式，0-贝塞尔平滑
+       @param  [in] precision 平滑精度，使用贝塞尔平滑时生效
+       @param  [in] vamx 设定的最大速度，mm/s
+       @param  [in] amax 设定的最大加速度，mm/s2
+       @param  [in] jmax 设定的最大加加速度，mm/s3
+       @param  [in] flag 匀速前瞻开启开关 0-不开启；1-开启
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetFocusPosition(self, pos):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        pos = list(map(float, pos))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetFocusPosition(pos[0],pos[1],pos[2])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
 
-    """2025.07.08"""
+    def LoadTrajectoryLA(self, name, mode, errorLim, type, precision, vamx, amax, jmax, flag):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("LoadTrajectoryLA", name, mode, errorLim, type, precision, vamx, amax, jmax, flag)
+
     """
-    @brief 设置编码器升级
-    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 轨迹复现(轨迹前瞻)
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetEncoderUpgrade(self, path):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        path = str(path)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetEncoderUpgrade(path)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
 
+    def MoveTrajectoryLA(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("MoveTrajectoryLA")
+
+    """2025.02.25"""
     """
-    @brief 设置关节固件升级
-    @param  [in] type 升级文件类型；1-升级固件；2-升级从站配置文件
-    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
-    @return 错误码 成功- 0, 失败-错误码
+      @brief  自定义碰撞检测阈值功能开始，设置关节端和TCP端的碰撞检测阈值
+      @param  [in] flag 1-仅关节检测开启；2-仅TCP检测开启；3-关节和TCP检测同时开启
+      @param  [in] jointDetectionThreshould 关节碰撞检测阈值 j1-j6
+      @param  [in] tcpDetectionThreshould TCP碰撞检测阈值，xyzabc
+      @param  [in] block 0-非阻塞；1-阻塞
+      @return  错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetJointFirmwareUpgrade(self, type, path):
-        type = int(type)
-        path = str(path)
-        errcode = self.__FileUpLoad(2, path)
-        if errcode == 0:
-            file_name = "/tmp/" + os.path.basename(path)
-            for joint_num in range(1, 7):
-                errcode = self.SlaveFileWrite(1, joint_num, file_name)
-                if errcode != 0:
-                    return errcode
-        return errcode
+    def CustomCollisionDetectionStart(self, flag, jointDetectionThreshould, tcpDetectionThreshould, block):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("CustomCollisionDetectionStart", flag, jointDetectionThreshould, tcpDetectionThreshould,
+                            block)
 
     """
-    @brief 设置控制箱固件升级
-    @param  [in] type 升级文件类型；1-升级固件；2-升级从站配置文件
-    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 自定义碰撞检测阈值功能关闭
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetCtrlFirmwareUpgrade(self, type, path):
-        type = int(type)
-        path = str(path)
-        errcode = self.__FileUpLoad(2, path)
-        if errcode == 0:
-            file_name = "/tmp/" + os.path.basename(path)
-            errcode = self.SlaveFileWrite(type, 0, file_name)
-            return errcode
-        return errcode
 
+    def CustomCollisionDetectionEnd(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("CustomCollisionDetectionEnd")
+
+    """2025.03.19"""
+    """3.8.1"""
     """
-    @brief 设置末端固件升级
-    @param  [in] type 升级文件类型；1-升级固件；2-升级从站配置文件
-    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 获取机器人状态
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回）robot_state_pkg 机器人状态结构体
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetEndFirmwareUpgrade(self, type, path):
-        type = int(type)
-        path = str(path)
-        errcode = self.__FileUpLoad(2, path)
-        if errcode == 0:
-            file_name = "/tmp/" + os.path.basename(path)
-            errcode = self.SlaveFileWrite(type, 7, file_name)
-            return errcode
-        return errcode
+    def GetRobotRealTimeState(self):
+        return 0,self.state_store.snapshot()[2]
 
-    """
-    @brief 关节全参数配置文件升级
-    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
-    @return 错误码 成功- 0, 失败-错误码
+    """   
+    @brief  停止运动
+    @param  [in] NULL
+    @return 错误码 成功-0  失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def JointAllParamUpgrade(self, path):
-        path = str(path)
-        errcode = self.__FileUpLoad(5, path)
-        if errcode == 0:
-            error = self.robot.JointAllParamUpgrade()
-            return error
-        return errcode
+    def StopMove(self):
+        error = self.send_message("/f/bIII0III102III4IIIStopIII/b/f")
+        return error
 
-    """2025.07.21"""
-    """3.8.5"""
+    """2025.03.28"""
     """
-    @brief 激光传感器记录点
-    @param  [in] coordID 激光传感器坐标系
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） joint 激光传感器识别点关节位置
-    @return 返回值（调用成功返回） desc 激光传感器识别点笛卡尔位置
-    @return 返回值（调用成功返回） exaxis 激光传感器识别点扩展轴位置
+       @brief 加速度平滑开启
+       @param  [in] saveFlag 是否断电保存
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserRecordPoint(self, coordID):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        coordID = int(coordID)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.LaserRecordPoint(coordID,0,100)
-                flag = False
-            except socket.error as e:
-                flag = True
-        error = _error[0]
-        if error == 0:
-            param_str = str(_error[1])
-            par_s = param_str.split(',')
-            if len(par_s) != 16:
-                return -1, None, None, None
-            return (error, [float(par_s[0]),float(par_s[1]),float(par_s[2]),float(par_s[3]),float(par_s[4]),float(par_s[5])],
-                    [float(par_s[6]),float(par_s[7]),float(par_s[8]),float(par_s[9]),float(par_s[10]),float(par_s[11])],
-                    [float(par_s[12]),float(par_s[13]),float(par_s[14]),float(par_s[15])])
-        return error, None, None, None
+    def AccSmoothStart(self, saveFlag):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        saveFlag = bool(saveFlag)
+        saveFlag_flag = 1 if saveFlag else 0
+        saveFlag_flag = int(saveFlag_flag)
+        error = self.command("AccSmoothStart", saveFlag_flag)
+
+        return error
 
-    """2025.08.07"""
     """
-    @brief 设置扩展轴与机器人同步运动策略
-    @param  [in] strategy 策略；0-以机器人为主；1-扩展轴与机器人同步
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 加速度平滑关闭
+       @param  [in] saveFlag 是否断电保存
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetExAxisRobotPlan(self, strategy):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        strategy = int(strategy)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetExAxisRobotPlan(strategy)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def AccSmoothEnd(self, saveFlag):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        saveFlag = bool(saveFlag)
+        saveFlag_flag = 1 if saveFlag else 0
+        saveFlag_flag = int(saveFlag_flag)
+
+        error = self.command("AccSmoothEnd", saveFlag_flag)
+
         return error
 
-    """2025.08.12"""
+    """2025.04.03"""
     """
-    @brief 获取从站板卡参数
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） type  0-Ethercat，1-CClink, 3-Ethercat, 4-EIP
-    @return 返回值（调用成功返回） version  协议版本
-    @return 返回值（调用成功返回） connState  0-未连接 1-已连接
+       @brief 控制器日志下载
+       @param  [in] savePath 保存文件路径"D://zDown/"
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetFieldBusConfig(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetFieldBusConfig()
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[2], _error[3], _error[4]
-        return error, None, None, None
+    def RbLogDownload(self, savePath):
+        try:
+            error = self.command("RbLogDownloadPrepare")
+            if error == 0:
+                savePath = str(savePath)
+                fileName = "rblog.tar.gz"
+                try:
+                    error = self.__FileDownLoad(1, fileName, savePath)
+                    return error
+                except socket.error as e:
+                    return RobotError.ERR_DOWN_LOAD_FILE_FAILED
+            else:
+                return error
+        except socket.error as e:
+            return RobotError.ERR_RPC_ERROR
 
     """
-    @brief 写入从站DO
-    @param  [in] DOIndex  DO编号
-    @param  [in] wirteNum  写入的数量
-    @param  [in] status[8] 写入的数值，最多写8个
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 所有数据源下载
+       @param  [in] savePath 保存文件路径"D://zDown/"
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FieldBusSlaveWriteDO(self, DOIndex, wirteNum, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DOIndex = int(DOIndex)
-        wirteNum = int(wirteNum)
-        status = list(map(int, status))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWriteDO(DOIndex, wirteNum, status)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def AllDataSourceDownload(self, savePath):
+        try:
+            error = self.command("AllDataSourceDownloadPrepare")
+            if error == 0:
+                savePath = str(savePath)
+                fileName = "alldatasource.tar.gz"
+                try:
+                    error = self.__FileDownLoad(2, fileName, savePath)
+                    return error
+                except socket.error as e:
+                    return RobotError.ERR_DOWN_LOAD_FILE_FAILED
+            else:
+                return error
+        except socket.error as e:
+            return RobotError.ERR_RPC_ERROR
 
     """
-    @brief 写入从站AO
-    @param  [in] AOIndex  AO编号
-    @param  [in] wirteNum  写入的数量
-    @param  [in] status[8] 写入的数值，最多写8个
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 数据备份包下载
+       @param  [in] savePath 保存文件路径"D://zDown/"
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FieldBusSlaveWriteAO(self, AOIndex, wirteNum, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AOIndex = int(AOIndex)
-        wirteNum = int(wirteNum)
-        status = list(map(int, status))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWriteAO(AOIndex, wirteNum, status)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def DataPackageDownload(self, savePath):
+        try:
+            error = self.command("DataPackageDownloadPrepare")
+            if error == 0:
+                savePath = str(savePath)
+                fileName = "fr_user_data.tar.gz"
+                try:
+                    error = self.__FileDownLoad(3, fileName, savePath)
+                    return error
+                except socket.error as e:
+                    return RobotError.ERR_DOWN_LOAD_FILE_FAILED
+            else:
+                return error
+        except socket.error as e:
+            return RobotError.ERR_RPC_ERROR
 
     """
-    @brief 读取从站DI
-    @param  [in] DOIndex  DI编号
-    @param  [in] readeNum  读取的数量
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） status[8] 读取到的数值，最多读8个
+       @brief 获取控制箱SN码
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） SNCode 控制箱SN码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FieldBusSlaveReadDI(self, DOIndex, readeNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DOIndex = int(DOIndex)
-        readeNum = int(readeNum)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FieldBusSlaveReadDI(DOIndex, readeNum)
-                flag = False
-            except socket.error as e:
-                flag = True
+    def GetRobotSN(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        _error = self.query("GetRobotSN")
 
         error = _error[0]
         if error == 0:
-            return error, _error[1:readeNum+1]
-        return error, None
+            return error, _error[1]
+        return error,None
 
     """
-    @brief 读取从站AI
-    @param  [in] AOIndex  AI编号
-    @param  [in] readeNum  读取的数量
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） status[8] 读取到的数值，最多读8个
+       @brief 关闭机器人操作系统
+       @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def FieldBusSlaveReadAI(self, AOIndex, readeNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AOIndex = int(AOIndex)
-        readeNum = int(readeNum)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.FieldBusSlaveReadAI(AOIndex, readeNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1:readeNum + 1]
-        return error, None
-
-    """
-    @brief 等待扩展DI输入
-    @param  [in] DIIndex DI编号
-    @param  [in] status 0-低电平；1-高电平
-    @param  [in] waitMs 最大等待时间(ms)
-    @return 错误码 成功- 0, 失败-错误码
-    """
+    def ShutDownRobotOS(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ShutDownRobotOS")
 
-    @log_call
-    @xmlrpc_timeout
-    def FieldBusSlaveWaitDI(self, DIIndex, status, waitMs):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        DIIndex = int(DIIndex)
-        status = int(status)
-        waitMs = int(waitMs)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWaitDI(DIIndex, status, waitMs)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        # while self.reconnect_flag:
+        #     time.sleep(0.1)
+        # if self.GetSafetyCode() != 0:
+        #     return self.GetSafetyCode()
+        #
+        # flag = True
+        # while flag:
+        #     try:
+        #         error = self.robot.ConveryComDetectTrigger()
+        #         # error = self.robot.ConveyorComDetectTrigger()
+        #         flag = False
+        #     except socket.error as e:
+        #         flag = True
+        #
+        # return error
 
+    """2025.04.27"""
     """
-    @brief 等待扩展AI输入
-    @param  [in] AIIndex AI编号
-    @param  [in] waitType 0-大于；1-小于
-    @param  [in] value AI值
-    @param  [in] waitMs 最大等待时间(ms)
-    @return 错误码 成功- 0, 失败-错误码
+       @brief 获取SmartTool按钮状态
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） state SmartTool手柄按钮状态;(bit0:0-通信正常；1-通信掉线；bit1-撤销操作；bit2-清空程序；bit3-A键；bit4-B键；bit5-C键；bit6-D键；bit7-E键；bit8-IO键；bit9-手自动；bit10开始)
     """
 
     @log_call
     @xmlrpc_timeout
-    def FieldBusSlaveWaitAI(self, AIIndex, waitType, value, waitMs):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        AIIndex = int(AIIndex)
-        waitType = int(waitType)
-        value = float(value)
-        waitMs = int(waitMs)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.FieldBusSlaveWaitAI(AIIndex, waitType, value, waitMs)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def GetSmarttoolBtnState(self):
+        return 0,self.read_state("smartToolState")
 
-    """
-    @brief 控制阵列式吸盘
-    @param  [in] slaveID 从站号
-    @param  [in] len 长度
-    @param  [in] ctrlValue 控制值 1-按最大真空度吸取 2-按设定真空度吸取 3-停止吸取
+    """2025.06.06"""
+    """   
+    @brief  获取夹爪激活状态
+    @param  [in] NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+    @return 返回值（调用成功返回） gripper_active bit0~bit15对应夹爪编号0~15，bit=0为未激活，bit=1为激活
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetSuckerCtrl(self, slaveID, len, ctrlValue):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        slaveID = int(slaveID)
-        len = int(len)
-        ctrlValue = list(map(int, ctrlValue))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetSuckerCtrl(slaveID, len, ctrlValue)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def GetGripperActivateStatus(self):
+        fault, value = self.read_state("gripper_fault", "gripper_active")
+        return 0, fault, value
 
-    """
-    @brief 获取阵列式吸盘状态
-    @param  [in] slaveID 从站号
+    """   
+    @brief  获取夹爪位置
+    @param  [in] NULL
     @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） state 吸附状态 0-释放物体 1-检测到工件吸附成功 2-没有吸附到物体 3-物体脱离
-    @return 返回值（调用成功返回） pressValue 当前真空度 单位kpa
-    @return 返回值（调用成功返回） error 吸盘当前的错误码
+    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+    @return 返回值（调用成功返回） position 位置百分比，范围0~100% 
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetSuckerState(self, slaveID):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        slaveID = int(slaveID)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSuckerState(slaveID)
-                flag = False
-            except socket.error as e:
-                flag = True
-
-        error = _error[0]
-        if error == 0:
-            return error, _error[1], _error[2], _error[3]
-        return error, None, None, None
+    def GetGripperCurPosition(self):
+        fault, value = self.read_state("gripper_fault", "gripper_position")
+        return 0, fault, value
 
-    """
-    @brief 等待吸盘状态
-    @param  [in] slaveID 从站号
-    @param  [in] state 吸附状态 0-释放物体 1-检测到工件吸附成功 2-没有吸附到物体 3-物体脱离
-    @param  [in] ms 等待最大时间
+    """   
+    @brief  获取夹爪电流
+    @param  [in] NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+    @return 返回值（调用成功返回） current 电流百分比，范围0~100%
     """
 
     @log_call
     @xmlrpc_timeout
-    def WaitSuckerState(self, slaveID, state, ms):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        slaveID = int(slaveID)
-        state = int(state)
-        ms = int(ms)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.WaitSuckerState(slaveID, state, ms)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
+    def GetGripperCurCurrent(self):
+        fault, value = self.read_state("gripper_fault", "gripper_current")
+        return 0, fault, value
 
-    """
-    @brief 上传开放协议的Lua文件
-    @param  [in] filePath 本地开放协议lua文件路径名
+    """   
+    @brief  获取夹爪电压
+    @param  [in] NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+    @return 返回值（调用成功返回） voltage 电压,单位0.1V
     """
 
     @log_call
     @xmlrpc_timeout
-    def OpenLuaUpload(self, filePath):
-        filePath =str(filePath)
-        errcode = self.__FileUpLoad(11, filePath)
-        if errcode == 0:
-            pos = filePath.rfind('/')
-            if pos == -1:
-                return RobotError.ERR_FILE_NAME
-            filename = filePath[pos + 1:]  # 获取文件名部分
-            error = self.robot.CtrlOpenLuaUpLoadCheck(filename)
-            return error
-        return errcode
+    def GetGripperVoltage(self):
+        fault, value = self.read_state("gripper_fault", "gripper_voltage")
+        return 0, fault, value
 
-    """3.8.6"""
-    """2025.09.03"""
-    """
-    @brief 设置拖动开启前负载力检测
-    @param  [in] flag 0-关闭；1-开启
+    """   
+    @brief  获取夹爪温度
+    @param  [in] NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+    @return 返回值（调用成功返回） temp 温度，单位℃
     """
 
     @log_call
     @xmlrpc_timeout
-    def SetTorqueDetectionSwitch(self, flag):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = int(flag)
-        flag_tmp = True
-        while flag_tmp:
-            try:
-                error = self.robot.SetTorqueDetectionSwitch(flag)
-                flag_tmp = False
-            except socket.error as e:
-                flag_tmp = True
-        return error
-
-    # """2025.09.03"""
-    # """
-    # @brief 设置拖动开启前负载力检测
-    # @param  [in] flag 0-关闭；1-开启
-    # @return 错误码 成功- 0, 失败-错误码
-    # """
-    #
-    # @log_call
-    # @xmlrpc_timeout
-    # def SetTorqueDetectionSwitch(self, flag):
-    #     while self.reconnect_flag:
-    #         time.sleep(0.1)
-    #     flag = int(flag)
-    #     flag_tmp = True
-    #     while flag_tmp:
-    #         try:
-    #             error = self.robot.SetTorqueDetectionSwitch(flag)
-    #             flag_tmp = False
-    #         except socket.error as e:
-    #             flag_tmp = True
-    #     return error
+    def GetGripperTemp(self):
+        fault, value = self.read_state("gripper_fault", "gripper_tmp")
+        return 0, fault, value
 
-    """2025.09.05"""
-    """
-    @brief 激光外设打开关闭函数
-    @param  [in] OnOff 0-关闭 1-打开
-    @param  [in] weldId 焊缝ID 默认为0
+    """   
+    @brief  获取夹爪速度
+    @param  [in] NULL
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） fault 0-无错误，1-有错误
+    @return 返回值（调用成功返回） speed 速度百分比，范围0~100%
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserTrackingLaserOnOff(self, OnOff, weldId=0):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        OnOff = int(OnOff)
-        weldId = int(weldId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingLaserOnOff(OnOff, weldId)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def GetGripperCurSpeed(self):
+        fault, value = self.read_state("gripper_fault", "gripper_speed")
+        return 0, fault, value
 
+    """2025.06.24"""
+    """3.8.3"""
     """
-    @brief 激光跟踪开始结束函数
-    @param  [in] OnOff 0-结束 1-开始
-    @param  [in] coordId 激光外设工具坐标系编号
+    @brief 设置宽电压控制箱温度及风扇转速监控参数
+    @param  [in] enable 0-不使能监测；1-使能监测
+    @param  [in] period 监测周期(s),范围1-100
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserTrackingTrackOnOff(self, OnOff, coordId):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        OnOff = int(OnOff)
-        coordId = int(coordId)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingTrackOnOff(OnOff, coordId)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def SetWideBoxTempFanMonitorParam(self, enable, period):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("SetWideBoxTempFanMonitorParam", enable, period)
 
     """
-    @brief 激光寻位-固定方向
-    @param  [in] direction 0-x+ 1-x- 2-y+ 3-y- 4-z+ 5-z-
-    @param  [in] vel 速度 单位%
-    @param  [in] distance 最大寻位距离 单位mm
-    @param  [in] timeout 寻位超时时间 单位ms
-    @param  [in] posSensorNum 激光标定的工具坐标编号
+    @brief 获取宽电压控制箱温度及风扇转速监控参数
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） enable 0-不使能监测；1-使能监测
+    @return 返回值（调用成功返回） period 监测周期(s),范围1-100
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserTrackingSearchStart_xyz(self, direction, vel, distance, timeout, posSensorNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        direction = int(direction)
-        vel = int(vel)
-        distance = int(distance)
-        timeout = int(timeout)
-        posSensorNum = int(posSensorNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStart_xyz(direction, vel, distance, timeout, posSensorNum)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-    @brief 激光寻位-任意方向
-    @param  [in] directionPoint 寻位输入的点的xyz左边,[x,y,z]
-    @param  [in] vel 速度 单位%
-    @param  [in] distance 最大寻位距离 单位mm
-    @param  [in] timeout 寻位超时时间 单位ms
-    @param  [in] posSensorNum 激光标定的工具坐标编号
-    @return 错误码 成功- 0, 失败-错误码
-    """
+    def GetWideBoxTempFanMonitorParam(self):
+        _error = self.query("GetWideBoxTempFanMonitorParam")
 
-    @log_call
-    @xmlrpc_timeout
-    def LaserTrackingSearchStart_point(self, directionPoint, vel, distance, timeout, posSensorNum):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        directionPoint = list(map(float, directionPoint))
-        vel = int(vel)
-        distance = int(distance)
-        timeout = int(timeout)
-        posSensorNum = int(posSensorNum)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSearchStart_point(6, vel, distance, timeout, posSensorNum, directionPoint[0], directionPoint[1], directionPoint[2])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2]
+        return error, None, None
 
+    """2025.08.12"""
     """
-    @brief 激光IP配置
-    @param  [in] ip 激光外设的ip地址
-    @param  [in] port 激光外设的端口号
+    @brief 获取从站板卡参数
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） type  0-Ethercat，1-CClink, 3-Ethercat, 4-EIP
+    @return 返回值（调用成功返回） version  协议版本
+    @return 返回值（调用成功返回） connState  0-未连接 1-已连接
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserTrackingSensorConfig(self, ip, port):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        ip =str (ip)
-        port = int(port)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSensorConfig(ip, port)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def GetFieldBusConfig(self):
+        _error = self.query("GetFieldBusConfig")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[2], _error[3], _error[4]
+        return error, None, None, None
 
     """
-    @brief 激光外设采样周期配置
-    @param  [in] period 激光外设采样周期 单位ms
+    @brief 写入从站DO
+    @param  [in] DOIndex  DO编号
+    @param  [in] wirteNum  写入的数量
+    @param  [in] status[8] 写入的数值，最多写8个
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserTrackingSensorSamplePeriod(self, period):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        period = int(period)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserTrackingSensorSamplePeriod(period)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def FieldBusSlaveWriteDO(self, DOIndex, wirteNum, status):
+        return self.command("FieldBusSlaveWriteDO", DOIndex, wirteNum, status)
 
     """
-    @brief 激光外设驱动加载
-    @param  [in] type 激光外设驱动的协议类型 101-睿牛 102-创想 103-全视 104-同舟 105-奥太
+    @brief 写入从站AO
+    @param  [in] AOIndex  AO编号
+    @param  [in] wirteNum  写入的数量
+    @param  [in] status[8] 写入的数值，最多写8个
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LoadPosSensorDriver(self, type):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        type = int(type)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LoadPosSensorDriver(type)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def FieldBusSlaveWriteAO(self, AOIndex, wirteNum, status):
+        return self.command("FieldBusSlaveWriteAO", AOIndex, wirteNum, status)
 
     """
-    @brief 激光外设驱动卸载
+    @brief 读取从站DI
+    @param  [in] DOIndex  DI编号
+    @param  [in] readeNum  读取的数量
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） status[8] 读取到的数值，最多读8个
     """
 
     @log_call
     @xmlrpc_timeout
-    def UnLoadPosSensorDriver(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.UnLoadPosSensorDriver()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def FieldBusSlaveReadDI(self, DOIndex, readeNum):
+        readeNum = int(readeNum)
+        _error = self.query("FieldBusSlaveReadDI", DOIndex, readeNum)
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1:readeNum+1]
+        return error, None
 
     """
-    @brief 激光焊缝轨迹记录
-    @param  [in] status 0-停止记录 1-实时跟踪  2-开始记录
-    @param  [in] delayTime 延时时间 单位ms
+    @brief 读取从站AI
+    @param  [in] AOIndex  AI编号
+    @param  [in] readeNum  读取的数量
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） status[8] 读取到的数值，最多读8个
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserSensorRecord1(self, status, delayTime):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        delayTime = int(delayTime)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorRecord1(status, delayTime)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def FieldBusSlaveReadAI(self, AOIndex, readeNum):
+        readeNum = int(readeNum)
+        _error = self.query("FieldBusSlaveReadAI", AOIndex, readeNum)
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1:readeNum + 1]
+        return error, None
 
     """
-    @brief 激光焊缝轨迹复现
-    @param  [in] delayTime 延时时间 单位ms
-    @param  [in] speed 速度 单位%
+    @brief 等待扩展DI输入
+    @param  [in] DIIndex DI编号
+    @param  [in] status 0-低电平；1-高电平
+    @param  [in] waitMs 最大等待时间(ms)
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserSensorReplay(self, delayTime, speed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        delayTime = int(delayTime)
-        speed = float(speed)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorReplay(3, delayTime, speed)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def FieldBusSlaveWaitDI(self, DIIndex, status, waitMs):
+        return self.command("FieldBusSlaveWaitDI", DIIndex, status, waitMs)
 
     """
-    @brief 激光跟踪复现
+    @brief 等待扩展AI输入
+    @param  [in] AIIndex AI编号
+    @param  [in] waitType 0-大于；1-小于
+    @param  [in] value AI值
+    @param  [in] waitMs 最大等待时间(ms)
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def MoveLTR(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveLTR(0)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def FieldBusSlaveWaitAI(self, AIIndex, waitType, value, waitMs):
+        return self.command("FieldBusSlaveWaitAI", AIIndex, waitType, value, waitMs)
 
     """
-    @brief 激光焊缝轨迹复现
-    @param  [in] delayMode 模式 0-延时时间 1-延时距离
-    @param  [in] delayTime 延时时间 单位ms
-    @param  [in] delayDisExAxisNum 扩展轴编号
-    @param  [in] delayDis 延时距离 单位mm
-    @param  [in] sensitivePara 补偿灵敏系数
-    @param  [in] speed 速度 单位%
+    @brief 控制阵列式吸盘
+    @param  [in] slaveID 从站号
+    @param  [in] len 长度
+    @param  [in] ctrlValue 控制值 1-按最大真空度吸取 2-按设定真空度吸取 3-停止吸取
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def LaserSensorRecordandReplay(self, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        delayMode = int(delayMode)
-        delayTime = int(delayTime)
-        delayDisExAxisNum = int(delayDisExAxisNum)
-        delayDis = float(delayDis)
-        sensitivePara = float(sensitivePara)
-        speed = float(speed)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.LaserSensorRecordandReplay(4, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def SetSuckerCtrl(self, slaveID, len, ctrlValue):
+        return self.command("SetSuckerCtrl", slaveID, len, ctrlValue)
 
     """
-    @brief 运动到焊缝记录的起点
-    @param  [in] moveType 0-PTP 1-LIN
-    @param  [in] ovl 速度 单位%
+    @brief 获取阵列式吸盘状态
+    @param  [in] slaveID 从站号
     @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） state 吸附状态 0-释放物体 1-检测到工件吸附成功 2-没有吸附到物体 3-物体脱离
+    @return 返回值（调用成功返回） pressValue 当前真空度 单位kpa
+    @return 返回值（调用成功返回） error 吸盘当前的错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def MoveToLaserRecordStart(self, moveType, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        moveType = int(moveType)
-        ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToLaserRecordStart(moveType, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def GetSuckerState(self, slaveID):
+        _error = self.query("GetSuckerState", slaveID)
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2], _error[3]
+        return error, None, None, None
 
     """
-    @brief 运动到焊缝记录的终点
-    @param  [in] moveType 0-PTP 1-LIN
-    @param  [in] ovl 速度 单位%
+    @brief 等待吸盘状态
+    @param  [in] slaveID 从站号
+    @param  [in] state 吸附状态 0-释放物体 1-检测到工件吸附成功 2-没有吸附到物体 3-物体脱离
+    @param  [in] ms 等待最大时间
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def MoveToLaserRecordEnd(self, moveType, ovl):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        moveType = int(moveType)
-        ovl = float(ovl)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToLaserRecordEnd(moveType, ovl)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def WaitSuckerState(self, slaveID, state, ms):
+        return self.command("WaitSuckerState", slaveID, state, ms)
+
 
     """
-    @brief 运动到激光传感器寻位点
-    @param  [in] moveFlag 运动类型：0-PTP；1-LIN
-    @param  [in] ovl 速度缩放因子，0-100
-    @param  [in] dataFlag 焊缝缓存数据选择：0-执行规划数据；1-执行记录数据
-    @param  [in] plateType 板材类型：0-波纹板；1-瓦楞板；2-围栏板；3-油桶；4-波纹甲壳钢
-    @param  [in] trackOffectType 激光传感器偏移类型：0-不偏移；1-基坐标系偏移；2-工具坐标系偏移；3-激光传感器原始数据偏移
-    @param  [in] offset 偏移量
+    @brief 上传开放协议的Lua文件
+    @param  [in] filePath 本地开放协议lua文件路径名
     @return 错误码 成功- 0, 失败-错误码
     """
 
     @log_call
     @xmlrpc_timeout
-    def MoveToLaserSeamPos(self, moveFlag, ovl, dataFlag, plateType, trackOffectType, offset):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        moveFlag = int(moveFlag)
-        ovl = float(ovl)
-        plateType = int(plateType)
-        trackOffectType = int(trackOffectType)
-        offset = list(map(float, offset))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MoveToLaserSeamPos([moveFlag, ovl, dataFlag, plateType, trackOffectType, offset[0], offset[1],offset[2], offset[3], offset[4],offset[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    def OpenLuaUpload(self, filePath):
+        filePath =str(filePath)
+        errcode = self.__FileUpLoad(11, filePath)
+        if errcode == 0:
+            pos = filePath.rfind('/')
+            if pos == -1:
+                return RobotError.ERR_FILE_NAME
+            filename = filePath[pos + 1:]  # 获取文件名部分
+            error = self.command("CtrlOpenLuaUpLoadCheck", filename)
+            return error
+        return errcode
 
+    """3.8.6"""
+    """2025.09.03"""
     """
-    @brief 获取激光传感器寻位点坐标信息
-    @param [in] trackOffectType 激光传感器偏移类型：0-不偏移；1-基坐标系偏移；2-工具坐标系偏移；3-激光传感器原始数据偏移
-    @param [in] offset 偏移量
+    @brief 设置拖动开启前负载力检测
+    @param  [in] flag 0-关闭；1-开启
     @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） jPos 关节位置[°]
-    @return 返回值（调用成功返回） descPos 笛卡尔位置[mm]
-    @return 返回值（调用成功返回） tool 工具坐标系
-    @return 返回值（调用成功返回） user 工件坐标系
-    @return 返回值（调用成功返回） exaxis 扩展轴位置[mm]
     """
 
     @log_call
     @xmlrpc_timeout
-    def GetLaserSeamPos(self, trackOffectType, offset):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        trackOffectType = int(trackOffectType)
-        offset = list(map(float, offset))
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetLaserSeamPos([trackOffectType, offset[0], offset[1], offset[2], offset[3],offset[4], offset[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
-        error = _error[0]
-        if error == 0:
-            paramStr = str(_error[1])
-            # print(f"{paramStr}\n")
-
-            parS = paramStr.split(',')
-            if len(parS) != 20:
-                return -1, None, None, None, None, None
-            return (error, [float(parS[0]),float(parS[1]),float(parS[2]),float(parS[3]),float(parS[4]),float(parS[5])],
-                    [float(parS[6]),float(parS[7]),float(parS[8]),float(parS[9]),float(parS[10]),float(parS[11])],
-                    int(parS[12]), int(parS[13]),
-                    [float(parS[16]),float(parS[17]),float(parS[18]),float(parS[19])])
-        return error, None, None, None, None, None
-
-    """2025.09.12"""
-    """
-    @brief 阻抗启停控制
-    @param [in] status 0：关闭；1-开启
-    @param [in] workSpace 0-关节空间；1-迪卡尔空间
-    @param [in] forceThreshold 触发力阈值(N)
-    @param [in] m 质量参数
-    @param [in] b 阻尼参数
-    @param [in] k 刚度参数
-    @param [in] maxV 最大线速度(mm/s)
-    @param [in] maxVA 最大线加速度(mm/s2)
-    @param [in] maxW 最大角速度(°/s)
-    @param [in] maxWA 最大角加速度(°/s2)
-    @return 错误码 成功- 0, 失败-错误码
-    """
+    def SetTorqueDetectionSwitch(self, flag):
+        return self.command("SetTorqueDetectionSwitch", flag)
 
-    @log_call
-    @xmlrpc_timeout
-    def ImpedanceControlStartStop(self, status, workSpace, forceThreshold, m, b, k, maxV, maxVA, maxW, maxWA):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        workSpace = int(workSpace)
-        forceThreshold = list(map(float, forceThreshold))
-        m = list(map(float, m))
-        b = list(map(float, b))
-        k = list(map(float, k))
-        maxV = float(maxV)
-        maxVA = float(maxVA)
-        maxW = float(maxW)
-        maxWA = float(maxWA)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.ImpedanceControlStartStop([status, workSpace,
-                                                     forceThreshold[0], forceThreshold[1], forceThreshold[2], forceThreshold[3], forceThreshold[4], forceThreshold[5]
-                                                     ,m[0], m[1], m[2], m[3], m[4], m[5]
-                                                     ,b[0], b[1], b[2], b[3], b[4], b[5]
-                                                     ,k[0], k[1], k[2], k[3], k[4], k[5]
-                                                     ,maxV, maxVA, maxW, maxWA])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+    # """2025.09.03"""
+    # """
+    # @brief 设置拖动开启前负载力检测
+    # @param  [in] flag 0-关闭；1-开启
+    # @return 错误码 成功- 0, 失败-错误码
+    # """
+    #
+    # @log_call
+    # @xmlrpc_timeout
+    # def SetTorqueDetectionSwitch(self, flag):
+    #     while self.reconnect_flag:
+    #         time.sleep(0.1)
+    #     flag = int(flag)
+    #     flag_tmp = True
+    #     while flag_tmp:
+    #         try:
+    #             error = self.robot.SetTorqueDetectionSwitch(flag)
+    #             flag_tmp = False
+    #         except socket.error as e:
+    #             flag_tmp = True
+    #     return error
 
     """2025.09.17"""
     """
@@ -13571,16 +6547,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetToolCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetToolCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetToolCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13596,16 +6563,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetWObjCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetWObjCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetWObjCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13621,16 +6579,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetExToolCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetExToolCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetExToolCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13646,16 +6595,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetExAxisCoordWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetExAxisCoordWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetExAxisCoordWithID", id)
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13672,16 +6612,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetTargetPayloadWithID(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetTargetPayloadWithID(id)
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetTargetPayloadWithID", id)
         error = _error[0]
         if error == 0:
             return error, _error[1], [_error[2], _error[3], _error[4]]
@@ -13696,12 +6627,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurToolCoord(self):
-        return 0, [self.robot_state_pkg.toolCoord[0],
-                   self.robot_state_pkg.toolCoord[1],
-                   self.robot_state_pkg.toolCoord[2],
-                   self.robot_state_pkg.toolCoord[3],
-                   self.robot_state_pkg.toolCoord[4],
-                   self.robot_state_pkg.toolCoord[5]]
+        return 0, self.read_state("toolCoord")
 
     """
     @brief 获取当前工件坐标系
@@ -13712,12 +6638,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurWObjCoord(self):
-        return 0, [self.robot_state_pkg.wobjCoord[0],
-                   self.robot_state_pkg.wobjCoord[1],
-                   self.robot_state_pkg.wobjCoord[2],
-                   self.robot_state_pkg.wobjCoord[3],
-                   self.robot_state_pkg.wobjCoord[4],
-                   self.robot_state_pkg.wobjCoord[5]]
+        return 0, self.read_state("wobjCoord")
 
     """
     @brief 获取当前外部工具坐标系
@@ -13728,12 +6649,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurExToolCoord(self):
-        return 0, [self.robot_state_pkg.extoolCoord[0],
-                   self.robot_state_pkg.extoolCoord[1],
-                   self.robot_state_pkg.extoolCoord[2],
-                   self.robot_state_pkg.extoolCoord[3],
-                   self.robot_state_pkg.extoolCoord[4],
-                   self.robot_state_pkg.extoolCoord[5]]
+        return 0, self.read_state("extoolCoord")
 
     """
     @brief 获取当前扩展轴坐标系
@@ -13744,152 +6660,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetCurExAxisCoord(self):
-        return 0, [self.robot_state_pkg.exAxisCoord[0],
-                   self.robot_state_pkg.exAxisCoord[1],
-                   self.robot_state_pkg.exAxisCoord[2],
-                   self.robot_state_pkg.exAxisCoord[3],
-                   self.robot_state_pkg.exAxisCoord[4],
-                   self.robot_state_pkg.exAxisCoord[5]]
-
-    """2025.09.18"""
-    """
-    @brief 设置自定义摆动参数
-    @param [in] id 自定义摆动编号：0-2
-    @param [in] pointNum 摆动点位个数 0-10
-    @param [in] point 移动端点数据x,y,z
-    @param [in] stayTime 摆动停留时间ms
-    @param [in] frequency 摆动频率 Hz
-    @param [in] incStayType 等待模式：0-周期不包含等待时间；1-周期包含等待时间
-    @param [in] stationary 摆动位置等待：0-等待时间内继续运动；1-等待时间内位置静止
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def CustomWeaveSetPara(self, id, pointNum, point, stayTime, frequency, incStayType, stationary):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        pointNum = int(pointNum)
-        point = list(map(float, point))
-        stayTime = list(map(float,stayTime))
-        frequency = float(frequency)
-        incStayType = int(incStayType)
-        stationary = int(stationary)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.CustomWeaveSetPara([id, pointNum,
-                                                       point[0],point[1],point[2],point[3],point[4],point[5],point[6],point[7],point[8],point[9],
-                                                       point[10],point[11],point[12],point[13],point[14],point[15],point[16],point[17],point[18],point[19],
-                                                       point[20],point[21],point[22],point[23],point[24],point[25],point[26],point[27],point[28],point[29],
-                                                       stayTime[0],stayTime[1],stayTime[2],stayTime[3],stayTime[4],stayTime[5],stayTime[6],stayTime[7],stayTime[8],stayTime[9],
-                                                       frequency,incStayType,stationary])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
-
-    """
-    @brief 获取自定义摆动参数
-    @param [in] id 自定义摆动编号：0-2
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） pointNum 摆动点位个数 0-10
-    @return 返回值（调用成功返回） point 移动端点数据x,y,z
-    @return 返回值（调用成功返回） stayTime 摆动停留时间ms
-    @return 返回值（调用成功返回） frequency 摆动频率 Hz
-    @return 返回值（调用成功返回） incStayType 等待模式：0-周期不包含等待时间；1-周期包含等待时间
-    @return 返回值（调用成功返回） stationary 摆动位置等待：0-等待时间内继续运动；1-等待时间内位置静止
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def CustomWeaveGetPara(self, id):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        id = int(id)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.CustomWeaveGetPara(id)
-                flag = False
-            except socket.error as e:
-                flag = True
-        error = _error[0]
-        if error == 0:
-            paramStr = str(_error[1])
-            # print(f"{paramStr}\n")
-
-            parS = paramStr.split(',')
-            if len(parS) != 44:
-                return -1, None, None, None, None, None, None
-            return (error, int(parS[0]), [float(parS[1]),  float(parS[2]),  float(parS[3]),
-                                          float(parS[4]),  float(parS[5]),  float(parS[6]),
-                                          float(parS[7]),  float(parS[8]),  float(parS[9]),
-                                          float(parS[10]), float(parS[11]), float(parS[12]),
-                                          float(parS[13]), float(parS[14]), float(parS[15]),
-                                          float(parS[16]), float(parS[17]), float(parS[18]),
-                                          float(parS[19]), float(parS[20]), float(parS[21]),
-                                          float(parS[22]), float(parS[23]), float(parS[24]),
-                                          float(parS[25]), float(parS[26]), float(parS[27]),
-                                          float(parS[28]), float(parS[29]), float(parS[30])],
-                                          [float(parS[31]), float(parS[32]), float(parS[33]),
-                                           float(parS[34]), float(parS[35]), float(parS[36]),
-                                           float(parS[37]), float(parS[38]), float(parS[39]),
-                                           float(parS[40])],
-                                          float(parS[41]),int(parS[42]), int(parS[43]))
-        return error, None, None, None, None, None, None
-
-    """2025.09.19"""
-    """
-    @brief 机器人操作系统升级(LA控制箱)
-    @param [in] filePath 操作系统升级包全路径
-    @return 错误码 成功- 0, 失败-错误码
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def KernelUpgrade(self, filePath):
-        filePath = str(filePath)
-        errcode = self.__FileUpLoad(6, filePath)
-        if errcode == 0:
-            try:
-                result = self.robot.KernelUpgrade()
-                if result is not None and hasattr(result, '__len__') and len(result) == 0:
-                    # print("警告: 内核升级调用成功，但返回空数据")
-                    return 0
-                return result if result is not None else 0
-            except xmlrpc.client.Fault as e:
-                if "array has only 0 items" in str(e):
-                    # print("内核升级指令已发送，但服务器返回空响应")
-                    return 0
-                else:
-                    # print(f"内核升级失败: {e}")
-                    return -1
-        return errcode
-
-    """
-    @brief 获取机器人操作系统升级结果(LA控制箱)
-    @return 错误码 成功- 0, 失败-错误码
-    @return 返回值（调用成功返回） result 升级结果：0:成功；-1:失败
-    """
-
-    @log_call
-    @xmlrpc_timeout
-    def GetKernelUpgradeResult(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetKernelUpgradeResult()
-                flag = False
-            except socket.error as e:
-                flag = True
-        error = _error[0]
-        if error == 0:
-            return error, _error[1]
-        return error, None
+        return 0, self.read_state("exAxisCoord")
 
     """3.8.7"""
     """2025.10.11"""
@@ -13902,17 +6673,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointSensitivityEnable(self, status):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        status = int(status)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.JointSensitivityEnable([status])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("JointSensitivityEnable", [status])
 
     """
     @brief 获取关节扭矩传感器灵敏度标定结果
@@ -13923,15 +6684,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointSensitivityCalibration(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.JointSensitivityCalibration()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("JointSensitivityCalibration")
         error = _error[0]
         if error == 0:
             return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
@@ -13945,16 +6698,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def JointSensitivityCollect(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.JointSensitivityCollect()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("JointSensitivityCollect")
 
     """2025.10.15"""
     """
@@ -13965,16 +6709,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def MotionQueueClear(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.MotionQueueClear()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("MotionQueueClear")
 
     """
     @brief 获取机器人8个从站端口错误帧数
@@ -13992,15 +6727,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetSlavePortErrCounter(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetSlavePortErrCounter()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetSlavePortErrCounter")
         error = _error[0]
         if error == 0:
             paramStr = str(_error[1])
@@ -14029,17 +6756,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SlavePortErrCounterClear(self, slaveID):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        slaveID = int(slaveID)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SlavePortErrCounterClear(slaveID)
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("SlavePortErrCounterClear", slaveID)
 
     """
     @brief 设置各轴速度前馈系数
@@ -14050,17 +6767,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def SetVelFeedForwardRatio(self, radio):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        radio = list(map(float,radio))
-        flag = True
-        while flag:
-            try:
-                error = self.robot.SetVelFeedForwardRatio([radio[0],radio[1],radio[2],radio[3],radio[4],radio[5]])
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("SetVelFeedForwardRatio", radio)
 
     """
     @brief 获取各轴速度前馈系数
@@ -14071,15 +6778,7 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def GetVelFeedForwardRatio(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                _error = self.robot.GetVelFeedForwardRatio()
-                flag = False
-            except socket.error as e:
-                flag = True
+        _error = self.query("GetVelFeedForwardRatio")
         error = _error[0]
         if error == 0:
             return error, [float(_error[1]), float(_error[2]), float(_error[3]), float(_error[4]), float(_error[5]), float(_error[6])]
@@ -14093,14 +6792,5 @@ class RPC():
     @log_call
     @xmlrpc_timeout
     def RobotMCULogCollect(self):
-        while self.reconnect_flag:
-            time.sleep(0.1)
-        flag = True
-        while flag:
-            try:
-                error = self.robot.RobotMCULogCollect()
-                flag = False
-            except socket.error as e:
-                flag = True
-        return error
+        return self.command("RobotMCULogCollect")
 
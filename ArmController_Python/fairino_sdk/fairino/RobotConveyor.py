@@ -0,0 +1,187 @@
+"""
+@brief  传送带接口
+        传送带跟踪的 IO/点位记录、参数设置与跟踪运动。
+        由 RPC 在首次访问其中的接口时导入并将方法并入 RPC 类，调用方式与其余接口相同，见 Robot.SDK_FAMILIES。
+"""
+
+from .Robot import RPC, xmlrpc_timeout
+
+log_call = RPC.log_call
+
+
+class ConveyorMixin:
+    """   
+    @brief  传动带启动、停止
+    @param  [in] 必选参数 status 状态，1-启动，0-停止 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorStartEnd(self, status):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ConveyorStartEnd", status)
+
+    """   
+    @brief  记录IO检测点
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorPointIORecord(self):
+        return self.command("ConveyorPointIORecord")
+
+    """   
+    @brief  记录A点
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorPointARecord(self):
+        return self.command("ConveyorPointARecord")
+
+    """   
+    @brief  记录参考点
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorRefPointRecord(self):
+        return self.command("ConveyorRefPointRecord")
+
+    """   
+    @brief  记录B点
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorPointBRecord(self):
+        return self.command("ConveyorPointBRecord")
+
+    """   
+    @brief  传送带工件IO检测
+    @param  [in] 必选参数 max_t 最大检测时间，单位ms
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorIODetect(self, max_t):
+        return self.command("ConveyorIODetect", max_t)
+
+    """   
+    @brief  获取物体当前位置
+    @param  [in] 必选参数  mode 1-跟踪抓取 2-跟踪运动 3-TPD跟踪
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorGetTrackData(self, mode):
+        return self.command("ConveyorGetTrackData", mode)
+
+    """   
+    @brief  传动带跟踪开始
+    @param  [in] 必选参数  status 状态，1-启动，0-停止
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorTrackStart(self, status):
+        return self.command("ConveyorTrackStart", status)
+
+    """   
+    @brief  传动带跟踪停止
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorTrackEnd(self):
+        return self.command("ConveyorTrackEnd")
+
+    """   
+    @brief  传动带参数配置
+    @param  [in] 必选参数  param = [encChannel,resolution,lead,wpAxis,vision,speedRadio]  encChannel编码器通道 1-2,resolution 编码器分辨率 编码器旋转一圈脉冲个数,
+    lead机械传动比 编码器旋转一圈传送带移动距离,wpAxis  工件坐标系编号 针对跟踪运动功能选择工件坐标系编号，跟踪抓取、TPD跟踪设为0,vision 是否配视觉  0 不配  1 配,
+    speedRadio 速度比  针对传送带跟踪抓取速度范围为（1-100）  跟踪运动、TPD跟踪设置为1
+    @param  [in] 必选参数 followType 跟踪运动类型，0-跟踪运动；1-追检运动
+    @param  [in] 默认参数 startDis 追检抓取需要设置， 跟踪起始距离， -1：自动计算(工件到达机器人下方后自动追检)，单位mm， 默认值0
+    @param  [in] 默认参数 endDis 追检抓取需要设置，跟踪终止距离， 单位mm， 默认值100
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorSetParam(self, param, followType, startDis=0, endDis=100):
+        return self.command("ConveyorSetParam", param, followType, startDis, endDis)
+
+    """   
+    @brief  传动带抓取点补偿
+    @param  [in] 必选参数 cmp 补偿位置 [x,y,z]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorCatchPointComp(self, cmp):
+        return self.command("ConveyorCatchPointComp", cmp)
+
+    """   
+    @brief  直线运动
+    @param  [in] 必选参数  name cvrCatchPoint和cvrRaisePoint
+    @param  [in] 必选参数 tool 工具号
+    @param  [in] 必选参数 wobj 工件号
+    @param  [in] 默认参数 vel 速度 默认20
+    @param  [in] 默认参数 acc 加速度 默认100
+    @param  [in] 默认参数 ovl 速度缩放因子 默认100
+    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorTrackMoveL(self, name, tool, wobj, vel=20, acc=100, ovl=100, blendR=-1.0):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        error = self.command("ConveyorTrackMoveL", name, tool, wobj, vel, acc, ovl, blendR, 0, 0)
+
+        return error
+
+    """
+       @brief 传送带通讯输入检测
+       @param  [in] timeout 等待超时时间ms
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorComDetect(self, timeout):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ConveyorComDetect", timeout)
+
+    """
+       @brief 传送带通讯输入检测触发
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ConveyorComDetectTrigger(self):
+        error = self.send_message("/f/bIII0III1149III25IIIConveyorComDetectTrigger()III/b/f")
+        return error
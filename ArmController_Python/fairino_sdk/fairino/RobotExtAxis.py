@@ -0,0 +1,952 @@
+"""
+@brief  扩展轴接口
+        485/UDP 扩展轴与伺服、扩展IO、外部轴坐标系标定与同步运动。
+        由 RPC 在首次访问其中的接口时导入并将方法并入 RPC 类，调用方式与其余接口相同，见 Robot.SDK_FAMILIES。
+"""
+
+from .Robot import RPC, xmlrpc_timeout
+
+log_call = RPC.log_call
+
+
+class ExtAxisMixin:
+    """   
+    @brief  设置485扩展轴参数
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 int servoCompany 伺服驱动器厂商，1-戴纳泰克
+    @param  [in] 必选参数 int servoModel 伺服驱动器型号，1-FD100-750C
+    @param  [in] 必选参数 int servoSoftVersion 伺服驱动器软件版本，1-V1.0
+    @param  [in] 必选参数 int servoResolution 编码器分辨率
+    @param  [in] 必选参数 float axisMechTransRatio 机械传动比  
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetParam(self, servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
+                         axisMechTransRatio):
+        return self.command("AuxServoSetParam", servoId, servoCompany, servoModel, servoSoftVersion, servoResolution,
+                            axisMechTransRatio)
+
+    """   
+    @brief  获取485扩展轴配置参数
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） int servoCompany 伺服驱动器厂商，1-戴纳泰克
+    @return 返回值（调用成功返回） servoModel 伺服驱动器型号，1-FD100-750C 
+    @return 返回值（调用成功返回） servoSoftVersion 伺服驱动器软件版本，1-V1.0
+    @return 返回值（调用成功返回） int servoResolution 编码器分辨率
+    @return 返回值（调用成功返回） float axisMechTransRatio 机械传动比
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoGetParam(self, servoId):
+        _error = self.query("AuxServoGetParam", servoId)
+
+        error = _error[0]
+        if _error[0] == 0:
+            return error, _error[1], _error[2], _error[3], _error[4], _error[5]
+        else:
+            return error,None,None,None,None,None
+
+    """   
+    @brief  设置485扩展轴使能/去使能
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 int status 使能状态，0-去使能， 1-使能
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoEnable(self, servoId, status):
+        return self.command("AuxServoEnable", servoId, status)
+
+    """   
+    @brief  设置485扩展轴控制模式
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 mode 控制模式，0-位置模式，1-速度模式
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetControlMode(self, servoId, mode):
+        return self.command("AuxServoSetControlMode", servoId, mode)
+
+    """   
+    @brief  设置485扩展轴目标位置(位置模式)
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 float pos 目标位置，mm或°
+    @param  [in] 必选参数 float speed 目标速度，mm/s或°/s
+    @param  [in] 必选参数 acc 加速度百分比[0-100] 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetTargetPos(self, servoId, pos, speed,acc=100):
+        return self.command("AuxServoSetTargetPos", servoId, pos, speed, acc)
+
+    """   
+    @brief  设置485扩展轴目标速度(速度模式)
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 float speed 目标速度，mm/s或°/s
+    @param  [in] 必选参数 acc 加速度百分比[0-100] 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetTargetSpeed(self, servoId, speed,acc):
+        return self.command("AuxServoSetTargetSpeed", servoId, speed, acc)
+
+    """   
+    @brief  设置485扩展轴目标转矩(力矩模式)
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 float torque 目标力矩，Nm
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetTargetTorque(self, servoId, torque):
+        return self.command("AuxServoSetTargetTorque", servoId, torque)
+
+    """   
+    @brief  设置485扩展轴回零
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @param  [in] 必选参数 int mode 回零模式，1-当前位置回零；2-负限位回零；3-正限位回零
+    @param  [in] 必选参数 float searchVel 回零速度，mm/s或°/s
+    @param  [in] 必选参数 float latchVel 箍位速度，mm/s或°/s
+    @param  [in] 必选参数 acc 加速度百分比[0-100] 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoHoming(self, servoId, mode, searchVel, latchVel,acc=100):
+        return self.command("AuxServoHoming", servoId, mode, searchVel, latchVel, acc)
+
+    """   
+    @brief  清除485扩展轴错误信息
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoClearError(self, servoId):
+        return self.command("AuxServoClearError", servoId)
+
+    """   
+    @brief  获取485扩展轴伺服状态
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） servoErrCode 伺服驱动器故障码
+    @return 返回值（调用成功返回） servoState 伺服驱动器状态 bit0:0-未使能；1-使能;  bit1:0-未运动；1-正在运动;bit2:0-正限位未触发，1-正限位触发；bit3:0-负限位未触发，1-负限位触发；   bit4 0-未定位完成；1-定位完成；  bit5：0-未回零；1-回零完成
+    @return 返回值（调用成功返回） servoPos 伺服当前位置 mm或°
+    @return 返回值（调用成功返回） servoSpeed 伺服当前速度 mm/s或°/s
+    @return 返回值（调用成功返回） servoTorque 伺服当前转矩Nm
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoGetStatus(self, servoId):
+        _error = self.query("AuxServoGetStatus", servoId)
+
+        error = _error[0]
+        if _error[0] == 0:
+            return error, _error[1], _error[2], _error[3], _error[4], _error[5]
+        else:
+            return error,None,None,None,None,None
+
+    """   
+    @brief  设置状态反馈中485扩展轴数据轴号
+    @param  [in] 必选参数 int servoId 伺服驱动器ID，范围[1-16],对应从站ID 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServosetStatusID(self, servoId):
+        return self.command("AuxServoSetStatusID", servoId)
+
+    """   
+    @brief  设置机器人外设协议
+    @param  [in] 必选参数 int protocol 机器人外设协议号 4096-扩展轴控制卡；4097-ModbusSlave；4098-ModbusMaster
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetExDevProtocol(self, protocol):
+        return self.command("SetExDevProtocol", protocol)
+
+    """   
+    @brief  获取机器人外设协议
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） int protocol 机器人外设协议号 4096-扩展轴控制卡；4097-ModbusSlave；4098-ModbusMaster
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetExDevProtocol(self):
+        _error = self.query("GetExDevProtocol")
+
+        error = _error[0]
+        if _error[0] == 0:
+            return error, _error[1]
+        else:
+            return error,None
+
+    """   
+    @brief  UDP扩展轴通讯参数配置
+    @param [in]必选参数 ip PLC IP地址
+    @param [in]必选参数 port	端口号
+    @param [in]必选参数 period 通讯周期(ms，暂不开放)
+    @param [in]必选参数 lossPkgTime	丢包检测时间(ms)
+    @param [in]必选参数 lossPkgNum	丢包次数
+    @param [in]必选参数 disconnectTime	通讯断开确认时长
+    @param [in]必选参数 reconnectEnable	通讯断开自动重连使能 0-不使能 1-使能
+    @param [in]必选参数 reconnectPeriod	重连周期间隔(ms)
+    @param [in]必选参数 reconnectNum	重连次数
+    @param [in]必选参数 selfConnect 断电重启是否自动建立连接；0-不建立连接；1-建立连接
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtDevSetUDPComParam(self, ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
+                             reconnectEnable, reconnectPeriod, reconnectNum,selfConnect):
+        period = int(period)
+        period = 2  # 暂不开放，必须是2
+
+        error = self.command("ExtDevSetUDPComParam", ip, port, period, lossPkgTime, lossPkgNum, disconnectTime,
+                             reconnectEnable, reconnectPeriod, reconnectNum, selfConnect)
+
+        return error
+
+    """   
+    @brief  获取UDP扩展轴通讯参数
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）ip PLC IP地址
+    @return 返回值（调用成功返回）port	端口号
+    @return 返回值（调用成功返回）period 通讯周期(ms，暂不开放)
+    @return 返回值（调用成功返回） lossPkgTime	丢包检测时间(ms)
+    @return 返回值（调用成功返回） lossPkgNum	丢包次数
+    @return 返回值（调用成功返回） disconnectTime	通讯断开确认时长
+    @return 返回值（调用成功返回） reconnectEnable	通讯断开自动重连使能 0-不使能 1-使能
+    @return 返回值（调用成功返回） reconnectPeriod	重连周期间隔(ms)
+    @return 返回值（调用成功返回） reconnectNum	重连次数
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtDevGetUDPComParam(self):
+        _error = self.query("ExtDevGetUDPComParam")
+
+        if _error[0] == 0:
+            return _error[0], [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6], _error[7], _error[8],
+                               _error[9]]
+        else:
+            return _error[0],None
+
+    """   
+    @brief  加载UDP通信
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtDevLoadUDPDriver(self):
+        return self.command("ExtDevLoadUDPDriver")
+
+    """   
+    @brief  卸载UDP通信
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtDevUnloadUDPDriver(self):
+        return self.command("ExtDevUnloadUDPDriver")
+
+    """   
+    @brief  UDP扩展轴通信异常断开后恢复连接
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtDevUDPClientComReset(self):
+        return self.command("ExtDevUDPClientComReset")
+
+    """   
+    @brief  UDP扩展轴通信异常断开后关闭通讯
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtDevUDPClientComClose(self):
+        return self.command("ExtDevUDPClientComClose")
+
+    """   
+    @brief  设置扩展机器人相对扩展轴位置
+    @param [in]必选参数 installType 0-机器人安装在外部轴上，1-机器人安装在外部轴外
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetRobotPosToAxis(self, installType):
+        return self.command("SetRobotPosToAxis", installType)
+
+    """   
+    @brief  设置扩展轴系统DH参数配置
+    @param [in]必选参数 axisConfig 外部轴构型，0-单自由度直线滑轨，1-两自由度L型变位机，2-三自由度，3-四自由度，4-单自由度变位机
+    @param [in]必选参数  axisDHd1 外部轴DH参数d1 mm
+    @param [in]必选参数  axisDHd2 外部轴DH参数d2 mm
+    @param [in]必选参数  axisDHd3 外部轴DH参数d3 mm
+    @param [in]必选参数  axisDHd4 外部轴DH参数d4 mm
+    @param [in]必选参数  axisDHa1 外部轴DH参数a1 mm
+    @param [in]必选参数  axisDHa2 外部轴DH参数a2 mm
+    @param [in]必选参数  axisDHa3 外部轴DH参数a3 mm
+    @param [in]必选参数  axisDHa4 外部轴DH参数a4 mm
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAxisDHParaConfig(self, axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1, axisDHa2, axisDHa3,
+                            axisDHa4):
+        return self.command("SetAxisDHParaConfig", axisConfig, axisDHd1, axisDHd2, axisDHd3, axisDHd4, axisDHa1,
+                            axisDHa2, axisDHa3, axisDHa4)
+
+    """   
+    @brief  UDP扩展轴参数配置
+    @param [in]必选参数 axisId 轴号[1-4]
+    @param [in]必选参数 axisType 扩展轴类型 0-平移；1-旋转
+    @param [in]必选参数 axisDirection 扩展轴方向 0-正向；1-反向
+    @param [in]必选参数 axisMax 扩展轴最大位置 mm
+    @param [in]必选参数 axisMin 扩展轴最小位置 mm
+    @param [in]必选参数 axisVel 速度mm/s
+    @param [in]必选参数 axisAcc 加速度mm/s2
+    @param [in]必选参数 axisLead 导程mm
+    @param [in]必选参数 encResolution 编码器分辨率
+    @param [in]必选参数 axisOffect 焊缝起始点扩展轴偏移量
+    @param [in]必选参数 axisCompany 驱动器厂家 1-禾川；2-汇川；3-松下
+    @param [in]必选参数 axisModel 驱动器型号 1-禾川-SV-XD3EA040L-E，2-禾川-SV-X2EA150A-A，1-汇川-SV620PT5R4I，1-松下-MADLN15SG，2-松下-MSDLN25SG，3-松下-MCDLN35SG
+    @param [in]必选参数 axisEncType 编码器类型  0-增量；1-绝对值
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisParamConfig(self, axisId, axisType, axisDirection, axisMax, axisMin, axisVel, axisAcc, axisLead,
+                           encResolution, axisOffect, axisCompany, axisModel, axisEncType):
+        return self.command("ExtAxisParamConfig", axisId, axisType, axisDirection, axisMax, axisMin, axisVel,
+                            axisAcc, axisLead, encResolution, axisOffect, axisCompany, axisModel, axisEncType)
+
+    """   
+    @brief  获取扩展轴驱动器配置信息
+    @param [in]必选参数 axisId 轴号[1-4]
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） axisCompany 驱动器厂家 1-禾川；2-汇川；3-松下
+    @return 返回值（调用成功返回） axisModel 驱动器型号 1-禾川-SV-XD3EA040L-E，2-禾川-SV-X2EA150A-A，1-汇川-SV620PT5R4I，1-松下-MADLN15SG，2-松下-MSDLN25SG，3-松下-MCDLN35SG
+    @return 返回值（调用成功返回） axisEncType 编码器类型  0-增量；1-绝对值
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetExAxisDriverConfig(self, axisId):
+        error = self.query("GetExAxisDriverConfig", axisId)
+
+        if error[0] == 0:
+            return error[0], [error[1], error[2], error[3]]
+        else:
+            return error
+
+    """   
+    @brief  设置扩展轴坐标系参考点-四点法
+    @param [in]必选参数 pointNum 点编号[1-4]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisSetRefPoint(self, pointNum):
+        return self.command("ExtAxisSetRefPoint", pointNum)
+
+    """   
+    @brief  计算扩展轴坐标系-四点法
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） coord 坐标系值[x,y,z,rx,ry,rz]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisComputeECoordSys(self):
+        return self.command("ExtAxisComputeECoordSys")
+
+    """   
+    @brief  设置标定参考点在变位机末端坐标系下位姿
+    @param [in]必选参数 pos 位姿值[x,y,z,rx,ry,rz]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetRefPointInExAxisEnd(self, pos):
+        pos = list(map(float, pos))
+        error = self.command("SetRefPointInExAxisEnd", pos[0], pos[1], pos[2], pos[3], pos[4], pos[5])
+
+        return error
+
+    """   
+    @brief  变位机坐标系参考点设置
+    @param [in]必选参数 pointNum 点编号[1-4]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def PositionorSetRefPoint(self, pointNum):
+        return self.command("PositionorSetRefPoint", pointNum)
+
+    """   
+    @brief  变位机坐标系计算-四点法
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） coord 坐标系值[x,y,z,rx,ry,rz]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def PositionorComputeECoordSys(self):
+        _error = self.query("PositionorComputeECoordSys")
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        else:
+            return error,None
+
+    """   
+    @brief  应用扩展轴坐标系
+    @param [in]必选参数 axisCoordNum 坐标系编号
+    @param [in]必选参数 toolNum 工具号
+    @param [in]必选参数 coord 坐标系值[x,y,z,rx,ry,rz]
+    @param [in]必选参数 calibFlag 标定标志 0-否，1-是    
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisActiveECoordSys(self, axisCoordNum, toolNum, coord, calibFlag):
+        coord = list(map(float, coord))
+        error = self.command("ExtAxisActiveECoordSys", axisCoordNum, toolNum, coord[0], coord[1], coord[2], coord[3],
+                             coord[4], coord[5], calibFlag)
+
+        return error
+
+    """   
+    @brief  UDP扩展轴使能
+    @param [in]必选参数 axisID 轴号[1-4]
+    @param [in]必选参数 status 0-去使能；1-使能
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisServoOn(self, axisID, status):
+        return self.command("ExtAxisServoOn", axisID, status)
+
+    """   
+    @brief  UDP扩展轴回零
+    @param [in]必选参数 axisID 轴号[1-4]
+    @param [in]必选参数 mode 回零方式 0当前位置回零，1负限位回零，2-正限位回零
+    @param [in]必选参数 searchVel 寻零速度(mm/s)
+    @param [in]必选参数 latchVel 寻零箍位速度(mm/s)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisSetHoming(self, axisID, mode, searchVel, latchVel):
+        return self.command("ExtAxisSetHoming", axisID, mode, searchVel, latchVel)
+
+    """   
+    @brief  UDP扩展轴点动开始
+    @param [in]必选参数 axisID 轴号[1-4]
+    @param [in]必选参数 direction 转动方向 0-反向；1-正向
+    @param [in]必选参数 vel 速度(mm/s)
+    @param [in]必选参数 acc (加速度 mm/s2)
+    @param [in]必选参数 maxDistance 最大点动距离
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisStartJog(self, axisID, direction, vel, acc, maxDistance):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        error = self.command("ExtAxisStartJog", 6, axisID, direction, vel, acc, maxDistance)
+
+        return error
+
+    """   
+    @brief  UDP扩展轴点动停止
+    @param [in]必选参数 axisID 轴号[1-4]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisStopJog(self, axisID):
+        axisID = int(axisID)
+        error =self.send_message("/f/bIII19III240III14IIIStopExtAxisJogIII/b/f")
+        # error = self.robot.ExtAxisStartJog(7, axisID, 0, 0.0, 0.0, 0.0)
+        return error
+
+    """   
+    @brief  设置扩展DO
+    @param [in]必选参数 DONum DO编号
+    @param [in]必选参数 bOpen 开关 True-开,False-关
+    @param [in]必选参数 smooth 是否平滑 True -是, False -否
+    @param [in]必选参数 block 是否阻塞 True -是, False -否
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAuxDO(self, DONum, bOpen, smooth, block):
+        bOpen = bool(bOpen)
+        smooth = bool(smooth)
+        block = bool(block)
+        open_flag = 1 if bOpen else 0
+        smooth_flag = 1 if smooth else 0
+        no_block_flag = 1 if block else 0
+        print("open_flag",open_flag)
+        print("smooth_flag", smooth_flag)
+        print("no_block_flag", no_block_flag)
+        error = self.command("SetAuxDO", DONum, open_flag, smooth_flag, no_block_flag)
+
+        return error
+
+    """   
+    @brief  设置扩展AO
+    @param [in]必选参数 AONum AO编号 
+    @param [in]必选参数 value 模拟量值[0-4095]
+    @param [in]必选参数 block 是否阻塞 True-是,False-否
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAuxAO(self, AONum, value, block):
+        value = float(value)
+        block = bool(block)
+        no_block_flag = 0 if block else 1
+        value =value
+        error = self.command("SetAuxAO", AONum, value, no_block_flag)
+
+        return error
+
+    """   
+    @brief  设置扩展DI输入滤波时间
+    @param [in]必选参数 filterTime 滤波时间(ms)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAuxDIFilterTime(self, filterTime):
+        return self.command("SetAuxDIFilterTime", filterTime)
+
+    """   
+    @brief  设置扩展AI输入滤波时间
+    @param [in]必选参数 AINum AI编号
+    @param [in]必选参数 filterTime 滤波时间(ms)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAuxAIFilterTime(self, AINum,filterTime):
+        return self.command("SetAuxAIFilterTime", AINum, filterTime)
+
+    """   
+    @brief  等待扩展DI输入
+    @param [in]必选参数 DINum DI编号
+    @param [in]必选参数 bOpen 开关 True-开,False-关
+    @param [in]必选参数 time 最大等待时间(ms)
+    @param [in]必选参数 errorAlarm 是否继续运动 True-是,False-否
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WaitAuxDI(self, DINum, bOpen, time, errorAlarm):
+        bOpen = bool(bOpen)
+        open_flag = 0 if bOpen else 1
+        errorAlarm = bool(errorAlarm)
+        errorAlarm_flag = 0 if errorAlarm else 1
+        error = self.command("WaitAuxDI", DINum, open_flag, time, errorAlarm_flag)
+
+        return error
+
+    """   
+    @brief  等待扩展AI输入
+    @param [in]必选参数 AINum AI编号
+    @param [in]必选参数 sign 0-大于；1-小于
+    @param [in]必选参数 value AI值
+    @param [in]必选参数 time 最大等待时间(ms)
+    @param [in]必选参数 errorAlarm 是否继续运动 True-是,False-否
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WaitAuxAI(self, AINum, sign, value, time, errorAlarm):
+        errorAlarm = bool(errorAlarm)
+        errorAlarm_flag = 0 if errorAlarm else 1
+        error = self.command("WaitAuxAI", AINum, sign, value, time, errorAlarm_flag)
+
+        return error
+
+    """   
+    @brief  获取扩展DI值
+    @param [in]必选参数 DINum DI编号
+    @param [in]必选参数 isNoBlock 是否阻塞 True-阻塞 false-非阻塞
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） isOpen 0-关；1-开
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetAuxDI(self, DINum, isNoBlock):
+        isNoBlock = bool(isNoBlock)
+        isNoBlock_flag = 0 if isNoBlock else 1
+        error = self.query("GetAuxDI", DINum, isNoBlock_flag)
+
+        if error[0] == 0:
+            return error[0], error[1]
+        else:
+            return error
+
+    """   
+    @brief  获取扩展AI值
+    @param [in]必选参数 AINum AI编号
+    @param [in]必选参数 isNoBlock 是否阻塞 True-阻塞 False-非阻塞
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） value 输入值
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetAuxAI(self, AINum, isNoBlock):
+        isNoBlock = bool(isNoBlock)
+        isNoBlock_flag = 0 if isNoBlock else 1
+        error = self.query("GetAuxAI", AINum, isNoBlock_flag)
+
+        if error[0] == 0:
+            return error[0], error[1]
+        else:
+            return error
+
+    """   
+    @brief  UDP扩展轴运动
+    @param [in]必选参数 pos 目标位置 轴 1 位置 ~ 轴 4 位置[exaxis[0],exaxis[1],exaxis[2],exaxis[3]]
+    @param [in]必选参数 ovl 速度百分比
+    @param [in]必选参数 blend 平滑参数(mm或ms)，-1,等待运动完成
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisMove(self, pos, ovl, blend=-1):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        pos = list(map(float, pos))
+        error = self.command("ExtAxisMoveJ", 0, pos[0], pos[1], pos[2], pos[3], ovl, blend)
+
+        return error
+
+    """   
+    @brief  UDP扩展轴与机器人关节运动同步运动(自动正/逆运动学计算)
+    @param  [in] 必选参数 joint_pos: 目标关节位置，单位 [°]
+    @param  [in] 必选参数 desc_pos: 目标笛卡尔位姿，单位 [mm][°]
+    @param  [in] 必选参数 tool: 工具号，[0~14]
+    @param  [in] 必选参数 user: 工件号，[0~14]
+    @param  [in] 必选参数 exaxis_pos: 外部轴 1 位置 ~ 外部轴 4 位置 
+    @param  [in] 默认参数 vel：速度百分比，[0~100] 默认20.0
+    @param  [in] 默认参数 acc：加速度百分比，[0~100] 暂不开放,默认0.0 
+    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0    
+    @param  [in] 默认参数 blendT:[-1.0]-运动到位 (阻塞)，[0~500.0]-平滑时间 (非阻塞)，单位 [ms] 默认-1.0
+    @param  [in] 默认参数 offset_flag:[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
+    @param  [in] 默认参数 offset_pos: 位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
+    @return 错误码 成功-0  失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisSyncMoveJ(self, joint_pos, tool, user, exaxis_pos, desc_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=20.0, acc=0.0, ovl=100.0,
+                         blendT=-1.0, offset_flag=0, offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        joint_pos = list(map(float, joint_pos))
+        desc_pos = list(map(float, desc_pos))
+        ovl = float(ovl)
+        exaxis_pos = list(map(float, exaxis_pos))
+        blendT = float(blendT)
+        if (desc_pos[0] == 0.0) and (desc_pos[1] == 0.0) and (desc_pos[2] == 0.0) and (desc_pos[3] == 0.0) and (
+                desc_pos[4] == 0.0) and (desc_pos[5] == 0.0):  # 若未输入参数则调用正运动学求解
+            ret = self.solve_forward_kin(joint_pos)  # 正运动学求解
+            if ret[0] == 0:
+                desc_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
+            else:
+                error = ret[0]
+                return error
+        error = self.command("ExtAxisMoveJ", 1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendT)
+        if error != 0:
+            return error
+        error = self.command("MoveJ", joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, offset_flag,
+                             offset_pos)
+
+        return error
+
+    """   
+    @brief  UDP扩展轴与机器人直线运动同步运动(自动正/逆运动学计算)
+    @param  [in] 必选参数 joint_pos: 目标关节位置，单位 [°] 
+    @param  [in] 必选参数 desc_pos: 目标笛卡尔位姿，单位 [mm][°]
+    @param  [in] 必选参数 tool: 工具号，[0~14]
+    @param  [in] 必选参数 user: 工件号，[0~14]
+    @param  [in] 必选参数 exaxis_pos: 外部轴 1 位置 ~ 外部轴 4 位置 
+    @param  [in] 默认参数 vel：速度百分比，[0~100] 默认20.0
+    @param  [in] 默认参数 acc：加速度百分比，[0~100] 暂不开放 默认0.0
+    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0
+    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0    
+    @param  [in] 默认参数 search:[0]-不焊丝寻位，[1]-焊丝寻位
+    @param  [in] 默认参数 offset_flag:[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
+    @param  [in] 默认参数 offset_pos: 位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
+    @param  [in] 默认参数 config 逆解关节空间配置，[-1]-参考当前关节位置解算，[0~7]-依据特定关节空间配置求解，默认-1
+    @return 错误码 成功-0  失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisSyncMoveL(self, desc_pos, tool, user, exaxis_pos, joint_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), vel=20.0, acc=0.0, ovl=100.0,
+                         blendR=-1.0, search=0, offset_flag=0, offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),config=-1):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos = list(map(float, desc_pos))
+        tool = int(tool)
+        user = int(user)
+        joint_pos = list(map(float, joint_pos))
+        vel = float(vel)
+        acc = float(acc)
+        ovl = float(ovl)
+        blendR = float(blendR)
+        exaxis_pos = list(map(float, exaxis_pos))
+        search = int(search)
+        offset_flag = int(offset_flag)
+        offset_pos = list(map(float, offset_pos))
+        config = int(config)
+
+        if ((joint_pos[0] == 0.0) and (joint_pos[1] == 0.0) and (joint_pos[2] == 0.0) and (joint_pos[3] == 0.0)
+                and (joint_pos[4] == 0.0) and (joint_pos[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
+            ret = self.solve_inverse_kin(0, desc_pos, config)  # 逆运动学求解
+            if ret[0] == 0:
+                joint_pos = [ret[1], ret[2], ret[3], ret[4], ret[5], ret[6]]
+            else:
+                error = ret[0]
+                return error
+        error = self.command("ExtAxisMoveJ", 1, exaxis_pos[0], exaxis_pos[1], exaxis_pos[2], exaxis_pos[3], ovl, blendR)
+        if error != 0:
+            return error
+        error = self.MoveL(desc_pos=desc_pos,tool= tool,user= user,vel= vel, acc=acc,ovl= ovl,blendR= blendR,blendMode=0,exaxis_pos= exaxis_pos,search= search,
+                           offset_flag=offset_flag,offset_pos= offset_pos)
+
+        return error
+
+    """   
+    @brief  UDP扩展轴与机器人圆弧运动同步运动(自动正/逆运动学计算)
+    @param  [in] 必选参数 joint_pos_p: 路径点关节位置，单位 [°] 
+    @param  [in] 必选参数 desc_pos_p: 路径点笛卡尔位姿，单位 [mm][°]
+    @param  [in] 必选参数 tool_p: 路径点工具号，[0~14]
+    @param  [in] 必选参数 user_p: 路径点工件号，[0~14]
+    @param  [in] 必选参数 exaxis_pos_p: 路径点外部轴 1 位置 ~ 外部轴 4 位置 默认[0.0,0.0,0.0,0.0]
+    @param  [in] 必选参数 joint_pos_t: 目标点关节位置，单位 [°] 
+    @param  [in] 必选参数 desc_pos_t: 目标点笛卡尔位姿，单位 [mm][°]
+    @param  [in] 必选参数 tool_t: 工具号，[0~14]
+    @param  [in] 必选参数 user_t: 工件号，[0~14]
+    @param  [in] 必选参数 exaxis_pos_t: 目标点外部轴 1 位置 ~ 外部轴 4 位置 默认[0.0,0.0,0.0,0.0]    
+    @param  [in] 默认参数 vel_p: 路径点速度百分比，[0~100] 默认20.0
+    @param  [in] 默认参数 acc_p: 路径点加速度百分比，[0~100] 暂不开放,默认0.0    
+    @param  [in] 默认参数 offset_flag_p: 路径点是否偏移[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
+    @param  [in] 默认参数 offset_pos_p: 路径点位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
+    @param  [in] 默认参数 vel_t: 目标点速度百分比，[0~100] 默认20.0
+    @param  [in] 默认参数 acc_t: 目标点加速度百分比，[0~100] 暂不开放 默认0.0
+    @param  [in] 默认参数 offset_flag_t: 目标点是否偏移[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
+    @param  [in] 默认参数 offset_pos_t: 目标点位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
+    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0
+    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0
+    @param  [in] 默认参数 config 逆解关节空间配置，[-1]-参考当前关节位置解算，[0~7]-依据特定关节空间配置求解，默认-1
+    @return 错误码 成功-0  失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisSyncMoveC(self, desc_pos_p, tool_p, user_p, exaxis_pos_p, desc_pos_t, tool_t,
+                         user_t, exaxis_pos_t,
+                         joint_pos_p=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0), joint_pos_t=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+                         vel_p=20.0, acc_p=100.0, offset_flag_p=0,
+                         offset_pos_p=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+                         vel_t=20.0, acc_t=100.0, offset_flag_t=0,
+                         offset_pos_t=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+                         ovl=100.0, blendR=-1.0,config=-1):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        desc_pos_p = list(map(float, desc_pos_p))
+        tool_p = float(int(tool_p))
+        user_p = float(int(user_p))
+        joint_pos_p = list(map(float, joint_pos_p))
+        vel_p = float(vel_p)
+        acc_p = float(acc_p)
+        exaxis_pos_p = list(map(float, exaxis_pos_p))
+        offset_flag_p = int(offset_flag_p)
+        offset_pos_p = list(map(float, offset_pos_p))
+
+        desc_pos_t = list(map(float, desc_pos_t))
+        tool_t = float(int(tool_t))
+        user_t = float(int(user_t))
+        joint_pos_t = list(map(float, joint_pos_t))
+        vel_t = float(vel_t)
+        acc_t = float(acc_t)
+        exaxis_pos_t = list(map(float, exaxis_pos_t))
+        offset_flag_t = int(offset_flag_t)
+        offset_pos_t = list(map(float, offset_pos_t))
+
+        ovl = float(ovl)
+        blendR = float(blendR)
+        config = int(config)
+
+        if ((joint_pos_p[0] == 0.0) and (joint_pos_p[1] == 0.0) and (joint_pos_p[2] == 0.0) and (joint_pos_p[3] == 0.0)
+                and (joint_pos_p[4] == 0.0) and (joint_pos_p[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
+            retp = self.solve_inverse_kin(0, desc_pos_p, config)  # 逆运动学求解
+            if retp[0] == 0:
+                joint_pos_p = [retp[1], retp[2], retp[3], retp[4], retp[5], retp[6]]
+            else:
+                error = retp[0]
+                return error
+
+        if ((joint_pos_t[0] == 0.0) and (joint_pos_t[1] == 0.0) and (joint_pos_t[2] == 0.0) and (joint_pos_t[3] == 0.0)
+                and (joint_pos_t[4] == 0.0) and (joint_pos_t[5] == 0.0)):  # 若未输入参数则调用逆运动学求解
+            rett = self.solve_inverse_kin(0, desc_pos_t, config)  # 逆运动学求解
+            if rett[0] == 0:
+                joint_pos_t = [rett[1], rett[2], rett[3], rett[4], rett[5], rett[6]]
+            else:
+                error = rett[0]
+                return error
+        error = self.command("ExtAxisMoveJ", 1, exaxis_pos_t[0], exaxis_pos_t[1], exaxis_pos_t[2], exaxis_pos_t[3], ovl,
+                             blendR)
+        if error != 0:
+            return error
+        error = self.command("MoveC:legacy", joint_pos_p, desc_pos_p, [tool_p, user_p, vel_p, acc_p], exaxis_pos_p,
+                             offset_flag_p, offset_pos_p, joint_pos_t, desc_pos_t, [tool_t, user_t, vel_t, acc_t],
+                             exaxis_pos_t, offset_flag_t, offset_pos_t, ovl, blendR)
+
+        return error
+
+    """   
+    @brief  设置485扩展轴运动加减速度
+    @param  [in]必选参数  acc 485扩展轴运动加速度
+    @param  [in]必选参数 dec 485扩展轴运动减速度
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetAcc(self,acc,dec):
+        return self.command("AuxServoSetAcc", acc, dec)
+
+    """   
+    @brief  设置485扩展轴急停加减速度
+    @param  [in]必选参数  acc 485扩展轴急停加速度
+    @param  [in]必选参数 dec 485扩展轴急停减速度
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoSetEmergencyStopAcc(self,acc,dec):
+        return self.command("AuxServoSetEmergencyStopAcc", acc, dec)
+
+    """   
+    @brief  获取485扩展轴急停加减速度
+    @return 错误码 成功- 0, 失败-错误码        
+    @return 返回值（调用成功返回） acc 485扩展轴急停加速度   
+    @return 返回值（调用成功返回） dec 485扩展轴急停减速度
+    """
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoGetEmergencyStopAcc(self):
+        error = self.query("AuxServoGetEmergencyStopAcc")
+
+        if error[0]==0:
+            return error[0],error[1],error[2]
+        else:
+            return error
+
+    """   
+    @brief  获取485扩展轴运动加减速度
+    @return 错误码 成功- 0, 失败-错误码        
+    @return 返回值（调用成功返回） acc 485扩展轴运动加速度 
+    @return 返回值（调用成功返回） dec 485扩展轴运动减速度
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def AuxServoGetAcc(self):
+        error = self.query("AuxServoGetAcc")
+
+        if error[0] == 0:
+            return error[0], error[1], error[2]
+        else:
+            return error
+
+    """2025.05.08"""
+    """
+       @brief 获取扩展轴坐标系
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） coord 扩展轴坐标系
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ExtAxisGetCoord(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        _error = self.query("ExtAxisGetCoord")
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        return error, None
+
+    """2025.08.07"""
+    """
+    @brief 设置扩展轴与机器人同步运动策略
+    @param  [in] strategy 策略；0-以机器人为主；1-扩展轴与机器人同步
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetExAxisRobotPlan(self, strategy):
+        return self.command("SetExAxisRobotPlan", strategy)
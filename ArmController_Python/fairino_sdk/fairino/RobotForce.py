@@ -0,0 +1,647 @@
+"""
+@brief  力控接口
+        力传感器配置与标定、恒力控制、柔顺控制、负载辨识、力传感器拖动与阻抗控制。
+        由 RPC 在首次访问其中的接口时导入并将方法并入 RPC 类，调用方式与其余接口相同，见 Robot.SDK_FAMILIES。
+"""
+
+from .Robot import RPC, xmlrpc_timeout
+
+log_call = RPC.log_call
+
+
+class ForceMixin:
+    """   
+    @brief  获取力传感器配置
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）[number,company,device,softversion,bus]
+            number 传感器编号
+            company  力传感器厂商，17-坤维科技，19-航天十一院，20-ATI 传感器，21-中科米点，22-伟航敏芯
+            device  设备号，坤维 (0-KWR75B)，航天十一院 (0-MCS6A-200-4)，ATI(0-AXIA80-M8)，中科米点 (0-MST2010)，伟航敏芯 (0-WHC6L-YB10A)
+            softvesion  软件版本号，暂不使用，默认为0    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_GetConfig(self):
+        _error = self.query("FT_GetConfig")
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1] + 1, _error[2] + 1, _error[3], _error[4]]
+        else:
+            return error,None
+
+    """   
+    @brief  力传感器配置
+    @param  [in] 必选参数 company：传感器厂商，17-坤维科技，19-航天十一院，20-ATI 传感器，21-中科米点，22-伟航敏芯，23-NBIT，24-鑫精诚(XJC)，26-NSR；
+    @param  [in] 必选参数 device：设备号，坤维 (0-KWR75B)，航天十一院 (0-MCS6A-200-4)，ATI(0-AXIA80-M8)，中科米点 (0-MST2010)，伟航敏芯 (0-WHC6L-YB10A)，NBIT(0-XLH93003ACS)，鑫精诚XJC(0-XJC-6F-D82)，NSR(0-NSR-FTSensorA)；
+    @param  [in] 默认参数 softversion：软件版本号，暂不使用，默认为 0
+    @param  [in] 默认参数 bus：设备挂载末端总线位置，暂不使用，默认为 0；
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_SetConfig(self, company, device, softversion=0, bus=0):
+        return self.command("FT_SetConfig", company, device, softversion, bus)
+
+    """   
+    @brief  力传感器激活
+    @param  [in] 必选参数 state：0-复位，1-激活
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_Activate(self, state):
+        return self.command("FT_Activate", state)
+
+    """   
+    @brief  力传感器校零
+    @param  [in] 必选参数 state：0-去除零点，1-零点矫正
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_SetZero(self, state):
+        return self.command("FT_SetZero", state)
+
+    """   
+    @brief  设置力传感器参考坐标系
+    @param  [in] 必选参数 ref：0-工具坐标系，1-基坐标系
+    @param  [in] 默认参数 coord：[x,y,z,rx,ry,rz] 自定义坐标系值,默认[0,0,0,0,0,0]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_SetRCS(self, ref,coord=(0,0,0,0,0,0)):
+        return self.command("FT_SetRCS", ref, coord)
+
+    """   
+    @brief  负载重量辨识计算
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）weight-负载重量，单位 kg
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_PdIdenCompute(self):
+        _error = self.query("FT_PdIdenCompute")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1]
+        else:
+            return error,None
+
+    """   
+    @brief  负载重量辨识记录
+    @param  [in] 必选参数 tool_id：传感器坐标系编号，范围 [1~14]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_PdIdenRecord(self, tool_id):
+        return self.command("FT_PdIdenRecord", tool_id)
+
+    """   
+    @brief  负载质心辨识计算
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）cog=[cogx,cogy,cogz] ，负载质心，单位 mm
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_PdCogIdenCompute(self):
+        _error = self.query("FT_PdCogIdenCompute")
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3]]
+        else:
+            return error,None
+
+    """   
+    @brief  负载质心辨识记录
+    @param  [in] 必选参数 tool_id：传感器坐标系编号，范围 [0~14]
+    @param  [in] 必选参数 index 点编号，范围[1~3]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_PdCogIdenRecord(self, tool_id, index):
+        return self.command("FT_PdCogIdenRecord", tool_id, index)
+
+    """   
+    @brief  获取参考坐标系下力/扭矩数据
+    @param  [in] 必选参数 NULL
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）data=[fx,fy,fz,tx,ty,tz]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_GetForceTorqueRCS(self):
+        # _error = self.robot.FT_GetForceTorqueRCS(0)
+        # error = _error[0]
+        # if error == 0:
+        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        # else:
+        #     return error
+        return 0,self.read_state("ft_sensor_data")
+
+    """   
+    @brief  获取力传感器原始力/扭矩数据
+    @param  [in] 必选参数 NULL
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）data=[fx,fy,fz,tx,ty,tz]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_GetForceTorqueOrigin(self):
+        # _error = self.robot.FT_GetForceTorqueOrigin(0)
+        # error = _error[0]
+        # return error
+        # if error == 0:
+        #     return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        # else:
+        #     return error
+        return 0,self.read_state("ft_sensor_raw_data")
+
+    """   
+    @brief  碰撞守护
+    @param  [in] 必选参数 flag：0-关闭碰撞守护，1-开启碰撞守护；
+    @param  [in] 必选参数 sensor_num：力传感器编号
+    @param  [in] 必选参数 select：六个自由度是否检测碰撞 [fx,fy,fz,mx,my,mz]，0-不生效，1-生效
+    @param  [in] 必选参数 force_torque：碰撞检测力/力矩，单位 N 或 Nm
+    @param  [in] 必选参数 max_threshold：最大阈值
+    @param  [in] 必选参数 min_threshold：最小阈值
+    力/力矩检测范围:(force_torque-min_threshold,force_torque+max_threshold)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_Guard(self, flag, sensor_num, select, force_torque, max_threshold, min_threshold):
+        return self.command("FT_Guard", flag, sensor_num, select, force_torque, max_threshold, min_threshold)
+
+    """   
+    @brief  恒力控制
+    @param  [in] 必选参数 flag：0-关闭碰撞守护，1-开启碰撞守护；
+    @param  [in] 必选参数 sensor_id：力传感器编号
+    @param  [in] 必选参数 select：[fx,fy,fz,mx,my,mz]六个自由度是否检测碰撞 ，0-不生效，1-生效
+    @param  [in] 必选参数 ft：[fx,fy,fz,mx,my,mz]碰撞检测力/力矩，单位 N 或 Nm
+    @param  [in] 必选参数 ft_pid：[f_p,f_i,f_d,m_p,m_i,m_d], 力PID参数，力矩PID参数
+    @param  [in] 必选参数 adj_sign：自适应启停状态，0-关闭，1-开启
+    @param  [in] 必选参数 ILC_sign: ILC 控制启停状态，0-停止，1-训练，2-实操
+    @param  [in] 必选参数 max_dis：最大调整距离，单位mm
+    @param  [in] 必选参数 max_ang：最大调整角度，单位deg
+    @param  [in] 必选参数 M 质量参数
+    @param  [in] 必选参数 B 阻尼参数
+    @param  [in] 默认参数 polishRadio：打磨盘半径，单位mm
+    @param  [in] 默认参数 filter_Sign 滤波开启标志 0-关；1-开，默认 0-关闭
+    @param  [in] 默认参数 posAdapt_sign 姿态顺应开启标志 0-关；1-开，默认 0-关闭
+    @param  [in] 默认参数 isNoBlock 阻塞标志，0-阻塞；1-非阻塞 默认0-阻塞
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_Control(self, flag, sensor_id, select, ft, ft_pid, adj_sign, ILC_sign, max_dis, max_ang, M=None, B=None, polishRadio=0, filter_Sign=0, posAdapt_sign=0, isNoBlock=0):
+        if M is None:
+            M = [0, 0]
+        if B is None:
+            B = [0, 0]
+        error = self.command("FT_Control", flag, sensor_id, select, ft, ft_pid, adj_sign, ILC_sign, max_dis, max_ang,
+                             polishRadio, filter_Sign, posAdapt_sign, [M[0], M[1], B[0], B[0]], isNoBlock)
+
+        return error
+
+    """   
+    @brief  螺旋线探索
+    @param  [in] 必选参数 rcs 参考坐标系，0-工具坐标系，1-基坐标系
+    @param  [in] 必选参数 ft：力或力矩阈值 (0~100)，单位 N 或 Nm
+    @param  [in] 默认参数 dr：每圈半径进给量，单位 mm 默认0.7
+    @param  [in] 默认参数 max_t_ms：最大探索时间，单位 ms 默认 60000
+    @param  [in] 默认参数 max_vel：线速度最大值，单位 mm/s 默认 5
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_SpiralSearch(self, rcs, ft, dr=0.7, max_t_ms=60000, max_vel=5):
+        return self.command("FT_SpiralSearch", rcs, ft, dr, max_t_ms, max_vel)
+
+    """   
+    @brief  旋转插入
+    @param  [in] 必选参数 rcs 参考坐标系，0-工具坐标系，1-基坐标系
+    @param  [in] 必选参数 ft：力或力矩阈值 (0~100)，单位 N 或 Nm
+    @param  [in] 必选参数 orn 力/扭矩方向，1-沿z轴方向，2-绕z轴方向
+    @param  [in] 默认参数 angVelRot：旋转角速度，单位 °/s  默认 3
+    @param  [in] 默认参数 angleMax：最大旋转角度，单位 ° 默认 45
+    @param  [in] 默认参数 angAccmax：最大旋转加速度，单位 °/s^2，暂不使用 默认0
+    @param  [in] 默认参数 rotorn：旋转方向，1-顺时针，2-逆时针 默认1
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_RotInsertion(self, rcs, ft, orn, angVelRot=3, angleMax=45, angAccmax=0, rotorn=1):
+        error = self.command("FT_RotInsertion", rcs, angVelRot, ft, angleMax, orn, angAccmax, rotorn)
+
+        return error
+
+    """   
+    @brief  直线插入
+    @param  [in] 必选参数 rcs 参考坐标系，0-工具坐标系，1-基坐标系
+    @param  [in] 必选参数 ft：力或力矩阈值 (0~100)，单位 N 或 Nm
+    @param  [in] 必选参数 disMax：最大插入距离，单位 mm
+    @param  [in] 必选参数 linorn：插入方向:0-负方向，1-正方向
+    @param  [in] 默认参数 lin_v：直线速度，单位 mm/s 默认1
+    @param  [in] 默认参数 lin_a：直线加速度，单位 mm/s^2，暂不使用 默认1
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_LinInsertion(self, rcs, ft, disMax, linorn, lin_v=1.0, lin_a=1.0):
+        error = self.command("FT_LinInsertion", rcs, ft, lin_v, lin_a, disMax, linorn)
+
+        return error
+
+    """   
+    @brief  计算中间平面位置开始
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_CalCenterStart(self):
+        return self.command("FT_CalCenterStart")
+
+    """   
+    @brief  计算中间平面位置结束
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）pos=[x,y,z,rx,ry,rz]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_CalCenterEnd(self):
+        _error = self.query("FT_CalCenterEnd")
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        else:
+            return error,None
+
+    """   
+    @brief  表面定位
+    @param  [in] 必选参数 rcs：参考坐标系，0-工具坐标系，1-基坐标系
+    @param  [in] 必选参数 dir：移动方向，1-正方向，2-负方向
+    @param  [in] 必选参数 axis：移动轴，1-x，2-y，3-z
+    @param  [in] 必选参数 disMax：最大探索距离，单位 mm
+    @param  [in] 必选参数 ft：动作终止力阈值，单位 N
+    @param  [in] 默认参数 lin_v：探索直线速度，单位 mm/s 默认3
+    @param  [in] 默认参数 lin_a：探索直线加速度，单位 mm/s^2 默认0
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_FindSurface(self, rcs, dir, axis, disMax, ft, lin_v=3.0, lin_a=0.0):
+        error = self.command("FT_FindSurface", rcs, dir, axis, lin_v, lin_a, disMax, ft)
+
+        return error
+
+    """   
+    @brief  柔顺控制关闭
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_ComplianceStop(self):
+        return self.command("FT_ComplianceStop")
+
+    """   
+    @brief  柔顺控制开启
+    @param  [in] 必选参数 p: 位置调节系数或柔顺系数
+    @param  [in] 必选参数 force：柔顺开启力阈值，单位 N
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FT_ComplianceStart(self, p, force):
+        return self.command("FT_ComplianceStart", p, force)
+
+    """   
+    @brief  负载辨识滤波初始化
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LoadIdentifyDynFilterInit(self):
+        return self.command("LoadIdentifyDynFilterInit")
+
+    """   
+    @brief  负载辨识变量初始化
+    @param  [in] NULL
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LoadIdentifyDynVarInit(self):
+        return self.command("LoadIdentifyDynVarInit")
+
+    """   
+    @brief  负载辨识主程序
+    @param  [in] 必选参数 joint_torque 关节扭矩 j1-j6
+    @param  [in] 必选参数 joint_pos 关节位置 j1-j6
+    @param  [in] 必选参数 t 采样周期
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LoadIdentifyMain(self, joint_torque, joint_pos, t):
+        return self.command("LoadIdentifyMain", joint_torque, joint_pos, t)
+
+    """   
+    @brief  获取负载辨识结果
+    @param  [in] 必选参数 gain 重力项系数double[6]，离心项系数double[6] 
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）weight 负载重量
+    @return 返回值（调用成功返回）cog 负载质心 [x,y,z]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LoadIdentifyGetResult(self, gain):
+        _error = self.query("LoadIdentifyGetResult", gain)
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], [_error[2], _error[3], _error[4]]
+        else:
+            return error,None,None
+
+    """   
+    @brief  力传感器辅助拖动
+    @param  [in]必选参数 status 控制状态，0-关闭；1-开启
+    @param  [in]必选参数 asaptiveFlag 自适应开启标志，0-关闭；1-开启
+    @param  [in]必选参数 interfereDragFlag 干涉区拖动标志，0-关闭；1-开启
+    @param  [in]必选参数 ingularityConstraintsFlag 奇异点策略，0-规避；1-穿越
+    @param  [in]必选参数 forceCollisionFlag 辅助拖动时机器人碰撞检测标志；0-关闭；1-开启
+    @param  [in]必选参数 M=[m1,m2,m3,m4,m5,m6] 惯性系数 
+    @param  [in]必选参数 B=[b1,b2,b3,b4,b5,b6] 阻尼系数
+    @param  [in]必选参数 K=[k1,k2,k3,k4,k5,k6] 刚度系数
+    @param  [in]必选参数 F=[f1,f2,f3,f4,f5,f6] 拖动六维力阈值
+    @param  [in]必选参数 Fmax 最大拖动力限制
+    @param  [in]必选参数 Vmax 最大关节速度限制
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def EndForceDragControl(self, status, asaptiveFlag, interfereDragFlag, ingularityConstraintsFlag, forceCollisionFlag, M, B, K, F, Fmax, Vmax):
+        return self.command("EndForceDragControl", status, asaptiveFlag, interfereDragFlag,
+                            ingularityConstraintsFlag, forceCollisionFlag, M, B, K, F, Fmax, Vmax)
+
+    """   
+    @brief  报错清除后力传感器自动开启
+    @param  [in]必选参数 status 控制状态，0-关闭；1-开启
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetForceSensorDragAutoFlag(self, status):
+        return self.command("SetForceSensorDragAutoFlag", status)
+
+    """   
+    @brief  设置六维力和关节阻抗混合拖动开关及参数
+    @param  [in]必选参数 status 控制状态，0-关闭；1-开启
+    @param  [in]必选参数 impedanceFlag 阻抗开启标志，0-关闭；1-开启
+    @param  [in]必选参数 lamdeDain 拖动增益
+    @param  [in]必选参数 KGain 刚度增益
+    @param  [in]必选参数 BGain 阻尼增益
+    @param  [in]必选参数 dragMaxTcpVel 拖动末端最大线速度限制
+    @param  [in]必选参数 dragMaxTcpOriVel 拖动末端最大角速度限制
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ForceAndJointImpedanceStartStop(self,status, impedanceFlag, lamdeDain, KGain, BGain,dragMaxTcpVel,dragMaxTcpOriVel):
+        if((len(lamdeDain)!=6)or(len(KGain)!=6)or(len(BGain)!=6)):
+            return 4
+        lamdeDain = list(map(float,lamdeDain))
+        KGain = list(map(float,KGain))
+        BGain = list(map(float,BGain))
+        error = self.command("ForceAndJointImpedanceStartStop", status, impedanceFlag, lamdeDain, KGain, BGain,
+                             dragMaxTcpVel, dragMaxTcpOriVel)
+
+        return error
+
+    """   
+    @brief  获取力传感器拖动开关状态
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） dragState 力传感器辅助拖动控制状态，0-关闭；1-开启
+    @return 返回值（调用成功返回） sixDimensionalDragState 六维力辅助拖动控制状态，0-关闭；1-开启
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetForceAndTorqueDragState(self):
+        _error = self.query("GetForceAndTorqueDragState")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2]
+        else:
+            return error,None,None
+
+    """   
+    @brief  设置力传感器下负载重量
+    @param  [in]必选参数 weight 负载重量 kg
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetForceSensorPayload(self,weight):
+        return self.command("SetForceSensorPayload", weight)
+
+    """   
+    @brief  设置力传感器下负载重量
+    @param  [in]必选参数 x 负载质心x mm 
+    @param  [in]必选参数 y 负载质心y mm 
+    @param  [in]必选参数 z 负载质心z mm 
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetForceSensorPayloadCog(self,x,y,z):
+        return self.command("SetForceSensorPayloadCog", x, y, z)
+
+    """   
+    @brief  获取力传感器下负载重量
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） weight 负载重量 kg
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetForceSensorPayload(self):
+        _error = self.query("GetForceSensorPayload")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1]
+        else:
+            return error,None
+
+    """   
+    @brief  获取力传感器下负载质心
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） x 负载质心x mm 
+    @return 返回值（调用成功返回） y 负载质心y mm 
+    @return 返回值（调用成功返回） z 负载质心z mm 
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetForceSensorPayloadCog(self):
+        _error = self.query("GetForceSensorPayloadCog")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2], _error[3]
+        else:
+            return error,None,None,None
+
+    """   
+    @brief  力传感器自动校零
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） weight 传感器质量 kg 
+    @return 返回值（调用成功返回） pos=[x,y,z] 传感器质心 mm
+    """
+    @log_call
+    @xmlrpc_timeout
+    def ForceSensorAutoComputeLoad(self):
+        rtn = self.ForceSensorSetSaveDataFlag(1)
+        if rtn!=0:
+            return rtn,None,None
+        error =self.GetActualJointPosDegree()
+        start_joint = error[1]
+        error = self.GetActualJointPosDegree()
+        if error[0]==0:
+            joint =error[1]
+            if joint[2]<0:
+                joint[3] = joint[3] + 90
+            else:
+                joint[3] = joint[3] - 90
+            rtn = self.MoveJ(joint,0,0,vel=10)
+            if rtn!=0:
+                return rtn,None,None
+        else:
+            return error,None,None
+
+        rtn = self.ForceSensorSetSaveDataFlag(2)
+        if rtn!=0:
+            return rtn,None,None
+
+        error = self.GetActualJointPosDegree()
+        if error[0] == 0:
+            joint = error[1]
+            if joint[5] < 0:
+                joint[5] = joint[5] + 90
+            else:
+                joint[5] = joint[5] - 90
+            rtn = self.MoveJ(joint, 0, 0,vel=10)
+            if rtn != 0:
+                return rtn,None,None
+        else:
+            return error,None,None
+
+        rtn = self.ForceSensorSetSaveDataFlag(3)
+        if rtn!=0:
+            return rtn,None,None
+
+        _error = self.query("ForceSensorComputeLoad")
+        error = _error[0]
+        self.MoveJ(start_joint,0,0,vel=10)
+        if error == 0:
+            return error, _error[1],[_error[2],_error[3],_error[4]]
+        else:
+            return error,None,None
+
+    """   
+    @brief  传感器自动校零数据记录
+    @param  [in]必选参数 recordCount 记录数据个数 1-3
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def ForceSensorSetSaveDataFlag(self,recordCount):
+        error = self.command("ForceSensorSetSaveDataFlag", recordCount)
+
+        return error
+
+    """   
+    @brief  传感器自动校零计算
+    @return 错误码 成功- 0, 失败-错误码    
+    @return 返回值（调用成功返回） weight 传感器质量 kg 
+    @return 返回值（调用成功返回） pos=[x,y,z] 传感器质心 mm
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ForceSensorComputeLoad(self):
+        _error = self.query("ForceSensorComputeLoad")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1],[_error[2],_error[3],_error[4]]
+        else:
+            return error,None,None
+
+    """2025.09.12"""
+    """
+    @brief 阻抗启停控制
+    @param [in] status 0：关闭；1-开启
+    @param [in] workSpace 0-关节空间；1-迪卡尔空间
+    @param [in] forceThreshold 触发力阈值(N)
+    @param [in] m 质量参数
+    @param [in] b 阻尼参数
+    @param [in] k 刚度参数
+    @param [in] maxV 最大线速度(mm/s)
+    @param [in] maxVA 最大线加速度(mm/s2)
+    @param [in] maxW 最大角速度(°/s)
+    @param [in] maxWA 最大角加速度(°/s2)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ImpedanceControlStartStop(self, status, workSpace, forceThreshold, m, b, k, maxV, maxVA, maxW, maxWA):
+        error = self.command("ImpedanceControlStartStop",
+                             [status, workSpace, forceThreshold, m, b, k, maxV, maxVA, maxW, maxWA])
+        return error
@@ -0,0 +1,435 @@
+"""
+@brief  激光跟踪接口
+        激光传感器记录与复现、激光跟踪、焊缝寻位与焦点跟随。
+        由 RPC 在首次访问其中的接口时导入并将方法并入 RPC 类，调用方式与其余接口相同，见 Robot.SDK_FAMILIES。
+"""
+
+from .Robot import RPC, xmlrpc_timeout
+
+log_call = RPC.log_call
+
+
+class LaserMixin:
+    """2025.01.09"""
+    """
+       @brief 
+       @param  [in] status
+       @param  [in] delayMode
+       @param  [in] delayTime
+       @param  [in] delayDisExAxisNum
+       @param  [in] delayDis
+       @param  [in] sensitivePara
+       @param  [in] speed
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserSensorRecord(self, status, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed):
+        return self.command("LaserSensorRecord", status, delayMode, delayTime, delayDisExAxisNum, delayDis,
+                            sensitivePara, speed)
+
+    """
+       @brief 
+       @param  [in] weldId
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserTrackingLaserOn(self, weldId):
+        return self.command("LaserTrackingLaserOn", weldId)
+
+    """
+       @brief 
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserTrackingLaserOff(self):
+        return self.command("LaserTrackingLaserOff")
+
+    """
+       @brief 
+       @param  [in] coordId
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserTrackingTrackOn(self, coordId):
+        return self.command("LaserTrackingTrackOn", coordId)
+
+    """
+       @brief 
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserTrackingTrackOff(self):
+        return self.command("LaserTrackingTrackOff")
+
+    """
+       @brief 
+       @param  [in] direction
+       @param  [in] directionPoint
+       @param  [in] vel
+       @param  [in] distance
+       @param  [in] timeout
+       @param  [in] posSensorNum
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserTrackingSearchStart(self, direction, directionPoint, vel, distance, timeout, posSensorNum):
+        directionPoint = list(map(float, directionPoint))
+        error = self.command("LaserTrackingSearchStart", direction, directionPoint[0], directionPoint[1],
+                             directionPoint[2], vel, distance, timeout, posSensorNum)
+
+        return error
+
+    """
+       @brief 激光寻位结束
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def LaserTrackingSearchStop(self):
+        return self.command("LaserTrackingSearchStop")
+
+    """2025.07.04"""
+    """3.8.4"""
+
+    """
+    @brief 设置焦点标定点
+    @param  [in] pointNum 焦点标定点编号 1-8
+    @param  [in] point 标定点坐标
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetFocusCalibPoint(self, pointNum, point):
+        point = list(map(float, point))
+        error = self.command("SetFocusCalibPoint", pointNum, point[0], point[1], point[2], point[3], point[4], point[5])
+        return error
+
+    """
+    @brief 计算焦点标定结果
+    @param  [in] pointNum 标定点个数
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） resultPos 标定结果XYZ
+    @return 返回值（调用成功返回） accuracy 标定精度误差
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ComputeFocusCalib(self, pointNum):
+        _error = self.query("ComputeFocusCalib", pointNum)
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3]], _error[4]
+        return error, None, None
+
+    """
+    @brief 开启焦点跟随
+    @param  [in] kp 比例参数，默认50.0
+    @param  [in] kpredict 前馈参数，默认19.0
+    @param  [in] aMax 最大角加速度限制，默认1440°/s^2
+    @param  [in] vMax 最大角速度限制，默认180°/s
+    @param  [in] type 锁定X轴指向(0-参考输入矢量；1-水平；2-垂直)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FocusStart(self, kp=50.0, kpredic=19.0, aMax=1440, vMax=180, type=0):
+        return self.command("FocusStart", kp, kpredic, aMax, vMax, type)
+
+    """
+    @brief 停止焦点跟随
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def FocusEnd(self):
+        return self.command("FocusEnd")
+
+    """
+    @brief 设置焦点坐标
+    @param  [in] pos 焦点坐标XYZ
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetFocusPosition(self, pos):
+        pos = list(map(float, pos))
+        error = self.command("SetFocusPosition", pos[0], pos[1], pos[2])
+        return error
+
+    """2025.07.21"""
+    """3.8.5"""
+    """
+    @brief 激光传感器记录点
+    @param  [in] coordID 激光传感器坐标系
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） joint 激光传感器识别点关节位置
+    @return 返回值（调用成功返回） desc 激光传感器识别点笛卡尔位置
+    @return 返回值（调用成功返回） exaxis 激光传感器识别点扩展轴位置
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserRecordPoint(self, coordID):
+        _error = self.query("LaserRecordPoint", coordID, 0, 100)
+        error = _error[0]
+        if error == 0:
+            param_str = str(_error[1])
+            par_s = param_str.split(',')
+            if len(par_s) != 16:
+                return -1, None, None, None
+            return (error, [float(par_s[0]),float(par_s[1]),float(par_s[2]),float(par_s[3]),float(par_s[4]),float(par_s[5])],
+                    [float(par_s[6]),float(par_s[7]),float(par_s[8]),float(par_s[9]),float(par_s[10]),float(par_s[11])],
+                    [float(par_s[12]),float(par_s[13]),float(par_s[14]),float(par_s[15])])
+        return error, None, None, None
+
+    """2025.09.05"""
+    """
+    @brief 激光外设打开关闭函数
+    @param  [in] OnOff 0-关闭 1-打开
+    @param  [in] weldId 焊缝ID 默认为0
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserTrackingLaserOnOff(self, OnOff, weldId=0):
+        return self.command("LaserTrackingLaserOnOff", OnOff, weldId)
+
+    """
+    @brief 激光跟踪开始结束函数
+    @param  [in] OnOff 0-结束 1-开始
+    @param  [in] coordId 激光外设工具坐标系编号
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserTrackingTrackOnOff(self, OnOff, coordId):
+        return self.command("LaserTrackingTrackOnOff", OnOff, coordId)
+
+    """
+    @brief 激光寻位-固定方向
+    @param  [in] direction 0-x+ 1-x- 2-y+ 3-y- 4-z+ 5-z-
+    @param  [in] vel 速度 单位%
+    @param  [in] distance 最大寻位距离 单位mm
+    @param  [in] timeout 寻位超时时间 单位ms
+    @param  [in] posSensorNum 激光标定的工具坐标编号
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserTrackingSearchStart_xyz(self, direction, vel, distance, timeout, posSensorNum):
+        return self.command("LaserTrackingSearchStart_xyz", direction, vel, distance, timeout, posSensorNum)
+
+    """
+    @brief 激光寻位-任意方向
+    @param  [in] directionPoint 寻位输入的点的xyz左边,[x,y,z]
+    @param  [in] vel 速度 单位%
+    @param  [in] distance 最大寻位距离 单位mm
+    @param  [in] timeout 寻位超时时间 单位ms
+    @param  [in] posSensorNum 激光标定的工具坐标编号
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserTrackingSearchStart_point(self, directionPoint, vel, distance, timeout, posSensorNum):
+        directionPoint = list(map(float, directionPoint))
+        error = self.command("LaserTrackingSearchStart_point", 6, vel, distance, timeout, posSensorNum,
+                             directionPoint[0], directionPoint[1], directionPoint[2])
+        return error
+
+    """
+    @brief 激光IP配置
+    @param  [in] ip 激光外设的ip地址
+    @param  [in] port 激光外设的端口号
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserTrackingSensorConfig(self, ip, port):
+        return self.command("LaserTrackingSensorConfig", ip, port)
+
+    """
+    @brief 激光外设采样周期配置
+    @param  [in] period 激光外设采样周期 单位ms
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserTrackingSensorSamplePeriod(self, period):
+        return self.command("LaserTrackingSensorSamplePeriod", period)
+
+    """
+    @brief 激光外设驱动加载
+    @param  [in] type 激光外设驱动的协议类型 101-睿牛 102-创想 103-全视 104-同舟 105-奥太
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LoadPosSensorDriver(self, type):
+        return self.command("LoadPosSensorDriver", type)
+
+    """
+    @brief 激光外设驱动卸载
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def UnLoadPosSensorDriver(self):
+        return self.command("UnLoadPosSensorDriver")
+
+    """
+    @brief 激光焊缝轨迹记录
+    @param  [in] status 0-停止记录 1-实时跟踪  2-开始记录
+    @param  [in] delayTime 延时时间 单位ms
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserSensorRecord1(self, status, delayTime):
+        return self.command("LaserSensorRecord1", status, delayTime)
+
+    """
+    @brief 激光焊缝轨迹复现
+    @param  [in] delayTime 延时时间 单位ms
+    @param  [in] speed 速度 单位%
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserSensorReplay(self, delayTime, speed):
+        error = self.command("LaserSensorReplay", 3, delayTime, speed)
+        return error
+
+    """
+    @brief 激光跟踪复现
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def MoveLTR(self):
+        error = self.command("MoveLTR", 0)
+        return error
+
+    """
+    @brief 激光焊缝轨迹复现
+    @param  [in] delayMode 模式 0-延时时间 1-延时距离
+    @param  [in] delayTime 延时时间 单位ms
+    @param  [in] delayDisExAxisNum 扩展轴编号
+    @param  [in] delayDis 延时距离 单位mm
+    @param  [in] sensitivePara 补偿灵敏系数
+    @param  [in] speed 速度 单位%
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def LaserSensorRecordandReplay(self, delayMode, delayTime, delayDisExAxisNum, delayDis, sensitivePara, speed):
+        error = self.command("LaserSensorRecordandReplay", 4, delayMode, delayTime, delayDisExAxisNum, delayDis,
+                             sensitivePara, speed)
+        return error
+
+    """
+    @brief 运动到焊缝记录的起点
+    @param  [in] moveType 0-PTP 1-LIN
+    @param  [in] ovl 速度 单位%
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def MoveToLaserRecordStart(self, moveType, ovl):
+        return self.command("MoveToLaserRecordStart", moveType, ovl)
+
+    """
+    @brief 运动到焊缝记录的终点
+    @param  [in] moveType 0-PTP 1-LIN
+    @param  [in] ovl 速度 单位%
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def MoveToLaserRecordEnd(self, moveType, ovl):
+        return self.command("MoveToLaserRecordEnd", moveType, ovl)
+
+    """
+    @brief 运动到激光传感器寻位点
+    @param  [in] moveFlag 运动类型：0-PTP；1-LIN
+    @param  [in] ovl 速度缩放因子，0-100
+    @param  [in] dataFlag 焊缝缓存数据选择：0-执行规划数据；1-执行记录数据
+    @param  [in] plateType 板材类型：0-波纹板；1-瓦楞板；2-围栏板；3-油桶；4-波纹甲壳钢
+    @param  [in] trackOffectType 激光传感器偏移类型：0-不偏移；1-基坐标系偏移；2-工具坐标系偏移；3-激光传感器原始数据偏移
+    @param  [in] offset 偏移量
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def MoveToLaserSeamPos(self, moveFlag, ovl, dataFlag, plateType, trackOffectType, offset):
+        error = self.command("MoveToLaserSeamPos", [moveFlag, ovl, dataFlag, plateType, trackOffectType, offset])
+        return error
+
+    """
+    @brief 获取激光传感器寻位点坐标信息
+    @param [in] trackOffectType 激光传感器偏移类型：0-不偏移；1-基坐标系偏移；2-工具坐标系偏移；3-激光传感器原始数据偏移
+    @param [in] offset 偏移量
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） jPos 关节位置[°]
+    @return 返回值（调用成功返回） descPos 笛卡尔位置[mm]
+    @return 返回值（调用成功返回） tool 工具坐标系
+    @return 返回值（调用成功返回） user 工件坐标系
+    @return 返回值（调用成功返回） exaxis 扩展轴位置[mm]
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetLaserSeamPos(self, trackOffectType, offset):
+        _error = self.query("GetLaserSeamPos", [trackOffectType, offset])
+        error = _error[0]
+        if error == 0:
+            paramStr = str(_error[1])
+            # print(f"{paramStr}\n")
+
+            parS = paramStr.split(',')
+            if len(parS) != 20:
+                return -1, None, None, None, None, None
+            return (error, [float(parS[0]),float(parS[1]),float(parS[2]),float(parS[3]),float(parS[4]),float(parS[5])],
+                    [float(parS[6]),float(parS[7]),float(parS[8]),float(parS[9]),float(parS[10]),float(parS[11])],
+                    int(parS[12]), int(parS[13]),
+                    [float(parS[16]),float(parS[17]),float(parS[18]),float(parS[19])])
+        return error, None, None, None, None, None
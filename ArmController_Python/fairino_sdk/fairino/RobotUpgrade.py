@@ -0,0 +1,194 @@
+"""
+@brief  固件升级接口
+        控制器软件、内核、驱动器与末端固件升级。
+        由 RPC 在首次访问其中的接口时导入并将方法并入 RPC 类，调用方式与其余接口相同，见 Robot.SDK_FAMILIES。
+        RPC 的私有文件传输接口按其名称改写后的名字访问(self._RPC__FileUpLoad)。
+"""
+
+import os
+import time
+import xmlrpc.client
+
+from .Robot import RPC, xmlrpc_timeout
+
+log_call = RPC.log_call
+
+
+class UpgradeMixin:
+    """   
+    @brief  机器人软件升级
+    @param  [in]必选参数  filePath 软件升级包全路径
+    @param  [in]必选参数 block 是否阻塞至升级完成 true:阻塞；false:非阻塞
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+    @log_call
+    @xmlrpc_timeout
+    def SoftwareUpgrade(self,filePath, block):
+        error = self._RPC__FileUpLoad(1,filePath)
+
+        print("__FileUpLoad", error)
+        if 0==error:
+            self.log_info("Software Upload success!")
+            error = self.command("SoftwareUpgrade")
+            if 0!=error:
+                return error
+            if block:
+                upgradeState = -1
+                time.sleep(0.5)
+                upgradeState = self.GetSoftwareUpgradeState()
+                if upgradeState == 0:
+                    self.log_error("software upgrade not start")
+                    return -1
+                while (upgradeState > 0 and upgradeState < 100):
+                    time.sleep(0.5)
+                    upgradeState = self.GetSoftwareUpgradeState()
+                    # print("upgradeState",upgradeState,"%")
+                if upgradeState == 100:
+                    error = 0
+                else:
+                    error = upgradeState
+            return error
+        else:
+            self.log_error("execute SoftwareUpgrade fail.")
+            return error
+
+    """   
+    @brief  获取机器人软件升级状态
+    @return 错误码 成功- 0, 失败-错误码   
+    @return 返回值（调用成功返回） state 机器人软件包升级状态 0：空闲中或上传升级包中，1~100：升级完成百分比，-1：升级软件失败，-2：校验失败，-3：版本校验失败，-4：解压失败，-5：用户配置升级失败，-6：外设配置升级失败，-7：扩展轴配置升级失败，-8：机器人配置升级失败，-9：DH参数配置升级失败
+    """
+    @log_call
+    @xmlrpc_timeout
+    def GetSoftwareUpgradeState(self):
+        error = self.read_state("softwareUpgradeState")
+        return error
+
+    """2025.07.08"""
+    """
+    @brief 设置编码器升级
+    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetEncoderUpgrade(self, path):
+        return self.command("SetEncoderUpgrade", path)
+
+    """
+    @brief 设置关节固件升级
+    @param  [in] type 升级文件类型；1-升级固件；2-升级从站配置文件
+    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetJointFirmwareUpgrade(self, type, path):
+        type = int(type)
+        path = str(path)
+        errcode = self._RPC__FileUpLoad(2, path)
+        if errcode == 0:
+            file_name = "/tmp/" + os.path.basename(path)
+            for joint_num in range(1, 7):
+                errcode = self.SlaveFileWrite(1, joint_num, file_name)
+                if errcode != 0:
+                    return errcode
+        return errcode
+
+    """
+    @brief 设置控制箱固件升级
+    @param  [in] type 升级文件类型；1-升级固件；2-升级从站配置文件
+    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetCtrlFirmwareUpgrade(self, type, path):
+        type = int(type)
+        path = str(path)
+        errcode = self._RPC__FileUpLoad(2, path)
+        if errcode == 0:
+            file_name = "/tmp/" + os.path.basename(path)
+            errcode = self.SlaveFileWrite(type, 0, file_name)
+            return errcode
+        return errcode
+
+    """
+    @brief 设置末端固件升级
+    @param  [in] type 升级文件类型；1-升级固件；2-升级从站配置文件
+    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetEndFirmwareUpgrade(self, type, path):
+        type = int(type)
+        path = str(path)
+        errcode = self._RPC__FileUpLoad(2, path)
+        if errcode == 0:
+            file_name = "/tmp/" + os.path.basename(path)
+            errcode = self.SlaveFileWrite(type, 7, file_name)
+            return errcode
+        return errcode
+
+    """
+    @brief 关节全参数配置文件升级
+    @param  [in] path 本地升级包全路径(D://zUP/XXXXX.bin)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def JointAllParamUpgrade(self, path):
+        path = str(path)
+        errcode = self._RPC__FileUpLoad(5, path)
+        if errcode == 0:
+            error = self.command("JointAllParamUpgrade")
+            return error
+        return errcode
+
+    """2025.09.19"""
+    """
+    @brief 机器人操作系统升级(LA控制箱)
+    @param [in] filePath 操作系统升级包全路径
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def KernelUpgrade(self, filePath):
+        filePath = str(filePath)
+        errcode = self._RPC__FileUpLoad(6, filePath)
+        if errcode == 0:
+            try:
+                result = self.query("KernelUpgrade")
+                if result is not None and hasattr(result, '__len__') and len(result) == 0:
+                    # print("警告: 内核升级调用成功，但返回空数据")
+                    return 0
+                return result if result is not None else 0
+            except xmlrpc.client.Fault as e:
+                if "array has only 0 items" in str(e):
+                    # print("内核升级指令已发送，但服务器返回空响应")
+                    return 0
+                else:
+                    # print(f"内核升级失败: {e}")
+                    return -1
+        return errcode
+
+    """
+    @brief 获取机器人操作系统升级结果(LA控制箱)
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） result 升级结果：0:成功；-1:失败
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetKernelUpgradeResult(self):
+        _error = self.query("GetKernelUpgradeResult")
+        error = _error[0]
+        if error == 0:
+            return error, _error[1]
+        return error, None
@@ -0,0 +1,1311 @@
+"""
+@brief  焊接接口
+        起弧/熄弧、焊接电流电压、摆焊、段焊、焊丝寻位、电弧跟踪、断弧续焊与爬行器。
+        由 RPC 在首次访问其中的接口时导入并将方法并入 RPC 类，调用方式与其余接口相同，见 Robot.SDK_FAMILIES。
+"""
+
+import time
+
+from .Robot import RPC, RobotError, xmlrpc_timeout
+
+log_call = RPC.log_call
+
+
+class WeldMixin:
+    """   
+    @brief  焊接开始 
+    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
+    @param  [in] 必选参数 arcNum 焊机配置文件编号
+    @param  [in] 必选参数 timeout 起弧超时时间
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ARCStart(self, ioType, arcNum, timeout):
+        return self.command("ARCStart", ioType, arcNum, timeout)
+
+    """   
+    @brief  焊接结束 
+    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
+    @param  [in] 必选参数 arcNum 焊机配置文件编号
+    @param  [in] 必选参数 timeout 熄弧超时时间
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ARCEnd(self, ioType, arcNum, timeout):
+        return self.command("ARCEnd", ioType, arcNum, timeout)
+
+    """   
+    @brief  设置焊接电流与输出模拟量对应关系 
+    @param  [in] 必选参数 currentMin 焊接电流-模拟量输出线性关系左侧点电流值(A)
+    @param  [in] 必选参数 currentMax 焊接电流-模拟量输出线性关系右侧点电流值(A)
+    @param  [in] 必选参数 outputVoltageMin 焊接电流-模拟量输出线性关系左侧点模拟量输出电压值(V)
+    @param  [in] 必选参数 outputVoltageMax 焊接电流-模拟量输出线性关系右侧点模拟量输出电压值(V)
+    @param  [in] 必选参数 AOIndex 焊接电流模拟量输出端口
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetCurrentRelation(self, currentMin, currentMax, outputVoltageMin, outputVoltageMax,AOIndex):
+        return self.command("WeldingSetCurrentRelation", currentMin, currentMax, outputVoltageMin, outputVoltageMax,
+                            AOIndex)
+
+    """   
+    @brief  设置焊接电压与输出模拟量对应关系 
+    @param  [in] 必选参数 weldVoltageMin 焊接电压-模拟量输出线性关系左侧点焊接电压值(A)
+    @param  [in] 必选参数 weldVoltageMax 焊接电压-模拟量输出线性关系右侧点焊接电压值(A)
+    @param  [in] 必选参数 outputVoltageMin 焊接电压-模拟量输出线性关系左侧点模拟量输出电压值(V)
+    @param  [in] 必选参数 outputVoltageMax 焊接电压-模拟量输出线性关系右侧点模拟量输出电压值(V)    
+    @param  [in] 必选参数 AOIndex 焊接电压模拟量输出端口
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetVoltageRelation(self, weldVoltageMin, weldVoltageMax, outputVoltageMin, outputVoltageMax,AOIndex):
+        return self.command("WeldingSetVoltageRelation", weldVoltageMin, weldVoltageMax, outputVoltageMin,
+                            outputVoltageMax, AOIndex)
+
+    """   
+    @brief  获取焊接电流与输出模拟量对应关系 
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）currentMin 焊接电流-模拟量输出线性关系左侧点电流值(A)
+    @return 返回值（调用成功返回）currentMax 焊接电流-模拟量输出线性关系右侧点电流值(A)
+    @return 返回值（调用成功返回）outputVoltageMin 焊接电流-模拟量输出线性关系左侧点模拟量输出电压值(V)
+    @return 返回值（调用成功返回）outputVoltageMax 焊接电流-模拟量输出线性关系右侧点模拟量输出电压值(V)
+    @return 返回值（调用成功返回） AOIndex 焊接电压电流模拟量输出端口
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingGetCurrentRelation(self):
+
+        try:
+            _error = self.query("WeldingGetCurrentRelation")
+
+            error = _error[0]
+            if error == 0:
+                return error, _error[1], _error[2], _error[3], _error[4], _error[5]
+            return _error,None,None,None,None,None
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR,None,None,None,None,None
+
+    """   
+    @brief  获取焊接电压与输出模拟量对应关系 
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回）weldVoltageMin 焊接电压-模拟量输出线性关系左侧点焊接电压值(A)
+    @return 返回值（调用成功返回）weldVoltageMax 焊接电压-模拟量输出线性关系右侧点焊接电压值(A)
+    @return 返回值（调用成功返回）outputVoltageMin 焊接电压-模拟量输出线性关系左侧点模拟量输出电压值(V)
+    @return 返回值（调用成功返回）outputVoltageMax 焊接电流-模拟量输出线性关系右侧点模拟量输出电压值(V)
+    @return 返回值（调用成功返回） AOIndex 焊接电压模拟量输出端口
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingGetVoltageRelation(self):
+
+        try:
+            _error = self.query("WeldingGetVoltageRelation")
+
+            error = _error[0]
+            if error == 0:
+                return error, _error[1], _error[2], _error[3], _error[4], _error[5]
+            return _error,None,None,None,None,None
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR,None,None,None,None,None
+
+    """   
+    @brief  设置焊接电流 
+    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
+    @param  [in] 必选参数 float current 焊接电流值(A)
+    @param  [in] 必选参数 AOIndex 焊接电流控制箱模拟量输出端口(0-1)
+    @param  [in] 必选参数 blend 是否平滑 0-不平滑，1-平滑
+    @return 错误码 成功- 0, 失败-
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetCurrent(self, ioType, current, AOIndex,blend):
+        return self.command("WeldingSetCurrent", ioType, current, AOIndex, blend)
+
+    """   
+    @brief  设置焊接电压 
+    @param  [in] 必选参数 ioType io类型 0-控制器IO； 1-扩展IO
+    @param  [in] 必选参数 float voltage 焊接电压值(A)
+    @param  [in] 必选参数 AOIndex 焊接电压控制箱模拟量输出端口(0-1)
+    @param  [in] 必选参数 blend 是否平滑 0-不平滑，1-平滑
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetVoltage(self, ioType, voltage, AOIndex,blend):
+        return self.command("WeldingSetVoltage", ioType, voltage, AOIndex, blend)
+
+    """   
+    @brief  设置摆动参数 
+    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
+    @param  [in] 必选参数 int weaveType 摆动类型 0-平面三角波摆动；1-垂直L型三角波摆动；2-顺时针圆形摆动；3-逆时针圆形摆动；4-平面正弦波摆动；5-垂直L型正弦波摆动；6-垂直三角波摆动；7-垂直正弦波摆动
+    @param  [in] 必选参数 float weaveFrequency 摆动频率(Hz)
+    @param  [in] 必选参数 int weaveIncStayTime 等待模式 0-周期不包含等待时间；1-周期包含等待时间
+    @param  [in] 必选参数 float weaveRange 摆动幅度(mm)
+    @param  [in] 必选参数 float weaveLeftRange 垂直三角摆动左弦长度(mm)
+    @param  [in] 必选参数 float weaveRightRange 垂直三角摆动右弦长度(mm)
+    @param  [in] 必选参数 int additionalStayTime 垂直三角摆动垂三角点停留时间(ms)
+    @param  [in] 必选参数 int weaveLeftStayTime 摆动左停留时间(ms)
+    @param  [in] 必选参数 int weaveRightStayTime 摆动右停留时间(ms)
+    @param  [in] 必选参数 int weaveCircleRadio 圆形摆动-回调比率(0-100%)
+    @param  [in] 必选参数 int weaveStationary 摆动位置等待，0-等待时间内位置继续移动；1-等待时间内位置静止
+    @param  [in] 必选参数 float weaveYawAngle 摆动方向方位角（绕摆动Z轴旋转），单位°,默认0
+    @param  [in] 必选参数 float weaveRotAngle 摆动方向方位角（绕摆动X轴旋转），单位°,默认0
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveSetPara(self, weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
+                     weaveLeftRange, weaveRightRange, additionalStayTime, weaveLeftStayTime,
+                     weaveRightStayTime, weaveCircleRadio, weaveStationary,weaveYawAngle=0,weaveRotAngle=0):
+        return self.command("WeaveSetPara", weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange,
+                            weaveLeftRange, weaveRightRange, additionalStayTime, weaveLeftStayTime,
+                            weaveRightStayTime, weaveCircleRadio, weaveStationary, weaveYawAngle, weaveRotAngle)
+
+    """   
+    @brief  即时设置摆动参数 
+    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
+    @param  [in] 必选参数 int weaveType 摆动类型 0-平面三角波摆动；1-垂直L型三角波摆动；2-顺时针圆形摆动；3-逆时针圆形摆动；4-平面正弦波摆动；5-垂直L型正弦波摆动；6-垂直三角波摆动；7-
+    @param  [in] 必选参数 float weaveFrequency 摆动频率(Hz)
+    @param  [in] 必选参数 int weaveIncStayTime 等待模式 0-周期不包含等待时间；1-周期包含等待时间
+    @param  [in] 必选参数 float weaveRange 摆动幅度(mm)
+    @param  [in] 必选参数 int weaveLeftStayTime 摆动左停留时间(ms)
+    @param  [in] 必选参数 int weaveRightStayTime 摆动右停留时间(ms)
+    @param  [in] 必选参数 int weaveCircleRadio 圆形摆动-回调比率(0-100%)
+    @param  [in] 必选参数 int weaveStationary 摆动位置等待，0-等待时间内位置继续移动；1-等待时间内位置静止
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveOnlineSetPara(self, weaveNum, weaveType, weaveFrequency, weaveIncStayTime, weaveRange, weaveLeftStayTime,
+                           weaveRightStayTime, weaveCircleRadio, weaveStationary):
+        try:
+            error = self.command("WeaveOnlineSetPara", weaveNum, weaveType, weaveFrequency, weaveIncStayTime,
+                                 weaveRange, weaveLeftStayTime, weaveRightStayTime, weaveCircleRadio, weaveStationary)
+
+            return error
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR
+
+    """   
+    @brief  摆动开始 
+    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveStart(self, weaveNum):
+        try:
+            error = self.command("WeaveStart", weaveNum)
+
+            return error
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR
+
+    """   
+    @brief  摆动结束 
+    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveEnd(self, weaveNum):
+        try:
+            error = self.command("WeaveEnd", weaveNum)
+
+            return error
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR
+
+    """   
+    @brief  正向送丝 
+    @param  [in] 必选参数 int ioType io类型  0-控制器IO；1-扩展IO
+    @param  [in] 必选参数 int wireFeed 送丝控制  0-停止送丝；1-送丝
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetForwardWireFeed(self, ioType, wireFeed):
+        try:
+            error = self.command("SetForwardWireFeed", ioType, wireFeed)
+
+            return error
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR
+
+    """   
+    @brief  反向送丝 
+    @param  [in] 必选参数 int ioType io类型  0-控制器IO；1-扩展IO
+    @param  [in] 必选参数 int wireFeed 送丝控制  0-停止送丝；1-送丝
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetReverseWireFeed(self, ioType, wireFeed):
+        try:
+            error = self.command("SetReverseWireFeed", ioType, wireFeed)
+
+            return error
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR
+
+    """   
+    @brief  送气
+    @param  [in] 必选参数 int ioType io类型  0-控制器IO；1-扩展IO
+    @param  [in] 必选参数 int airControl 送气控制  0-停止送气；1-送气
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAspirated(self, ioType, airControl):
+        try:
+            error = self.command("SetAspirated", ioType, airControl)
+
+            return error
+        except Exception as e:
+            return RobotError.ERR_RPC_ERROR
+
+    """   
+    @brief  段焊获取位置和姿态
+    @param  [in]必选参数 startPos=[x,y,z,rx,ry,rz] 起始点坐标
+    @param  [in]必选参数 endPos=[x,y,z,rx,ry,rz] 终止点坐标
+    @param  [in]必选参数 startDistance 焊接点至起点的长度
+    @return 错误码 成功- 0, 失败-错误码    
+    @return 返回值（调用成功返回） weldPointDesc=[x,y,z,rx,ry,rz] 焊接点的笛卡尔坐标信息
+    @return 返回值（调用成功返回） weldPointJoint=[j1,j2,j3,j4,j5,j6] 焊接点的关节坐标信息
+    @return 返回值（调用成功返回） tool 工具号
+    @return 返回值（调用成功返回） user 工件号
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def GetSegmentWeldPoint(self, startPos, endPos, startDistance):
+        _error = self.query("GetSegmentWeldPoint", startPos, endPos, startDistance)
+
+        error = _error[0]
+        if error == 0:
+            data = _error[1].split(',')
+            if len(data) != 14:
+                self.log_error("GetSegmentWeldPoint fail")
+                return -1
+            else:
+                data = list(map(float,data))
+                tool = int(data[12])
+                work = int(data[13])
+                return (error, [ data[0],data[1],data[3],data[4],data[4],data[5]],
+                        [data[6],data[7],data[8],data[9],data[10],data[11]],tool, work)
+        else:
+            return error,None,None,None
+
+    """   
+    @brief  分段焊接启动
+    @param  [in] 必选参数 startDesePos: 初始笛卡尔位姿，单位 [mm][°]
+    @param  [in] 必选参数 endDesePos: 目标笛卡尔位姿，单位 [mm][°]
+    @param  [in] 必选参数 startJPos: 目标关节位置，单位 [°]
+    @param  [in] 必选参数 endJPos: 目标关节位置，单位 [°] 
+    @param  [in] 必选参数 weldLength: 焊接长度，单位 [mm]
+    @param  [in] 必选参数 noWeldLength: 非焊接长度，单位 [mm]    
+    @param  [in] 必选参数 weaveType 摆动类型 0-平面三角波摆动；1-垂直L型三角波摆动；2-顺时针圆形摆动；3-逆时针圆形摆动；4-平面正弦波摆动；5-垂直L型正弦波摆动；6-垂直三角波摆动；7-垂直正弦波摆动
+    @param  [in] 必选参数 arcNum 焊机配置文件编号
+    @param  [in] 必选参数 timeout 熄弧超时时间
+    @param  [in] 必选参数 isWeave true-焊接 false-不焊接
+    @param  [in] 必选参数 int weaveNum 摆焊参数配置编号
+    @param  [in] 必选参数 tool: 工具号，[0~14]
+    @param  [in] 必选参数 tool: 工具号，[0~14]
+    @param  [in] 必选参数 user: 工件号，[0~14]
+    @param  [in] 默认参数 vel：速度百分比，[0~100] 默认20.0
+    @param  [in] 默认参数 acc：加速度百分比，[0~100] 暂不开放 默认0.0
+    @param  [in] 默认参数 ovl: 速度缩放因子，[0~100] 默认100.0
+    @param  [in] 默认参数 blendR:[-1.0]-运动到位 (阻塞)，[0~1000]-平滑半径 (非阻塞)，单位 [mm] 默认-1.0
+    @param  [in] 默认参数 exaxis_pos: 外部轴 1 位置 ~ 外部轴 4 位置 默认[0.0,0.0,0.0,0.0]
+    @param  [in] 默认参数 search:[0]-不焊丝寻位，[1]-焊丝寻位
+    @param  [in] 默认参数 offset_flag:[0]-不偏移，[1]-工件/基坐标系下偏移，[2]-工具坐标系下偏移 默认 0
+    @param  [in] 默认参数 offset_pos: 位姿偏移量，单位 [mm][°] 默认[0.0,0.0,0.0,0.0,0.0,0.0]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SegmentWeldStart(self, startDesePos, endDesePos, startJPos, endJPos, weldLength, noWeldLength, weldIOType,
+                         arcNum, weldTimeout, isWeave, weaveNum, tool, user,
+                         vel=20.0, acc=0.0, ovl=100.0, blendR=-1.0, exaxis_pos=(0.0, 0.0, 0.0, 0.0), search=0,
+                         offset_flag=0, offset_pos=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)):
+        startDesePos = list(map(float, startDesePos))
+        endDesePos = list(map(float, endDesePos))
+        startJPos = list(map(float, startJPos))
+        endJPos = list(map(float, endJPos))
+
+        weldLength = float(weldLength)
+        noWeldLength = float(noWeldLength)
+        weldIOType = int(weldIOType)
+        arcNum = int(arcNum)
+        weldTimeout = int(weldTimeout)
+        isWeave = bool(isWeave)
+        weaveNum = int(weaveNum)
+        tool = int(tool)
+        user = int(user)
+        vel = float(vel)
+        acc = float(acc)
+        ovl = float(ovl)
+        blendR = float(blendR)
+        exaxis_pos = list(map(float, exaxis_pos))
+        search = int(search)
+        offset_flag = int(offset_flag)
+        offset_pos = list(map(float, offset_pos))
+
+        rtn = 0
+        # 获取起点到终点之间的距离和各方向角度余弦值
+        # print("1",startDesePos,endDesePos)
+        result = self.query("GetSegWeldDisDir", startDesePos[0], startDesePos[1], startDesePos[2], endDesePos[0],
+                            endDesePos[1], endDesePos[2])
+        # print("result",result)
+        if result[0] != 0:
+            return int(result[0])
+
+        distance = result[1]
+        endOffPos = list(offset_pos)
+
+        rtn = self.command("MoveJ", startJPos, startDesePos, tool, user, vel, acc, ovl, exaxis_pos, blendR, offset_flag,
+                           offset_pos)
+        # print("rtn1", rtn)
+        if rtn != 0:
+            return rtn
+
+        weldNum = 0
+        noWeldNum = 0
+        i = 0
+        while i < int(distance / (weldLength + noWeldLength)) * 2 + 2:
+            if i % 2 == 0:
+                weldNum += 1
+                if weldNum * weldLength + noWeldNum * noWeldLength > distance:
+
+                    rtn = self.command("ARCStart", weldIOType, arcNum, weldTimeout)
+                    # print("rtn2", rtn)
+                    if rtn != 0:
+                        return rtn
+                    if isWeave:
+                        rtn = self.command("WeaveStart", weaveNum)
+                        if rtn != 0:
+                            # print("rtn3", rtn)
+                            return rtn
+
+                    # getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
+                    # # print("getsegmentrtn", getsegmentrtn)
+                    # # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
+                    # # print("weldNum", weldNum, "weldLength", weldLength)
+                    # # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
+                    # if getsegmentrtn[0] != 0  :
+                    #     return getsegmentrtn[0]
+                    # data = getsegmentrtn[1].split(',')
+                    # data = list(map(float, data))
+                    # if len(data) != 14:
+                    #     self.log_error("GetSegmentWeldPoint fail")
+                    #     return -1
+                    # tmpJoint = [data[0],data[1],data[2],data[3],data[4],data[5]]
+                    # tmpWeldDesc = [data[6],data[7],data[8],data[9],data[10],data[11]]
+                    # tmpTool = int(data[12])
+                    # tmpUser = int(data[13])
+                    rtn = self.command("MoveL:legacy", endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
+                                           search, 0, endOffPos)
+                    # print("rtn3", rtn,endJPos,endDesePos)
+                    if rtn != 0:
+                        self.command("ARCEnd", weldIOType, arcNum, weldTimeout)
+                        if isWeave:
+                            rtn = self.command("WeaveEnd", weaveNum)
+                            # print("rtn4", rtn)
+                            if rtn != 0:
+                                return rtn
+                        return rtn
+                    rtn = self.command("ARCEnd", weldIOType, arcNum, weldTimeout)
+                    # print("rtn5", rtn)
+                    if rtn != 0:
+                        break
+                    if isWeave:
+                        rtn = self.command("WeaveEnd", weaveNum)
+                        # print("rtn6", rtn)
+                        if rtn != 0:
+                            break
+
+                else:
+                    rtn = self.command("ARCStart", weldIOType, arcNum, weldTimeout)
+                    # print("rtn7", rtn)
+                    if rtn != 0:
+                        return rtn
+                    if isWeave:
+                        rtn = self.command("WeaveStart", weaveNum)
+                        # print("rtn8", rtn)
+                        if rtn != 0:
+                            return rtn
+
+                    getsegmentrtn = self.query("GetSegmentWeldPoint", startDesePos, endDesePos,
+                                               weldNum * weldLength + noWeldNum * noWeldLength)
+                    # print("rtn9", getsegmentrtn)
+                    # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
+                    # print("weldNum", weldNum, "weldLength", weldLength)
+                    # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
+                    if getsegmentrtn[0] != 0:
+                        return getsegmentrtn[0]
+                    data = getsegmentrtn[1].split(',')
+                    data = list(map(float, data))
+                    if len(data) != 14:
+                        self.log_error("GetSegmentWeldPoint fail")
+                        return -1
+                    tmpJoint = [data[0], data[1], data[2], data[3], data[4], data[5]]
+                    tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
+                    tmpTool = int(data[12])
+                    tmpUser = int(data[13])
+                    # print("tmpJoint",tmpJoint,tmpWeldDesc,tmpTool,tmpUser)
+                    time.sleep(1)
+                    nihao = self.command("MoveL:legacy", tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
+                                           search, 0, endOffPos)
+                    # print("rtn10nihao", nihao)
+                    if nihao != 0:
+                        self.command("ARCEnd", weldIOType, arcNum, weldTimeout)
+                        if isWeave:
+                            rtn = self.command("WeaveEnd", weaveNum)
+                            # print("rtn11", rtn)
+                            if rtn != 0:
+                                return rtn
+                        return rtn
+                    rtn = self.command("ARCEnd", weldIOType, arcNum, weldTimeout)
+                    # print("rtn12", rtn)
+                    if rtn != 0:
+                        return rtn
+                    if isWeave:
+                        rtn = self.command("WeaveEnd", weaveNum)
+                        # print("rtn13", rtn)
+                        if rtn != 0:
+                            return rtn
+            else:
+                noWeldNum += 1
+                if weldNum * weldLength + noWeldNum * noWeldLength > distance:
+                    # getsegmentrtn = self.robot.GetSegmentWeldPoint(startDesePos, endDesePos, weldNum* weldLength + noWeldNum * noWeldLength)
+                    # # print("rtn14", getsegmentrtn)
+                    # # print(startDesePos, endDesePos, weldNum * weldLength + noWeldNum * noWeldLength)
+                    # # print("weldNum", weldNum, "weldLength", weldLength)
+                    # # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
+                    # if getsegmentrtn[0] != 0:
+                    #     return getsegmentrtn[0]
+                    # data = getsegmentrtn[1].split(',')
+                    # data = list(map(float,data))
+                    # if len(data) != 14:
+                    #     self.log_error("GetSegmentWeldPoint fail")
+                    #     return -1
+                    # tmpJoint = [data[0], data[1], data[2], data[3], data[4], data[5]]
+                    # tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
+                    # tmpTool = int(data[12])
+                    # tmpUser = int(data[13])
+                    rtn = self.command("MoveL:legacy", endJPos,endDesePos, tool, user, vel, acc, ovl, blendR,0, exaxis_pos,
+                                           search, 0, endOffPos)
+                    # print("rtn15", rtn,endJPos,endDesePos)
+                    if rtn != 0:
+                       return rtn
+                    break
+                else:
+                    getsegmentrtn = self.query("GetSegmentWeldPoint", startDesePos, endDesePos, weldNum* weldLength + noWeldNum * noWeldLength)
+                    # print("rtn16", getsegmentrtn,startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
+
+                    # print(startDesePos,endDesePos,weldNum* weldLength + noWeldNum * noWeldLength)
+                    # print("weldNum",weldNum,"weldLength",weldLength)
+                    # print("noWeldNum", noWeldNum, "noWeldLength", noWeldLength)
+                    if getsegmentrtn[0] != 0:
+                        return getsegmentrtn[0]
+                    data = getsegmentrtn[1].split(',')
+                    data = list(map(float, data))
+                    if len(data) != 14:
+                        self.log_error("GetSegmentWeldPoint fail")
+                        return -1
+                    tmpJoint = [data[0], data[1], data[2], data[3], data[4], data[5]]
+                    tmpWeldDesc = [data[6], data[7], data[8], data[9], data[10], data[11]]
+                    tmpTool = int(data[12])
+                    tmpUser = int(data[13])
+                    rtn = self.command("MoveL:legacy", tmpJoint, tmpWeldDesc, tmpTool, tmpUser, vel, acc, ovl, blendR,0, exaxis_pos,
+                                           search, 0, endOffPos)
+                    # print("rtn17", rtn)
+                    if rtn != 0:
+                        return rtn
+            i =i + 1
+        return rtn
+
+    """   
+    @brief  分段焊接终止
+    @param  [in] 必选参数 ioType：io类型 0-控制器IO； 1-扩展IO
+    @param  [in] 必选参数 arcNum：焊机配置文件编号
+    @param  [in] 必选参数 timeout：熄弧超时时间
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SegmentWeldEnd(self, ioType, arcNum, timeout):
+
+        rtn = self.command("SegmentWeldEnd", ioType, arcNum, timeout)
+
+        return rtn
+
+    """   
+    @brief  焊丝寻位开始
+    @param [in]必选参数 refPos  1-基准点 2-接触点
+    @param [in]必选参数 searchVel   寻位速度 %
+    @param [in]必选参数 searchDis  寻位距离 mm
+    @param [in]必选参数 autoBackFlag 自动返回标志，0-不自动；-自动
+    @param [in]必选参数 autoBackVel  自动返回速度 %
+    @param [in]必选参数 autoBackDis  自动返回距离 mm
+    @param [in]必选参数 offectFlag  1-带偏移量寻位；2-示教点寻位
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WireSearchStart(self, refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag):
+        return self.command("WireSearchStart", refPos, searchVel, searchDis, autoBackFlag, autoBackVel, autoBackDis,
+                            offectFlag)
+
+    """   
+    @brief  焊丝寻位结束
+    @param [in]必选参数 refPos  1-基准点 2-接触点
+    @param [in]必选参数 searchVel   寻位速度 %
+    @param [in]必选参数 searchDis  寻位距离 mm
+    @param [in]必选参数 autoBackFlag 自动返回标志，0-不自动；-自动
+    @param [in]必选参数 autoBackVel  自动返回速度 %
+    @param [in]必选参数 autoBackDis  自动返回距离 mm
+    @param [in]必选参数 offectFlag  1-带偏移量寻位；2-示教点寻位
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def WireSearchEnd(self, refPos,searchVel,searchDis,autoBackFlag,autoBackVel,autoBackDis,offectFlag):
+        return self.command("WireSearchEnd", refPos, searchVel, searchDis, autoBackFlag, autoBackVel, autoBackDis,
+                            offectFlag)
+
+    """   
+    @brief  计算焊丝寻位偏移量
+    @param  [in]必选参数 seamType  焊缝类型
+    @param  [in]必选参数 method   计算方法
+    @param  [in]必选参数 varNameRef 基准点1-6，“#”表示无点变量
+    @param  [in]必选参数 varNameRes 接触点1-6，“#”表示无点变量
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） offectFlag 0-偏移量直接叠加到指令点；1-偏移量需要对指令点进行坐标变换
+    @return 返回值（调用成功返回） offect 偏移位姿[x, y, z, a, b, c]
+    """
+    @log_call
+    @xmlrpc_timeout
+    def GetWireSearchOffset(self, seamType, method,varNameRef,varNameRes):
+        if(len(varNameRes)!=6):
+            return 4
+        if(len(varNameRes)!=6):
+            return 4
+        varNameRef = list(map(str, varNameRef))
+        varNameRes = list(map(str, varNameRes))
+
+        _error = self.query("GetWireSearchOffset", seamType, method, varNameRef[0], varNameRef[1], varNameRef[2],
+                            varNameRef[3], varNameRef[4], varNameRef[5], varNameRes[0], varNameRes[1], varNameRes[2],
+                            varNameRes[3], varNameRes[4], varNameRes[5])
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], [_error[2], _error[3], _error[4], _error[5], _error[6], _error[7]]
+        else:
+            return error,None,None
+
+    """   
+    @brief  等待焊丝寻位完成
+    @param  [in]必选参数 varName  接触点名称 “RES0” ~ “RES99”
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def WireSearchWait(self,varname):
+        return self.command("WireSearchWait", varname)
+
+    """   
+    @brief  焊丝寻位接触点写入数据库
+    @param  [in]必选参数 varName  接触点名称 “RES0” ~ “RES99”
+    @param  [in]必选参数 pos  接触点数据[x, y, x, a, b, c]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def SetPointToDatabase(self,varName,pos):
+        return self.command("SetPointToDatabase", varName, pos)
+
+    """   
+    @brief  电弧跟踪控制
+    @param  [in]必选参数 flag 开关，0-关；1-开
+    @param  [in]必选参数 delayTime 滞后时间，单位ms
+    @param  [in]必选参数 isLeftRight 左右偏差补偿 0-关闭，1-开启
+    @param  [in]必选参数 klr 左右调节系数(灵敏度)
+    @param  [in]必选参数 tStartLr 左右开始补偿时间cyc
+    @param  [in]必选参数 stepMaxLr 左右每次最大补偿量 mm
+    @param  [in]必选参数 sumMaxLr 左右总计最大补偿量 mm
+    @param  [in]必选参数 isUpLow 上下偏差补偿 0-关闭，1-开启
+    @param  [in]必选参数 kud 上下调节系数(灵敏度)
+    @param  [in]必选参数 tStartUd 上下开始补偿时间cyc
+    @param  [in]必选参数 stepMaxUd 上下每次最大补偿量 mm
+    @param  [in]必选参数 sumMaxUd 上下总计最大补偿量
+    @param  [in]必选参数 axisSelect 上下坐标系选择，0-摆动；1-工具；2-基座
+    @param  [in]必选参数 referenceType 上下基准电流设定方式，0-反馈；1-常数
+    @param  [in]必选参数 referSampleStartUd 上下基准电流采样开始计数(反馈)，cyc
+    @param  [in]必选参数 referSampleCountUd 上下基准电流采样循环计数(反馈)，cyc
+    @param  [in]必选参数 referenceCurrent 上下基准电流mA
+    @param  [in]必选参数 offsetType 偏置跟踪类型，0-不偏置；1-采样；2-百分比
+    @param  [in]必选参数 offsetParameter 偏置参数；采样(偏置采样开始时间，默认采一周期)；百分比(偏置百分比(-100 ~ 100))
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceControl(self,flag,delaytime, isLeftRight, klr, tStartLr, stepMaxLr, sumMaxLr, isUpLow, kud, tStartUd, stepMaxUd,
+                            sumMaxUd, axisSelect, referenceType, referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter):
+        error = self.command("ArcWeldTraceControl", flag, delaytime, isLeftRight, [klr, tStartLr, stepMaxLr, sumMaxLr],
+                             isUpLow, [kud, tStartUd, stepMaxUd, sumMaxUd], axisSelect, referenceType,
+                             referSampleStartUd, referSampleCountUd, referenceCurrent, offsetType, offsetParameter)
+
+        return error
+
+    """   
+    @brief  电弧跟踪AI通带选择
+    @param  [in]必选参数 channel 电弧跟踪AI通带选择,[0-3]
+    @return 错误码 成功- 0, 失败-错误码
+    """
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceExtAIChannelConfig(self,channel):
+        return self.command("ArcWeldTraceExtAIChannelConfig", channel)
+
+    """   
+    @brief  仿真摆动开始
+    @param  [in]必选参数 weaveNum  摆动参数编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveStartSim(self,weaveNum):
+        return self.command("WeaveStartSim", weaveNum)
+
+    """   
+    @brief  仿真摆动结束
+    @param  [in]必选参数 weaveNum  摆动参数编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveEndSim(self,weaveNum):
+        return self.command("WeaveEndSim", weaveNum)
+
+    """   
+    @brief  开始轨迹检测预警(不运动)
+    @param  [in]必选参数 weaveNum  摆动参数编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveInspectStart(self,weaveNum):
+        return self.command("WeaveInspectStart", weaveNum)
+
+    """   
+    @brief  结束轨迹检测预警(不运动)
+    @param  [in]必选参数 weaveNum  摆动参数编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeaveInspectEnd(self,weaveNum):
+        return self.command("WeaveInspectEnd", weaveNum)
+
+    """   
+    @brief  设置焊接工艺曲线参数
+    @param  [in]必选参数 id 焊接工艺编号(1-99)
+    @param  [in]必选参数 startCurrent 起弧电流(A)
+    @param  [in]必选参数 startVoltage 起弧电压(V)
+    @param  [in]必选参数 startTime 起弧时间(ms)
+    @param  [in]必选参数 weldCurrent 焊接电流(A)
+    @param  [in]必选参数 weldVoltage 焊接电压(V)
+    @param  [in]必选参数 endCurrent 收弧电流(A)
+    @param  [in]必选参数 endVoltage 收弧电压(V)
+    @param  [in]必选参数 endTime 收弧时间(ms)
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetProcessParam(self, id, startCurrent, startVoltage, startTime, weldCurrent, weldVoltage, endCurrent,
+                               endVoltage, endTime):
+        return self.command("WeldingSetProcessParam", id, startCurrent, startVoltage, startTime, weldCurrent,
+                            weldVoltage, endCurrent, endVoltage, endTime)
+
+    """   
+    @brief  获取焊接工艺曲线参数    
+    @param  [in]必选参数 id 焊接工艺编号(1-99)
+    @return 错误码 成功- 0, 失败-错误码  
+    @return 返回值（调用成功返回） startCurrent 起弧电流(A)
+    @return 返回值（调用成功返回） startVoltage 起弧电压(V)
+    @return 返回值（调用成功返回） startTime 起弧时间(ms)
+    @return 返回值（调用成功返回） weldCurrent 焊接电流(A)
+    @return 返回值（调用成功返回） weldVoltage 焊接电压(V)
+    @return 返回值（调用成功返回） endCurrent 收弧电流(A)
+    @return 返回值（调用成功返回） endVoltage 收弧电压(V)
+    @return 返回值（调用成功返回） endTime 收弧时间(ms)
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingGetProcessParam(self, id):
+        _error = self.query("WeldingGetProcessParam", id)
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2], _error[3], _error[4], _error[5], _error[6], _error[7], _error[8]
+        else:
+            return error,None,None,None,None,None,None,None,None
+
+    """   
+    @brief  扩展IO-配置焊机气体检测信号
+    @param  [in]必选参数 DONum  气体检测信号扩展DO编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetAirControlExtDoNum(self,DONum):
+        return self.command("SetAirControlExtDoNum", DONum)
+
+    """   
+    @brief  扩展IO-配置焊机起弧信号
+    @param  [in]必选参数 DONum  焊机起弧信号扩展DO编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetArcStartExtDoNum(self,DONum):
+        return self.command("SetArcStartExtDoNum", DONum)
+
+    """   
+    @brief  扩展IO-配置焊机反向送丝信号
+    @param  [in]必选参数 DONum  反向送丝信号扩展DO编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetWireReverseFeedExtDoNum(self,DONum):
+        return self.command("SetWireReverseFeedExtDoNum", DONum)
+
+    """   
+    @brief  扩展IO-配置焊机正向送丝信号
+    @param  [in]必选参数 DONum  正向送丝信号扩展DO编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetWireForwardFeedExtDoNum(self,DONum):
+        return self.command("SetWireForwardFeedExtDoNum", DONum)
+
+    """   
+    @brief  扩展IO-配置焊机起弧成功信号
+    @param  [in]必选参数 DINum  起弧成功信号扩展DI编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetArcDoneExtDiNum(self,DINum):
+        return self.command("SetArcDoneExtDiNum", DINum)
+
+    """   
+    @brief  扩展IO-配置焊机准备信号
+    @param  [in]必选参数 DINum  焊机准备信号扩展DI编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetWeldReadyExtDiNum(self,DINum):
+        return self.command("SetWeldReadyExtDiNum", DINum)
+
+    """   
+    @brief  扩展IO-配置焊接中断恢复信号
+    @param  [in]必选参数 reWeldDINum  焊接中断后恢复焊接信号扩展DI编号
+    @param  [in]必选参数 abortWeldDINum  焊接中断后退出焊接信号扩展DI编号
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def SetExtDIWeldBreakOffRecover(self,reWeldDINum, abortWeldDINum):
+        return self.command("SetExtDIWeldBreakOffRecover", reWeldDINum, abortWeldDINum)
+
+    """   
+    @brief  电弧追踪 + 多层多道补偿开启
+    @param  [in] 必选参数 NULL
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceReplayStart(self):
+        return self.command("ArcWeldTraceReplayStart")
+
+    """   
+    @brief  电弧追踪 + 多层多道补偿关闭
+    @param  [in] 必选参数 NULL
+    @return 错误码 成功- 0, 失败-错误码    
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceReplayEnd(self):
+        return self.command("ArcWeldTraceReplayEnd")
+
+    """   
+    @brief  偏移量坐标变化-多层多道焊
+    @param  [in] pointo 基准点笛卡尔位姿
+    @param  [in] pointX 基准点X向偏移方向点笛卡尔位姿
+    @param  [in] pointZ 基准点Z向偏移方向点笛卡尔位姿
+    @param  [in] dx x方向偏移量(mm)
+    @param  [in] dz z方向偏移量(mm)
+    @param  [in] dry 绕y轴偏移量(°)
+    @return 错误码 成功- 0, 失败-错误码    
+    @return 返回值（调用成功返回） offset 计算结果偏移量
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def MultilayerOffsetTrsfToBase(self,pointo,pointX,pointZ,dx,dz,dry):
+        pointo =list(map(float,pointo))
+        pointX = list(map(float, pointX))
+        pointZ = list(map(float, pointZ))
+        _error = self.query("MultilayerOffsetTrsfToBase", pointo[0], pointo[1], pointo[2], pointX[0], pointX[1],
+                            pointX[2], pointZ[0], pointZ[1], pointZ[2], dx, dz, dry)
+
+        error = _error[0]
+        if error == 0:
+            return error, [_error[1], _error[2], _error[3], _error[4], _error[5], _error[6]]
+        else:
+            return error,None
+
+    """   
+    @brief  可移动装置使能
+    @param  [in] enable 使能状态，0-去使能， 1-使能
+    @return 错误码 成功- 0, 失败-错误码     
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def TractorEnable(self, enable):
+        return self.command("TractorEnable", enable)
+
+    """   
+    @brief  可移动装置回零
+    @return 错误码 成功- 0, 失败-错误码     
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def TractorHoming(self):
+        return self.command("TractorHoming")
+
+    """   
+    @brief 可移动装置直线运动
+    @param [in] distance 直线运动距离（mm）
+    @param [in] vel 直线运动速度百分比（0-100）
+    @return 错误码 成功- 0, 失败-错误码  
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def TractorMoveL(self,distance,vel):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("TractorMoveL", distance, vel)
+
+    """   
+    @brief 可移动装置圆弧运动
+    @param [in] radio 圆弧运动半径（mm）
+    @param [in] angle 圆弧运动角度（°）
+    @param [in] vel 圆弧运动速度百分比（0-100）
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def TractorMoveC(self,radio, angle, vel):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("TractorMoveC", radio, angle, vel)
+
+    """   
+    @brief 可移动装置停止运动
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def TractorStop(self):
+        return self.command("ProgramStop")
+
+    """   
+    @brief 设置焊丝寻位扩展IO端口
+    @param [in] searchDoneDINum 焊丝寻位成功DO端口(0-127)
+    @param [in] searchStartDONum 焊丝寻位启停控制DO端口(0-127)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def SetWireSearchExtDIONum(self,searchDoneDINum,searchStartDONum):
+        return self.command("SetWireSearchExtDIONum", searchDoneDINum, searchStartDONum)
+
+    """   
+    @brief 设置焊机控制模式扩展DO端口
+    @param [in] DONum 焊机控制模式DO端口(0-127)
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def SetWeldMachineCtrlModeExtDoNum(self, DONum):
+        return self.command("SetWeldMachineCtrlModeExtDoNum", DONum)
+
+    """   
+    @brief 设置焊机控制模式
+    @param [in] mode 焊机控制模式;0-一元化
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def SetWeldMachineCtrlMode(self, mode):
+        return self.command("SetWeldMachineCtrlMode", mode)
+
+    """
+       @brief 设置机器人焊接电弧意外中断检测参数
+       @param  [in] checkEnable 是否使能检测；0-不使能；1-使能
+       @param  [in] arcInterruptTimeLength 电弧中断确认时长(ms)
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeldingSetCheckArcInterruptionParam(self, checkEnable, arcInterruptTimeLength):
+        return self.command("WeldingSetCheckArcInterruptionParam", checkEnable, arcInterruptTimeLength)
+
+    """
+       @brief 获取机器人焊接电弧意外中断检测参数
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） checkEnable 是否使能检测；0-不使能；1-使能
+       @return 返回值（调用成功返回） arcInterruptTimeLength 电弧中断确认时长(ms)
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeldingGetCheckArcInterruptionParam(self):
+        _error = self.query("WeldingGetCheckArcInterruptionParam")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2]
+        return error,None,None
+
+    """
+       @brief 设置机器人焊接中断恢复参数
+       @param  [in] enable 是否使能焊接中断恢复
+       @param  [in] length 焊缝重叠距离(mm)
+       @param  [in] velocity 机器人回到再起弧点速度百分比(0-100)
+       @param  [in] moveType 机器人运动到再起弧点方式；0-LIN；1-PTP
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeldingSetReWeldAfterBreakOffParam(self, enable, length, velocity, moveType):
+        return self.command("WeldingSetReWeldAfterBreakOffParam", enable, length, velocity, moveType)
+
+    """
+       @brief 获取机器人焊接中断恢复参数
+       @return 错误码 成功- 0, 失败-错误码
+       @return 返回值（调用成功返回） enable 是否使能焊接中断恢复
+       @return 返回值（调用成功返回） length 焊缝重叠距离(mm)
+       @return 返回值（调用成功返回） velocity 机器人回到再起弧点速度百分比(0-100)
+       @return 返回值（调用成功返回） moveType 机器人运动到再起弧点方式；0-LIN；1-PTP
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeldingGetReWeldAfterBreakOffParam(self):
+        _error = self.query("WeldingGetReWeldAfterBreakOffParam")
+
+        error = _error[0]
+        if error == 0:
+            return error, _error[1], _error[2], _error[3], _error[4]
+        return error,None,None,None,None
+
+    """
+       @brief 设置机器人焊接中断后恢复焊接
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeldingStartReWeldAfterBreakOff(self):
+        return self.command("WeldingStartReWeldAfterBreakOff")
+
+    """
+       @brief 设置机器人焊接中断后退出焊接
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeldingAbortWeldAfterBreakOff(self):
+        return self.command("WeldingAbortWeldAfterBreakOff")
+
+    """2025.01.24"""
+    """3.7.9"""
+    """
+       @brief 摆动渐变开始
+       @param  [in] weaveChangeFlag 摆动编号 1-变摆动参数；2-变摆动参数+焊接速度
+       @param  [in] weaveNum 摆动编号
+       @param  [in] velStart 焊接开始速度，(cm/min)
+       @param  [in] velEnd 焊接结束速度，(cm/min)
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeaveChangeStart(self, weaveChangeFlag, weaveNum, velStart, velEnd):
+        return self.command("WeaveChangeStart", weaveChangeFlag, weaveNum, velStart, velEnd)
+
+    """
+       @brief 摆动渐变结束
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+
+    def WeaveChangeEnd(self):
+        return self.command("WeaveChangeEnd")
+
+    """2025.04.14"""
+    """3.8.2"""
+    """
+       @brief 电弧跟踪焊机电流反馈AI通道选择
+       @param  [in] channel 通道；0-扩展AI0；1-扩展AI1；2-扩展AI2；3-扩展AI3；4-控制箱AI0；5-控制箱AI1
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceAIChannelCurrent(self, channel):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ArcWeldTraceAIChannelCurrent", channel)
+
+    """
+       @brief 电弧跟踪焊机电压反馈AI通道选择
+       @param  [in] channel 通道；0-扩展AI0；1-扩展AI1；2-扩展AI2；3-扩展AI3；4-控制箱AI0；5-控制箱AI1
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceAIChannelVoltage(self, channel):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ArcWeldTraceAIChannelVoltage", channel)
+
+    """
+       @brief 电弧跟踪焊机电流反馈转换参数
+       @param  [in] AILow AI通道下限，默认值0V，范围[0-10V]
+       @param  [in] AIHigh AI通道上限，默认值10V，范围[0-10V]
+       @param  [in] currentLow AI通道下限对应焊机电流值，默认值0V，范围[0-200V]
+       @param  [in] currentHigh AI通道上限对应焊机电流值，默认值100V，范围[0-200V]
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceCurrentPara(self, AILow=0, AIHigh=10, currentLow=0, currentHigh=100):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ArcWeldTraceCurrentPara", AILow, AIHigh, currentLow, currentHigh)
+
+    """
+       @brief 电弧跟踪焊机电压反馈转换参数
+       @param  [in] AILow AI通道下限，默认值0V，范围[0-10V]
+       @param  [in] AIHigh AI通道上限，默认值10V，范围[0-10V]
+       @param  [in] voltageLow AI通道下限对应焊机电压值，默认值0V，范围[0-200V]
+       @param  [in] voltageHigh AI通道上限对应焊机电压值，默认值100V，范围[0-200V]
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def ArcWeldTraceVoltagePara(self, AILow=0, AIHigh=10, voltageLow=0, voltageHigh=100):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("ArcWeldTraceVoltagePara", AILow, AIHigh, voltageLow, voltageHigh)
+
+    """2025.04.16"""
+    """
+       @brief 设置焊接电压渐变开始
+       @param  [in] IOType 控制类型；0-控制箱IO；1-数字通信协议(UDP);2-数字通信协议(ModbusTCP)
+       @param  [in] voltageStart 起始焊接电压(V)
+       @param  [in] voltageEnd 终止焊接电压(V)
+       @param  [in] AOIndex 控制箱AO端口号(0-1)
+       @param  [in] blend 是否平滑 0-不平滑；1-平滑
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetVoltageGradualChangeStart(self, IOType, voltageStart, voltageEnd, AOIndex, blend):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("WeldingSetVoltageGradualChangeStart", IOType, voltageStart, voltageEnd, AOIndex, blend)
+
+    """
+       @brief 设置焊接电压渐变结束
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetVoltageGradualChangeEnd(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("WeldingSetVoltageGradualChangeEnd")
+
+    """
+       @brief 设置焊接电流渐变开始
+       @param  [in] IOType 控制类型；0-控制箱IO；1-数字通信协议(UDP);2-数字通信协议(ModbusTCP)
+       @param  [in] currentStart 起始焊接电流(A)
+       @param  [in] currentEnd 终止焊接电流(A)
+       @param  [in] AOIndex 控制箱AO端口号(0-1)
+       @param  [in] blend 是否平滑 0-不平滑；1-平滑
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetCurrentGradualChangeStart(self, IOType, currentStart, currentEnd, AOIndex, blend):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("WeldingSetCurrentGradualChangeStart", IOType, currentStart, currentEnd, AOIndex, blend)
+
+    """
+       @brief 设置焊接电流渐变结束
+       @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def WeldingSetCurrentGradualChangeEnd(self):
+        safety = self.GetSafetyCode()
+        if safety != 0:
+            return safety
+        return self.command("WeldingSetCurrentGradualChangeEnd")
+
+    """2025.09.18"""
+    """
+    @brief 设置自定义摆动参数
+    @param [in] id 自定义摆动编号：0-2
+    @param [in] pointNum 摆动点位个数 0-10
+    @param [in] point 移动端点数据x,y,z
+    @param [in] stayTime 摆动停留时间ms
+    @param [in] frequency 摆动频率 Hz
+    @param [in] incStayType 等待模式：0-周期不包含等待时间；1-周期包含等待时间
+    @param [in] stationary 摆动位置等待：0-等待时间内继续运动；1-等待时间内位置静止
+    @return 错误码 成功- 0, 失败-错误码
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def CustomWeaveSetPara(self, id, pointNum, point, stayTime, frequency, incStayType, stationary):
+        error = self.command("CustomWeaveSetPara", [id, pointNum, point, stayTime, frequency, incStayType, stationary])
+        return error
+
+    """
+    @brief 获取自定义摆动参数
+    @param [in] id 自定义摆动编号：0-2
+    @return 错误码 成功- 0, 失败-错误码
+    @return 返回值（调用成功返回） pointNum 摆动点位个数 0-10
+    @return 返回值（调用成功返回） point 移动端点数据x,y,z
+    @return 返回值（调用成功返回） stayTime 摆动停留时间ms
+    @return 返回值（调用成功返回） frequency 摆动频率 Hz
+    @return 返回值（调用成功返回） incStayType 等待模式：0-周期不包含等待时间；1-周期包含等待时间
+    @return 返回值（调用成功返回） stationary 摆动位置等待：0-等待时间内继续运动；1-等待时间内位置静止
+    """
+
+    @log_call
+    @xmlrpc_timeout
+    def CustomWeaveGetPara(self, id):
+        _error = self.query("CustomWeaveGetPara", id)
+        error = _error[0]
+        if error == 0:
+            paramStr = str(_error[1])
+            # print(f"{paramStr}\n")
+
+            parS = paramStr.split(',')
+            if len(parS) != 44:
+                return -1, None, None, None, None, None, None
+            return (error, int(parS[0]), [float(parS[1]),  float(parS[2]),  float(parS[3]),
+                                          float(parS[4]),  float(parS[5]),  float(parS[6]),
+                                          float(parS[7]),  float(parS[8]),  float(parS[9]),
+                                          float(parS[10]), float(parS[11]), float(parS[12]),
+                                          float(parS[13]), float(parS[14]), float(parS[15]),
+                                          float(parS[16]), float(parS[17]), float(parS[18]),
+                                          float(parS[19]), float(parS[20]), float(parS[21]),
+                                          float(parS[22]), float(parS[23]), float(parS[24]),
+                                          float(parS[25]), float(parS[26]), float(parS[27]),
+                                          float(parS[28]), float(parS[29]), float(parS[30])],
+                                          [float(parS[31]), float(parS[32]), float(parS[33]),
+                                           float(parS[34]), float(parS[35]), float(parS[36]),
+                                           float(parS[37]), float(parS[38]), float(parS[39]),
+                                           float(parS[40])],
+                                          float(parS[41]),int(parS[42]), int(parS[43]))
+        return error, None, None, None, None, None, None
@@ -0,0 +1,252 @@
+"""
+@brief  ServoJ/ServoCart 伺服指令流
+        调用方推入轨迹(列表或生成器)，预取线程提前完成参数转换与 XML-RPC 请求体编组，发送线程按绝对时间节拍 t0 + k*cmdT 下发，
+        不随单次调用耗时累积漂移。队列为空时重发上一个目标点(欠载)，发送超过一个周期时跳过已错过的节拍。
+        统计节拍抖动、错过节拍数、欠载次数与单次调用耗时。
+"""
+
+import socket
+import threading
+import time
+from array import array
+from queue import Queue, Empty, Full
+
+from .Robot import RobotError, RobotDisconnected
+from .Signatures import signature
+
+
+class ServoStreamer:
+    MODE_JOINT = 0  # ServoJ
+    MODE_CART = 1  # ServoCart
+    PREFETCH = 32  # 预取队列长度
+    SPIN_TIME = 0.001  # 节拍前最后一段忙等，减小 sleep 唤醒误差
+    JITTER_SAMPLES = 4096  # 抖动采样环形缓冲，用于计算分位数
+
+    def __init__(self, rpc, mode=MODE_JOINT, cmdT=0.008, prefetch=PREFETCH, axisPos=(0.0, 0.0, 0.0, 0.0),
+                 cart_mode=0, pos_gain=(1.0, 1.0, 1.0, 1.0, 1.0, 1.0), acc=0.0, vel=0.0, filterT=0.0, gain=0.0, id=0):
+        """
+        @param rpc RPC 实例
+        @param mode MODE_JOINT-ServoJ，MODE_CART-ServoCart
+        @param cmdT 指令下发周期，单位s
+        @param prefetch 预取队列长度
+        @param axisPos ServoJ 默认外部轴位置，轨迹点为 (joint_pos, axisPos) 时使用点内的值
+        @param cart_mode ServoCart 运动模式 [0]-绝对运动(基坐标系)，[1]-增量运动(基坐标系)，[2]-增量运动(工具坐标系)
+        其余参数与 ServoJ/ServoCart 相同
+        """
+        self.rpc = rpc
+        self.mode = mode
+        self.cmdT = float(cmdT)
+        self.axisPos = list(map(float, axisPos))
+        self.cart_mode = int(cart_mode)
+        self.pos_gain = list(map(float, pos_gain))
+        self.acc = float(acc)
+        self.vel = float(vel)
+        self.filterT = float(filterT)
+        self.gain = float(gain)
+        self.id = int(id)
+        self.servo_j = signature("ServoJ")
+        self.servo_cart = signature("ServoCart")
+
+        self.queue = Queue(maxsize=prefetch)
+        self.stop_event = threading.Event()
+        self.source_done = threading.Event()
+        self.feeder = None
+        self.sender = None
+        self.error = 0  # 非0时为导致下发中止的错误码(发送失败或轨迹源异常)
+        self.active = False  # 已 ServoMoveStart 且未 ServoMoveEnd
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.sent = 0
+        self.underruns = 0
+        self.missed_deadlines = 0
+        self.send_errors = 0
+        self.jitter_max = 0.0
+        self.jitter_sum = 0.0
+        self.call_time_max = 0.0
+        self.call_time_sum = 0.0
+        self.jitter_samples = array('d', bytes(8 * self.JITTER_SAMPLES))
+
+    def convert(self, target):
+        """将轨迹点编组为 ServoJ/ServoCart 的 XML-RPC 请求体，在预取线程中执行"""
+        if self.mode == self.MODE_JOINT:
+            if len(target) == 2:
+                joint_pos, axisPos = target
+            else:
+                joint_pos, axisPos = target, self.axisPos
+            return self.servo_j.marshal(joint_pos, axisPos, self.acc, self.vel, self.cmdT, self.filterT,
+                                        self.gain, self.id)
+        return self.servo_cart.marshal(self.cart_mode, target, self.pos_gain, self.acc, self.vel, self.cmdT,
+                                       self.filterT, self.gain)
+
+    def start(self, source):
+        """
+        开始伺服运动并下发轨迹
+        @param source 轨迹点列表或生成器；ServoJ 为 joint_pos 或 (joint_pos, axisPos)，ServoCart 为 desc_pos
+        @return 错误码 成功-0  失败-错误码
+        """
+        if self.sender is not None and self.sender.is_alive():
+            return RobotError.ERR_OTHER
+        self.stop_event.clear()
+        self.source_done.clear()
+        self.queue = Queue(maxsize=self.queue.maxsize)
+        self.error = 0
+        self.reset_stats()
+        error = self.rpc.ServoMoveStart()
+        if error != 0:
+            return error
+        self.active = True
+        self.feeder = threading.Thread(target=self.feed_routine, args=(iter(source),), daemon=True)
+        self.sender = threading.Thread(target=self.send_routine, daemon=True)
+        self.feeder.start()
+        # 先预取一部分，避免开头就欠载；最多等待一个队列长度的周期
+        prefetch_end = time.perf_counter() + self.queue.maxsize * self.cmdT
+        while not self.queue.full() and not self.source_done.is_set() and time.perf_counter() < prefetch_end:
+            time.sleep(0.0005)
+        self.sender.start()
+        return 0
+
+    def feed_routine(self, source):
+        try:
+            for target in source:
+                item = self.convert(target)
+                while not self.stop_event.is_set():
+                    try:
+                        self.queue.put(item, timeout=0.1)
+                        break
+                    except Full:
+                        pass
+                if self.stop_event.is_set():
+                    return
+        except Exception as ex:
+            # 轨迹源或参数转换出错：停止下发，由 run() 返回错误码，而不是发完已预取的点后返回成功
+            self.rpc.log_error(f"ServoStreamer trajectory source failed: {ex}")
+            if self.error == 0:
+                self.error = RobotError.ERR_OTHER
+            self.stop_event.set()
+        finally:
+            self.source_done.set()
+
+    def send_routine(self):
+        send = self.rpc.send_request
+        cmdT = self.cmdT
+        item = None
+        tick = 0
+        t0 = time.perf_counter()
+        while not self.stop_event.is_set():
+            deadline = t0 + tick * cmdT
+            now = time.perf_counter()
+            if deadline - now > self.SPIN_TIME:
+                time.sleep(deadline - now - self.SPIN_TIME)
+            # 最后一段忙等不超过 SPIN_TIME，并响应 stop()
+            spin_end = min(deadline, time.perf_counter() + self.SPIN_TIME)
+            while time.perf_counter() < spin_end and not self.stop_event.is_set():
+                pass
+            if self.stop_event.is_set():
+                break
+
+            try:
+                item = self.queue.get_nowait()
+            except Empty:
+                if self.source_done.is_set() and self.queue.empty():
+                    break
+                self.underruns += 1
+                if item is None:
+                    tick += 1
+                    continue
+                # 欠载时保持上一个目标点，ServoCart 增量模式不重发
+                if self.mode == self.MODE_CART and self.cart_mode != 0:
+                    tick += 1
+                    continue
+
+            try:
+                safety = self.rpc.GetSafetyCode()
+                if safety != 0:
+                    self.error = safety
+                    break
+                start = time.perf_counter()
+                jitter = start - deadline
+                error = send(item)
+            except RobotDisconnected:
+                error = RobotError.ERROR_RECONN  # 断线且重连策略为立即失败或等待超时
+            except socket.error as ex:
+                self.rpc.log_error(f"ServoStreamer send failed after reconnect: {ex}")
+                error = RobotError.ERR_SOCKET_COM_FAILED
+            except Exception as ex:
+                # XML-RPC Fault、socket 超时等：不能让发送线程静默退出而 run() 返回成功
+                self.rpc.log_error(f"ServoStreamer send failed: {ex}")
+                error = RobotError.ERR_OTHER
+            if error != 0:
+                self.send_errors += 1
+                self.error = error
+                break
+            end = time.perf_counter()
+            self.record(jitter, end - start)
+
+            # 跳过已经错过的节拍
+            tick += 1
+            late = int((end - t0) / cmdT) - tick + 1
+            if late > 0:
+                self.missed_deadlines += late
+                tick += late
+        self.source_done.set()
+
+    def record(self, jitter, call_time):
+        self.jitter_samples[self.sent % self.JITTER_SAMPLES] = jitter
+        self.sent += 1
+        self.jitter_sum += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        self.call_time_sum += call_time
+        self.call_time_max = max(self.call_time_max, call_time)
+
+    def wait(self, timeout=None):
+        """等待轨迹下发完成，返回 True-完成，False-超时"""
+        if self.sender is None:
+            return True
+        self.sender.join(timeout)
+        return not self.sender.is_alive()
+
+    def stop(self):
+        """停止下发并结束伺服运动，返回 ServoMoveEnd 错误码"""
+        self.stop_event.set()
+        for thread in (self.sender, self.feeder):
+            if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+                thread.join()
+        if not self.active:
+            return 0
+        self.active = False
+        return self.rpc.ServoMoveEnd()
+
+    def run(self, source, timeout=None):
+        """下发整条轨迹并等待完成，返回错误码"""
+        error = self.start(source)
+        if error != 0:
+            return error
+        self.wait(timeout)
+        end_error = self.stop()
+        return self.error if self.error != 0 else end_error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def stats(self):
+        """
+        @return {sent, underruns, missed_deadlines, send_errors, jitter_avg_ms, jitter_max_ms,
+                 jitter_p99_ms, call_time_avg_ms, call_time_max_ms}
+        """
+        count = min(self.sent, self.JITTER_SAMPLES)
+        samples = sorted(self.jitter_samples[:count])
+        return {
+            "sent": self.sent,
+            "underruns": self.underruns,
+            "missed_deadlines": self.missed_deadlines,
+            "send_errors": self.send_errors,
+            "jitter_avg_ms": self.jitter_sum * 1000 / self.sent if self.sent else 0.0,
+            "jitter_max_ms": self.jitter_max * 1000,
+            "jitter_p99_ms": samples[int(count * 0.99)] * 1000 if count else 0.0,
+            "call_time_avg_ms": self.call_time_sum * 1000 / self.sent if self.sent else 0.0,
+            "call_time_max_ms": self.call_time_max * 1000,
+        }
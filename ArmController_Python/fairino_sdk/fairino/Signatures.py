@@ -0,0 +1,575 @@
+"""
+@brief  XML-RPC 指令参数签名表与预编译编组
+        SDK_SIGNATURES 按控制器指令名声明各参数类型，首次调用某指令时生成该指令专用的参数转换函数与请求体模板，
+        之后每次调用只做类型转换与一次字符串格式化，生成的请求体与 xmlrpc.client.dumps 逐字节一致。
+        列表参数接受 list/tuple/NumPy 数组，NumPy 数组经 tolist() 一次转换，不逐元素转换 NumPy 标量。
+        类型代码：i-int，f-float，s-str，F-float 列表(F6 等表示固定长度，长度不符时抛出 ValueError)，I-int 列表，
+        A(...)-由若干组拼成的一个混合数组，如 MoveL 的 A(F6,F6,i,i,f)：参数为各组组成的序列，组内只能是 i/f/F<n>
+"""
+
+import threading
+from xml.sax.saxutils import escape
+
+XML_HEADER = "<?xml version='1.0'?>\n<methodCall>\n<methodName>%s</methodName>\n<params>\n"
+XML_FOOTER = "</params>\n</methodCall>\n"
+XML_VALUES = {
+    "i": "<value><int>%d</int></value>",
+    "f": "<value><double>%r</double></value>",
+    "s": "<value><string>%s</string></value>",
+    "F": "<value><array><data>\n%s</data></array></value>",
+    "I": "<value><array><data>\n%s</data></array></value>",
+    "A": "<value><array><data>\n%s</data></array></value>",
+}
+DOUBLE = "<value><double>%r</double></value>\n".__mod__
+INT = "<value><int>%d</int></value>\n".__mod__
+ELEMENTS = {"i": ("int", "<value><int>%d</int></value>\n"), "f": ("float", "<value><double>%r</double></value>\n")}
+
+
+def floats(value, count=None, where=None):
+    """转换为 float 列表，NumPy 数组先整体 tolist()"""
+    if type(value) is not list and hasattr(value, "tolist"):
+        value = value.tolist()
+    value = list(map(float, value))
+    if count is not None and len(value) != count:
+        raise ValueError("%s 需要 %d 个数值，实际为 %d 个" % (where, count, len(value)))
+    return value
+
+
+def ints(value):
+    if type(value) is not list and hasattr(value, "tolist"):
+        value = value.tolist()
+    return list(map(int, value))
+
+
+def doubles(values):
+    return "".join(map(DOUBLE, values))
+
+
+def integers(values):
+    return "".join(map(INT, values))
+
+
+class Signature:
+    """一条指令的编组函数：coerce(*args) 返回转换后的参数元组，render(values) 返回 XML-RPC 请求体"""
+
+    __slots__ = ("name", "codes", "coerce", "render")
+
+    def __init__(self, name, codes):
+        self.name = name
+        self.codes = codes.split()
+        args = ["a%d" % i for i in range(len(self.codes))]
+        coerce_items = []
+        render_items = []
+        fragments = []
+        for i, code in enumerate(self.codes):
+            value = "v[%d]" % i
+            kind, count = code[0], code[1:]
+            if kind == "i":
+                coerce_items.append("int(%s)" % args[i])
+                render_items.append(value)
+            elif kind == "f":
+                coerce_items.append("float(%s)" % args[i])
+                render_items.append(value)
+            elif kind == "s":
+                coerce_items.append("str(%s)" % args[i])
+                render_items.append("escape(%s)" % value)
+            elif kind == "F":
+                where = "%s 参数 %d" % (name, i + 1)
+                coerce_items.append("floats(%s, %s, %r)" % (args[i], count or None, where))
+                render_items.append("doubles(%s)" % value)
+            elif kind == "I":
+                coerce_items.append("ints(%s)" % args[i])
+                render_items.append("integers(%s)" % value)
+            elif kind == "A":
+                coerce, elements = self.compile_group(name, i, args[i], count)
+                coerce_items.append(coerce)
+                render_items.append("*" + value)
+                fragments.append("<param>\n%s\n</param>\n" % (XML_VALUES[kind] % elements))
+                continue
+            else:
+                raise ValueError("%s: 未知类型代码 %s" % (name, code))
+            fragments.append("<param>\n%s\n</param>\n" % XML_VALUES[kind])
+        template = XML_HEADER % name + "".join(fragments) + XML_FOOTER
+        source = ("def coerce(%s):\n    return (%s)\n"
+                  "def render(v):\n    return (TEMPLATE %% (%s)).encode('utf-8', 'xmlcharrefreplace')\n"
+                  % (", ".join(args), "".join(item + ", " for item in coerce_items),
+                     "".join(item + ", " for item in render_items)))
+        namespace = {"TEMPLATE": template, "floats": floats, "ints": ints, "doubles": doubles,
+                     "integers": integers, "escape": escape}
+        exec(compile(source, "<signature %s>" % name, "exec"), namespace)
+        self.coerce = namespace["coerce"]
+        self.render = namespace["render"]
+
+    @staticmethod
+    def compile_group(name, index, arg, group):
+        """A(...) 类型：返回生成平铺列表的表达式与数组元素模板，每个元素在模板中占一个固定位置"""
+        if not (group.startswith("(") and group.endswith(")")):
+            raise ValueError("%s: A 类型需要写成 A(...)" % name)
+        items = []
+        elements = []
+        for k, sub in enumerate(group[1:-1].split(",")):
+            kind, count = sub[0], sub[1:]
+            element = "%s[%d]" % (arg, k)
+            if kind in ELEMENTS and not count:
+                items.append("%s(%s)" % (ELEMENTS[kind][0], element))
+                elements.append(ELEMENTS[kind][1])
+            elif kind == "F" and count:
+                where = "%s 参数 %d 第 %d 组" % (name, index + 1, k + 1)
+                items.append("*floats(%s, %s, %r)" % (element, count, where))
+                elements.append(ELEMENTS["f"][1] * int(count))
+            else:
+                raise ValueError("%s: A(...) 内不支持类型代码 %s" % (name, sub))
+        return "[%s]" % ", ".join(items), "".join(elements)
+
+    def marshal(self, *args):
+        return self.render(self.coerce(*args))
+
+
+compiled = {}  # 指令名 -> Signature，首次使用时生成
+compile_lock = threading.Lock()
+
+
+def signature(name):
+    """
+    返回指令 name 的 Signature，未在 SDK_SIGNATURES 中声明时抛出 KeyError
+    name 可写作 "指令名:变体"，用于同一指令的另一种参数布局，如 "MoveL:legacy"，请求中的指令名不含变体
+    """
+    sig = compiled.get(name)
+    if sig is None:
+        with compile_lock:
+            sig = compiled.get(name)
+            if sig is None:
+                sig = compiled[name] = Signature(name.partition(":")[0], SDK_SIGNATURES[name])
+    return sig
+
+
+# 控制器指令名 -> 参数类型，按 Robot.py 与各功能模块中的顺序排列
+SDK_SIGNATURES = {
+    "GetForwardKin": "F6",
+    "GetInverseKin": "i F6 i",
+    "GetControllerIP": "",
+    "Mode": "i",
+    "DragTeachSwitch": "i",
+    "IsInDragTeach": "",
+    "RobotEnable": "i",
+    "StartJOG": "i i i f f f",
+    "StopJOG": "i",
+    "ImmStopJOG": "",
+    "MoveJ": "F6 F6 i i f f f F4 f i F6",
+    "JointOverSpeedProtectStart": "i i",
+    "JointOverSpeedProtectEnd": "",
+    "MoveL": "A(F6,F6,i,i,f,f,f,f,i,F4,i,i,F6,f,i)",
+    "MoveC": "A(F6,F6,i,i,f,f,F4,i,F6,F6,F6,i,i,f,f,F4,i,F6,f,f,f,i)",
+    "Circle": "A(F6,F6,i,i,f,f,F4,F6,F6,i,i,f,f,F4,f,i,F6,f,f,i)",
+    "NewSpiral": "A(F6,F6,i,i,f,f,F4,f,i,F6,f,f,f,f,f,i,i)",
+    "ServoMoveStart": "",
+    "ServoMoveEnd": "",
+    "ServoJ": "F6 F f f f f f i",
+    "ServoCart": "i F6 F6 f f f f f",
+    "ServoJTStart": "",
+    "ServoJT": "F f",
+    "ServoJTEnd": "",
+    "MoveCart": "F6 i i f f f f i",
+    "SplinePTP": "F6 F6 i i f f f",
+    "SplineStart": "",
+    "SplineEnd": "",
+    "NewSplineStart": "i i",
+    "NewSplinePoint": "F6 F6 i i f f f f i",
+    "NewSplineEnd": "",
+    "StopMotion": "",
+    "PointsOffsetEnable": "i F",
+    "PointsOffsetDisable": "",
+    "SetDO": "i i i i",
+    "SetToolDO": "i i i i",
+    "SetAO": "i f i",
+    "SetToolAO": "i f i",
+    "WaitDI": "i i i i",
+    "WaitMultiDI": "i i i i i",
+    "WaitToolDI": "i i i i",
+    "WaitAI": "i i f i i",
+    "WaitToolAI": "i i f i i",
+    "SetSpeed": "i",
+    "SetSysVarValue": "i f",
+    "SetToolPoint": "i",
+    "ComputeTool": "",
+    "SetTcp4RefPoint": "i",
+    "ComputeTcp4": "",
+    "SetToolCoord": "i F i i i i",
+    "SetToolList": "i F i i i",
+    "SetExTCPPoint": "i",
+    "ComputeExTCF": "",
+    "SetExToolCoord": "i F F",
+    "SetExToolList": "i F F",
+    "SetWObjCoordPoint": "i",
+    "ComputeWObjCoord": "i i",
+    "SetWObjCoord": "i F i",
+    "SetWObjList": "i F i",
+    "SetLoadWeight": "i f",
+    "SetRobotInstallPos": "i",
+    "SetRobotInstallAngle": "f f",
+    "SetLoadCoord": "f f f i",
+    "WaitMs": "i",
+    "SetAnticollision": "i F i",
+    "SetCollisionStrategy": "i i i i I",
+    "SetLimitPositive": "F",
+    "SetLimitNegative": "F",
+    "ResetAllError": "",
+    "FrictionCompensationOnOff": "i",
+    "SetFrictionValue_level": "F",
+    "SetFrictionValue_wall": "F",
+    "SetFrictionValue_ceiling": "F",
+    "SetFrictionValue_freedom": "F",
+    "GetRobotInstallAngle": "",
+    "GetSysVarValue": "i",
+    "GetActualJointPosRadian": "i",
+    "GetInverseKinRef": "i F6 F6",
+    "GetInverseKinHasSolution": "i F6 F6",
+    "GetTargetPayload": "i",
+    "GetTargetPayloadCog": "i",
+    "GetTCPOffset": "i",
+    "GetWObjOffset": "i",
+    "GetJointSoftLimitDeg": "i",
+    "GetSystemClock": "",
+    "GetRobotCurJointsConfig": "",
+    "GetDefaultTransVel": "",
+    "GetRobotTeachingPoint": "s",
+    "GetSSHKeygen": "",
+    "SetSSHScpCmd": "i s s s s",
+    "ComputeFileMD5": "s",
+    "GetSoftwareVersion": "",
+    "GetSlaveHardVersion": "",
+    "GetSlaveFirmVersion": "",
+    "GetDHCompensation": "",
+    "SetTPDParam": "i s i i i",
+    "SetTPDStart": "i s i i i",
+    "SetWebTPDStop": "",
+    "SetTPDDelete": "s",
+    "LoadTPD": "s",
+    "GetTPDStartPose": "s",
+    "MoveTPD": "s i f",
+    "LoadTrajectoryJ": "s f i",
+    "MoveTrajectoryJ": "",
+    "GetTrajectoryStartPose": "s",
+    "GetTrajectoryPointNum": "",
+    "SetTrajectoryJSpeed": "f",
+    "SetTrajectoryJForceTorque": "F",
+    "SetTrajectoryJForceFx": "f",
+    "SetTrajectoryJForceFy": "f",
+    "SetTrajectoryJTorqueTx": "f",
+    "LoadDefaultProgConfig": "i s",
+    "ProgramLoad": "s",
+    "GetCurrentLine": "",
+    "ProgramRun": "",
+    "ProgramPause": "",
+    "ProgramResume": "",
+    "ProgramStop": "",
+    "GetLoadedProgram": "",
+    "GetGripperConfig": "",
+    "ActGripper": "i i",
+    "MoveGripper": "i i i i i i i f i i",
+    "GetGripperMotionDone": "",
+    "SetGripperConfig": "i i i i",
+    "ComputePrePick": "F6 f f",
+    "ComputePostPick": "F6 f f",
+    "PointTableDownload": "s",
+    "PointTableUpload": "s",
+    "PointTableSwitch": "s",
+    "PointTableUpdateLua": "s",
+    "FileDownload": "i s",
+    "FileUpload": "i s",
+    "FileDelete": "i s",
+    "LuaUpLoadUpdate": "s",
+    "GetLuaList": "",
+    "SetOaccScale": "f",
+    "MoveAOStart": "i i i i",
+    "MoveAOStop": "",
+    "MoveToolAOStart": "i i i i",
+    "MoveToolAOStop": "",
+    "AxleSensorConfig": "i i i i",
+    "AxleSensorConfigGet": "",
+    "AxleSensorActivate": "i",
+    "AxleSensorRegWrite": "i i i i i i i",
+    "SetOutputResetCtlBoxDO": "i",
+    "SetOutputResetCtlBoxAO": "i",
+    "SetOutputResetAxleDO": "i",
+    "SetOutputResetAxleAO": "i",
+    "SetOutputResetExtDO": "i",
+    "SetOutputResetExtAO": "i",
+    "SetOutputResetSmartToolDO": "i",
+    "SetCollisionDetectionMethod": "i i",
+    "SetStaticCollisionOnOff": "i",
+    "SetPowerLimit": "i f",
+    "SetRobotRealtimeStateSamplePeriod": "i",
+    "GetRobotRealtimeStateSamplePeriod": "",
+    "AngularSpeedStart": "i",
+    "AngularSpeedEnd": "",
+    "GetAxleCommunicationParam": "",
+    "SetAxleCommunicationParam": "i i i i i i i",
+    "SetAxleFileType": "i",
+    "SetAxleLuaEnable": "i",
+    "SetRecoverAxleLuaErr": "i",
+    "GetAxleLuaEnableStatus": "",
+    "SetAxleLuaEnableDeviceType": "i i i",
+    "GetAxleLuaEnableDeviceType": "",
+    "GetAxleLuaEnableDevice": "",
+    "SetAxleLuaGripperFunc": "i I",
+    "GetAxleLuaGripperFunc": "i",
+    "SetCtrlOpenLUAName": "i s",
+    "GetCtrlOpenLUAName": "",
+    "LoadCtrlOpenLUA": "i",
+    "UnloadCtrlOpenLUA": "i",
+    "SetCtrlOpenLuaErrCode": "i",
+    "SlaveFileWrite": "i i s",
+    "SetSysServoBootMode": "",
+    "SingularAvoidStart": "i f f f",
+    "SingularAvoidEnd": "",
+    "PtpFIRPlanningStart": "f f",
+    "PtpFIRPlanningEnd": "",
+    "LinArcFIRPlanningStart": "f f f f",
+    "LinArcFIRPlanningEnd": "",
+    "ToolTrsfStart": "i",
+    "ToolTrsfEnd": "",
+    "ComputeToolCoordWithPoints": "i f f f f f f",
+    "ComputeWObjCoordWithPoints": "i f f f i",
+    "LoadTrajectoryLA": "s i f i f f f f i",
+    "MoveTrajectoryLA": "",
+    "CustomCollisionDetectionStart": "i F F i",
+    "CustomCollisionDetectionEnd": "",
+    "AccSmoothStart": "i",
+    "AccSmoothEnd": "i",
+    "RbLogDownloadPrepare": "",
+    "AllDataSourceDownloadPrepare": "",
+    "DataPackageDownloadPrepare": "",
+    "GetRobotSN": "",
+    "ShutDownRobotOS": "",
+    "SetWideBoxTempFanMonitorParam": "i i",
+    "GetWideBoxTempFanMonitorParam": "",
+    "GetFieldBusConfig": "",
+    "FieldBusSlaveWriteDO": "i i I",
+    "FieldBusSlaveWriteAO": "i i I",
+    "FieldBusSlaveReadDI": "i i",
+    "FieldBusSlaveReadAI": "i i",
+    "FieldBusSlaveWaitDI": "i i i",
+    "FieldBusSlaveWaitAI": "i i f i",
+    "SetSuckerCtrl": "i i I",
+    "GetSuckerState": "i",
+    "WaitSuckerState": "i i i",
+    "CtrlOpenLuaUpLoadCheck": "s",
+    "SetTorqueDetectionSwitch": "i",
+    "GetToolCoordWithID": "i",
+    "GetWObjCoordWithID": "i",
+    "GetExToolCoordWithID": "i",
+    "GetExAxisCoordWithID": "i",
+    "GetTargetPayloadWithID": "i",
+    "JointSensitivityEnable": "I",
+    "JointSensitivityCalibration": "",
+    "JointSensitivityCollect": "",
+    "MotionQueueClear": "",
+    "GetSlavePortErrCounter": "",
+    "SlavePortErrCounterClear": "i",
+    "SetVelFeedForwardRatio": "F6",
+    "GetVelFeedForwardRatio": "",
+    "RobotMCULogCollect": "",
+    # RobotForce (力控)
+    "FT_GetConfig": "",
+    "FT_SetConfig": "i i i i",
+    "FT_Activate": "i",
+    "FT_SetZero": "i",
+    "FT_SetRCS": "i F6",
+    "FT_PdIdenCompute": "",
+    "FT_PdIdenRecord": "i",
+    "FT_PdCogIdenCompute": "",
+    "FT_PdCogIdenRecord": "i i",
+    "FT_Guard": "i i I F F F",
+    "FT_Control": "i i I F F i i f f f i i F4 i",
+    "FT_SpiralSearch": "i f f f f",
+    "FT_RotInsertion": "i f f f i f i",
+    "FT_LinInsertion": "i f f f f i",
+    "FT_CalCenterStart": "",
+    "FT_CalCenterEnd": "",
+    "FT_FindSurface": "i i i f f f f",
+    "FT_ComplianceStop": "",
+    "FT_ComplianceStart": "f f",
+    "LoadIdentifyDynFilterInit": "",
+    "LoadIdentifyDynVarInit": "",
+    "LoadIdentifyMain": "F F6 f",
+    "LoadIdentifyGetResult": "F",
+    "EndForceDragControl": "i i i i i F F F F f f",
+    "SetForceSensorDragAutoFlag": "i",
+    "ForceAndJointImpedanceStartStop": "i i F F F f f",
+    "GetForceAndTorqueDragState": "",
+    "SetForceSensorPayload": "f",
+    "SetForceSensorPayloadCog": "f f f",
+    "GetForceSensorPayload": "",
+    "GetForceSensorPayloadCog": "",
+    "ForceSensorComputeLoad": "",
+    "ForceSensorSetSaveDataFlag": "i",
+    "ImpedanceControlStartStop": "A(i,i,F6,F6,F6,F6,f,f,f,f)",
+    # RobotConveyor (传送带)
+    "ConveyorStartEnd": "i",
+    "ConveyorPointIORecord": "",
+    "ConveyorPointARecord": "",
+    "ConveyorRefPointRecord": "",
+    "ConveyorPointBRecord": "",
+    "ConveyorIODetect": "i",
+    "ConveyorGetTrackData": "i",
+    "ConveyorTrackStart": "i",
+    "ConveyorTrackEnd": "",
+    "ConveyorSetParam": "F i i i",
+    "ConveyorCatchPointComp": "F",
+    "ConveyorTrackMoveL": "s i i f f f f i i",
+    "ConveyorComDetect": "i",
+    # RobotWeld (焊接)
+    "ARCStart": "i i i",
+    "ARCEnd": "i i i",
+    "WeldingSetCurrentRelation": "f f f f i",
+    "WeldingSetVoltageRelation": "f f f f i",
+    "WeldingGetCurrentRelation": "",
+    "WeldingGetVoltageRelation": "",
+    "WeldingSetCurrent": "i f i i",
+    "WeldingSetVoltage": "i f i i",
+    "WeaveSetPara": "i i f i f f f i i i i i f f",
+    "WeaveOnlineSetPara": "i i f i f i i i i",
+    "WeaveStart": "i",
+    "WeaveEnd": "i",
+    "SetForwardWireFeed": "i i",
+    "SetReverseWireFeed": "i i",
+    "SetAspirated": "i i",
+    "GetSegmentWeldPoint": "F F f",
+    "GetSegWeldDisDir": "f f f f f f",
+    "MoveL:legacy": "F6 F6 i i f f f f i F4 i i F6",
+    "SegmentWeldEnd": "i i i",
+    "WireSearchStart": "i f i i f i i",
+    "WireSearchEnd": "i f i i f i i",
+    "GetWireSearchOffset": "i i s s s s s s s s s s s s",
+    "WireSearchWait": "s",
+    "SetPointToDatabase": "s F",
+    "ArcWeldTraceControl": "i f i F4 i F4 i i f f f i i",
+    "ArcWeldTraceExtAIChannelConfig": "i",
+    "WeaveStartSim": "i",
+    "WeaveEndSim": "i",
+    "WeaveInspectStart": "i",
+    "WeaveInspectEnd": "i",
+    "WeldingSetProcessParam": "i f f f f f f f f",
+    "WeldingGetProcessParam": "i",
+    "SetAirControlExtDoNum": "i",
+    "SetArcStartExtDoNum": "i",
+    "SetWireReverseFeedExtDoNum": "i",
+    "SetWireForwardFeedExtDoNum": "i",
+    "SetArcDoneExtDiNum": "i",
+    "SetWeldReadyExtDiNum": "i",
+    "SetExtDIWeldBreakOffRecover": "i i",
+    "ArcWeldTraceReplayStart": "",
+    "ArcWeldTraceReplayEnd": "",
+    "MultilayerOffsetTrsfToBase": "f f f f f f f f f f f f",
+    "TractorEnable": "i",
+    "TractorHoming": "",
+    "TractorMoveL": "f f",
+    "TractorMoveC": "f f f",
+    "SetWireSearchExtDIONum": "i i",
+    "SetWeldMachineCtrlModeExtDoNum": "i",
+    "SetWeldMachineCtrlMode": "i",
+    "WeldingSetCheckArcInterruptionParam": "i i",
+    "WeldingGetCheckArcInterruptionParam": "",
+    "WeldingSetReWeldAfterBreakOffParam": "i f f i",
+    "WeldingGetReWeldAfterBreakOffParam": "",
+    "WeldingStartReWeldAfterBreakOff": "",
+    "WeldingAbortWeldAfterBreakOff": "",
+    "WeaveChangeStart": "i i f f",
+    "WeaveChangeEnd": "",
+    "ArcWeldTraceAIChannelCurrent": "i",
+    "ArcWeldTraceAIChannelVoltage": "i",
+    "ArcWeldTraceCurrentPara": "f f f f",
+    "ArcWeldTraceVoltagePara": "f f f f",
+    "WeldingSetVoltageGradualChangeStart": "i f f i i",
+    "WeldingSetVoltageGradualChangeEnd": "",
+    "WeldingSetCurrentGradualChangeStart": "i f f i i",
+    "WeldingSetCurrentGradualChangeEnd": "",
+    "CustomWeaveSetPara": "A(i,i,F30,F10,f,i,i)",
+    "CustomWeaveGetPara": "i",
+    # RobotLaser (激光跟踪)
+    "LaserSensorRecord": "i i i i f f f",
+    "LaserTrackingLaserOn": "i",
+    "LaserTrackingLaserOff": "",
+    "LaserTrackingTrackOn": "i",
+    "LaserTrackingTrackOff": "",
+    "LaserTrackingSearchStart": "i f f f i i i i",
+    "LaserTrackingSearchStop": "",
+    "SetFocusCalibPoint": "i f f f f f f",
+    "ComputeFocusCalib": "i",
+    "FocusStart": "f f f f i",
+    "FocusEnd": "",
+    "SetFocusPosition": "f f f",
+    "LaserRecordPoint": "i i i",
+    "LaserTrackingLaserOnOff": "i i",
+    "LaserTrackingTrackOnOff": "i i",
+    "LaserTrackingSearchStart_xyz": "i i i i i",
+    "LaserTrackingSearchStart_point": "i i i i i f f f",
+    "LaserTrackingSensorConfig": "s i",
+    "LaserTrackingSensorSamplePeriod": "i",
+    "LoadPosSensorDriver": "i",
+    "UnLoadPosSensorDriver": "",
+    "LaserSensorRecord1": "i i",
+    "LaserSensorReplay": "i i f",
+    "MoveLTR": "i",
+    "LaserSensorRecordandReplay": "i i i i f f f",
+    "MoveToLaserRecordStart": "i f",
+    "MoveToLaserRecordEnd": "i f",
+    "MoveToLaserSeamPos": "A(i,f,i,i,i,F6)",
+    "GetLaserSeamPos": "A(i,F6)",
+    # RobotExtAxis (外部轴)
+    "AuxServoSetParam": "i i i i i f",
+    "AuxServoGetParam": "i",
+    "AuxServoEnable": "i i",
+    "AuxServoSetControlMode": "i i",
+    "AuxServoSetTargetPos": "i f f f",
+    "AuxServoSetTargetSpeed": "i f f",
+    "AuxServoSetTargetTorque": "i f",
+    "AuxServoHoming": "i i f f f",
+    "AuxServoClearError": "i",
+    "AuxServoGetStatus": "i",
+    "AuxServoSetStatusID": "i",
+    "SetExDevProtocol": "i",
+    "GetExDevProtocol": "",
+    "ExtDevSetUDPComParam": "s i i i i i i i i i",
+    "ExtDevGetUDPComParam": "",
+    "ExtDevLoadUDPDriver": "",
+    "ExtDevUnloadUDPDriver": "",
+    "ExtDevUDPClientComReset": "",
+    "ExtDevUDPClientComClose": "",
+    "SetRobotPosToAxis": "i",
+    "SetAxisDHParaConfig": "i f f f f f f f f",
+    "ExtAxisParamConfig": "i i i f f f f f i f i i i",
+    "GetExAxisDriverConfig": "i",
+    "ExtAxisSetRefPoint": "i",
+    "ExtAxisComputeECoordSys": "",
+    "SetRefPointInExAxisEnd": "f f f f f f",
+    "PositionorSetRefPoint": "i",
+    "PositionorComputeECoordSys": "",
+    "ExtAxisActiveECoordSys": "i i f f f f f f i",
+    "ExtAxisServoOn": "i i",
+    "ExtAxisSetHoming": "i i f f",
+    "ExtAxisStartJog": "i i i f f f",
+    "SetAuxDO": "i i i i",
+    "SetAuxAO": "i f i",
+    "SetAuxDIFilterTime": "i",
+    "SetAuxAIFilterTime": "i i",
+    "WaitAuxDI": "i i i i",
+    "WaitAuxAI": "i i i i i",
+    "GetAuxDI": "i i",
+    "GetAuxAI": "i i",
+    "ExtAxisMoveJ": "i f f f f f f",
+    "MoveC:legacy": "F6 F6 F4 F4 i F6 F6 F6 F4 F4 i F6 f f",
+    "AuxServoSetAcc": "f f",
+    "AuxServoSetEmergencyStopAcc": "f f",
+    "AuxServoGetEmergencyStopAcc": "",
+    "AuxServoGetAcc": "",
+    "ExtAxisGetCoord": "",
+    "SetExAxisRobotPlan": "i",
+    # RobotUpgrade (固件升级)
+    "SoftwareUpgrade": "",
+    "SetEncoderUpgrade": "s",
+    "JointAllParamUpgrade": "",
+    "KernelUpgrade": "",
+    "GetKernelUpgradeResult": "",
+}
@@ -0,0 +1,253 @@
+"""
+@brief  20004 实时状态转发
+        一个进程持有与控制器的状态连接(StateBroker)，把每帧状态转发给本机多个订阅者(StateSubscriber)，
+        各订阅者不再各自连接 20004、各自解析。订阅时可指定字段与降频倍数，只传输所选字段。
+        传输使用本机 TCP(默认 127.0.0.1:20104)或 Unix 域套接字(地址为文件路径时)。
+        协议：订阅者发送一行 JSON {"fields": [...]|null, "decimation": n}，转发端回复一行 JSON
+        {"record_size", "fields"}，之后连续发送定长记录，记录格式与 StateRecorder 相同(序号, 时间戳, 所选字段)。
+        慢速订阅者的发送队列满时丢弃最旧的帧，不阻塞状态线程。
+"""
+
+import ctypes
+import json
+import os
+import socket
+import threading
+from collections import deque
+
+from .Robot import RobotStatePkg
+from .StateRecorder import RECORD_PREFIX, copy_fields, record_layout
+
+DEFAULT_ADDRESS = "127.0.0.1:20104"
+
+
+def parse_address(address):
+    """'host:port' 或 (host, port) 为 TCP，其余字符串为 Unix 域套接字路径，返回 (family, address)"""
+    if isinstance(address, tuple):
+        return socket.AF_INET, address
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address and "\\" not in address:
+        return socket.AF_INET, (host, int(port))
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError("当前平台不支持 Unix 域套接字，请使用 'host:port' 地址")
+    return socket.AF_UNIX, address
+
+
+def fields_struct(fields):
+    """生成与所选字段记录布局一致的 ctypes 结构体，字段访问方式与 RobotStatePkg 相同"""
+    types = dict(RobotStatePkg._fields_)
+
+    class StateFields(ctypes.Structure):
+        _pack_ = 1
+        _fields_ = [(name, types[name]) for name in fields]
+
+    return StateFields
+
+
+class Subscription:
+    QUEUE_LEN = 64  # 每个订阅者最多缓存的帧数
+
+    def __init__(self, sock, fields, decimation):
+        self.sock = sock
+        self.fields, self.copies, self.record_size = record_layout(fields)
+        self.decimation = max(1, int(decimation))
+        self.frames = 0  # 收到的帧数，用于降频
+        self.sent = 0
+        self.dropped = 0
+        self.queue = deque()
+        self.cond = threading.Condition()
+        self.closed = False
+
+    def offer(self, seq, stamp, slot):
+        """在状态线程中调用：按降频倍数取帧，拷贝所选字段后入队"""
+        self.frames += 1
+        if (self.frames - 1) % self.decimation:
+            return
+        record = bytearray(self.record_size)
+        RECORD_PREFIX.pack_into(record, 0, seq, stamp)
+        copy_fields(self.copies, ctypes.addressof(ctypes.c_char.from_buffer(record)), ctypes.addressof(slot))
+        with self.cond:
+            if len(self.queue) >= self.QUEUE_LEN:
+                self.queue.popleft()
+                self.dropped += 1
+            self.queue.append(record)
+            self.cond.notify()
+
+    def send_routine(self):
+        try:
+            while True:
+                with self.cond:
+                    self.cond.wait_for(lambda: self.queue or self.closed)
+                    if self.closed:
+                        return
+                    records = b"".join(self.queue)
+                    count = len(self.queue)
+                    self.queue.clear()
+                self.sock.sendall(records)
+                self.sent += count
+        except OSError:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class StateBroker:
+    def __init__(self, rpc, address=DEFAULT_ADDRESS):
+        """
+        @param rpc 持有 20004 连接的 RPC 实例
+        @param address 监听地址，'host:port' 或 Unix 域套接字路径
+        """
+        self.rpc = rpc
+        self.family, self.address = parse_address(address)
+        self.subscriptions = ()  # 写时复制，状态线程中遍历无需加锁
+        self.lock = threading.Lock()
+        self.server = None
+        self.accept_thread = None
+
+    def start(self):
+        if self.family != socket.AF_INET and os.path.exists(self.address):
+            os.remove(self.address)
+        self.server = socket.socket(self.family, socket.SOCK_STREAM)
+        if self.family == socket.AF_INET:
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen()
+        self.rpc.state_store.add_listener(self.on_state)
+        self.accept_thread = threading.Thread(target=self.accept_routine, name="fairino-broker", daemon=True)
+        self.accept_thread.start()
+        return self
+
+    def serve_forever(self):
+        """启动并阻塞到 RPC 关闭"""
+        if self.server is None:
+            self.start()
+        self.rpc.state_store.wait_until(lambda pkg: False)
+        self.stop()
+
+    def stop(self):
+        self.rpc.state_store.remove_listener(self.on_state)
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+            if self.family != socket.AF_INET and os.path.exists(self.address):
+                os.remove(self.address)
+        for subscription in self.subscriptions:
+            subscription.close()
+        self.subscriptions = ()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def accept_routine(self):
+        server = self.server
+        while True:
+            try:
+                sock, peer = server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self.subscribe, args=(sock,), daemon=True).start()
+
+    def subscribe(self, sock):
+        try:
+            if self.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.settimeout(5)
+            request = json.loads(sock.makefile("rb").readline() or b"{}")
+            subscription = Subscription(sock, request.get("fields"), request.get("decimation", 1))
+            reply = {"record_size": subscription.record_size, "fields": subscription.fields}
+            sock.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+            sock.settimeout(None)
+        except (OSError, ValueError) as ex:
+            self.rpc.log_warning(f"State subscription rejected: {ex}")
+            try:
+                sock.sendall(json.dumps({"error": str(ex)}).encode("utf-8") + b"\n")
+            except OSError:
+                pass
+            sock.close()
+            return
+        with self.lock:
+            self.subscriptions = self.subscriptions + (subscription,)
+        subscription.send_routine()
+        with self.lock:
+            self.subscriptions = tuple(s for s in self.subscriptions if s is not subscription)
+
+    def on_state(self, seq, stamp, slot):
+        if slot is None:  # RPC 已关闭
+            for subscription in self.subscriptions:
+                subscription.close()
+            return
+        for subscription in self.subscriptions:
+            subscription.offer(seq, stamp, slot)
+
+    def stats(self):
+        """@return [{fields, decimation, sent, dropped}]，fields 为 None 表示完整状态包"""
+        return [{"fields": None if s.record_size == RECORD_PREFIX.size + ctypes.sizeof(RobotStatePkg)
+                 else [f[0] for f in s.fields],
+                 "decimation": s.decimation, "sent": s.sent, "dropped": s.dropped}
+                for s in self.subscriptions]
+
+
+class StateSubscriber:
+    def __init__(self, address=DEFAULT_ADDRESS, fields=None, decimation=1, timeout=5):
+        """
+        @param address StateBroker 地址
+        @param fields 订阅的 RobotStatePkg 字段名列表，None 订阅完整状态包
+        @param decimation 每 decimation 帧接收一帧
+        """
+        family, address = parse_address(address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(address)
+        self.sock.sendall(json.dumps({"fields": fields, "decimation": decimation}).encode("utf-8") + b"\n")
+        self.stream = self.sock.makefile("rb")
+        reply = json.loads(self.stream.readline() or b"{}")
+        if "record_size" not in reply:
+            self.sock.close()
+            raise ConnectionError(reply.get("error", "state broker closed the connection"))
+        self.sock.settimeout(None)
+        self.record_size = reply["record_size"]
+        self.fields = [field[0] for field in reply["fields"]]
+        self.struct = RobotStatePkg if fields is None else fields_struct(self.fields)
+
+    def recv(self):
+        """
+        接收下一帧
+        @return (seq, stamp, pkg)，pkg 为 RobotStatePkg 或只含所选字段的同名结构体；转发端关闭时返回 None
+        """
+        data = self.stream.read(self.record_size)
+        if len(data) < self.record_size:
+            return None
+        seq, stamp = RECORD_PREFIX.unpack_from(data)
+        return seq, stamp, self.struct.from_buffer_copy(data, RECORD_PREFIX.size)
+
+    def __iter__(self):
+        while True:
+            frame = self.recv()
+            if frame is None:
+                return
+            yield frame
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,58 @@
+"""
+@brief  RobotStatePkg 的 NumPy 结构化类型
+        STATE_DTYPE 由 RobotStatePkg._fields_ 生成，与 ctypes 布局逐字节一致(1字节对齐、嵌套 EXT_AXIS_STATUS*4 等)，
+        单个状态包、原始状态字节流与 StateRecorder 记录文件都可以零拷贝地视为 NumPy 记录，按列批量计算。
+        需要 NumPy，SDK 其余部分不依赖本模块。
+"""
+
+import ctypes
+
+import numpy as np
+
+from .Robot import RobotStatePkg
+from .StateRecorder import RECORD_PREFIX, dtype_spec, numpy_dtype
+
+STATE_DTYPE = numpy_dtype(dtype_spec(RobotStatePkg))
+if STATE_DTYPE.itemsize != ctypes.sizeof(RobotStatePkg):
+    raise ImportError("STATE_DTYPE 与 RobotStatePkg 长度不一致")
+
+
+def view_pkg(pkg):
+    """
+    将一个 RobotStatePkg 视为 NumPy 记录，不拷贝，与 pkg 共享内存
+    @return numpy.void，如 view_pkg(pkg)["jt_cur_pos"] 为 6 个 float64
+    """
+    return np.frombuffer(pkg, dtype=STATE_DTYPE, count=1)[0]
+
+
+def view_buffer(buffer, count=-1, offset=0):
+    """
+    将连续存放的状态包字节(bytes/bytearray/mmap 等)视为结构化数组，不拷贝
+    @param count 状态包数量，-1 表示到缓冲区末尾
+    @param offset 第一个状态包的字节偏移
+    """
+    return np.frombuffer(buffer, dtype=STATE_DTYPE, count=count, offset=offset)
+
+
+def from_pkgs(pkgs):
+    """将多个 RobotStatePkg(如 snapshot() 的结果)拷贝为一个结构化数组"""
+    pkgs = list(pkgs)
+    array = np.empty(len(pkgs), dtype=STATE_DTYPE)
+    raw = array.view(np.uint8).reshape(len(pkgs), STATE_DTYPE.itemsize)
+    for row, pkg in zip(raw, pkgs):
+        ctypes.memmove(row.ctypes.data, ctypes.addressof(pkg), STATE_DTYPE.itemsize)
+    return array
+
+
+def recording_packets(recording):
+    """
+    完整状态包记录文件(StateRecorder 未指定 fields)的零拷贝视图
+    @param recording StateRecording
+    @return (seq, stamp, packets)，packets 为 STATE_DTYPE 数组
+    """
+    if not recording.full_pkg:
+        raise ValueError("记录文件只包含部分字段，请使用 recording.array()")
+    dtype = np.dtype({"names": ["seq", "stamp", "pkg"], "formats": ["<u8", "<f8", STATE_DTYPE],
+                      "offsets": [0, 8, RECORD_PREFIX.size], "itemsize": recording.record_size})
+    records = recording.array().view(dtype) if len(recording) else np.zeros(0, dtype=dtype)
+    return records["seq"], records["stamp"], records["pkg"]
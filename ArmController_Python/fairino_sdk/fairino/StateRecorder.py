@@ -0,0 +1,248 @@
+"""
+@brief  20004 实时状态时序记录
+        每帧状态按固定长度记录追加到预分配并内存映射的文件中，记录为 (序号, 接收时间戳, RobotStatePkg 原始字节或所选字段)。
+        写入只做内存拷贝，在状态线程中完成；文件头保存字段表与记录数，读取端以 NumPy 结构化数组零拷贝映射，可按序号或时间随机访问。
+        文件格式：4096 字节文件头 + capacity 条定长记录，多字节数值均为小端。
+"""
+
+import ctypes
+import json
+import mmap
+import struct
+import threading
+
+from .Robot import RobotStatePkg
+
+MAGIC = b'FRSTATE1'
+VERSION = 1
+HEADER_SIZE = 4096
+# 魔数, 版本, 记录长度, 容量, 已写记录数, 丢弃记录数, 字段表长度
+HEADER_FORMAT = '<8sIIQQQI'
+COUNT_OFFSET = 8 + 4 + 4 + 8  # 已写记录数在文件头中的偏移，每帧更新
+RECORD_PREFIX = struct.Struct('<Qd')  # 序号, 接收时间戳(s)
+
+# ctypes 基本类型代码 -> NumPy 类型字符，字节数取 sizeof，避免 c_long 等平台差异
+CTYPE_KINDS = {'b': 'i', 'h': 'i', 'i': 'i', 'l': 'i', 'q': 'i',
+               'B': 'u', 'H': 'u', 'I': 'u', 'L': 'u', 'Q': 'u',
+               'f': 'f', 'd': 'f', '?': 'b', 'c': 'S'}
+
+
+def dtype_spec(ctype):
+    """
+    将 ctypes 类型转换为可 JSON 保存的类型描述：基本类型为 NumPy 类型字符串，
+    数组为 {"base", "shape"}，结构体为 {"names", "formats", "offsets", "itemsize"}，偏移按 _pack_ 后的实际布局
+    """
+    if issubclass(ctype, ctypes.Array):
+        base = dtype_spec(ctype._type_)
+        if isinstance(base, dict) and "shape" in base:
+            return {"base": base["base"], "shape": [ctype._length_] + base["shape"]}
+        return {"base": base, "shape": [ctype._length_]}
+    if issubclass(ctype, ctypes.Structure):
+        names = [field[0] for field in ctype._fields_]
+        return {
+            "names": names,
+            "formats": [dtype_spec(field[1]) for field in ctype._fields_],
+            "offsets": [getattr(ctype, name).offset for name in names],
+            "itemsize": ctypes.sizeof(ctype),
+        }
+    kind = CTYPE_KINDS[ctype._type_]
+    if kind == 'b':
+        return '?'
+    return '<%s%d' % (kind, ctypes.sizeof(ctype))
+
+
+def numpy_dtype(spec):
+    """由 dtype_spec 的描述生成 numpy.dtype"""
+    import numpy as np
+
+    def convert(spec):
+        if isinstance(spec, str):
+            return spec
+        if "shape" in spec:
+            return (convert(spec["base"]), tuple(spec["shape"]))
+        return {"names": spec["names"], "formats": [convert(f) for f in spec["formats"]],
+                "offsets": spec["offsets"], "itemsize": spec["itemsize"]}
+
+    return np.dtype(convert(spec))
+
+
+def record_layout(fields=None):
+    """
+    计算定长记录布局：RECORD_PREFIX 之后依次紧密排列所选字段
+    @param fields RobotStatePkg 字段名列表，None 表示完整状态包
+    @return (字段表 [(字段名, 记录内偏移, 类型描述)], 拷贝表 [(状态包内偏移, 记录内偏移, 长度)], 记录长度)；
+            拷贝表中相邻字段已合并为一次拷贝
+    """
+    types = dict(RobotStatePkg._fields_)
+    names = [field[0] for field in RobotStatePkg._fields_] if fields is None else list(fields)
+    table = []
+    copies = []
+    offset = RECORD_PREFIX.size
+    for name in names:
+        if name not in types:
+            raise ValueError("RobotStatePkg 没有字段 %s" % name)
+        field = getattr(RobotStatePkg, name)
+        table.append((name, offset, dtype_spec(types[name])))
+        last = copies[-1] if copies else None
+        if last is not None and last[0] + last[2] == field.offset and last[1] + last[2] == offset:
+            copies[-1] = (last[0], last[1], last[2] + field.size)
+        else:
+            copies.append((field.offset, offset, field.size))
+        offset += field.size
+    return table, copies, offset
+
+
+def copy_fields(copies, dst, src):
+    """按拷贝表将状态包(地址 src)的字段拷贝到记录(地址 dst)"""
+    for src_offset, dst_offset, size in copies:
+        ctypes.memmove(dst + dst_offset, src + src_offset, size)
+
+
+class StateRecorder:
+    DEFAULT_CAPACITY = 125 * 3600  # 125Hz 记录 1 小时
+
+    def __init__(self, file_path, fields=None, capacity=DEFAULT_CAPACITY):
+        """
+        @param file_path 记录文件路径，已存在时覆盖
+        @param fields 记录的 RobotStatePkg 字段名列表，None 记录完整状态包
+        @param capacity 最大记录条数，文件按此预分配；写满后新帧计入 dropped 并丢弃
+        """
+        self.fields, self.copies, self.record_size = record_layout(fields)
+        self.full_pkg = fields is None
+        self.capacity = int(capacity)
+        self.file_path = file_path
+        self.count = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.store = None
+
+        table = json.dumps({"struct": "RobotStatePkg" if self.full_pkg else None, "prefix": ["seq", "stamp"],
+                            "fields": self.fields}).encode('utf-8')
+        if struct.calcsize(HEADER_FORMAT) + len(table) > HEADER_SIZE:
+            raise ValueError("字段过多，文件头无法容纳字段表")
+        self.file = open(file_path, 'w+b')
+        self.file.truncate(HEADER_SIZE + self.capacity * self.record_size)
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        struct.pack_into(HEADER_FORMAT, self.mm, 0, MAGIC, VERSION, self.record_size, self.capacity, 0, 0, len(table))
+        self.mm[struct.calcsize(HEADER_FORMAT):struct.calcsize(HEADER_FORMAT) + len(table)] = table
+        self.view = (ctypes.c_char * len(self.mm)).from_buffer(self.mm)
+        self.base = ctypes.addressof(self.view)
+
+    def attach(self, rpc):
+        """开始记录 rpc 的实时状态，每帧在状态线程中写入"""
+        self.detach()
+        self.store = rpc.state_store
+        self.store.add_listener(self.on_state)
+        return self
+
+    def detach(self):
+        if self.store is not None:
+            self.store.remove_listener(self.on_state)
+            self.store = None
+
+    def on_state(self, seq, stamp, slot):
+        if slot is not None:
+            self.record(slot, seq, stamp)
+
+    def record(self, pkg, seq, stamp):
+        """写入一帧状态，返回 True-已写入，False-文件已满"""
+        with self.lock:
+            if self.view is None:
+                return False
+            if self.count >= self.capacity:
+                self.dropped += 1
+                return False
+            offset = HEADER_SIZE + self.count * self.record_size
+            RECORD_PREFIX.pack_into(self.mm, offset, seq, stamp)
+            copy_fields(self.copies, self.base + offset, ctypes.addressof(pkg))
+            self.count += 1
+            struct.pack_into('<QQ', self.mm, COUNT_OFFSET, self.count, self.dropped)
+            return True
+
+    def flush(self):
+        with self.lock:
+            if self.view is not None:
+                self.mm.flush()
+
+    def close(self):
+        """停止记录并关闭文件，文件保留预分配长度，读取端按记录数访问"""
+        self.detach()
+        with self.lock:
+            if self.view is None:
+                return
+            struct.pack_into('<QQ', self.mm, COUNT_OFFSET, self.count, self.dropped)
+            self.view = None  # 释放对 mmap 的引用后才能关闭
+            self.mm.flush()
+            self.mm.close()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def stats(self):
+        return {"count": self.count, "dropped": self.dropped, "capacity": self.capacity,
+                "record_size": self.record_size, "bytes": self.count * self.record_size}
+
+
+class StateRecording:
+    """读取 StateRecorder 文件；array() 需要 NumPy，read_pkg() 不需要"""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        magic, version, self.record_size, self.capacity, self.count, self.dropped, table_len = \
+            struct.unpack_from(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("不是状态记录文件: %s" % file_path)
+        start = struct.calcsize(HEADER_FORMAT)
+        table = json.loads(header[start:start + table_len].decode('utf-8'))
+        self.full_pkg = table["struct"] == "RobotStatePkg"
+        self.fields = [tuple(field) for field in table["fields"]]
+
+    def __len__(self):
+        return self.count
+
+    def refresh(self):
+        """重新读取记录数，用于读取仍在写入的文件"""
+        with open(self.file_path, 'rb') as f:
+            f.seek(COUNT_OFFSET)
+            self.count, self.dropped = struct.unpack('<QQ', f.read(16))
+        return self.count
+
+    def dtype_spec(self):
+        return {
+            "names": ["seq", "stamp"] + [name for name, offset, spec in self.fields],
+            "formats": ["<u8", "<f8"] + [spec for name, offset, spec in self.fields],
+            "offsets": [0, 8] + [offset for name, offset, spec in self.fields],
+            "itemsize": self.record_size,
+        }
+
+    def array(self):
+        """以 numpy.memmap 结构化数组只读映射全部已写记录，不拷贝数据"""
+        import numpy as np
+        if self.count == 0:
+            return np.zeros(0, dtype=numpy_dtype(self.dtype_spec()))
+        return np.memmap(self.file_path, dtype=numpy_dtype(self.dtype_spec()), mode='r',
+                         offset=HEADER_SIZE, shape=(self.count,))
+
+    def index_at(self, stamp, records=None):
+        """返回接收时间戳不早于 stamp 的第一条记录的下标"""
+        import numpy as np
+        records = self.array() if records is None else records
+        return int(np.searchsorted(records["stamp"], stamp))
+
+    def read_pkg(self, index):
+        """读取第 index 条完整状态包，返回 (seq, stamp, RobotStatePkg)"""
+        if not self.full_pkg:
+            raise ValueError("记录文件只包含部分字段")
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        with open(self.file_path, 'rb') as f:
+            f.seek(HEADER_SIZE + index * self.record_size)
+            data = f.read(self.record_size)
+        seq, stamp = RECORD_PREFIX.unpack_from(data)
+        return seq, stamp, RobotStatePkg.from_buffer_copy(data, RECORD_PREFIX.size)
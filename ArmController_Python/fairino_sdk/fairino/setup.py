@@ -5,4 +5,6 @@
 from distutils.core import setup                   #  (python3.12之前的使用)
 # from setuptools import setup                         #  (python3.12使用)
 from Cython.Build import cythonize
-setup(name='Robot', ext_modules=cythonize('Robot.py'))
+# 力控/传送带/焊接等按需导入的功能模块与 Robot.py 一起编译，见 Robot.SDK_FAMILIES
+setup(name='Robot', ext_modules=cythonize(['Robot.py', 'RobotForce.py', 'RobotConveyor.py', 'RobotWeld.py',
+                                           'RobotLaser.py', 'RobotExtAxis.py', 'RobotUpgrade.py']))
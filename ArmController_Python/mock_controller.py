@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mock Fairino Controller - giả lập bộ điều khiển FR5 để benchmark và chạy workflow không cần robot
+- XML-RPC 20003: các lệnh chuyển động, IO, chương trình Lua, file (HTTP/1.1 keep-alive, system.multicall)
+- 20004: luồng RobotStatePkg có checksum đúng, chu kỳ cấu hình được
+- 20010/20011: upload/download file theo giao thức /f/b ... /b/f của SDK
+- Tiêm độ trễ (latency + jitter) và mất gói (lệnh XML-RPC bị đóng kết nối, frame trạng thái bị bỏ/sai checksum)
+
+Động học trong mock chỉ là ánh xạ tuyến tính thay thế, không phải FK/IK thật của FR5.
+
+Chạy: python mock_controller.py [--host 127.0.0.1] [--period 0.008] [--latency 0.002] [--loss 0.0]
+Sau đó trỏ robot_ip của workflow/GUI về 127.0.0.1
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import math
+import ctypes
+import random
+import socket
+import hashlib
+import argparse
+import threading
+import xmlrpc.client
+from socketserver import ThreadingMixIn
+from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+
+# Thêm SDK path vào sys.path
+SDK_PATH = os.path.join(os.path.dirname(__file__), 'fairino_sdk')
+if os.path.exists(SDK_PATH):
+    sys.path.insert(0, SDK_PATH)
+
+from fairino.Robot import RobotStatePkg
+
+SDK_COMMAND_PATTERN = re.compile(r'\.command\("(\w+)')
+
+
+def sdk_commands():
+    """Các lệnh SDK gửi qua RPC.command (chỉ nhận mã lỗi); lệnh gửi qua RPC.query cần dữ liệu trả về"""
+    names = set()
+    for path in glob.glob(os.path.join(SDK_PATH, 'fairino', '*.py')):
+        with open(path, encoding='utf-8') as f:
+            names.update(SDK_COMMAND_PATTERN.findall(f.read()))
+    return frozenset(names)
+
+
+SDK_COMMANDS = sdk_commands()
+MAX_JOINT_SPEED = 180.0  # °/s ứng với vel=100, ovl=100
+BLOCKING_MOVE_TIMEOUT = 60.0  # MoveJ/MoveL chặn tối đa (s)
+
+
+def check_length(value, count, where):
+    """Tham số mảng sai độ dài trả về Fault như controller, không để lỗi lan sang luồng 20004"""
+    if not isinstance(value, (list, tuple)) or len(value) != count:
+        raise xmlrpc.client.Fault(-1, f"{where} requires {count} values")
+    return value
+
+
+def fake_forward_kin(joint_pos):
+    """Ánh xạ tuyến tính thay cho FK thật (đủ để SDK/workflow chạy end-to-end)"""
+    j = joint_pos
+    return [300.0 + 2.0 * j[0], 2.0 * j[1], 400.0 + 2.0 * j[2], j[3], j[4], j[5]]
+
+
+def fake_inverse_kin(desc_pos):
+    d = desc_pos
+    return [(d[0] - 300.0) / 2.0, d[1] / 2.0, (d[2] - 400.0) / 2.0, d[3], d[4], d[5]]
+
+
+class MockRobotState:
+    """Trạng thái robot giả lập, cập nhật theo từng chu kỳ của luồng 20004"""
+
+    def __init__(self, program_duration: float = 2.0):
+        self.lock = threading.Condition()
+        self.joints = [0.0, -90.0, 90.0, -90.0, -90.0, 0.0]
+        self.target = list(self.joints)
+        self.joint_speed = [0.0] * 6  # °/s từng khớp của chuyển động hiện tại
+        self.motion_done = 1
+        self.program_state = 1  # 1-dừng, 2-chạy, 3-tạm dừng
+        self.program_remaining = 0.0
+        self.program_duration = program_duration
+        self.loaded_program = ""
+        self.enabled = 1
+        self.mode = 0
+        self.speed = 100
+        self.do_h = self.do_l = self.tool_do = 0
+        self.di_h = self.di_l = self.tool_di = 0
+        self.safety_stop = 0
+        self.main_code = self.sub_code = 0
+        self.tool = self.user = 0
+        self.servo_cmd_num = 0
+        self.last_servo_target = list(self.joints)
+
+    def start_motion(self, target, vel, ovl=100.0):
+        with self.lock:
+            self.target = list(map(float, target))
+            speed = MAX_JOINT_SPEED * max(float(vel), 1.0) / 100.0 * max(float(ovl), 1.0) / 100.0 * self.speed / 100.0
+            deltas = [abs(t - c) for t, c in zip(self.target, self.joints)]
+            duration = max(deltas) / speed if max(deltas) > 0 else 0.0
+            # Đồng bộ các khớp cùng kết thúc
+            self.joint_speed = [d / duration if duration > 0 else 0.0 for d in deltas]
+            self.motion_done = 0 if duration > 0 else 1
+
+    def wait_motion(self, timeout=BLOCKING_MOVE_TIMEOUT):
+        with self.lock:
+            return self.lock.wait_for(lambda: self.motion_done == 1, timeout)
+
+    def stop_motion(self):
+        with self.lock:
+            self.target = list(self.joints)
+            self.motion_done = 1
+            self.lock.notify_all()
+
+    def step(self, dt: float):
+        with self.lock:
+            if self.motion_done == 0:
+                done = True
+                for i in range(6):
+                    diff = self.target[i] - self.joints[i]
+                    move = self.joint_speed[i] * dt
+                    if abs(diff) <= move:
+                        self.joints[i] = self.target[i]
+                    else:
+                        self.joints[i] += math.copysign(move, diff)
+                        done = False
+                if done:
+                    self.motion_done = 1
+                    self.lock.notify_all()
+            if self.program_state == 2:
+                self.program_remaining -= dt
+                if self.program_remaining <= 0:
+                    self.program_state = 1
+                    self.lock.notify_all()
+
+    def fill(self, pkg: RobotStatePkg):
+        """Ghi trạng thái hiện tại vào RobotStatePkg"""
+        with self.lock:
+            moving = self.motion_done == 0
+            pkg.program_state = self.program_state
+            if self.program_state != 1:
+                pkg.robot_state = self.program_state
+            else:
+                pkg.robot_state = 2 if moving else 1
+            pkg.main_code = self.main_code
+            pkg.sub_code = self.sub_code
+            pkg.robot_mode = self.mode
+            tcp = fake_forward_kin(self.joints)
+            for i in range(6):
+                pkg.jt_cur_pos[i] = self.joints[i]
+                pkg.tl_cur_pos[i] = tcp[i]
+                pkg.flange_cur_pos[i] = tcp[i]
+                pkg.actual_qd[i] = self.joint_speed[i] if moving else 0.0
+                pkg.lastServoTarget[i] = self.last_servo_target[i]
+                pkg.jointDriverTemperature[i] = 35.0
+            pkg.tool = self.tool
+            pkg.user = self.user
+            pkg.cl_dgt_output_h = self.do_h
+            pkg.cl_dgt_output_l = self.do_l
+            pkg.tl_dgt_output_l = self.tool_do
+            pkg.cl_dgt_input_h = self.di_h
+            pkg.cl_dgt_input_l = self.di_l
+            pkg.tl_dgt_input_l = self.tool_di
+            pkg.motion_done = self.motion_done
+            pkg.safety_stop0_state = self.safety_stop
+            pkg.rbtEnableState = self.enabled
+            pkg.servoJCmdNum = self.servo_cmd_num
+
+
+class MockRobotService:
+    """
+    Các hàm XML-RPC; lệnh chưa mô phỏng: lệnh SDK gửi qua RPC.command trả về 0 (strict: Fault),
+    còn lại (lệnh query cần dữ liệu trả về, tên không có trong SDK) trả về Fault
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.state = controller.state
+        self.files = controller.files
+
+    def _dispatch(self, method, params):
+        self.controller.call_count += 1
+        func = getattr(self, method, None)
+        if method.startswith('_') or func is None:
+            if method not in SDK_COMMANDS or self.controller.strict:
+                raise xmlrpc.client.Fault(-1, f"{method} is not implemented in mock controller")
+            return 0
+        return func(*params)
+
+    # ---------- Cơ bản ----------
+    def GetControllerIP(self):
+        return [0, self.controller.host]
+
+    def GetSoftwareVersion(self):
+        return [0, "FR5-MOCK", "V3.8.7", "MOCK"]
+
+    def Mode(self, state):
+        self.state.mode = int(state)
+        return 0
+
+    def RobotEnable(self, state):
+        self.state.enabled = int(state)
+        return 0
+
+    def SetSpeed(self, vel):
+        self.state.speed = int(vel)
+        return 0
+
+    def ResetAllError(self):
+        self.state.main_code = self.state.sub_code = 0
+        return 0
+
+    def DragTeachSwitch(self, state):
+        return 0
+
+    def IsInDragTeach(self):
+        return [0, 0]
+
+    # ---------- Chuyển động ----------
+    def GetForwardKin(self, joint_pos):
+        check_length(joint_pos, 6, "GetForwardKin joint_pos")
+        return [0] + fake_forward_kin(joint_pos)
+
+    def GetInverseKin(self, type, desc_pos, config=-1):
+        check_length(desc_pos, 6, "GetInverseKin desc_pos")
+        return [0] + fake_inverse_kin(desc_pos)
+
+    def GetDHCompensation(self):
+        return [0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+    def GetTCPOffset(self, flag=1):
+        return [0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+    def GetJointSoftLimitDeg(self, flag=1):
+        return [0, -175.0, 175.0, -265.0, 85.0, -160.0, 160.0, -265.0, 85.0, -175.0, 175.0, -175.0, 175.0]
+
+    def GetInverseKinRef(self, type, desc_pos, joint_pos_ref):
+        check_length(desc_pos, 6, "GetInverseKinRef desc_pos")
+        return [0] + fake_inverse_kin(desc_pos)
+
+    def MoveJ(self, joint_pos, desc_pos, tool, user, vel, acc, ovl, exaxis_pos, blendT, *args):
+        check_length(joint_pos, 6, "MoveJ joint_pos")
+        if self.state.safety_stop:
+            return 99
+        self.state.tool, self.state.user = int(tool), int(user)
+        self.state.start_motion(joint_pos, vel, ovl)
+        if blendT < 0 and not self.state.wait_motion():
+            return -1
+        return 0
+
+    def MoveL(self, params):
+        if not isinstance(params, list) or len(params) < 18:
+            raise xmlrpc.client.Fault(-1, "MoveL requires at least 18 values")
+        if self.state.safety_stop:
+            return 99
+        joint_pos = params[0:6]
+        desc_pos = params[6:12]
+        if not any(joint_pos):
+            joint_pos = fake_inverse_kin(desc_pos)
+        self.state.tool, self.state.user = int(params[12]), int(params[13])
+        self.state.start_motion(joint_pos, params[14], params[16])
+        if params[17] < 0 and not self.state.wait_motion():
+            return -1
+        return 0
+
+    def StopMotion(self):
+        self.state.stop_motion()
+        return 0
+
+    def ServoMoveStart(self):
+        return 0
+
+    def ServoMoveEnd(self):
+        return 0
+
+    def ServoJ(self, joint_pos, axisPos, acc, vel, cmdT, filterT, gain, id):
+        check_length(joint_pos, 6, "ServoJ joint_pos")
+        check_length(axisPos, 4, "ServoJ axisPos")
+        with self.state.lock:
+            self.state.joints = list(map(float, joint_pos))
+            self.state.target = list(self.state.joints)
+            self.state.last_servo_target = list(self.state.joints)
+            self.state.servo_cmd_num += 1
+        return 0
+
+    def ServoCart(self, mode, desc_pos, pos_gain, acc, vel, cmdT, filterT, gain):
+        check_length(desc_pos, 6, "ServoCart desc_pos")
+        check_length(pos_gain, 6, "ServoCart pos_gain")
+        with self.state.lock:
+            if mode == 0:
+                self.state.joints = fake_inverse_kin(desc_pos)
+            else:
+                tcp = fake_forward_kin(self.state.joints)
+                self.state.joints = fake_inverse_kin([c + d * g for c, d, g in zip(tcp, desc_pos, pos_gain)])
+            self.state.target = list(self.state.joints)
+        return 0
+
+    # ---------- IO ----------
+    def SetDO(self, id, status, smooth=0, block=0):
+        with self.state.lock:
+            if 0 <= id < 8:
+                self.state.do_l = (self.state.do_l & ~(1 << id) | (int(status) << id)) & 0xFF
+            elif 8 <= id < 16:
+                self.state.do_h = (self.state.do_h & ~(1 << (id - 8)) | (int(status) << (id - 8))) & 0xFF
+            else:
+                return -1
+        return 0
+
+    def SetToolDO(self, id, status, smooth=0, block=0):
+        with self.state.lock:
+            if not 0 <= id < 2:
+                return -1
+            self.state.tool_do = (self.state.tool_do & ~(1 << id) | (int(status) << id)) & 0xFF
+        return 0
+
+    def GetDI(self, id, block=0):
+        with self.state.lock:
+            value = (self.state.di_l | (self.state.di_h << 8)) >> id & 1
+        return [0, value]
+
+    # ---------- Chương trình ----------
+    def ProgramLoad(self, program_name):
+        name = os.path.basename(program_name)
+        if self.controller.strict and name not in self.files[0]:
+            return -1
+        self.state.loaded_program = program_name
+        return 0
+
+    def GetLoadedProgram(self):
+        return [0, self.state.loaded_program]
+
+    def ProgramRun(self):
+        if self.state.safety_stop:
+            return 99
+        with self.state.lock:
+            self.state.program_state = 2
+            self.state.program_remaining = self.state.program_duration
+        return 0
+
+    def ProgramPause(self):
+        with self.state.lock:
+            if self.state.program_state == 2:
+                self.state.program_state = 3
+        return 0
+
+    def ProgramResume(self):
+        with self.state.lock:
+            if self.state.program_state == 3:
+                self.state.program_state = 2
+        return 0
+
+    def ProgramStop(self):
+        with self.state.lock:
+            self.state.program_state = 1
+            self.state.program_remaining = 0.0
+            self.state.lock.notify_all()
+        return 0
+
+    # ---------- File ----------
+    def FileUpload(self, file_type, file_name):
+        self.controller.expect_upload(int(file_type), file_name, size_digits=10)
+        return 0
+
+    def PointTableUpload(self, point_table_name):
+        self.controller.expect_upload(-1, point_table_name, size_digits=8)
+        return 0
+
+    def FileDownload(self, file_type, file_name):
+        data = self.files.get(int(file_type), {}).get(file_name)
+        if data is None:
+            return -1
+        self.controller.expect_download(data, size_digits=10)
+        return 0
+
+    def PointTableDownload(self, point_table_name):
+        data = self.files.get(-1, {}).get(point_table_name)
+        if data is None:
+            return -1
+        self.controller.expect_download(data, size_digits=8)
+        return 0
+
+    def FileDelete(self, file_type, file_name):
+        if self.files.get(int(file_type), {}).pop(file_name, None) is None:
+            return -1
+        return 0
+
+    def LuaUpLoadUpdate(self, file_name):
+        return [0, ""]
+
+    def GetLuaList(self):
+        names = sorted(self.files[0])
+        return [0, len(names), ";".join(names)]
+
+    def ComputeFileMD5(self, file_path):
+        data = self.files[0].get(os.path.basename(file_path))
+        if data is None:
+            return [-1, ""]
+        return [0, hashlib.md5(data).hexdigest()]
+
+    def PointTableSwitch(self, point_table_name):
+        return 0
+
+
+class MockRequestHandler(SimpleXMLRPCRequestHandler):
+    rpc_paths = ('/RPC2', '/RPC', '/')
+    protocol_version = "HTTP/1.1"  # giữ kết nối như controller thật
+
+    def do_POST(self):
+        controller = self.server.controller
+        if controller.loss_rate > 0 and controller.random.random() < controller.loss_rate:
+            # Mất lệnh: đóng kết nối không trả lời
+            controller.lost_calls += 1
+            self.close_connection = True
+            return
+        controller.inject_latency()
+        super().do_POST()
+
+
+class MockXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class MockController:
+    """Bộ điều khiển giả lập FR5: XML-RPC 20003, trạng thái 20004, file 20010/20011"""
+
+    def __init__(self, host: str = '127.0.0.1', cmd_port: int = 20003, state_port: int = 20004,
+                 upload_port: int = 20010, download_port: int = 20011, state_period: float = 0.008,
+                 latency: float = 0.0, latency_jitter: float = 0.0, loss_rate: float = 0.0,
+                 state_loss_rate: float = 0.0, program_duration: float = 2.0, strict: bool = False,
+                 seed: int = None):
+        """
+        Args:
+            state_period: chu kỳ gửi frame 20004 (s)
+            latency / latency_jitter: độ trễ cố định + ngẫu nhiên [0, jitter] cho mỗi request XML-RPC (s)
+            loss_rate: xác suất request XML-RPC bị đóng kết nối không trả lời
+            state_loss_rate: xác suất frame trạng thái bị bỏ hoặc sai checksum
+            program_duration: thời gian chạy giả lập của ProgramRun (s)
+            strict: lệnh chưa mô phỏng trả về Fault; ProgramLoad yêu cầu file đã upload
+        """
+        self.host = host
+        self.cmd_port = cmd_port
+        self.state_port = state_port
+        self.upload_port = upload_port
+        self.download_port = download_port
+        self.state_period = state_period
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.loss_rate = loss_rate
+        self.state_loss_rate = state_loss_rate
+        self.strict = strict
+        self.random = random.Random(seed)
+
+        self.state = MockRobotState(program_duration)
+        self.files = {0: {}, -1: {}}  # loại file -> {tên: bytes}, -1 là bảng điểm
+        self.pending_upload = None
+        self.pending_download = None
+        self.transfer_lock = threading.Lock()
+
+        self.call_count = 0
+        self.lost_calls = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+        self.stop_event = threading.Event()
+        self.state_clients = []
+        self.state_clients_lock = threading.Lock()
+        self.threads = []
+        self.sockets = []
+        self.xmlrpc_server = None
+
+    # ---------- Vòng đời ----------
+    def start(self):
+        self.xmlrpc_server = MockXMLRPCServer((self.host, self.cmd_port), requestHandler=MockRequestHandler,
+                                              logRequests=False, allow_none=True)
+        self.xmlrpc_server.controller = self
+        self.xmlrpc_server.register_instance(MockRobotService(self))
+        self.xmlrpc_server.register_multicall_functions()
+        self.spawn(self.xmlrpc_server.serve_forever)
+
+        self.spawn(self.accept_loop, self.listen(self.state_port), self.add_state_client)
+        self.spawn(self.accept_loop, self.listen(self.upload_port), self.handle_upload)
+        self.spawn(self.accept_loop, self.listen(self.download_port), self.handle_download)
+        self.spawn(self.state_loop)
+        print(f"🤖 Mock controller: XML-RPC {self.host}:{self.cmd_port}, state :{self.state_port} "
+              f"({self.state_period * 1000:.1f} ms), file :{self.upload_port}/:{self.download_port}")
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.xmlrpc_server:
+            self.xmlrpc_server.shutdown()
+            self.xmlrpc_server.server_close()
+        for sock in self.sockets:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        with self.state_clients_lock:
+            for client in self.state_clients:
+                client.close()
+            self.state_clients = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def spawn(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self.threads.append(thread)
+
+    def listen(self, port: int) -> socket.socket:
+        srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        srv.bind((self.host, port))
+        srv.listen(8)
+        srv.settimeout(0.2)
+        self.sockets.append(srv)
+        return srv
+
+    def accept_loop(self, srv: socket.socket, handler):
+        while not self.stop_event.is_set():
+            try:
+                conn, addr = srv.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.spawn(handler, conn)
+
+    def inject_latency(self):
+        delay = self.latency
+        if self.latency_jitter > 0:
+            delay += self.random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    # ---------- Tiện ích cho test ----------
+    def set_di(self, id: int, status: int):
+        """Đặt mức DI tủ điều khiển (0~15)"""
+        with self.state.lock:
+            if id < 8:
+                self.state.di_l = (self.state.di_l & ~(1 << id) | (int(status) << id)) & 0xFF
+            else:
+                self.state.di_h = (self.state.di_h & ~(1 << (id - 8)) | (int(status) << (id - 8))) & 0xFF
+
+    def set_safety_stop(self, on: bool):
+        with self.state.lock:
+            self.state.safety_stop = 1 if on else 0
+
+    # ---------- 20004 ----------
+    def add_state_client(self, conn: socket.socket):
+        with self.state_clients_lock:
+            self.state_clients.append(conn)
+
+    def build_frame(self, pkg: RobotStatePkg, frame_cnt: int) -> bytes:
+        pkg.frame_head = 0x5A5A
+        pkg.frame_cnt = frame_cnt & 0xFF
+        pkg.data_len = ctypes.sizeof(RobotStatePkg) - 7
+        now = time.time()
+        t = time.localtime(now)
+        pkg.year, pkg.mouth, pkg.day = t.tm_year, t.tm_mon, t.tm_mday
+        pkg.hour, pkg.minute, pkg.second = t.tm_hour, t.tm_min, t.tm_sec
+        pkg.millisecond = int(now * 1000) % 1000
+        raw = bytearray(bytes(pkg))
+        checksum = sum(memoryview(raw)[:-2]) & 0xFFFF
+        raw[-2] = checksum & 0xFF
+        raw[-1] = checksum >> 8
+        return bytes(raw)
+
+    def state_loop(self):
+        pkg = RobotStatePkg()
+        frame_cnt = 0
+        next_time = time.perf_counter()
+        last = next_time
+        while not self.stop_event.is_set():
+            now = time.perf_counter()
+            self.state.step(now - last)
+            last = now
+            self.state.fill(pkg)
+            frame = self.build_frame(pkg, frame_cnt)
+            frame_cnt += 1
+            if self.state_loss_rate > 0 and self.random.random() < self.state_loss_rate:
+                self.frames_dropped += 1
+                if self.random.random() < 0.5:
+                    frame = None  # bỏ frame
+                else:
+                    frame = frame[:-1] + bytes([frame[-1] ^ 0xFF])  # sai checksum
+            if frame is not None:
+                with self.state_clients_lock:
+                    clients = list(self.state_clients)
+                for client in clients:
+                    try:
+                        client.sendall(frame)
+                    except OSError:
+                        with self.state_clients_lock:
+                            if client in self.state_clients:
+                                self.state_clients.remove(client)
+                        client.close()
+                self.frames_sent += 1
+            next_time += self.state_period
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.perf_counter()
+
+    # ---------- 20010 / 20011 ----------
+    def expect_upload(self, file_type: int, file_name: str, size_digits: int):
+        with self.transfer_lock:
+            self.pending_upload = (file_type, file_name, size_digits)
+
+    def expect_download(self, data: bytes, size_digits: int):
+        with self.transfer_lock:
+            self.pending_download = (data, size_digits)
+
+    def handle_upload(self, conn: socket.socket):
+        with self.transfer_lock:
+            pending, self.pending_upload = self.pending_upload, None
+        conn.settimeout(20)
+        try:
+            if pending is None:
+                conn.sendall(b"FAIL")
+                return
+            file_type, file_name, size_digits = pending
+            head_len = 4 + size_digits + 32
+            data = bytearray()
+            total_size = None
+            while total_size is None or len(data) < total_size:
+                part = conn.recv(1024 * 1024)
+                if not part:
+                    break
+                data += part
+                if total_size is None and len(data) >= head_len:
+                    if data[:4] != b"/f/b":
+                        break
+                    total_size = int(data[4:4 + size_digits])
+            ok = (total_size is not None and len(data) == total_size and data[-4:] == b"/b/f")
+            if ok:
+                content = bytes(data[head_len:-4])
+                md5 = data[4 + size_digits:head_len].decode('ascii')
+                ok = hashlib.md5(content).hexdigest() == md5
+            if ok:
+                self.files.setdefault(file_type, {})[file_name] = content
+            conn.sendall(b"SUCCESS" if ok else b"FAIL")
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def handle_download(self, conn: socket.socket):
+        with self.transfer_lock:
+            pending, self.pending_download = self.pending_download, None
+        conn.settimeout(20)
+        try:
+            if pending is None:
+                return
+            data, size_digits = pending
+            total_size = len(data) + 4 + size_digits + 32 + 4
+            head = b"/f/b" + str(total_size).rjust(size_digits, '0' if size_digits == 8 else ' ').encode('ascii')
+            conn.sendall(head + hashlib.md5(data).hexdigest().encode('ascii'))
+            conn.sendall(data)
+            conn.sendall(b"/b/f")
+            conn.recv(16)  # SUCCESS / FAIL
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Fairino FR5 controller")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--period', type=float, default=0.008, help="chu kỳ frame 20004 (s)")
+    parser.add_argument('--latency', type=float, default=0.0, help="độ trễ XML-RPC (s)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="độ trễ ngẫu nhiên thêm tối đa (s)")
+    parser.add_argument('--loss', type=float, default=0.0, help="tỉ lệ mất lệnh XML-RPC")
+    parser.add_argument('--state-loss', type=float, default=0.0, help="tỉ lệ frame 20004 bị bỏ/sai checksum")
+    parser.add_argument('--program-duration', type=float, default=2.0, help="thời gian ProgramRun giả lập (s)")
+    parser.add_argument('--lua-dir', default=os.path.join(os.path.dirname(__file__), 'lua_scripts'),
+                        help="nạp sẵn các file .lua vào controller giả lập")
+    args = parser.parse_args()
+
+    controller = MockController(args.host, state_period=args.period, latency=args.latency,
+                                latency_jitter=args.jitter, loss_rate=args.loss, state_loss_rate=args.state_loss,
+                                program_duration=args.program_duration)
+    if os.path.isdir(args.lua_dir):
+        for name in os.listdir(args.lua_dir):
+            if name.endswith('.lua'):
+                with open(os.path.join(args.lua_dir, name), 'rb') as f:
+                    controller.files[0][name] = f.read()
+
+    with controller:
+        try:
+            while True:
+                time.sleep(5)
+                print(f"📊 calls={controller.call_count} lost={controller.lost_calls} "
+                      f"frames={controller.frames_sent} dropped={controller.frames_dropped}")
+        except KeyboardInterrupt:
+            print("\n⏹️ Dừng mock controller")
+
+
+if __name__ == '__main__':
+    main()
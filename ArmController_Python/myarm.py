@@ -56,15 +56,20 @@ def get_robot():
             try:
                 from fairino import Robot as SDK_Robot
                 print(f"Using fairino SDK Robot (from {sdk_path}) to connect to {ROBOT_IP}")
-                inst = SDK_Robot.RPC(ROBOT_IP)
+                inst = SDK_Robot.RPC(ROBOT_IP, blocking=False)
                 # SDK sets a connection flag (RPC.is_conect). If the SDK failed to
                 # establish XML-RPC communication it sets this to False and most
                 # high-level calls will return error -4. In that case prefer the
                 # xmlrpc.ServerProxy fallback so the tool can still operate.
+                # The SDK connects in the background; wait_ready() returns as soon
+                # as the XML-RPC probe finishes (a few ms on a reachable robot).
                 conn_ok = True
                 try:
-                    # prefer instance attribute if available
-                    conn_ok = bool(getattr(inst, 'is_conect', True))
+                    if hasattr(inst, 'wait_ready'):
+                        conn_ok = bool(inst.wait_ready(2.0))
+                    else:
+                        # prefer instance attribute if available
+                        conn_ok = bool(getattr(inst, 'is_conect', True))
                 except Exception:
                     conn_ok = True
 
@@ -17,6 +17,7 @@ if os.path.exists(SDK_PATH):
 # Cấu hình mặc định
 DEFAULT_ROBOT_IP = '192.168.58.2'
 LUA_DIR = os.path.join(os.path.dirname(__file__), 'lua_scripts')
+UPLOAD_MANIFEST = os.path.join(os.path.dirname(__file__), 'fairino_upload_manifest.json')
 
 class FairinoRobotSDK:
     def __init__(self, robot_ip=DEFAULT_ROBOT_IP):
@@ -24,15 +25,20 @@ class FairinoRobotSDK:
         self.robot = None
         self.connected = False
         self.auto_mode = False
+        self.file_sync = None  # Bỏ qua upload khi controller đã có file giống hệt
         
     def connect(self):
         """Kết nối đến robot sử dụng SDK"""
         try:
             # Import SDK
             from fairino import Robot
-            self.robot = Robot.RPC(self.robot_ip)
+            from fairino.FileSync import FileSync
+            self.robot = Robot.RPC(self.robot_ip, blocking=False)
+            self.file_sync = FileSync(self.robot, UPLOAD_MANIFEST)
             
-            # Kiểm tra kết nối
+            # Kiểm tra kết nối (SDK kết nối ở nền, chờ kết quả dò XML-RPC)
+            if hasattr(self.robot, 'wait_ready'):
+                self.robot.wait_ready(2.0)
             if hasattr(self.robot, 'is_conect'):
                 if self.robot.is_conect:
                     self.connected = True
@@ -175,6 +181,17 @@ class FairinoRobotSDK:
             print(f"\nDang upload {filename}...")
             full_path = os.path.abspath(filepath)
             
+            if self.file_sync is not None:
+                result = self.file_sync.sync_lua([full_path])[filename]
+                if result == self.file_sync.SKIPPED:
+                    print(f"[OK] {filename} khong thay doi, bo qua upload")
+                    return True
+                if result == self.file_sync.UPLOADED:
+                    print(f"[OK] Upload thanh cong {filename} (LuaUpload)")
+                    return True
+                print(f"[LOI] LuaUpload that bai: {result}")
+                return False
+
             # Chỉ thử LuaUpload
             if hasattr(self.robot, 'LuaUpload'):
                 try:
@@ -629,7 +646,15 @@ class FairinoRobotSDK:
             print(f"\n[BƯỚC 1] Upload {os.path.basename(db_file)}...")
             
             try:
-                if hasattr(self.robot, 'PointTableUpLoad'):
+                if self.file_sync is not None:
+                    result = self.file_sync.sync_point_tables([db_file])[os.path.basename(db_file)]
+                    if result == self.file_sync.SKIPPED:
+                        print(f"[OK] {os.path.basename(db_file)} không thay đổi, bỏ qua upload")
+                    elif result == self.file_sync.UPLOADED:
+                        print(f"[OK] Upload {os.path.basename(db_file)} thành công!")
+                    else:
+                        print(f"[INFO] PointTableUpLoad trả về: {result}")
+                elif hasattr(self.robot, 'PointTableUpLoad'):
                     result = self.robot.PointTableUpLoad(db_file)
                     print(f"PointTableUpLoad result: {result}")
                     
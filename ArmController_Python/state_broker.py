@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+State broker - một tiến trình giữ kết nối 20004 và phát lại trạng thái robot cho nhiều chương trình trên cùng máy
+- GUI, workflow và script giám sát không còn mỗi cái một kết nối 20004 + một thread parse riêng
+- Chương trình dùng SDK chỉ cần đặt biến môi trường FAIRINO_STATE_BROKER=127.0.0.1:20104
+  (hoặc RPC(ip, state_broker="127.0.0.1:20104")); lệnh XML-RPC 20003 vẫn gửi trực tiếp tới controller
+- Script giám sát có thể đăng ký một phần field và giảm tần số:
+  StateSubscriber(fields=["jt_cur_pos", "jointDriverTemperature"], decimation=25)
+
+Chạy: python state_broker.py [--ip 192.168.58.2] [--listen 127.0.0.1:20104]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Thêm SDK path vào sys.path
+SDK_PATH = os.path.join(os.path.dirname(__file__), 'fairino_sdk')
+if os.path.exists(SDK_PATH):
+    sys.path.insert(0, SDK_PATH)
+
+from fairino import Robot
+from fairino.StateBroker import StateBroker, DEFAULT_ADDRESS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fairino robot state broker")
+    parser.add_argument('--ip', default='192.168.58.2', help="IP controller")
+    parser.add_argument('--listen', default=DEFAULT_ADDRESS, help="'host:port' hoặc đường dẫn Unix socket")
+    args = parser.parse_args()
+
+    # Broker luôn kết nối thẳng tới controller, không tự đăng ký vào broker khác
+    robot = Robot.RPC(args.ip, blocking=False, state_broker="")
+    if not robot.wait_ready(5):
+        print(f"❌ Không kết nối được robot {args.ip}")
+        robot.CloseRPC()
+        return
+
+    with StateBroker(robot, args.listen) as broker:
+        print(f"📡 State broker: {args.ip}:20004 -> {args.listen}")
+        try:
+            while True:
+                time.sleep(5)
+                seq = robot.snapshot()[0]
+                subs = broker.stats()
+                dropped = sum(s['dropped'] for s in subs)
+                print(f"📊 frames={seq} subscribers={len(subs)} dropped={dropped}")
+        except KeyboardInterrupt:
+            print("\n⏹️ Dừng state broker")
+    robot.CloseRPC()
+
+
+if __name__ == '__main__':
+    main()
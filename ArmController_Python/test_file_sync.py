@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test FileSync - upload Lua có điều kiện với mock_controller.py (không cần robot, dùng cho CI)
+Mock chiếm các cổng 20003/20004/20010/20011 trên 127.0.0.1 trong lúc test.
+
+Chạy: python test_file_sync.py  hoặc  python -m pytest test_file_sync.py
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'fairino_sdk'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fairino import Robot
+from fairino.FileSync import FileSync
+from mock_controller import MockController
+
+
+@contextmanager
+def synced(names):
+    """Khởi động mock, tạo file Lua tạm và FileSync với manifest riêng"""
+    with tempfile.TemporaryDirectory() as tmp, MockController() as controller:
+        paths = []
+        for name in names:
+            path = os.path.join(tmp, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'-- {name}\nprint("{name}")\n')
+            paths.append(path)
+        robot = Robot.RPC('127.0.0.1')
+        try:
+            robot.wait_ready(2.0)
+            yield controller, robot, FileSync(robot, os.path.join(tmp, 'manifest.json')), paths
+        finally:
+            robot.CloseRPC()
+
+
+def test_upload_skip_verify():
+    """Lần đầu upload; lần sau bỏ qua theo manifest; verify_remote bỏ qua theo MD5 của controller"""
+    with synced(['a.lua', 'b.lua']) as (controller, robot, sync, paths):
+        assert sync.sync_lua(paths) == {'a.lua': FileSync.UPLOADED, 'b.lua': FileSync.UPLOADED}
+        assert sorted(controller.files[0]) == ['a.lua', 'b.lua']
+
+        assert sync.sync_lua(paths) == {'a.lua': FileSync.SKIPPED, 'b.lua': FileSync.SKIPPED}
+
+        sync.forget()
+        assert sync.sync_lua(paths, verify_remote=True) == {'a.lua': FileSync.SKIPPED, 'b.lua': FileSync.SKIPPED}
+
+        controller.files[0]['a.lua'] = b'-- changed on controller\n'
+        assert sync.sync_lua(paths, verify_remote=True) == {'a.lua': FileSync.UPLOADED, 'b.lua': FileSync.SKIPPED}
+
+
+def test_disconnected():
+    """Mất kết nối: GetLuaList/ComputeFileMD5 trả về int, sync_lua trả về mã lỗi thay vì TypeError"""
+    with synced(['a.lua']) as (controller, robot, sync, paths):
+        assert sync.sync_lua(paths) == {'a.lua': FileSync.UPLOADED}
+        Robot.RPC.is_conect = False
+        try:
+            assert sync.remote_md5(['a.lua']) == {'a.lua': None}
+            assert sync.sync_lua(paths) == {'a.lua': Robot.RobotError.ERR_RPC_ERROR}
+        finally:
+            Robot.RPC.is_conect = True
+        # upload thất bại đã xóa bản ghi manifest: lần sau kiểm tra lại bằng MD5 của controller
+        assert sync.sync_lua(paths) == {'a.lua': FileSync.SKIPPED}
+
+
+def main():
+    tests = [test_upload_skip_verify, test_disconnected]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"LOI: {test.__name__}: {e!r}")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
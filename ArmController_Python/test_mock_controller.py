@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Mock Controller - chạy SDK end-to-end với mock_controller.py (không cần robot, dùng cho CI)
+Mock chiếm các cổng 20003/20004/20010/20011 trên 127.0.0.1 trong lúc test.
+
+Chạy: python test_mock_controller.py  hoặc  python -m pytest test_mock_controller.py
+"""
+
+import os
+import sys
+import time
+import xmlrpc.client
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'fairino_sdk'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fairino import Robot
+from mock_controller import MockController, SDK_COMMANDS
+
+
+@contextmanager
+def connected(**options):
+    """Khởi động mock, kết nối RPC và chờ frame 20004 đầu tiên"""
+    with MockController(**options) as controller:
+        robot = Robot.RPC('127.0.0.1')
+        try:
+            assert robot.wait_until(lambda pkg: True, 2.0, 0), "không nhận được frame 20004"
+            yield controller, robot
+        finally:
+            robot.CloseRPC()
+
+
+def test_motion_and_program():
+    """MoveJ cập nhật trạng thái 20004; ProgramRun kết thúc sau program_duration"""
+    with connected(program_duration=0.3) as (controller, robot):
+        assert robot.MoveJ([10.0, -90.0, 90.0, -90.0, -90.0, 0.0], 0, 0, vel=100) == 0
+        assert robot.wait_motion_done(5.0)
+        assert robot.read_state("jt_cur_pos")[0] == 10.0
+
+        seq = robot.snapshot()[0]
+        start = time.monotonic()
+        assert robot.ProgramRun() == 0
+        assert robot.wait_program_done(seq, 3.0)
+        assert time.monotonic() - start >= 0.25
+
+
+def test_unimplemented_methods():
+    """Lệnh chưa mô phỏng trả về 0, query chưa mô phỏng trả về Fault thay vì giá trị sai kiểu"""
+    assert "SetAO" in SDK_COMMANDS and "FT_GetConfig" not in SDK_COMMANDS
+    with connected() as (controller, robot):
+        assert robot.SetAO(0, 10.0) == 0
+        try:
+            robot.FT_GetConfig()
+        except xmlrpc.client.Fault:
+            pass
+        else:
+            raise AssertionError("FT_GetConfig phải trả về Fault")
+
+
+def test_servo_rejects_bad_length():
+    """ServoJ sai độ dài trả về Fault và luồng 20004 vẫn tiếp tục"""
+    with connected() as (controller, robot):
+        try:
+            robot.robot.ServoJ([1.0, 2.0, 3.0], [0.0] * 4, 0.0, 0.0, 0.008, 0.0, 0.0, 0)
+        except xmlrpc.client.Fault:
+            pass
+        else:
+            raise AssertionError("ServoJ 3 khớp phải trả về Fault")
+        seq = robot.snapshot()[0]
+        assert robot.wait_until(lambda pkg: True, 1.0, seq + 5)
+
+
+def main():
+    tests = [test_motion_and_program, test_unimplemented_methods, test_servo_rejects_bad_length]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"OK: {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"LOI: {test.__name__}: {e!r}")
+    return failed == 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -1,14 +1,14 @@
 from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
-import threading, socket, time, os
+import threading, socket, time, os, tempfile
 
-# Ensure lua_scripts exists and create a small test lua file
-root = os.path.dirname(__file__)
-lua_dir = os.path.join(root, 'lua_scripts')
-if not os.path.exists(lua_dir):
-    os.makedirs(lua_dir)
-lua_file = os.path.join(lua_dir, 'test_sim.lua')
-with open(lua_file, 'w', encoding='utf-8') as f:
-    f.write('print("hello from lua test")\n')
+
+def make_test_lua():
+    # Create a small test lua file in a temp dir (never inside lua_scripts/)
+    lua_dir = tempfile.mkdtemp(prefix='lua_upload_test_')
+    lua_file = os.path.join(lua_dir, 'test_sim.lua')
+    with open(lua_file, 'w', encoding='utf-8') as f:
+        f.write('print("hello from lua test")\n')
+    return lua_dir
 
 class RequestHandler(SimpleXMLRPCRequestHandler):
     rpc_paths = ('/RPC2', '/RPC', '/')
@@ -96,6 +96,7 @@ if __name__ == '__main__':
     myarm.ROBOT_IP = '127.0.0.1'
     myarm.XMLRPC_PORT = 20003
     myarm.TCP_PORT = 20010
+    myarm.LUA_DIR = make_test_lua()
 
     print('\n--- Starting upload test ---')
     ok = myarm.upload_lua('test_sim.lua')
@@ -1 +1 @@
-__all__ = ["iot_controller"]
+__all__ = ["iot_controller", "async_iot_controller"]
@@ -0,0 +1,229 @@
+import asyncio
+from collections import deque
+from typing import Optional
+
+import serial
+
+from iot_controller import IoTController, Match, match_command, normalize_hex_string, build_frame
+from protocol import FrameDecoder
+
+
+class AsyncIoTController:
+	"""asyncio counterpart of IoTController: one event loop can drive many ports.
+
+	On POSIX the port's file descriptor is registered with loop.add_reader(), so no thread is
+	involved; bytes are split with the same FrameDecoder as the threaded controller (frames as soon
+	as their last byte is in, other bytes after RX_IDLE seconds of silence, a partial frame after
+	FRAME_HOLD). Where the port has no
+	selectable descriptor (Windows COM ports, ProactorEventLoop) reads run in the loop's default
+	executor with an RX_IDLE read timeout instead.
+	"""
+
+	RX_IDLE: float = IoTController.RX_IDLE
+	FRAME_HOLD: float = IoTController.FRAME_HOLD
+	INBOX_LIMIT: int = IoTController.INBOX_LIMIT
+
+	list_ports = staticmethod(IoTController.list_ports)
+
+	def __init__(self) -> None:
+		self._ser: Optional[serial.Serial] = None
+		self._loop: Optional[asyncio.AbstractEventLoop] = None
+		self._timeout: float = 1.0
+		self._decoder = FrameDecoder()
+		self._fd: Optional[int] = None
+		self._poll_task: Optional[asyncio.Task] = None
+		self._idle_handle: Optional[asyncio.TimerHandle] = None
+		self._reading = False
+		self._inbox: deque[bytes] = deque()
+		self._waiters: deque[tuple[Optional[Match], asyncio.Future]] = deque()
+
+	async def open(self, port: str, baudrate: int = 115200, timeout: float = 1.0, rtscts: bool = False, xonxoff: bool = False) -> None:
+		if self.is_open():
+			self.close()
+		self._loop = asyncio.get_running_loop()
+		self._timeout = timeout
+		# opening a port can block (driver, USB adapter); keep it off the loop
+		self._ser = await self._loop.run_in_executor(None, lambda: serial.Serial(
+			port=port,
+			baudrate=baudrate,
+			timeout=0,
+			rtscts=rtscts,
+			xonxoff=xonxoff,
+			bytesize=serial.EIGHTBITS,
+			parity=serial.PARITY_NONE,
+			stopbits=serial.STOPBITS_ONE,
+		))
+		self._decoder = FrameDecoder()
+		self._inbox.clear()
+		self._reading = True
+		try:
+			fd = self._ser.fileno()
+			self._loop.add_reader(fd, self._on_readable)
+			self._fd = fd
+		except (AttributeError, NotImplementedError, OSError):
+			self._ser.timeout = self.RX_IDLE
+			self._poll_task = self._loop.create_task(self._poll(self._ser))
+
+	def is_open(self) -> bool:
+		return bool(self._ser and self._ser.is_open)
+
+	def close(self) -> None:
+		ser = self._ser
+		if self._fd is not None:
+			self._loop.remove_reader(self._fd)
+			self._fd = None
+		if self._poll_task is not None:
+			self._poll_task.cancel()
+			self._poll_task = None
+		if ser and ser.is_open:
+			try:
+				ser.cancel_read()
+			except Exception:
+				pass
+			ser.close()
+		self._shutdown()
+
+	def _on_readable(self) -> None:
+		try:
+			data = self._ser.read(self._ser.in_waiting or 1)
+		except (serial.SerialException, OSError, TypeError):
+			self.close()  # device unplugged
+			return
+		if data:
+			self._received(data)
+
+	async def _poll(self, ser: serial.Serial) -> None:
+		try:
+			while ser.is_open:
+				data = await self._loop.run_in_executor(None, lambda: ser.read(ser.in_waiting or 1))
+				if data:
+					self._received(data)
+		except (serial.SerialException, OSError, TypeError, AttributeError):
+			if self._ser is ser:
+				self._poll_task = None
+				self.close()
+
+	def _received(self, data: bytes) -> None:
+		self._deliver(self._decoder.feed(data))
+		if self._idle_handle is not None:
+			self._idle_handle.cancel()
+			self._idle_handle = None
+		if self._decoder.pending():
+			self._idle_handle = self._loop.call_later(self.RX_IDLE, self._on_idle)
+
+	def _on_idle(self) -> None:
+		self._idle_handle = None
+		self._deliver(self._decoder.idle())
+		if self._decoder.pending():
+			self._idle_handle = self._loop.call_later(self.FRAME_HOLD - self.RX_IDLE, self._on_hold_expired)
+
+	def _on_hold_expired(self) -> None:
+		self._idle_handle = None
+		self._deliver(self._decoder.flush())
+
+	def _shutdown(self) -> None:
+		if self._idle_handle is not None:
+			self._idle_handle.cancel()
+			self._idle_handle = None
+		self._deliver(self._decoder.flush())
+		self._reading = False
+		waiters, self._waiters = self._waiters, deque()
+		for _match, future in waiters:
+			if not future.done():
+				future.set_result(b"")
+
+	def _deliver(self, messages: list[bytes]) -> None:
+		for message in messages:
+			for waiter in self._waiters:
+				match, future = waiter
+				if future.done():
+					continue  # timed out or cancelled, removed below
+				if match is None or match(message):
+					future.set_result(message)
+					break
+			else:
+				self._inbox.append(message)
+			self._waiters = deque(w for w in self._waiters if not w[1].done())
+		while len(self._inbox) > self.INBOX_LIMIT:
+			self._inbox.popleft()
+
+	async def wait_reply(self, future: asyncio.Future, timeout: Optional[float]) -> bytes:
+		"""Wait for a future from expect(); b"" on timeout (the waiter is withdrawn)."""
+		try:
+			return await asyncio.wait_for(future, timeout)
+		except asyncio.TimeoutError:
+			self._withdraw(future)
+			return b""
+
+	def _withdraw(self, future: asyncio.Future) -> None:
+		future.cancel()
+		self._waiters = deque(w for w in self._waiters if w[1] is not future)
+
+	def expect(self, match: Optional[Match] | int = None) -> asyncio.Future:
+		"""Future for the next message accepted by match (a predicate or a CommandCode).
+
+		Same rules as IoTController.expect: register before writing; b"" if the port closes first.
+		"""
+		if not self.is_open():
+			raise RuntimeError("Serial port is not open")
+		if isinstance(match, int):
+			match = match_command(match)
+		future = self._loop.create_future()
+		if self._reading:
+			self._waiters.append((match, future))
+		else:
+			future.set_result(b"")
+		return future
+
+	def write(self, data: bytes) -> int:
+		if not self.is_open():
+			raise RuntimeError("Serial port is not open")
+		return self._ser.write(data)
+
+	async def request(self, data: bytes, match: Optional[Match] | int = None, timeout: Optional[float] = 2.0) -> bytes:
+		"""Write data and return the first reply accepted by match (b"" on timeout)."""
+		future = self.expect(match)
+		try:
+			self.write(data)
+		except Exception:
+			self._withdraw(future)
+			raise
+		return await self.wait_reply(future, timeout)
+
+	async def query(self, command_code: int, instruction_code: int, data_hex: str | None = None, timeout: Optional[float] = 2.0) -> bytes:
+		"""Send one frame and return the reply frame with the same CommandCode (b"" on timeout)."""
+		data_bytes = normalize_hex_string(data_hex) if data_hex else b""
+		return await self.request(build_frame(command_code, instruction_code, data_bytes), command_code, timeout)
+
+	def send_hex(self, hex_string: str) -> int:
+		return self.write(normalize_hex_string(hex_string))
+
+	def send_frame(self, command_code: int, instruction_code: int, data_hex: str | None = None) -> int:
+		data_bytes = normalize_hex_string(data_hex) if data_hex else b""
+		return self.write(build_frame(command_code, instruction_code, data_bytes))
+
+	def read_available(self) -> bytes:
+		"""Return (and drop) everything received so far that no waiter claimed."""
+		data = b"".join(self._inbox)
+		self._inbox.clear()
+		return data
+
+	def discard_input(self) -> None:
+		self._inbox.clear()
+
+	async def read_frame(self, overall_timeout: Optional[float] = 2.0) -> bytes:
+		"""Next reply (frame or idle-terminated chunk) as in IoTController.read_frame; b"" on timeout."""
+		if not self.is_open():
+			raise RuntimeError("Serial port is not open")
+		if self._inbox:
+			return self._inbox.popleft()
+		return await self.wait_reply(self.expect(), overall_timeout)
+
+	async def __aenter__(self) -> "AsyncIoTController":
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.close()
+
+
+__all__ = ["AsyncIoTController"]
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Async IoT Device Manager
+Quản lý nhiều thiết bị IoT trên một event loop asyncio (không thread cho mỗi thiết bị)
+"""
+
+import os
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+from datetime import datetime
+
+from async_iot_controller import AsyncIoTController
+from iot_device_manager import IoTDeviceManager
+
+
+class AsyncIoTDeviceManager(IoTDeviceManager):
+    """
+    Phiên bản asyncio của IoTDeviceManager
+
+    Cấu hình (config.env), thống kê và báo cáo sức khỏe dùng chung với IoTDeviceManager;
+    kết nối, gửi lệnh, broadcast và monitoring là coroutine/task trên cùng một event loop
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.devices: Dict[str, AsyncIoTController] = {}
+        self.monitoring_tasks: Dict[str, asyncio.Task] = {}
+        # get_device_health/get_system_overview đếm thiết bị đang monitoring theo dict này
+        self.monitoring_threads = self.monitoring_tasks
+
+    async def connect_device(self, device_name: str) -> bool:
+        """Kết nối đến thiết bị"""
+        if device_name not in self.device_status:
+            logging.error(f"Device {device_name} not found in configuration")
+            return False
+
+        if device_name in self.devices and self.devices[device_name].is_open():
+            logging.info(f"Device {device_name} already connected")
+            return True
+
+        try:
+            controller = AsyncIoTController()
+            status = self.device_status[device_name]
+
+            baudrate = int(os.getenv('DEFAULT_BAUDRATE', '115200'))
+            timeout = float(os.getenv('DEFAULT_TIMEOUT', '2.0'))
+
+            await controller.open(status.com_port, baudrate=baudrate, timeout=timeout)
+
+            self.devices[device_name] = controller
+            status.connected = True
+            status.last_seen = datetime.now()
+            logging.info(f"Successfully connected to {device_name} on {status.com_port}")
+            return True
+
+        except Exception as e:
+            logging.error(f"Connection error for {device_name}: {e}")
+            return False
+
+    async def connect_all(self) -> Dict[str, bool]:
+        """Kết nối đồng thời tất cả thiết bị trong cấu hình"""
+        names = list(self.device_status.keys())
+        results = await asyncio.gather(*(self.connect_device(name) for name in names))
+        return dict(zip(names, results))
+
+    async def disconnect_device(self, device_name: str) -> bool:
+        """Ngắt kết nối thiết bị"""
+        if device_name not in self.devices:
+            return False
+
+        await self.stop_monitoring(device_name)
+        try:
+            self.devices.pop(device_name).close()
+
+            if device_name in self.device_status:
+                self.device_status[device_name].connected = False
+
+            logging.info(f"Disconnected from {device_name}")
+            return True
+
+        except Exception as e:
+            logging.error(f"Disconnection error for {device_name}: {e}")
+            return False
+
+    async def send_command(self, device_name: str, command: Dict,
+                           timeout: Optional[float] = None) -> Tuple[bool, Optional[bytes]]:
+        """Gửi lệnh đến thiết bị và đợi phản hồi (timeout mặc định: DEFAULT_TIMEOUT)"""
+        if device_name not in self.devices or not self.devices[device_name].is_open():
+            logging.error(f"Device {device_name} not connected")
+            return False, None
+
+        try:
+            controller = self.devices[device_name]
+
+            # Build và gửi frame; request() đăng ký chờ phản hồi trước khi ghi và hủy nếu ghi lỗi
+            frame, match = self.build_command_frame(command)
+            self.device_status[device_name].commands_sent += 1
+
+            if timeout is None:
+                timeout = float(os.getenv('DEFAULT_TIMEOUT', '2.0'))
+            response = await controller.request(frame, match, timeout)
+            return self._record_response(device_name, len(frame), response)
+
+        except Exception as e:
+            self._record_error(device_name, e)
+            return False, None
+
+    async def broadcast_command(self, command: Dict) -> Dict[str, Tuple[bool, Optional[bytes]]]:
+        """Gửi lệnh đồng thời đến tất cả thiết bị đã kết nối"""
+        names = [name for name, controller in self.devices.items() if controller.is_open()]
+        results = await asyncio.gather(*(self.send_command(name, command) for name in names))
+        return dict(zip(names, results))
+
+    def start_monitoring(self, device_name: str, interval: float = 5.0):
+        """Bắt đầu monitoring thiết bị (gọi trong event loop đang chạy)"""
+        if device_name in self.monitoring_tasks:
+            logging.warning(f"Monitoring already started for {device_name}")
+            return
+
+        task = asyncio.get_running_loop().create_task(self._monitor_loop(device_name, interval))
+        self.monitoring_tasks[device_name] = task
+        logging.info(f"Started monitoring for {device_name}")
+
+    async def _monitor_loop(self, device_name: str, interval: float):
+        while self.running and device_name in self.devices:
+            try:
+                status_cmd = self.device_commands.get(device_name, {}).get('status_query')
+                if status_cmd:
+                    success, response = await self.send_command(device_name, status_cmd)
+                    if not success:
+                        logging.warning(f"Monitoring failed for {device_name}")
+
+            except Exception as e:
+                logging.error(f"Monitoring error for {device_name}: {e}")
+
+            await asyncio.sleep(interval)
+
+    async def stop_monitoring(self, device_name: str):
+        """Dừng monitoring thiết bị"""
+        task = self.monitoring_tasks.pop(device_name, None)
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logging.info(f"Stopped monitoring for {device_name}")
+
+    async def stop(self):
+        """Dừng device manager"""
+        self.running = False
+
+        for device_name in list(self.monitoring_tasks.keys()):
+            await self.stop_monitoring(device_name)
+
+        for device_name in list(self.devices.keys()):
+            await self.disconnect_device(device_name)
+
+        logging.info("Async IoT Device Manager stopped")
+
+    def __enter__(self):
+        raise TypeError("AsyncIoTDeviceManager: dùng 'async with'")
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.stop()
+
+
+async def main():
+    """Test function"""
+    async with AsyncIoTDeviceManager() as manager:
+        print("Async IoT Device Manager started")
+
+        # Connect to all devices
+        for device_name, connected in (await manager.connect_all()).items():
+            if connected:
+                print(f"Connected to {device_name}")
+                manager.start_monitoring(device_name)
+
+        # Run for 30 seconds
+        await asyncio.sleep(30)
+
+        # Print status
+        print("\nDevice Status:")
+        for device_name in manager.get_all_status():
+            health = manager.get_device_health(device_name)
+            print(f"{device_name}: {health}")
+
+        print("\nSystem Overview:")
+        overview = manager.get_system_overview()
+        for key, value in overview.items():
+            print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,10 +1,15 @@
 import binascii
-from typing import Optional, List
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Callable, Optional, List
+import threading
 import time
 
 import serial
 from serial.tools import list_ports
 
+from protocol import FrameDecoder, verify_frame
+
 
 def normalize_hex_string(hex_string: str) -> bytes:
 	cleaned = hex_string.replace(" ", "").replace("0x", "").replace("-", "").replace("_", "")
@@ -32,9 +37,36 @@ def build_frame(command_code: int, instruction_code: int, data_bytes: bytes | No
 	return frame_wo_cs_end + bytes([checksum, 0xFF])
 
 
+Match = Callable[[bytes], bool]
+
+
+def match_command(command_code: int) -> Match:
+	"""Match predicate for valid frames whose CommandCode is command_code."""
+	return lambda message: len(message) >= 2 and message[0] == command_code and verify_frame(message)
+
+
 class IoTController:
+	"""Serial port with a background reader.
+
+	While the port is open a daemon thread reads whatever bytes arrive and splits them with
+	FrameDecoder: frames as soon as their last byte is in, other bytes (ASCII replies) once the
+	line has been idle for RX_IDLE seconds; a partial frame is given up after FRAME_HOLD seconds. Each message completes the oldest pending waiter
+	whose match accepts it (see expect/request/query); unclaimed messages go to an inbox read by
+	read_frame/read_bytes/read_until_hex.
+	"""
+
+	RX_IDLE: float = 0.02
+	FRAME_HOLD: float = 0.2
+	INBOX_LIMIT: int = 256
+
 	def __init__(self) -> None:
 		self._ser: Optional[serial.Serial] = None
+		self._timeout: float = 1.0
+		self._reader: Optional[threading.Thread] = None
+		self._reading = False
+		self._lock = threading.Lock()
+		self._inbox: deque[bytes] = deque()
+		self._waiters: deque[tuple[Optional[Match], Future]] = deque()
 
 	@staticmethod
 	def list_ports() -> list[str]:
@@ -43,45 +75,185 @@ class IoTController:
 	def open(self, port: str, baudrate: int = 115200, timeout: float = 1.0, rtscts: bool = False, xonxoff: bool = False) -> None:
 		if self._ser and self._ser.is_open:
 			self.close()
+		# timeout is the default for read_bytes/read_until_hex; the port itself only blocks for RX_IDLE
+		self._timeout = timeout
 		self._ser = serial.Serial(
 			port=port,
 			baudrate=baudrate,
-			timeout=timeout,
+			timeout=self.RX_IDLE,
 			rtscts=rtscts,
 			xonxoff=xonxoff,
 			bytesize=serial.EIGHTBITS,
 			parity=serial.PARITY_NONE,
 			stopbits=serial.STOPBITS_ONE,
 		)
+		with self._lock:
+			self._inbox.clear()
+			self._reading = True
+		self._reader = threading.Thread(target=self._read_loop, args=(self._ser,), name=f"iot-reader-{port}", daemon=True)
+		self._reader.start()
 
 	def is_open(self) -> bool:
 		return bool(self._ser and self._ser.is_open)
 
 	def close(self) -> None:
 		if self._ser and self._ser.is_open:
+			try:
+				self._ser.cancel_read()
+			except Exception:
+				pass
 			self._ser.close()
+		reader, self._reader = self._reader, None
+		if reader and reader is not threading.current_thread():
+			reader.join(1.0)
 
-	def send_hex(self, hex_string: str) -> int:
+	def _read_loop(self, ser: serial.Serial) -> None:
+		decoder = FrameDecoder()
+		last_rx = time.monotonic()
+		try:
+			while ser.is_open:
+				data = ser.read(ser.in_waiting or 1)
+				if data:
+					last_rx = time.monotonic()
+					self._deliver(decoder.feed(data))
+				elif time.monotonic() - last_rx >= self.FRAME_HOLD:
+					self._deliver(decoder.flush())
+				else:
+					self._deliver(decoder.idle())
+		except (serial.SerialException, OSError, TypeError, AttributeError):
+			pass  # port closed or device unplugged
+		finally:
+			self._deliver(decoder.flush())
+			with self._lock:
+				self._reading = False
+				waiters, self._waiters = self._waiters, deque()
+			for _match, future in waiters:
+				if not future.done():
+					future.set_result(b"")
+			if ser.is_open:
+				try:
+					ser.close()
+				except Exception:
+					pass
+
+	def _deliver(self, messages: list[bytes]) -> None:
+		if not messages:
+			return
+		with self._lock:
+			for message in messages:
+				for waiter in self._waiters:
+					match, future = waiter
+					if match is None or match(message):
+						self._waiters.remove(waiter)
+						future.set_result(message)
+						break
+				else:
+					self._inbox.append(message)
+			while len(self._inbox) > self.INBOX_LIMIT:
+				self._inbox.popleft()
+
+	def wait_reply(self, future: Future, timeout: Optional[float]) -> bytes:
+		"""Wait for a future from expect(); b"" on timeout (the waiter is withdrawn)."""
+		try:
+			return future.result(timeout)
+		except FutureTimeout:
+			with self._lock:
+				if future.done():
+					return future.result()
+				self._waiters = deque(w for w in self._waiters if w[1] is not future)
+			return b""
+
+	def _take(self, match: Optional[Match], timeout: Optional[float]) -> bytes:
+		"""Next inbox message accepted by match, waiting up to timeout (None = forever); b"" on timeout."""
+		if not self.is_open():
+			raise RuntimeError("Serial port is not open")
+		with self._lock:
+			for message in self._inbox:
+				if match is None or match(message):
+					self._inbox.remove(message)
+					return message
+			if not self._reading:
+				return b""
+			future: Future = Future()
+			self._waiters.append((match, future))
+		return self.wait_reply(future, timeout)
+
+	def _unread(self, data: bytes) -> None:
+		if data:
+			with self._lock:
+				self._inbox.appendleft(bytes(data))
+
+	def expect(self, match: Optional[Match] | int = None) -> Future:
+		"""Register interest in the next message accepted by match (a predicate or a CommandCode).
+
+		Only messages arriving after this call count, so register before writing the request.
+		The future resolves to the message, or b"" if the port closes first.
+		"""
+		if not self.is_open():
+			raise RuntimeError("Serial port is not open")
+		if isinstance(match, int):
+			match = match_command(match)
+		future: Future = Future()
+		with self._lock:
+			if self._reading:
+				self._waiters.append((match, future))
+			else:
+				future.set_result(b"")
+		return future
+
+	def write(self, data: bytes) -> int:
 		if not self.is_open():
 			raise RuntimeError("Serial port is not open")
-		payload = normalize_hex_string(hex_string)
-		written = self._ser.write(payload)
+		written = self._ser.write(data)
 		self._ser.flush()
 		return written
 
+	def request(self, data: bytes, match: Optional[Match] | int = None, timeout: Optional[float] = 2.0) -> bytes:
+		"""Write data and return the first reply accepted by match (b"" on timeout)."""
+		future = self.expect(match)
+		try:
+			self.write(data)
+		except Exception:
+			self.wait_reply(future, 0)
+			raise
+		return self.wait_reply(future, timeout)
+
+	def query(self, command_code: int, instruction_code: int, data_hex: str | None = None, timeout: Optional[float] = 2.0) -> bytes:
+		"""Send one frame and return the reply frame with the same CommandCode (b"" on timeout)."""
+		data_bytes = normalize_hex_string(data_hex) if data_hex else b""
+		return self.request(build_frame(command_code, instruction_code, data_bytes), command_code, timeout)
+
+	def send_hex(self, hex_string: str) -> int:
+		if not self.is_open():
+			raise RuntimeError("Serial port is not open")
+		return self.write(normalize_hex_string(hex_string))
+
 	def send_frame(self, command_code: int, instruction_code: int, data_hex: str | None = None) -> int:
 		if not self.is_open():
 			raise RuntimeError("Serial port is not open")
 		data_bytes = normalize_hex_string(data_hex) if data_hex else b""
-		frame = build_frame(command_code, instruction_code, data_bytes)
-		written = self._ser.write(frame)
-		self._ser.flush()
-		return written
+		return self.write(build_frame(command_code, instruction_code, data_bytes))
+
+	def read_available(self) -> bytes:
+		"""Return (and drop) everything received so far that no waiter claimed."""
+		with self._lock:
+			data = b"".join(self._inbox)
+			self._inbox.clear()
+		return data
+
+	def discard_input(self) -> None:
+		self.read_available()
 
 	def read_bytes(self, num_bytes: int = 1) -> bytes:
-		if not self.is_open():
-			raise RuntimeError("Serial port is not open")
-		return self._ser.read(num_bytes)
+		deadline = time.monotonic() + self._timeout
+		buffer = bytearray()
+		while len(buffer) < num_bytes:
+			message = self._take(None, max(deadline - time.monotonic(), 0.0))
+			if not message:
+				break
+			buffer += message
+		self._unread(buffer[num_bytes:])
+		return bytes(buffer[:num_bytes])
 
 	def read_until_hex(self, hex_pattern: str, max_bytes: int = 4096) -> bytes:
 		if not self.is_open():
@@ -89,44 +261,27 @@ class IoTController:
 		pattern = normalize_hex_string(hex_pattern)
 		if not pattern:
 			return b""
+		deadline = time.monotonic() + self._timeout
 		buffer = bytearray()
 		while len(buffer) < max_bytes:
-			b = self._ser.read(1)
-			if not b:
+			message = self._take(None, max(deadline - time.monotonic(), 0.0))
+			if not message:
 				break
-			buffer += b
-			if buffer.endswith(pattern):
-				break
-		return bytes(buffer)
+			buffer += message
+			index = buffer.find(pattern)
+			if index >= 0:
+				end = index + len(pattern)
+				self._unread(buffer[end:])
+				return bytes(buffer[:end])
+		self._unread(buffer[max_bytes:])
+		return bytes(buffer[:max_bytes])
 
-	def read_frame(self, overall_timeout: float = 2.0) -> bytes:
-		"""Read one framed reply: [cmd][len][ins][data...][checksum][0xFF]."""
-		if not self.is_open():
-			raise RuntimeError("Serial port is not open")
-		start = time.time()
-		buf = bytearray()
-		# Read first two bytes (cmd, len)
-		while len(buf) < 2:
-			b = self._ser.read(1)
-			if b:
-				buf += b
-			else:
-				if time.time() - start > overall_timeout:
-					return bytes(buf)
-		# Determine remaining bytes based on length
-		if len(buf) < 2:
-			return bytes(buf)
-		total_len = buf[1]
-		remaining = max(total_len - len(buf), 0)
-		while remaining > 0:
-			chunk = self._ser.read(remaining)
-			if chunk:
-				buf += chunk
-				remaining = max(total_len - len(buf), 0)
-			else:
-				if time.time() - start > overall_timeout:
-					break
-		return bytes(buf)
+	def read_frame(self, overall_timeout: Optional[float] = 2.0) -> bytes:
+		"""Next reply: one frame [cmd][len][ins][data...][checksum][0xFF], or a chunk of other
+		bytes (e.g. an ASCII reply) once the line went idle. Returns b"" on timeout;
+		overall_timeout=None waits until a reply arrives or the port closes.
+		"""
+		return self._take(None, overall_timeout)
 
 
-__all__ = ["IoTController", "normalize_hex_string", "build_frame", "compute_checksum"]
+__all__ = ["IoTController", "match_command", "normalize_hex_string", "build_frame", "compute_checksum"]
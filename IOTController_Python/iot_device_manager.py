@@ -11,7 +11,7 @@ import json
 import time
 import threading
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from dotenv import load_dotenv
@@ -146,6 +146,44 @@ class IoTDeviceManager:
             logging.error(f"Disconnection error for {device_name}: {e}")
             return False
     
+    @staticmethod
+    def build_command_frame(command: Dict) -> Tuple[bytes, Callable[[bytes], bool]]:
+        """Frame của lệnh cấu hình và điều kiện nhận phản hồi của nó
+        
+        Phản hồi là frame cùng command code (hoặc chuỗi không phải frame), nên lệnh monitoring chạy
+        song song trên cùng thiết bị không lấy nhầm phản hồi của nhau
+        """
+        cmd_code = int(command['command_code'], 16)
+        ins_code = int(command['instruction_code'], 16)
+        data_bytes = command.get('data_bytes', [])
+        
+        # Convert data_bytes to bytes
+        data_hex = ''.join(f'{b:02X}' for b in data_bytes) if data_bytes else ''
+        
+        frame = build_frame(cmd_code, ins_code, bytes.fromhex(data_hex) if data_hex else b'')
+        return frame, lambda message: message[0] == cmd_code or not verify_frame(message)
+    
+    def _record_response(self, device_name: str, written: int, response: Optional[bytes]) -> Tuple[bool, Optional[bytes]]:
+        """Cập nhật thống kê thiết bị theo phản hồi nhận được"""
+        status = self.device_status[device_name]
+        if response:
+            status.response_count += 1
+            status.last_seen = datetime.now()
+            
+            if verify_frame(response):
+                logging.info(f"Command sent to {device_name}: {written} bytes, response: {response.hex().upper()}")
+            else:
+                logging.warning(f"Invalid frame received from {device_name}: {response.hex().upper()}")
+            return True, response
+        else:
+            logging.warning(f"No response from {device_name}")
+            return True, None
+    
+    def _record_error(self, device_name: str, error: Exception):
+        if device_name in self.device_status:
+            self.device_status[device_name].error_count += 1
+        logging.error(f"Command error for {device_name}: {error}")
+    
     def send_command(self, device_name: str, command: Dict) -> Tuple[bool, Optional[bytes]]:
         """Gửi lệnh đến thiết bị và nhận phản hồi"""
         if device_name not in self.devices or not self.devices[device_name].is_open():
@@ -154,43 +192,18 @@ class IoTDeviceManager:
         
         try:
             controller = self.devices[device_name]
-            status = self.device_status[device_name]
-            
-            cmd_code = int(command['command_code'], 16)
-            ins_code = int(command['instruction_code'], 16)
-            data_bytes = command.get('data_bytes', [])
-            
-            # Convert data_bytes to bytes
-            data_hex = ''.join(f'{b:02X}' for b in data_bytes) if data_bytes else ''
             
-            # Build và gửi frame
-            frame = build_frame(cmd_code, ins_code, bytes.fromhex(data_hex) if data_hex else b'')
-            written = controller.send_hex(frame.hex())
+            # Build và gửi frame; request() đăng ký chờ phản hồi trước khi ghi và rút lại nếu ghi lỗi
+            frame, match = self.build_command_frame(command)
+            self.device_status[device_name].commands_sent += 1
             
-            status.commands_sent += 1
-            
-            # Đọc phản hồi
+            # Đọc phản hồi (trả về ngay khi reader nhận đủ frame)
             timeout = float(os.getenv('DEFAULT_TIMEOUT', '2.0'))
-            response = controller.read_frame(timeout)
-            
-            if response:
-                status.response_count += 1
-                status.last_seen = datetime.now()
-                
-                if verify_frame(response):
-                    logging.info(f"Command sent to {device_name}: {written} bytes, response: {response.hex().upper()}")
-                    return True, response
-                else:
-                    logging.warning(f"Invalid frame received from {device_name}: {response.hex().upper()}")
-                    return True, response
-            else:
-                logging.warning(f"No response from {device_name}")
-                return True, None
+            response = controller.request(frame, match, timeout)
+            return self._record_response(device_name, len(frame), response)
                 
         except Exception as e:
-            if device_name in self.device_status:
-                self.device_status[device_name].error_count += 1
-            logging.error(f"Command error for {device_name}: {e}")
+            self._record_error(device_name, e)
             return False, None
     
     def start_monitoring(self, device_name: str, interval: float = 5.0):
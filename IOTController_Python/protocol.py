@@ -78,3 +78,95 @@ def compute_checksum(payload_without_checksum_and_end: bytes) -> int:
 	return sum(payload_without_checksum_and_end) & 0xFF
 
 
+
+
+MIN_FRAME_LENGTH: int = 5
+
+
+class FrameDecoder:
+	"""Incremental splitter for a serial byte stream.
+
+	feed() returns complete messages in arrival order: a frame is emitted as soon as its last
+	byte arrives and passes verify_frame(); bytes that cannot start a valid frame (ASCII replies,
+	noise) are collected into a raw chunk, emitted before the next frame or by idle() once the
+	line has gone quiet. A partial frame with a plausible header survives idle() (USB-serial
+	adapters can pause mid-frame for their latency timer) and is only given up by flush().
+	"""
+
+	def __init__(self) -> None:
+		self._buf = bytearray()
+		self._raw = bytearray()
+
+	def feed(self, data: bytes) -> list[bytes]:
+		buf = self._buf
+		buf += data
+		messages = []
+		while len(buf) >= 2:
+			length = buf[1]
+			if length >= MIN_FRAME_LENGTH:
+				if len(buf) < length:
+					start = self._find_frame(1)
+					if start < 0:
+						break  # may be a frame still arriving
+					self._raw += buf[:start]
+					del buf[:start]
+					continue
+				frame = bytes(buf[:length])
+				if verify_frame(frame):
+					if self._raw:
+						messages.append(bytes(self._raw))
+						self._raw.clear()
+					messages.append(frame)
+					del buf[:length]
+					continue
+			self._raw.append(buf[0])
+			del buf[0]
+		return messages
+
+	def _find_frame(self, start: int) -> int:
+		"""Offset of the first complete, valid frame at or after start (-1 if none)."""
+		buf = self._buf
+		for offset in range(start, len(buf) - MIN_FRAME_LENGTH + 1):
+			length = buf[offset + 1]
+			if length >= MIN_FRAME_LENGTH and offset + length <= len(buf) and buf[offset + length - 1] == END_CODE \
+					and verify_frame(bytes(buf[offset:offset + length])):
+				return offset
+		return -1
+
+	def _frame_starts_at(self, offset: int) -> bool:
+		"""True if the buffered bytes from offset on can still be the start of a frame.
+
+		Past the first byte the instruction code must already be in, so the line ending of an
+		ASCII reply is not mistaken for a frame header.
+		"""
+		buf = self._buf
+		if buf[offset + 1] < MIN_FRAME_LENGTH:
+			return False
+		if offset + 2 >= len(buf):
+			return offset == 0
+		return buf[offset + 2] in (INSTRUCTION_QUERY, INSTRUCTION_SET)
+
+	def idle(self) -> list[bytes]:
+		"""Return the raw chunk after a short silence, keeping a partial frame that may still complete."""
+		buf = self._buf
+		if len(buf) > 1:
+			start = 0
+			while start < len(buf) - 1 and not self._frame_starts_at(start):
+				start += 1
+			if start == len(buf) - 1:
+				start = len(buf)
+			self._raw += buf[:start]
+			del buf[:start]
+		chunk = bytes(self._raw)
+		self._raw.clear()
+		return [chunk] if chunk else []
+
+	def flush(self) -> list[bytes]:
+		"""Return everything still buffered as one raw chunk (long silence or port closed)."""
+		chunk = bytes(self._raw + self._buf)
+		self._raw.clear()
+		self._buf.clear()
+		return [chunk] if chunk else []
+
+	def pending(self) -> int:
+		return len(self._raw) + len(self._buf)
@@ -372,16 +372,15 @@ class SimpleIoTGUI:
             self.log_message(f"🔍 Raw Debug - Bytes: {[hex(b) for b in data]}")
             
             # Gửi raw data qua serial
-            if hasattr(self.controller, '_ser') and self.controller._ser and self.controller._ser.is_open:
-                written = self.controller._ser.write(data)
-                self.controller._ser.flush()
+            if self.controller.is_open():
+                self.controller.discard_input()
+                written = self.controller.write(data)
                 
                 self.log_message(f"📤 Raw Sent {written} bytes: {command}")
                 
                 # Đọc phản hồi với timeout dài hơn
-                time.sleep(1.0)  # Chờ lâu hơn để nhận phản hồi
-                if self.controller._ser.in_waiting > 0:
-                    response = self.controller._ser.read(self.controller._ser.in_waiting)
+                response = self.controller.read_frame(1.0)
+                if response:
                     self.log_message(f"📥 Raw Response: {response.hex().upper()}")
                     self.log_message(f"📥 Raw Response Length: {len(response)} bytes")
                     if response:
@@ -455,9 +454,9 @@ class SimpleIoTGUI:
                     else:
                         data = command.encode('ascii')
                 
-                if hasattr(self.controller, '_ser') and self.controller._ser and self.controller._ser.is_open:
-                    written = self.controller._ser.write(data)
-                    self.controller._ser.flush()
+                if self.controller.is_open():
+                    self.controller.discard_input()
+                    written = self.controller.write(data)
                     self.log_message(f"✅ Đã gửi {written} bytes")
                     
                     # Clear input
@@ -465,19 +464,17 @@ class SimpleIoTGUI:
                     
                     # Đợi response (không timeout)
                     self.log_message("⏳ Đang đợi response completion (không timeout)...")
-                    while True:
-                        if self.controller._ser.in_waiting > 0:
-                            response = self.controller._ser.read(self.controller._ser.in_waiting)
-                            if response:
-                                self.log_message(f"✅ Nhận response: {response.hex().upper()}")
-                                try:
-                                    response_text = response.decode('utf-8', errors='ignore').strip()
-                                    self.log_message(f"📥 Response text: '{response_text}'")
-                                except:
-                                    pass
-                                self.log_message(f"✅ COMPLETION: Thiết bị đã hoàn thành!")
-                                return
-                        time.sleep(0.2)
+                    response = self.controller.read_frame(None)
+                    if response:
+                        self.log_message(f"✅ Nhận response: {response.hex().upper()}")
+                        try:
+                            response_text = response.decode('utf-8', errors='ignore').strip()
+                            self.log_message(f"📥 Response text: '{response_text}'")
+                        except:
+                            pass
+                        self.log_message(f"✅ COMPLETION: Thiết bị đã hoàn thành!")
+                    else:
+                        self.log_message("❌ Serial connection đã đóng trước khi có response")
                     
                 else:
                     self.log_message("❌ Serial connection không khả dụng")
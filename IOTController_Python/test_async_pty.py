@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test IoTController / AsyncIoTController qua cặp pty (không cần thiết bị, chỉ chạy trên Linux/macOS)
+Mỗi cặp pty: controller mở đầu slave, thiết bị giả lập đọc/ghi đầu master.
+
+Chạy: python test_async_pty.py  hoặc  python -m pytest test_async_pty.py
+"""
+
+import asyncio
+import os
+import pty
+import select
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from async_iot_controller import AsyncIoTController
+from iot_controller import IoTController
+from protocol import FrameDecoder, build_frame
+
+PORT_COUNT = 30  # số cặp pty cho test nhiều port trên một event loop
+
+
+class FakeDevice:
+    """Đầu master của một cặp pty: trả lời frame theo thứ tự tùy chọn, có thể rút (đóng master)"""
+
+    def __init__(self, reverse: int = 1, split_gap: float = 0.0):
+        """
+        Args:
+            reverse: gom bấy nhiêu frame rồi trả lời theo thứ tự ngược lại
+            split_gap: > 0 thì mỗi frame trả lời bị tách đôi, cách nhau split_gap giây
+        """
+        self.master, slave = pty.openpty()
+        self.port = os.ttyname(slave)
+        self.fds = (self.master, slave)  # giữ slave mở để master không nhận EIO trước khi controller mở port
+        self.reverse = reverse
+        self.split_gap = split_gap
+        self.silent = set()  # CommandCode không trả lời
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        decoder = FrameDecoder()
+        pending = []
+        while not self.stopped.is_set():
+            # không chặn trong os.read: master đang bị đọc thì close() chưa thật sự đóng được
+            if not select.select([self.master], [], [], 0.02)[0]:
+                continue
+            try:
+                data = os.read(self.master, 1024)
+            except OSError:
+                return
+            if not data:
+                return
+            for message in decoder.feed(data):
+                if message[0] in self.silent:
+                    continue
+                pending.append(build_frame(message[0], message[2], b"\x01"))
+                if len(pending) >= self.reverse:
+                    for reply in reversed(pending):
+                        self.reply(reply)
+                    pending = []
+
+    def reply(self, frame: bytes):
+        try:
+            if self.split_gap > 0:
+                os.write(self.master, frame[:3])
+                time.sleep(self.split_gap)
+                os.write(self.master, frame[3:])
+            else:
+                os.write(self.master, frame)
+        except OSError:
+            pass
+
+    def unplug(self):
+        self.stopped.set()
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+        fds, self.fds = self.fds, ()  # chỉ đóng một lần: số fd có thể đã được cấp lại
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def test_query_routing():
+    """Hai query đồng thời, thiết bị trả lời ngược thứ tự: mỗi query nhận đúng frame của mình"""
+    device = FakeDevice(reverse=2)
+    controller = IoTController()
+    controller.open(device.port)
+    try:
+        results = {}
+        threads = [threading.Thread(target=lambda code=code: results.__setitem__(code, controller.query(code, 0x55)))
+                   for code in (0x04, 0x05)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)
+        for thread in threads:
+            thread.join(3)
+        assert results[0x04] == build_frame(0x04, 0x55, b"\x01")
+        assert results[0x05] == build_frame(0x05, 0x55, b"\x01")
+    finally:
+        controller.close()
+        device.unplug()
+
+
+def test_split_frame_and_timeout():
+    """Frame bị tách bởi khoảng lặng dài hơn RX_IDLE vẫn được ghép; lệnh không trả lời hết timeout"""
+    device = FakeDevice(split_gap=IoTController.RX_IDLE * 3)
+    device.silent.add(0x06)
+    controller = IoTController()
+    controller.open(device.port)
+    try:
+        assert controller.query(0x04, 0x55, timeout=2.0) == build_frame(0x04, 0x55, b"\x01")
+        start = time.monotonic()
+        assert controller.query(0x06, 0x55, timeout=0.2) == b""
+        assert 0.15 <= time.monotonic() - start < 1.0
+        assert not controller._waiters
+    finally:
+        controller.close()
+        device.unplug()
+
+
+def test_unplug_releases_waiters():
+    """Rút thiết bị hoặc close(): waiter đang chờ nhận b"" ngay, không đợi hết timeout"""
+    for action in ("unplug", "close"):
+        device = FakeDevice()
+        device.silent.add(0x04)
+        controller = IoTController()
+        controller.open(device.port)
+        future = controller.expect(0x04)
+        controller.send_frame(0x04, 0x55)
+        start = time.monotonic()
+        if action == "unplug":
+            device.unplug()
+        else:
+            controller.close()
+        assert controller.wait_reply(future, 5.0) == b""
+        assert time.monotonic() - start < 2.0
+        controller.close()
+        device.unplug()
+
+
+async def async_query_routing():
+    device = FakeDevice(reverse=2)
+    controller = AsyncIoTController()
+    await controller.open(device.port)
+    try:
+        first, second = await asyncio.gather(controller.query(0x04, 0x55), controller.query(0x05, 0x55))
+        assert first == build_frame(0x04, 0x55, b"\x01")
+        assert second == build_frame(0x05, 0x55, b"\x01")
+    finally:
+        controller.close()
+        device.unplug()
+
+
+async def async_split_frame_and_timeout():
+    device = FakeDevice(split_gap=AsyncIoTController.RX_IDLE * 3)
+    device.silent.add(0x06)
+    controller = AsyncIoTController()
+    await controller.open(device.port)
+    try:
+        assert await controller.query(0x04, 0x55) == build_frame(0x04, 0x55, b"\x01")
+        assert await controller.query(0x06, 0x55, timeout=0.2) == b""
+        assert not controller._waiters
+    finally:
+        controller.close()
+        device.unplug()
+
+
+async def async_unplug_releases_waiters():
+    for action in ("unplug", "close"):
+        device = FakeDevice()
+        device.silent.add(0x04)
+        controller = AsyncIoTController()
+        await controller.open(device.port)
+        pending = asyncio.ensure_future(controller.query(0x04, 0x55, timeout=5.0))
+        await asyncio.sleep(0.05)
+        start = time.monotonic()
+        if action == "unplug":
+            device.unplug()
+        else:
+            controller.close()
+        assert await pending == b""
+        assert time.monotonic() - start < 2.0
+        assert not controller.is_open()
+        controller.close()
+        device.unplug()
+
+
+async def async_many_ports():
+    devices = [FakeDevice() for _ in range(PORT_COUNT)]
+    controllers = [AsyncIoTController() for _ in devices]
+    await asyncio.gather(*(c.open(d.port) for c, d in zip(controllers, devices)))
+    try:
+        for _ in range(3):
+            replies = await asyncio.gather(*(c.query(0x04, 0x55) for c in controllers))
+            assert all(reply == build_frame(0x04, 0x55, b"\x01") for reply in replies)
+    finally:
+        for controller, device in zip(controllers, devices):
+            controller.close()
+            device.unplug()
+
+
+def test_async_query_routing():
+    asyncio.run(async_query_routing())
+
+
+def test_async_split_frame_and_timeout():
+    asyncio.run(async_split_frame_and_timeout())
+
+
+def test_async_unplug_releases_waiters():
+    asyncio.run(async_unplug_releases_waiters())
+
+
+def test_async_many_ports():
+    """PORT_COUNT cặp pty trên một event loop, không dùng thread đọc"""
+    asyncio.run(async_many_ports())
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"OK: {name}")
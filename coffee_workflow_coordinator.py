@@ -12,12 +12,15 @@ Giải quyết vấn đề: Đảm bảo mỗi bước hoàn thành trước khi
 import os
 import sys
 import time
-import threading
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait as wait_futures
 from typing import Dict, List, Callable, Optional, Any
 import logging
 
+from workflow_plan import (SCHEDULING_KEYS, WorkflowPlan, compile_workflow, compile_workflow_file,
+                           encode_command, expected_response)
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +48,15 @@ class CoffeeWorkflowCoordinator:
         # Workflow registry để lưu các workflow đã tạo
         self.workflow_registry = {}
         
+        # Bộ lập lịch DAG: số bước chạy đồng thời tối đa, thời gian từng bước của lần chạy gần nhất
+        self.max_workers = 4
+        self.running_steps = set()
+        self.step_timings = {}
+        self.step_dependencies = {}
+        
+        # Plan đã biên dịch của workflow đang load (None khi các bước đã bị sửa sau khi load)
+        self.plan: Optional[WorkflowPlan] = None
+        
     def add_step(self, step_name: str, step_type: str, action_func: Callable, 
                  wait_func: Optional[Callable] = None, timeout: float = 30.0):
         """
@@ -65,6 +77,7 @@ class CoffeeWorkflowCoordinator:
             'timeout': timeout
         }
         self.steps.append(step)
+        self.plan = None
         logger.info(f"✅ Đã thêm bước: {step_name} (type: {step_type})")
     
     def connect_robot(self, robot_instance):
@@ -81,10 +94,13 @@ class CoffeeWorkflowCoordinator:
         self.iot_devices[device_name.lower()] = iot_controller
         logger.info(f"✅ Đã kết nối thiết bị IoT: {device_name}")
     
-    def check_robot_complete(self, timeout: float = 12.0) -> bool:
+    def check_robot_complete(self, timeout: float = 12.0, after_seq: Optional[int] = None) -> bool:
         """
         Kiểm tra xem robot có hoàn thành chương trình/motion không (timeout mặc định 3 giây)
         
+        Args:
+            after_seq: seq trạng thái lấy trước ProgramRun (xem _robot_state_seq), None = seq hiện tại
+
         Returns:
             True nếu robot đã hoàn thành, False nếu timeout hoặc lỗi
         """
@@ -95,6 +111,9 @@ class CoffeeWorkflowCoordinator:
         logger.info(f"⏳ Đang kiểm tra robot hoàn thành (timeout: {timeout}s)...")
         # Detect XML-RPC ServerProxy (mọi thuộc tính đều 'tồn tại')
         is_xmlrpc_proxy = 'ServerProxy' in type(self.robot).__name__
+        # SDK RPC có luồng trạng thái 20004: chờ bằng condition variable thay vì polling
+        if (not is_xmlrpc_proxy) and callable(getattr(self.robot, 'wait_program_done', None)):
+            return self._wait_program_done(timeout, after_seq)
         # Pre-detect capability: nếu không có bất kỳ API trạng thái nào callable, fallback chờ
         has_state_pkg = (not is_xmlrpc_proxy) and hasattr(self.robot, 'robot_state_pkg')
         has_get_program_state = callable(getattr(self.robot, 'GetProgramState', None))
@@ -201,6 +220,24 @@ class CoffeeWorkflowCoordinator:
             return True
         return False
     
+    def _robot_state_seq(self) -> Optional[int]:
+        """seq khung trạng thái 20004 mới nhất của SDK (lấy trước ProgramRun), None nếu robot không có luồng trạng thái"""
+        if 'ServerProxy' in type(self.robot).__name__ or not callable(getattr(self.robot, 'snapshot', None)):
+            return None
+        return self.robot.snapshot()[0]
+
+    def _wait_program_done(self, timeout: float, after_seq: Optional[int] = None) -> bool:
+        """
+        Chờ chương trình Lua chạy xong dựa trên luồng trạng thái của SDK
+        (program_state: 1 = dừng, 2 = đang chạy, 3 = tạm dừng)
+        """
+        start_time = time.time()
+        if self.robot.wait_program_done(after_seq, timeout):
+            logger.info(f"✅ Robot đã hoàn thành! (state stream, {time.time() - start_time:.2f}s)")
+            return True
+        logger.warning(f"⚠️ Timeout kiểm tra robot ({timeout}s)")
+        return False
+
     def check_iot_complete(self, device_name: str, expected_response: bytes = None, 
                          timeout: Optional[float] = 10.0, prefer_raw: bool = False) -> bool:
         """
@@ -209,7 +246,8 @@ class CoffeeWorkflowCoordinator:
         Args:
             device_name: Tên thiết bị IoT
             expected_response: Byte response mong đợi (None = bất kỳ response nào)
-            timeout: Timeout (giây)
+            timeout: Timeout (giây), None = chờ vô hạn
+            prefer_raw: Giữ để tương thích cấu hình cũ (reader trả về cả frame lẫn chuỗi RAW)
         
         Returns:
             True nếu nhận được response, False nếu timeout
@@ -232,46 +270,10 @@ class CoffeeWorkflowCoordinator:
             logger.info(f"⏳ Đang đợi response từ {device_name} (timeout: {timeout}s)...")
         
         try:
-            # Chế độ ưu tiên RAW: không yêu cầu frame, chỉ cần bất kỳ bytes (hoặc khớp expected)
-            if prefer_raw and hasattr(controller, '_ser') and getattr(controller, '_ser') and controller._ser.is_open:
-                ser = controller._ser
-                start_time = time.time()
-                while True:
-                    if ser.in_waiting > 0:
-                        response = ser.read(ser.in_waiting)
-                        if response:
-                            logger.info(f"📥 Nhận RAW response từ {device_name}: {response.hex().upper()}")
-                            if expected_response:
-                                if response == expected_response:
-                                    logger.info("✅ RAW response khớp expected")
-                                    return True
-                                else:
-                                    logger.warning("⚠️ RAW response không khớp expected")
-                                    return False
-                            return True
-                    if timeout is not None and (time.time() - start_time) > timeout:
-                        logger.warning("⚠️ RAW wait timeout")
-                        return False
-                    time.sleep(0.1)
+            # Reader nền của controller tách sẵn frame (ngay khi đủ byte) hoặc chuỗi RAW (khi đường truyền lặng),
+            # nên cả chế độ frame lẫn prefer_raw đều chỉ cần đợi message kế tiếp; timeout=None -> chờ vô hạn
+            response = controller.read_frame(timeout)
 
-            # Đọc frame phản hồi (có fallback RAW ngắn)
-            if timeout is None:
-                # Chờ vô hạn cho đến khi có frame
-                while True:
-                    response = controller.read_frame(2.0)
-                    # Fallback: nếu không có frame, kiểm tra raw bytes
-                    if (not response) and hasattr(controller, '_ser') and getattr(controller, '_ser') and controller._ser.is_open:
-                        if controller._ser.in_waiting > 0:
-                            response = controller._ser.read(controller._ser.in_waiting)
-                    if response:
-                        break
-                    time.sleep(0.1)
-            else:
-                response = controller.read_frame(timeout)
-                if (not response) and hasattr(controller, '_ser') and getattr(controller, '_ser') and controller._ser.is_open:
-                    if controller._ser.in_waiting > 0:
-                        response = controller._ser.read(controller._ser.in_waiting)
-            
             if response:
                 logger.info(f"📥 Nhận response từ {device_name}: {response.hex().upper()}")
                 
@@ -297,7 +299,7 @@ class CoffeeWorkflowCoordinator:
     def _default_wait(self, step_info: Dict) -> bool:
         """Default wait function nếu không có wait_func cụ thể"""
         if step_info['type'] == 'robot':
-            return self.check_robot_complete(step_info['timeout'])
+            return self.check_robot_complete(step_info['timeout'], step_info.get('robot_seq'))
         elif step_info['type'] == 'iot':
             # Tìm device name từ step_info
             device_name = step_info.get('device', 'default')
@@ -327,6 +329,8 @@ class CoffeeWorkflowCoordinator:
         try:
             # 1. Thực hiện action
             logger.info(f"▶️ Đang thực hiện: {step['name']}...")
+            # seq trước action: _default_wait chỉ xét trạng thái robot sau khi action chạy
+            step['robot_seq'] = self._robot_state_seq() if self.robot_connected else None
             action_result = step['action']()
             
             if not action_result:
@@ -360,108 +364,251 @@ class CoffeeWorkflowCoordinator:
     
     def run_workflow(self) -> bool:
         """
-        Chạy toàn bộ workflow tuần tự (phiên bản đơn giản, ổn định)
+        Chạy toàn bộ workflow theo đồ thị phụ thuộc (depends_on)
+
+        Workflow không khai báo depends_on vẫn chạy tuần tự như trước; các bước độc lập
+        (vd. bật máy đá và máy khuấy trong lúc robot lấy cốc) chạy đồng thời, mỗi tài nguyên
+        (robot arm, từng cổng serial) chỉ được một bước dùng tại một thời điểm.
         """
         if not self.steps:
             logger.error("❌ Workflow trống!")
             return False
-        
+
         logger.info(f"\n{'='*70}")
         logger.info(f"🎬 BẮT ĐẦU WORKFLOW: {self.workflow_name}")
         logger.info(f"📋 Tổng cộng {len(self.steps)} bước")
         logger.info(f"{'='*70}\n")
-        
+
+        missing = self.missing_devices()
+        if missing:
+            logger.error(f"❌ Thiết bị IoT chưa kết nối: {', '.join(missing)}")
+            return False
+
         self.current_step = 0
         self.completed_steps = []
         self.workflow_start_time = time.time()
-        
-        for i, _ in enumerate(self.steps):
-            self.current_step = i
-            success = self.run_step(i)
-            if not success:
-                step_name = self.steps[i].get('name', f'Step_{i}')
-                logger.error(f"\n❌ WORKFLOW THẤT BẠI tại bước {i + 1}: {step_name}")
-                return False
-            logger.info(f"✅ Bước {i + 1} hoàn thành. Tiếp tục...\n")
-        
+
+        success = self._run_dag(list(range(len(self.steps))))
+        if not success:
+            return False
+
         elapsed_time = time.time() - self.workflow_start_time
         logger.info(f"\n{'='*70}")
         logger.info(f"🎉 WORKFLOW HOÀN THÀNH!")
         logger.info(f"✅ Đã hoàn thành {len(self.completed_steps)}/{len(self.steps)} bước")
         logger.info(f"⏱️ Thời gian thực hiện: {elapsed_time:.2f} giây")
+        self._log_critical_path()
         logger.info(f"{'='*70}\n")
-        
+
         return True
-    
-    def _handle_conditional_step(self, step: Dict, step_index: int) -> str:
-        """Xử lý conditional step"""
-        condition_config = step.get('condition', {})
-        if_true = step.get('if_true')
-        if_false = step.get('if_false')
-        
-        # Kiểm tra điều kiện
-        condition_result = self._check_condition(condition_config)
-        
-        if condition_result:
-            logger.info(f"✅ Điều kiện đúng, chuyển sang: {if_true}")
-            # Tìm và chuyển đến step if_true
-            if if_true:
-                target_index = self._find_step_by_id(if_true)
-                if target_index != -1:
-                    self.current_step = target_index - 1  # -1 vì loop sẽ tăng lên 1
-            return 'success'
-        else:
-            logger.info(f"❌ Điều kiện sai, chuyển sang: {if_false}")
-            # Tìm và chuyển đến step if_false
-            if if_false:
-                target_index = self._find_step_by_id(if_false)
-                if target_index != -1:
-                    self.current_step = target_index - 1
-            return 'skip'
-    
-    def _handle_parallel_step(self, step: Dict, step_index: int) -> bool:
-        """Xử lý parallel step - chạy nhiều bước song song"""
-        parallel_step_ids = step.get('parallel_steps', [])
-        
-        if not parallel_step_ids:
-            logger.warning("⚠️ Parallel step không có step nào để chạy")
-            return True
-        
-        logger.info(f"🔄 Chạy song song {len(parallel_step_ids)} bước...")
-        
-        # Tìm các step cần chạy
-        steps_to_run = []
-        for step_id in parallel_step_ids:
-            target_index = self._find_step_by_id(step_id)
-            if target_index != -1:
-                steps_to_run.append(target_index)
-        
-        # Chạy song song bằng threading
-        results = {}
-        
-        def run_step_thread(step_idx):
-            results[step_idx] = self.run_step(step_idx)
-        
-        threads = []
-        for step_idx in steps_to_run:
-            thread = threading.Thread(target=run_step_thread, args=(step_idx,))
-            thread.start()
-            threads.append(thread)
-        
-        # Đợi tất cả threads hoàn thành
-        for thread in threads:
-            thread.join(timeout=300)  # Timeout 5 phút
-        
-        # Kiểm tra kết quả
-        all_success = all(results.values())
-        
-        if all_success:
-            logger.info("✅ Tất cả parallel steps đã hoàn thành")
-        else:
-            logger.error("❌ Một số parallel steps thất bại")
-        
-        return all_success
-    
+
+    # ==================== DAG SCHEDULER ====================
+
+    def _step_key(self, step_index: int) -> str:
+        """ID của bước; bước thêm bằng add_step (không có ID) dùng 'step_<index>'"""
+        return self.steps[step_index].get('id') or f"step_{step_index}"
+
+    def _resolve_dependencies(self, indices: List[int]) -> Optional[Dict[str, set]]:
+        """
+        Tập bước phải xong trước mỗi bước (theo ID)
+
+        - Bước không có key 'depends_on' chạy sau bước đứng ngay trước nó (giữ hành vi tuần tự)
+        - 'depends_on': [] là bước gốc, chạy ngay khi workflow bắt đầu
+
+        Returns:
+            {step_id: set(step_id)} hoặc None nếu ID không tồn tại / có chu trình
+        """
+        keys = [self._step_key(i) for i in indices]
+        deps = {}
+        for position, (i, key) in enumerate(zip(indices, keys)):
+            step = self.steps[i]
+            if 'depends_on' in step:
+                deps[key] = set(step['depends_on'] or [])
+            else:
+                deps[key] = {keys[position - 1]} if position > 0 else set()
+            unknown = deps[key].difference(keys)
+            if unknown:
+                logger.error(f"❌ Bước '{step['name']}' phụ thuộc bước không tồn tại: {', '.join(sorted(unknown))}")
+                return None
+
+        # Kiểm tra chu trình (Kahn)
+        remaining = {key: set(d) for key, d in deps.items()}
+        while remaining:
+            roots = [key for key, d in remaining.items() if not d]
+            if not roots:
+                logger.error(f"❌ depends_on có chu trình giữa các bước: {', '.join(remaining)}")
+                return None
+            for key in roots:
+                del remaining[key]
+            for d in remaining.values():
+                d.difference_update(roots)
+        return deps
+
+    def _step_resources(self, step: Dict) -> List[str]:
+        """
+        Tài nguyên bước dùng độc quyền: 'arm' cho bước robot, 'serial:<port>' cho mỗi thiết bị IoT
+        (hai tên thiết bị cùng một cổng dùng chung một khóa). JSON có thể ghi đè bằng 'resources'.
+        """
+        if 'resources' in step:
+            return sorted(set(step['resources']))
+        if step['type'] == 'robot':
+            return ['arm']
+        resources = set()
+        for config in (step.get('action_config') or {}, step.get('wait_config') or {}):
+            device_name = config.get('device')
+            if not device_name:
+                continue
+            controller = (
+                self.iot_devices.get(device_name)
+                or self.iot_devices.get(device_name.upper())
+                or self.iot_devices.get(device_name.lower())
+            )
+            port = getattr(getattr(controller, '_ser', None), 'port', None)
+            resources.add(f"serial:{port}" if port else f"iot:{device_name.upper()}")
+        return sorted(resources)
+
+    def _run_timed_step(self, step_index: int) -> bool:
+        """Chạy một bước trong thread của executor và ghi lại thời điểm bắt đầu/kết thúc"""
+        key = self._step_key(step_index)
+        self.current_step = step_index
+        self.running_steps.add(key)
+        start = time.time() - self.workflow_start_time
+        try:
+            success = self.run_step(step_index)
+        finally:
+            self.running_steps.discard(key)
+        self.step_timings[key] = {
+            'name': self.steps[step_index]['name'],
+            'start': start,
+            'end': time.time() - self.workflow_start_time,
+            'success': success
+        }
+        return success
+
+    def _run_dag(self, indices: List[int], dependencies: Optional[Dict[str, set]] = None) -> bool:
+        """
+        Chạy các bước theo đồ thị phụ thuộc trên ThreadPoolExecutor (tối đa self.max_workers bước)
+
+        Bước sẵn sàng (đã xong mọi depends_on) được giao cho executor khi tất cả tài nguyên của nó rảnh,
+        ưu tiên theo thứ tự trong workflow. Khi một bước thất bại, không giao thêm bước mới
+        và đợi các bước đang chạy kết thúc.
+
+        Args:
+            indices: Index các bước cần chạy
+            dependencies: {step_id: set(step_id)}; None = lấy từ depends_on
+        """
+        if dependencies is None:
+            dependencies = self._resolve_dependencies(indices)
+            if dependencies is None:
+                return False
+        if not hasattr(self, 'workflow_start_time'):
+            self.workflow_start_time = time.time()
+        index_of = {self._step_key(i): i for i in indices}
+        resources = {key: self._step_resources(self.steps[i]) for key, i in index_of.items()}
+        self.step_dependencies = dependencies
+        self.step_timings = {}
+
+        pending = list(index_of)
+        done = set()
+        busy = set()
+        running = {}
+        failed = None
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="workflow") as executor:
+            while running or (pending and failed is None):
+                if failed is None:
+                    for key in list(pending):
+                        if len(running) >= self.max_workers:
+                            break
+                        if dependencies[key] <= done and busy.isdisjoint(resources[key]):
+                            pending.remove(key)
+                            busy.update(resources[key])
+                            running[executor.submit(self._run_timed_step, index_of[key])] = key
+                if not running:
+                    break
+                finished, _ = wait_futures(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    busy.difference_update(resources[key])
+                    if future.result():
+                        done.add(key)
+                    elif failed is None:
+                        failed = key
+
+        if failed is not None:
+            i = index_of[failed]
+            logger.error(f"\n❌ WORKFLOW THẤT BẠI tại bước {i + 1}: {self.steps[i].get('name', failed)}")
+            return False
+        return True
+
+    def get_critical_path_report(self) -> Dict:
+        """
+        Đường găng của lần chạy gần nhất: chuỗi depends_on có tổng thời gian thực đo dài nhất
+
+        Returns:
+            {
+                'elapsed': thời gian chạy thực tế,
+                'sequential': tổng thời gian các bước (nếu chạy tuần tự),
+                'critical_path': [step_id, ...],
+                'critical_time': độ dài đường găng,
+                'resource_wait': elapsed - critical_time (thời gian mất do chờ tài nguyên),
+                'steps': {step_id: {name, start, end, duration, slack}}
+            }
+        """
+        timings = self.step_timings
+        if not timings:
+            return {}
+        deps = {key: [d for d in self.step_dependencies.get(key, ()) if d in timings] for key in timings}
+        order = sorted(timings, key=lambda key: timings[key]['end'])
+        duration = {key: timings[key]['end'] - timings[key]['start'] for key in timings}
+
+        # Thời điểm xong sớm nhất nếu chỉ bị ràng buộc bởi depends_on
+        finish = {}
+        for key in order:
+            finish[key] = max((finish[d] for d in deps[key]), default=0.0) + duration[key]
+        critical_time = max(finish.values())
+
+        # Thời điểm xong muộn nhất không làm chậm đường găng -> slack
+        latest = {key: critical_time for key in timings}
+        for key in reversed(order):
+            for d in deps[key]:
+                latest[d] = min(latest[d], latest[key] - duration[key])
+
+        path = [max(finish, key=finish.get)]
+        while deps[path[-1]]:
+            path.append(max(deps[path[-1]], key=finish.get))
+        path.reverse()
+
+        elapsed = max(t['end'] for t in timings.values())
+        return {
+            'elapsed': elapsed,
+            'sequential': sum(duration.values()),
+            'critical_path': path,
+            'critical_time': critical_time,
+            'resource_wait': max(0.0, elapsed - critical_time),
+            'steps': {
+                key: {
+                    'name': timings[key]['name'],
+                    'start': timings[key]['start'],
+                    'end': timings[key]['end'],
+                    'duration': duration[key],
+                    'slack': latest[key] - finish[key]
+                }
+                for key in order
+            }
+        }
+
+    def _log_critical_path(self):
+        """Ghi báo cáo đường găng ra log"""
+        report = self.get_critical_path_report()
+        if not report:
+            return
+        saved = max(0.0, 1 - report['elapsed'] / report['sequential']) if report['sequential'] > 0 else 0.0
+        logger.info(f"📈 Tuần tự: {report['sequential']:.2f}s → thực tế: {report['elapsed']:.2f}s (giảm {saved:.0%})")
+        logger.info(f"🧭 Đường găng ({report['critical_time']:.2f}s, chờ tài nguyên {report['resource_wait']:.2f}s): "
+                    + " → ".join(report['steps'][key]['name'] for key in report['critical_path']))
+        for key, info in report['steps'].items():
+            logger.info(f"   {info['start']:7.2f}s - {info['end']:7.2f}s  slack {info['slack']:6.2f}s  {info['name']}")
+
     def _execute_fallback(self, fallback_step_id: str) -> bool:
         """Thực thi fallback step khi có lỗi"""
         fallback_index = self._find_step_by_id(fallback_step_id)
@@ -493,7 +640,8 @@ class CoffeeWorkflowCoordinator:
             'elapsed_time': elapsed_time,
             'status': 'running' if self.current_step < len(self.steps) else 'completed',
             'completed_step_names': [s['name'] for s in self.completed_steps],
-            'current_step_name': self.steps[self.current_step]['name'] if self.current_step < len(self.steps) else None
+            'current_step_name': self.steps[self.current_step]['name'] if self.current_step < len(self.steps) else None,
+            'running_steps': sorted(self.running_steps)
         }
     
     # ==================== WORKFLOW MANAGEMENT ====================
@@ -507,7 +655,9 @@ class CoffeeWorkflowCoordinator:
     
     def add_step_advanced(self, step_id: str, step_name: str, step_type: str, 
                          action_config: Dict, wait_config: Dict = None, 
-                         timeout: float = 30.0, position: int = None):
+                         timeout: float = 30.0, position: int = None,
+                         depends_on: List[str] = None, resources: List[str] = None,
+                         reserve: List[str] = None, release: List[str] = None):
         """
         Thêm bước vào workflow với cấu hình chi tiết
         
@@ -519,6 +669,10 @@ class CoffeeWorkflowCoordinator:
             wait_config: Cấu hình wait (dict)
             timeout: Timeout (giây)
             position: Vị trí chèn (None = cuối)
+            depends_on: ID các bước phải xong trước (None = sau bước đứng trước, [] = bước gốc)
+            resources: Tài nguyên dùng độc quyền (None = tự suy ra: 'arm' / cổng serial)
+            reserve: Tài nguyên đơn hàng giữ lại sau bước này (OrderPipeline), vd. vị trí cốc ở máy khuấy
+            release: Tài nguyên đã reserve được trả lại khi bước này xong
         """
         step = {
             'id': step_id,
@@ -529,6 +683,9 @@ class CoffeeWorkflowCoordinator:
             'timeout': timeout,
             'created_at': time.time()
         }
+        for key, value in zip(SCHEDULING_KEYS, (depends_on, resources, reserve, release)):
+            if value is not None:
+                step[key] = list(value)
         
         # Tạo action function từ config
         step['action'] = self._create_action_from_config(action_config)
@@ -540,6 +697,7 @@ class CoffeeWorkflowCoordinator:
             self.steps.append(step)
         else:
             self.steps.insert(position, step)
+        self.plan = None
         
         logger.info(f"✅ Đã thêm bước: {step_name} (ID: {step_id})")
         return step_id
@@ -563,6 +721,11 @@ class CoffeeWorkflowCoordinator:
         for key, value in kwargs.items():
             if key in ['name', 'type', 'timeout']:
                 step[key] = value
+            elif key in SCHEDULING_KEYS:
+                if value is None:
+                    step.pop(key, None)
+                else:
+                    step[key] = list(value)
             elif key == 'action_config':
                 step['action_config'] = value
                 step['action'] = self._create_action_from_config(value)
@@ -571,6 +734,7 @@ class CoffeeWorkflowCoordinator:
                 step['wait'] = self._create_wait_from_config(value)
         
         step['updated_at'] = time.time()
+        self.plan = None
         logger.info(f"✅ Đã cập nhật bước: {step_id}")
         return True
     
@@ -588,6 +752,11 @@ class CoffeeWorkflowCoordinator:
         
         step_name = self.steps[step_index]['name']
         del self.steps[step_index]
+        self.plan = None
+        # Bỏ ID đã xóa khỏi depends_on của các bước còn lại
+        for step in self.steps:
+            if step_id in step.get('depends_on', ()):
+                step['depends_on'] = [d for d in step['depends_on'] if d != step_id]
         logger.info(f"✅ Đã xóa bước: {step_name} (ID: {step_id})")
         return True
     
@@ -611,6 +780,7 @@ class CoffeeWorkflowCoordinator:
         # Di chuyển bước
         step = self.steps.pop(step_index)
         self.steps.insert(new_position, step)
+        self.plan = None
         
         logger.info(f"✅ Đã di chuyển bước '{step['name']}' đến vị trí {new_position + 1}")
         return True
@@ -639,6 +809,7 @@ class CoffeeWorkflowCoordinator:
         
         # Chèn sau bước gốc
         self.steps.insert(step_index + 1, new_step)
+        self.plan = None
         
         logger.info(f"✅ Đã nhân bản bước: {new_step['name']} (ID: {new_step_id})")
         return new_step_id
@@ -668,6 +839,7 @@ class CoffeeWorkflowCoordinator:
         self.steps.clear()
         self.completed_steps.clear()
         self.current_step = 0
+        self.plan = None
         logger.info("🗑️ Đã xóa tất cả bước trong workflow")
     
     def _find_step_by_id(self, step_id: str) -> int:
@@ -677,8 +849,13 @@ class CoffeeWorkflowCoordinator:
                 return i
         return -1
     
-    def _create_action_from_config(self, action_config: Dict) -> Callable:
-        """Tạo action function từ config"""
+    def _create_action_from_config(self, action_config: Dict, compiled: Optional[Dict] = None) -> Callable:
+        """
+        Tạo action function từ config
+
+        Args:
+            compiled: Phần đã biên dịch của WorkflowPlan ({'payload', 'expected'}); None = mã hóa từ config
+        """
         action_type = action_config.get('type', 'default')
         
         if action_type == 'run_lua':
@@ -707,10 +884,17 @@ class CoffeeWorkflowCoordinator:
         elif action_type == 'send_command':
             device = action_config.get('device', '')
             command = action_config.get('command', '')
-            mode = action_config.get('mode')  # 'ascii' | 'hex' | None(auto)
-            terminator = action_config.get('terminator')  # 'CR'|'LF'|'CRLF'|'none'|None
+            # Mã hóa lệnh (mode 'ascii'|'hex'|auto, terminator 'CR'|'LF'|'CRLF'|'none') một lần khi tạo bước
+            payload = compiled.get('payload') if compiled else None
+            if payload is None:
+                try:
+                    payload = encode_command(command, action_config.get('mode'), action_config.get('terminator'))
+                except ValueError as e:
+                    logger.error(f"❌ Lệnh '{command}' không mã hóa được: {e}")
+                    return lambda: False
             def action():
-                return self._send_iot_command(device, command, mode=mode, terminator=terminator)
+                logger.info(f"📤 Gửi lệnh đến {device}: {command}")
+                return self._write_iot_payload(device, payload)
             return action
         
         elif action_type == 'read_sensor':
@@ -742,8 +926,8 @@ class CoffeeWorkflowCoordinator:
                 return True
             return action
     
-    def _create_wait_from_config(self, wait_config: Dict) -> Callable:
-        """Tạo wait function từ config"""
+    def _create_wait_from_config(self, wait_config: Dict, compiled: Optional[Dict] = None) -> Callable:
+        """Tạo wait function từ config (compiled: như _create_action_from_config)"""
         wait_type = wait_config.get('type', 'default')
         
         if wait_type == 'robot_complete':
@@ -760,19 +944,12 @@ class CoffeeWorkflowCoordinator:
             timeout = wait_config.get('timeout', None)
             prefer_raw = bool(wait_config.get('prefer_raw', False))
             # Hỗ trợ expected ở dạng ascii hoặc hex
-            expected_ascii = wait_config.get('expected_ascii')
-            expected_hex = wait_config.get('expected_hex')
-            expected_bytes = None
-            if expected_ascii is not None:
-                try:
-                    expected_bytes = str(expected_ascii).encode('ascii')
-                except Exception:
-                    expected_bytes = None
-            elif expected_hex is not None:
+            if compiled:
+                expected_bytes = compiled.get('expected')
+            else:
                 try:
-                    clean = str(expected_hex).replace(' ', '').replace('-', '').replace('0x', '').replace('0X', '')
-                    expected_bytes = bytes.fromhex(clean)
-                except Exception:
+                    expected_bytes = expected_response(wait_config)
+                except ValueError:
                     expected_bytes = None
             def wait(step_info):
                 return self.check_iot_complete(device, expected_response=expected_bytes, timeout=timeout, prefer_raw=prefer_raw)
@@ -811,13 +988,14 @@ class CoffeeWorkflowCoordinator:
             if hasattr(self.robot, 'ProgramLoad'):
                 load_result = self.robot.ProgramLoad(remote_path)
                 if int(load_result) == 0:
+                    after_seq = self._robot_state_seq()
                     run_result = self.robot.ProgramRun()
                     if int(run_result) != 0:
                         logger.error(f"ProgramRun failed: {run_result}")
                         return False
                     # Run & Wait Completion inside action (default 8s)
                     logger.info("⏳ Đang đợi robot hoàn thành (Run & Wait Completion)...")
-                    done = self.check_robot_complete(timeout=8.0)
+                    done = self.check_robot_complete(timeout=8.0, after_seq=after_seq)
                     if not done:
                         logger.warning("⚠️ Timeout đợi robot hoàn thành")
                     return done
@@ -832,7 +1010,17 @@ class CoffeeWorkflowCoordinator:
             return False
     
     def _send_iot_command(self, device_name: str, command: str, mode: Optional[str] = None, terminator: Optional[str] = None) -> bool:
-        """Gửi lệnh IoT action"""
+        """Gửi lệnh IoT action (mã hóa theo mode/terminator như workflow_plan.encode_command)"""
+        logger.info(f"📤 Gửi lệnh đến {device_name}: {command}")
+        try:
+            data = encode_command(command, mode, terminator)
+        except ValueError as e:
+            logger.error(f"Lỗi gửi IoT command: {e}")
+            return False
+        return self._write_iot_payload(device_name, data)
+    
+    def _write_iot_payload(self, device_name: str, data: bytes) -> bool:
+        """Ghi payload đã mã hóa ra cổng serial của thiết bị"""
         controller = (
             self.iot_devices.get(device_name)
             or self.iot_devices.get(device_name.upper())
@@ -843,54 +1031,10 @@ class CoffeeWorkflowCoordinator:
             return False
         
         try:
-            logger.info(f"📤 Gửi lệnh đến {device_name}: {command}")
-            
-            # Xây dựng payload theo mode/terminator:
-            # - HEX string: "AA 55 01" hoặc "AA5501" → bytes.fromhex
-            # - Số: giữ ASCII (thiết bị nhận số tốc độ v.v.)
-            # - Khác: ASCII
-            cmd_str = str(command).strip()
-            hex_candidate = cmd_str.replace(' ', '').replace('-', '').replace('0x', '').replace('0X', '')
-            is_hex = len(hex_candidate) >= 2 and all(c in '0123456789abcdefABCDEF' for c in hex_candidate)
-
-            def apply_terminator(b: bytes) -> bytes:
-                if not terminator or terminator.lower() == 'none':
-                    return b
-                t = terminator.upper()
-                if t == 'CR':
-                    return b + b'\r'
-                if t == 'LF':
-                    return b + b'\n'
-                if t == 'CRLF':
-                    return b + b'\r\n'
-                return b
-
-            if mode == 'hex':
-                data = bytes.fromhex(hex_candidate)
-                logger.info("🔧 [MODE=HEX] Sending HEX bytes")
-                data = apply_terminator(data)
-            elif mode == 'ascii':
-                data = apply_terminator(cmd_str.encode('ascii'))
-                logger.info("🔧 [MODE=ASCII] Sending ASCII")
-            else:
-                # Auto mode giữ ngược tương thích như GUI
-                if is_hex and len(hex_candidate) % 2 == 0:
-                    try:
-                        data = bytes.fromhex(hex_candidate)
-                        logger.info("🔧 [AUTO] Detected HEX BINARY")
-                    except Exception:
-                        data = cmd_str.encode('ascii')
-                elif cmd_str.isdigit() or cmd_str.upper() == 'GO':
-                    data = cmd_str.encode('ascii')
-                    logger.info("🔧 [AUTO] Sending ASCII (digit/GO)")
-                else:
-                    data = cmd_str.encode('ascii')
-                    logger.info("🔧 [AUTO] Sending ASCII")
-                data = apply_terminator(data)
-            if hasattr(controller, '_ser') and controller._ser and controller._ser.is_open:
-                written = controller._ser.write(data)
-                controller._ser.flush()
-                return written > 0
+            if controller.is_open():
+                # Bỏ các response cũ chưa ai đọc để wait iot_response chỉ thấy phản hồi của lệnh này
+                controller.discard_input()
+                return controller.write(data) > 0
             else:
                 logger.error("❌ Serial port chưa mở!")
                 return False
@@ -964,15 +1108,11 @@ class CoffeeWorkflowCoordinator:
             # Gửi command để đọc sensor
             read_command = f"READ_{sensor.upper()}"
             
-            if hasattr(controller, '_ser') and controller._ser and controller._ser.is_open:
-                # Gửi command
-                controller._ser.write(read_command.encode('ascii'))
-                controller._ser.flush()
-                
-                # Đọc response
-                time.sleep(0.5)  # Chờ response
-                if controller._ser.in_waiting > 0:
-                    response = controller._ser.read(controller._ser.in_waiting)
+            if controller.is_open():
+                # Gửi command và đợi response (trả về ngay khi nhận đủ)
+                controller.discard_input()
+                response = controller.request(read_command.encode('ascii'), timeout=0.5)
+                if response:
                     logger.info(f"📥 Sensor value: {response.decode('ascii', errors='ignore')}")
                     return True
                 else:
@@ -999,10 +1139,8 @@ class CoffeeWorkflowCoordinator:
             # Gửi command để thiết lập tham số
             set_command = f"SET_{parameter.upper()}_{value}"
             
-            if hasattr(controller, '_ser') and controller._ser and controller._ser.is_open:
-                written = controller._ser.write(set_command.encode('ascii'))
-                controller._ser.flush()
-                return written > 0
+            if controller.is_open():
+                return controller.write(set_command.encode('ascii')) > 0
             else:
                 logger.error("❌ Serial port chưa mở!")
                 return False
@@ -1026,14 +1164,11 @@ class CoffeeWorkflowCoordinator:
                 return False
             
             controller = self.iot_devices[device]
-            if hasattr(controller, '_ser') and controller._ser and controller._ser.is_open:
-                # Gửi command đọc sensor
-                controller._ser.write(f"READ_{sensor.upper()}".encode('ascii'))
-                controller._ser.flush()
-                
-                time.sleep(0.3)
-                if controller._ser.in_waiting > 0:
-                    response = controller._ser.read(controller._ser.in_waiting)
+            if controller.is_open():
+                # Gửi command đọc sensor và đợi response
+                controller.discard_input()
+                response = controller.request(f"READ_{sensor.upper()}".encode('ascii'), timeout=0.3)
+                if response:
                     try:
                         sensor_value = float(response.decode('ascii', errors='ignore').strip())
                         
@@ -1105,6 +1240,9 @@ class CoffeeWorkflowCoordinator:
                 'timeout': step['timeout'],
                 'created_at': step.get('created_at', time.time())
             }
+            for key in SCHEDULING_KEYS:
+                if key in step:
+                    step_data[key] = step[key]
             workflow_data['steps'].append(step_data)
         
         json_str = json.dumps(workflow_data, indent=2, ensure_ascii=False)
@@ -1126,38 +1264,62 @@ class CoffeeWorkflowCoordinator:
             file_path: Đường dẫn file JSON
         """
         try:
-            if file_path:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    workflow_data = json.load(f)
-            else:
-                workflow_data = json.loads(json_data)
-            
-            # Clear workflow hiện tại
-            self.clear_workflow()
-            
-            # Import metadata
-            self.workflow_id = workflow_data.get('workflow_id', str(uuid.uuid4()))
-            self.workflow_name = workflow_data.get('workflow_name', 'Imported Workflow')
-            self.workflow_version = workflow_data.get('workflow_version', '1.0')
-            self.workflow_description = workflow_data.get('workflow_description', '')
-            
-            # Import các bước
-            for step_data in workflow_data.get('steps', []):
-                self.add_step_advanced(
-                    step_id=step_data['id'],
-                    step_name=step_data['name'],
-                    step_type=step_data['type'],
-                    action_config=step_data['action_config'],
-                    wait_config=step_data['wait_config'],
-                    timeout=step_data['timeout']
-                )
-            
-            logger.info(f"📥 Đã import workflow: {self.workflow_name} ({len(self.steps)} bước)")
-            return True
-            
+            plan = compile_workflow_file(file_path) if file_path else compile_workflow(json_data)
         except Exception as e:
             logger.error(f"❌ Lỗi import workflow: {e}")
             return False
+        return self.load_plan(plan)
+    
+    def load_plan(self, plan: WorkflowPlan) -> bool:
+        """
+        Dựng các bước từ WorkflowPlan đã biên dịch
+        
+        Plan trùng với plan đang load (file không đổi, các bước chưa bị sửa) thì giữ nguyên các bước
+        và closure hiện có; lệnh serial và expected response đã được mã hóa sẵn trong plan.
+        """
+        if plan is self.plan:
+            logger.info(f"📥 Workflow không đổi, dùng lại plan: {self.workflow_name} ({len(self.steps)} bước)")
+            return True
+        
+        # Clear workflow hiện tại
+        self.clear_workflow()
+        
+        # Import metadata
+        self.workflow_id = plan.workflow_id or str(uuid.uuid4())
+        self.workflow_name = plan.workflow_name
+        self.workflow_version = plan.workflow_version
+        self.workflow_description = plan.workflow_description
+        
+        # Import các bước
+        for step_data, compiled in zip(plan.steps, plan.compiled):
+            step = {
+                'id': step_data['id'],
+                'name': step_data['name'],
+                'type': step_data['type'],
+                'action_config': dict(step_data['action_config']),
+                'wait_config': dict(step_data['wait_config']),
+                'timeout': step_data['timeout'],
+                'created_at': step_data.get('created_at', time.time())
+            }
+            for key in SCHEDULING_KEYS:
+                if step_data.get(key) is not None:
+                    step[key] = list(step_data[key])
+            step['action'] = self._create_action_from_config(step['action_config'], compiled)
+            step['wait'] = self._create_wait_from_config(step['wait_config'], compiled)
+            self.steps.append(step)
+        
+        self.plan = plan
+        logger.info(f"📥 Đã import workflow: {self.workflow_name} ({len(self.steps)} bước)")
+        return True
+    
+    def missing_devices(self) -> List[str]:
+        """Thiết bị IoT workflow (đã load từ plan) cần nhưng chưa kết nối"""
+        if self.plan is None:
+            return []
+        return sorted(
+            name for name in self.plan.devices
+            if not (self.iot_devices.get(name) or self.iot_devices.get(name.upper()) or self.iot_devices.get(name.lower()))
+        )
     
     def load_workflow_from_file(self, file_path: str):
         """Load workflow từ file JSON"""
@@ -1416,9 +1578,8 @@ def iot_send_command(device_name: str, command: str):
             else:
                 data = command.encode('ascii')
             
-            if hasattr(controller, '_ser') and controller._ser and controller._ser.is_open:
-                written = controller._ser.write(data)
-                controller._ser.flush()
+            if controller.is_open():
+                written = controller.write(data)
                 logger.info(f"📤 Đã gửi {written} bytes")
                 return written > 0
             else:
@@ -1508,6 +1669,7 @@ if __name__ == "__main__":
 # Export
 __all__ = [
     'CoffeeWorkflowCoordinator', 
+    'SCHEDULING_KEYS', 
     'robot_run_lua', 
     'iot_send_command', 
     'iot_wait_response',
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Order Pipeline
+Hàng đợi đơn hàng chạy gối đầu nhiều đồ uống trên cùng robot arm và thiết bị IoT
+
+Mỗi đơn là một lần chạy workflow (theo depends_on như run_workflow); các bước của nhiều đơn
+dùng chung khóa tài nguyên ('arm', 'serial:<port>') nên máy đá của đơn N+1 chạy được trong lúc
+đơn N đang khuấy.
+- Ưu tiên: priority lớn chạy trước, cùng priority thì đơn nộp trước chạy trước
+- Giữ chỗ: bước có 'reserve' giữ tài nguyên cho đơn đó đến khi bước có 'release' xong
+  (vd. cốc đang nằm trong máy khuấy thì đơn khác không được đưa cốc vào)
+- Backpressure: tối đa max_active đơn chạy cùng lúc, tối đa max_pending đơn chờ + đang chạy
+- Thống kê: số ly/giờ, mức sử dụng từng tài nguyên và từng bước -> tìm thiết bị nghẽn
+"""
+
+import time
+import heapq
+import itertools
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from coffee_workflow_coordinator import CoffeeWorkflowCoordinator
+from workflow_plan import compile_workflow_file
+
+logger = logging.getLogger(__name__)
+
+
+class Order:
+    """Một đơn hàng trong pipeline"""
+
+    def __init__(self, order_id: str, workflow: CoffeeWorkflowCoordinator, priority: int, seq: int):
+        self.order_id = order_id
+        self.workflow = workflow
+        self.priority = priority
+        self.seq = seq
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.success = None
+        self.failed_step = None
+        self._done = threading.Event()
+
+        # Trạng thái lập lịch (chỉ truy cập khi giữ OrderPipeline.cond)
+        self.index_of = {}
+        self.dependencies = {}
+        self.pending = []
+        self.completed = set()
+        self.running = 0
+        self.reserved = set()
+
+    @property
+    def sort_key(self):
+        return (-self.priority, self.seq)
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[bool]:
+        """
+        Đợi đơn hàng kết thúc
+
+        Returns:
+            True/False theo kết quả, None nếu hết timeout
+        """
+        if not self._done.wait(timeout):
+            return None
+        return self.success
+
+
+class OrderPipeline:
+    """Lập lịch nhiều đơn hàng chồng lấn trên các tài nguyên dùng chung"""
+
+    def __init__(self, coordinator: CoffeeWorkflowCoordinator, max_workers: int = 4,
+                 max_active: int = 3, max_pending: int = 10):
+        """
+        Args:
+            coordinator: Coordinator đã kết nối robot và thiết bị IoT (workflow mặc định cho submit())
+            max_workers: Số bước chạy đồng thời tối đa (mọi đơn)
+            max_active: Số đơn chạy gối đầu tối đa
+            max_pending: Số đơn chờ + đang chạy tối đa; submit() chặn hoặc từ chối khi đầy
+        """
+        self.coordinator = coordinator
+        self.max_workers = max_workers
+        self.max_active = max_active
+        self.max_pending = max_pending
+
+        self.cond = threading.Condition()
+        self.waiting = []  # heap (sort_key, Order)
+        self.active: List[Order] = []
+        self.running = 0
+        self.closed = False
+        self.workflows: Dict[str, CoffeeWorkflowCoordinator] = {}
+        self.counter = itertools.count(1)
+
+        # Tài nguyên: khóa theo bước đang chạy và giữ chỗ theo đơn
+        self.locked = set()
+        self.reserved_by: Dict[str, Order] = {}
+        self.occupancy: Dict[str, int] = {}
+        self.occupied_since: Dict[str, float] = {}
+        self.resource_busy: Dict[str, float] = {}
+
+        # Thống kê
+        self.started_at = None
+        self.orders_completed = 0
+        self.orders_failed = 0
+        self.latencies: List[float] = []
+        self.queue_waits: List[float] = []
+        self.stage_stats: Dict[str, Dict] = {}
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="order-step")
+        self.thread = threading.Thread(target=self._schedule_routine, name="order-pipeline", daemon=True)
+        self.thread.start()
+
+    # ==================== ĐƠN HÀNG ====================
+
+    def submit(self, workflow=None, priority: int = 0, order_id: str = None,
+               block: bool = True, timeout: Optional[float] = None) -> Optional[Order]:
+        """
+        Thêm đơn hàng vào hàng đợi
+
+        Args:
+            workflow: None = workflow của coordinator, đường dẫn file JSON, hoặc CoffeeWorkflowCoordinator
+            priority: Độ ưu tiên (lớn chạy trước)
+            order_id: Mã đơn (None = tự đánh số)
+            block: Hàng đợi đầy thì chờ (True) hay từ chối ngay (False)
+            timeout: Thời gian chờ tối đa khi block (giây)
+
+        Returns:
+            Order, hoặc None nếu hàng đợi đầy / pipeline đã đóng / không load được workflow
+        """
+        workflow = self._get_workflow(workflow)
+        if workflow is None:
+            return None
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.closed or self._pending_count() < self.max_pending,
+                                      timeout if block else 0):
+                logger.warning(f"⚠️ Hàng đợi đầy ({self.max_pending} đơn), từ chối đơn mới")
+                return None
+            if self.closed:
+                logger.error("❌ Pipeline đã đóng!")
+                return None
+            seq = next(self.counter)
+            order = Order(order_id or f"order_{seq}", workflow, priority, seq)
+            heapq.heappush(self.waiting, (order.sort_key, order))
+            self.cond.notify_all()
+        logger.info(f"🧾 Nhận đơn {order.order_id}: {workflow.workflow_name} (priority {priority})")
+        return order
+
+    def _get_workflow(self, workflow) -> Optional[CoffeeWorkflowCoordinator]:
+        """
+        Coordinator cho đơn hàng; workflow từ file dùng plan đã biên dịch (chỉ os.stat khi file không đổi)
+        và một coordinator dùng chung robot/thiết bị cho mỗi plan. File bị sửa thì tạo coordinator mới,
+        các đơn đang chạy vẫn giữ các bước cũ.
+        """
+        if workflow is None:
+            return self.coordinator
+        if isinstance(workflow, CoffeeWorkflowCoordinator):
+            return workflow
+        try:
+            plan = compile_workflow_file(workflow)
+        except Exception as e:
+            logger.error(f"❌ Không load được workflow {workflow}: {e}")
+            return None
+        coordinator = self.workflows.get(workflow)
+        if coordinator is None or coordinator.plan is not plan:
+            coordinator = CoffeeWorkflowCoordinator()
+            coordinator.iot_devices = self.coordinator.iot_devices
+            if self.coordinator.robot_connected:
+                coordinator.connect_robot(self.coordinator.robot)
+            coordinator.load_plan(plan)
+            self.workflows[workflow] = coordinator
+        missing = coordinator.missing_devices()
+        if missing:
+            logger.error(f"❌ Thiết bị IoT chưa kết nối: {', '.join(missing)}")
+            return None
+        return coordinator
+
+    def _pending_count(self) -> int:
+        return len(self.waiting) + len(self.active)
+
+    def close(self, wait: bool = True):
+        """Không nhận đơn mới; wait=True đợi các đơn đã nhận chạy xong"""
+        with self.cond:
+            self.closed = True
+            if not wait:
+                for _, order in self.waiting:
+                    self._finish_order(order, False)
+                self.waiting = []
+            self.cond.notify_all()
+        if wait:
+            self.thread.join()
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ==================== LẬP LỊCH ====================
+
+    def _schedule_routine(self):
+        with self.cond:
+            while True:
+                self._admit()
+                dispatched = self._dispatch()
+                if self.closed and not self.waiting and not self.active:
+                    return
+                if not dispatched and self.running == 0 and self.active:
+                    self._break_deadlock()
+                    continue
+                self.cond.wait()
+
+    def _admit(self):
+        """Đưa đơn từ hàng đợi vào chạy khi còn chỗ"""
+        while self.waiting and len(self.active) < self.max_active:
+            _, order = heapq.heappop(self.waiting)
+            workflow = order.workflow
+            indices = list(range(len(workflow.steps)))
+            dependencies = workflow._resolve_dependencies(indices) if indices else {}
+            order.started_at = time.time()
+            if self.started_at is None:
+                self.started_at = order.started_at
+            self.queue_waits.append(order.started_at - order.submitted_at)
+            if dependencies is None:
+                self._finish_order(order, False)
+                continue
+            order.index_of = {workflow._step_key(i): i for i in indices}
+            order.dependencies = dependencies
+            order.pending = list(order.index_of)
+            self.active.append(order)
+            self.active.sort(key=lambda o: o.sort_key)
+            logger.info(f"▶️ Bắt đầu đơn {order.order_id} ({len(self.active)} đơn đang chạy)")
+            if not order.pending:
+                self._finish_order(order, True)
+
+    def _dispatch(self) -> bool:
+        """Giao các bước sẵn sàng cho executor, đơn ưu tiên cao trước; trả về True nếu giao được bước nào"""
+        dispatched = False
+        for order in list(self.active):
+            if order.failed_step is not None:
+                continue
+            for key in list(order.pending):
+                if self.running >= self.max_workers:
+                    return dispatched
+                if not order.dependencies[key] <= order.completed:
+                    continue
+                step = order.workflow.steps[order.index_of[key]]
+                resources = order.workflow._step_resources(step)
+                if not self._available(order, resources + step.get('reserve', [])):
+                    continue
+                self._start_step(order, key, step, resources)
+                dispatched = True
+        return dispatched
+
+    def _available(self, order: Order, resources: List[str]) -> bool:
+        for resource in resources:
+            if resource in self.locked:
+                return False
+            holder = self.reserved_by.get(resource)
+            if holder is not None and holder is not order:
+                return False
+        return True
+
+    def _start_step(self, order: Order, key: str, step: Dict, resources: List[str]):
+        now = time.time()
+        order.pending.remove(key)
+        order.running += 1
+        self.running += 1
+        for resource in resources:
+            self.locked.add(resource)
+            self._occupy(resource, now)
+        for resource in step.get('reserve', []):
+            if resource not in order.reserved:
+                order.reserved.add(resource)
+                self.reserved_by[resource] = order
+                self._occupy(resource, now)
+        future = self.executor.submit(order.workflow.run_step, order.index_of[key])
+        future.add_done_callback(lambda f: self._step_done(order, key, step, resources, now, f))
+
+    def _step_done(self, order: Order, key: str, step: Dict, resources: List[str], start: float, future):
+        now = time.time()
+        success = not future.cancelled() and future.exception() is None and bool(future.result())
+        with self.cond:
+            self.running -= 1
+            order.running -= 1
+            for resource in resources:
+                self.locked.discard(resource)
+                self._vacate(resource, now)
+            for resource in step.get('release', []):
+                self._release(order, resource, now)
+
+            stage = self.stage_stats.setdefault(key, {'name': step['name'], 'count': 0, 'busy': 0.0, 'failed': 0})
+            stage['count'] += 1
+            stage['busy'] += now - start
+            if success:
+                order.completed.add(key)
+            else:
+                stage['failed'] += 1
+                if order.failed_step is None:
+                    order.failed_step = key
+                    logger.error(f"❌ Đơn {order.order_id} thất bại tại bước: {step['name']}")
+
+            if order.running == 0 and (order.failed_step is not None or not order.pending):
+                self._finish_order(order, order.failed_step is None)
+            self.cond.notify_all()
+
+    def _release(self, order: Order, resource: str, now: float):
+        if resource in order.reserved:
+            order.reserved.discard(resource)
+            del self.reserved_by[resource]
+            self._vacate(resource, now)
+
+    def _finish_order(self, order: Order, success: bool):
+        now = time.time()
+        for resource in list(order.reserved):
+            self._release(order, resource, now)
+        if order in self.active:
+            self.active.remove(order)
+        order.finished_at = now
+        order.success = success
+        if success:
+            self.orders_completed += 1
+            self.latencies.append(now - order.submitted_at)
+            logger.info(f"☕ Đơn {order.order_id} hoàn thành sau {now - order.submitted_at:.2f}s")
+        else:
+            self.orders_failed += 1
+        # completed_steps của coordinator dùng chung chỉ có ý nghĩa trong một lần chạy
+        if not any(o.workflow is order.workflow for o in self.active):
+            order.workflow.completed_steps = []
+        order._done.set()
+
+    def _break_deadlock(self):
+        """Không bước nào chạy được mà vẫn còn đơn (giữ chỗ chéo nhau): hủy đơn ưu tiên thấp nhất"""
+        order = self.active[-1]
+        order.failed_step = order.pending[0] if order.pending else None
+        logger.error(f"❌ Deadlock giữ chỗ tài nguyên, hủy đơn {order.order_id}")
+        self._finish_order(order, False)
+
+    # ==================== THỐNG KÊ ====================
+
+    def _occupy(self, resource: str, now: float):
+        count = self.occupancy.get(resource, 0)
+        if count == 0:
+            self.occupied_since[resource] = now
+        self.occupancy[resource] = count + 1
+
+    def _vacate(self, resource: str, now: float):
+        count = self.occupancy[resource] - 1
+        self.occupancy[resource] = count
+        if count == 0:
+            self.resource_busy[resource] = self.resource_busy.get(resource, 0.0) + now - self.occupied_since.pop(resource)
+
+    def stats(self) -> Dict:
+        """
+        Thống kê pipeline
+
+        Returns:
+            {
+                'orders_completed', 'orders_failed', 'orders_active', 'orders_waiting',
+                'elapsed', 'drinks_per_hour', 'mean_latency', 'mean_queue_wait',
+                'resources': {resource: {'busy', 'utilization'}},
+                'stages': {step_id: {'name', 'count', 'failed', 'mean', 'utilization'}},
+                'bottleneck': tài nguyên có mức sử dụng cao nhất
+            }
+        """
+        with self.cond:
+            now = time.time()
+            elapsed = now - self.started_at if self.started_at else 0.0
+            busy = dict(self.resource_busy)
+            for resource, since in self.occupied_since.items():
+                busy[resource] = busy.get(resource, 0.0) + now - since
+            resources = {
+                resource: {'busy': seconds, 'utilization': seconds / elapsed if elapsed > 0 else 0.0}
+                for resource, seconds in sorted(busy.items())
+            }
+            stages = {
+                key: {
+                    'name': stage['name'],
+                    'count': stage['count'],
+                    'failed': stage['failed'],
+                    'mean': stage['busy'] / stage['count'],
+                    'utilization': stage['busy'] / elapsed if elapsed > 0 else 0.0
+                }
+                for key, stage in self.stage_stats.items()
+            }
+            return {
+                'orders_completed': self.orders_completed,
+                'orders_failed': self.orders_failed,
+                'orders_active': len(self.active),
+                'orders_waiting': len(self.waiting),
+                'elapsed': elapsed,
+                'drinks_per_hour': self.orders_completed / elapsed * 3600 if elapsed > 0 else 0.0,
+                'mean_latency': sum(self.latencies) / len(self.latencies) if self.latencies else 0.0,
+                'mean_queue_wait': sum(self.queue_waits) / len(self.queue_waits) if self.queue_waits else 0.0,
+                'resources': resources,
+                'stages': stages,
+                'bottleneck': max(resources, key=lambda r: resources[r]['busy']) if resources else None
+            }
+
+    def log_stats(self):
+        """Ghi thống kê pipeline ra log"""
+        stats = self.stats()
+        logger.info(f"📊 {stats['orders_completed']} ly ({stats['orders_failed']} lỗi) trong {stats['elapsed']:.1f}s "
+                    f"→ {stats['drinks_per_hour']:.1f} ly/giờ, trễ TB {stats['mean_latency']:.1f}s, "
+                    f"chờ hàng đợi TB {stats['mean_queue_wait']:.1f}s")
+        for resource, info in stats['resources'].items():
+            mark = "  ← nghẽn" if resource == stats['bottleneck'] else ""
+            logger.info(f"   {resource:<24} {info['utilization']:6.1%}{mark}")
+        for info in stats['stages'].values():
+            logger.info(f"   {info['name']:<40} x{info['count']:<4} TB {info['mean']:6.2f}s  {info['utilization']:6.1%}")
+
+
+__all__ = ['Order', 'OrderPipeline']
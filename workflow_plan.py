@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Workflow Plan
+Biên dịch workflow JSON một lần cho mỗi file: kiểm tra schema, ghi nhận thiết bị cần kết nối,
+mã hóa sẵn payload serial (kèm terminator) và expected response
+
+Plan được cache theo (mtime, kích thước) của file và SHA-256 nội dung: load lại file không đổi
+chỉ tốn một lần os.stat; file bị touch nhưng nội dung giữ nguyên vẫn dùng plan cũ.
+Coordinator dựng closure action/wait từ plan một lần, lúc chạy chỉ ghi bytes đã mã hóa ra cổng serial.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+# Các key lập lịch tùy chọn của một bước (giữ nguyên khi export/import JSON)
+SCHEDULING_KEYS = ('depends_on', 'resources', 'reserve', 'release')
+
+# Loại bước / action / wait hợp lệ và các field bắt buộc của từng loại
+STEP_TYPES = ('robot', 'iot', 'delay', 'condition', 'parallel')
+ACTION_FIELDS = {
+    'run_lua': ('file',),
+    'move_to_position': (),
+    'gripper_open': (),
+    'gripper_close': (),
+    'send_command': ('device', 'command'),
+    'read_sensor': ('device', 'sensor'),
+    'set_parameter': ('device', 'parameter'),
+    'delay': (),
+    'default': (),
+}
+WAIT_FIELDS = {
+    'robot_complete': (),
+    'iot_response': ('device',),
+    'condition_check': (),
+    'time_delay': (),
+    'default': (),
+}
+MODES = (None, 'ascii', 'hex')
+TERMINATORS = {None: b'', '': b'', 'NONE': b'', 'CR': b'\r', 'LF': b'\n', 'CRLF': b'\r\n'}
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+class WorkflowValidationError(ValueError):
+    """Workflow JSON không đúng schema; errors là danh sách lỗi theo từng bước"""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def clean_hex(text: str) -> str:
+    return str(text).strip().replace(' ', '').replace('-', '').replace('0x', '').replace('0X', '')
+
+
+def encode_command(command, mode: Optional[str] = None, terminator: Optional[str] = None) -> bytes:
+    """
+    Mã hóa lệnh IoT thành bytes gửi ra cổng serial
+
+    Args:
+        command: Chuỗi lệnh; 'hex' -> "AA 55 01"/"AA5501", 'ascii' -> gửi nguyên văn
+        mode: 'ascii' | 'hex' | None (tự nhận: chuỗi hex độ dài chẵn gửi dạng binary, còn lại ASCII)
+        terminator: 'CR' | 'LF' | 'CRLF' | 'none' | None
+
+    Raises:
+        ValueError: mode/terminator không hợp lệ, hex sai, hoặc lệnh ASCII có ký tự ngoài ASCII
+    """
+    cmd_str = str(command).strip()
+    hex_candidate = clean_hex(cmd_str)
+    if mode not in MODES:
+        raise ValueError(f"mode không hợp lệ: {mode}")
+    suffix = TERMINATORS.get(terminator.upper() if isinstance(terminator, str) else terminator)
+    if suffix is None:
+        raise ValueError(f"terminator không hợp lệ: {terminator}")
+    if mode == 'hex':
+        data = bytes.fromhex(hex_candidate)
+    elif mode == 'ascii':
+        data = cmd_str.encode('ascii')
+    elif len(hex_candidate) >= 2 and len(hex_candidate) % 2 == 0 and HEX_DIGITS.issuperset(hex_candidate):
+        data = bytes.fromhex(hex_candidate)
+    else:
+        data = cmd_str.encode('ascii')
+    return data + suffix
+
+
+def expected_response(wait_config: Dict) -> Optional[bytes]:
+    """Bytes phản hồi mong đợi từ expected_ascii / expected_hex của wait_config (None = bất kỳ)"""
+    if wait_config.get('expected_ascii') is not None:
+        return str(wait_config['expected_ascii']).encode('ascii')
+    if wait_config.get('expected_hex') is not None:
+        return bytes.fromhex(clean_hex(wait_config['expected_hex']))
+    return None
+
+
+class WorkflowPlan:
+    """Workflow đã kiểm tra và mã hóa sẵn; dùng chung (chỉ đọc) giữa các coordinator"""
+
+    def __init__(self, data: Dict, digest: str):
+        self.digest = digest
+        self.workflow_id = data.get('workflow_id')
+        self.workflow_name = data.get('workflow_name', 'Imported Workflow')
+        self.workflow_version = data.get('workflow_version', '1.0')
+        self.workflow_description = data.get('workflow_description', '')
+        self.steps: List[Dict] = []
+        self.compiled: List[Dict] = []  # song song với steps: {'payload', 'expected'}
+        self.devices = set()
+
+        errors = []
+        if not isinstance(data.get('steps'), list):
+            raise WorkflowValidationError(["'steps' phải là danh sách"])
+        ids = [step.get('id') for step in data['steps'] if isinstance(step, dict)]
+        seen = set()
+        for position, step in enumerate(data['steps'], 1):
+            where = f"bước {position}"
+            if not isinstance(step, dict):
+                errors.append(f"{where}: phải là object")
+                continue
+            missing = [key for key in ('id', 'name', 'type', 'action_config', 'wait_config', 'timeout') if key not in step]
+            if missing:
+                errors.append(f"{where}: thiếu {', '.join(missing)}")
+                continue
+            where = f"bước {position} ({step['id']})"
+            if step['id'] in seen:
+                errors.append(f"{where}: trùng ID")
+            seen.add(step['id'])
+            if step['type'] not in STEP_TYPES:
+                errors.append(f"{where}: type '{step['type']}' không hợp lệ")
+            if not isinstance(step['timeout'], (int, float)) or isinstance(step['timeout'], bool):
+                errors.append(f"{where}: timeout phải là số")
+            for key in SCHEDULING_KEYS:
+                value = step.get(key)
+                if value is not None and not (isinstance(value, list) and all(isinstance(v, str) for v in value)):
+                    errors.append(f"{where}: {key} phải là danh sách chuỗi")
+            unknown = [d for d in step.get('depends_on') or () if d not in ids]
+            if unknown:
+                errors.append(f"{where}: depends_on không tồn tại: {', '.join(map(str, unknown))}")
+
+            compiled = {'payload': None, 'expected': None}
+            action_config = self._check_config(step['action_config'], ACTION_FIELDS, f"{where} action", errors)
+            wait_config = self._check_config(step['wait_config'], WAIT_FIELDS, f"{where} wait", errors)
+            if action_config is not None and action_config.get('type') == 'send_command':
+                try:
+                    compiled['payload'] = encode_command(action_config['command'], action_config.get('mode'),
+                                                         action_config.get('terminator'))
+                except ValueError as e:
+                    errors.append(f"{where}: lệnh '{action_config['command']}' không mã hóa được ({e})")
+            if wait_config is not None and wait_config.get('type') == 'iot_response':
+                try:
+                    compiled['expected'] = expected_response(wait_config)
+                except ValueError as e:
+                    errors.append(f"{where}: expected response không hợp lệ ({e})")
+
+            self.steps.append(dict(step, action_config=action_config, wait_config=wait_config))
+            self.compiled.append(compiled)
+        if errors:
+            raise WorkflowValidationError(errors)
+
+    def _check_config(self, config, fields: Dict, where: str, errors: List[str]) -> Optional[Dict]:
+        """Kiểm tra action_config/wait_config, ghi nhận thiết bị cần kết nối; trả về bản sao"""
+        if not isinstance(config, dict):
+            errors.append(f"{where}: phải là object")
+            return None
+        config_type = config.get('type', 'default')
+        if config_type not in fields:
+            errors.append(f"{where}: type '{config_type}' không hợp lệ")
+            return None
+        missing = [key for key in fields[config_type] if config.get(key) in (None, '')]
+        if missing:
+            errors.append(f"{where} '{config_type}': thiếu {', '.join(missing)}")
+            return None
+        if config.get('device'):
+            self.devices.add(str(config['device']))
+        return dict(config)
+
+
+# Cache: đường dẫn -> (mtime_ns, size, plan); SHA-256 -> plan
+_file_plans: Dict[str, tuple] = {}
+_digest_plans: Dict[str, WorkflowPlan] = {}
+_cache_lock = threading.Lock()
+
+
+def compile_workflow(text) -> WorkflowPlan:
+    """Biên dịch workflow từ JSON (str/bytes), cache theo SHA-256 nội dung"""
+    raw = text.encode('utf-8') if isinstance(text, str) else text
+    digest = hashlib.sha256(raw).hexdigest()
+    with _cache_lock:
+        plan = _digest_plans.get(digest)
+    if plan is None:
+        plan = WorkflowPlan(json.loads(raw), digest)
+        with _cache_lock:
+            plan = _digest_plans.setdefault(digest, plan)
+    return plan
+
+
+def compile_workflow_file(file_path: str) -> WorkflowPlan:
+    """
+    Biên dịch workflow từ file; file chưa đổi (mtime, size) trả về plan đã cache mà không đọc lại
+
+    Raises:
+        OSError, json.JSONDecodeError, WorkflowValidationError
+    """
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    with _cache_lock:
+        cached = _file_plans.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    with open(path, 'rb') as f:
+        plan = compile_workflow(f.read())
+    with _cache_lock:
+        _file_plans[path] = (st.st_mtime_ns, st.st_size, plan)
+    return plan
+
+
+def clear_cache():
+    """Xóa cache plan (vd. sau khi sửa nhiều file workflow)"""
+    with _cache_lock:
+        _file_plans.clear()
+        _digest_plans.clear()
+
+
+__all__ = [
+    'SCHEDULING_KEYS',
+    'WorkflowPlan',
+    'WorkflowValidationError',
+    'compile_workflow',
+    'compile_workflow_file',
+    'clear_cache',
+    'encode_command',
+    'expected_response'
+]